@@ -1,5 +1,5 @@
 from business_rules.operators import BaseType, type_operator
-from typing import Union, Any, List, Tuple
+from typing import Union, Any, Callable, List, Optional, Tuple
 from business_rules.fields import FIELD_DATAFRAME
 from business_rules.utils import (
     flatten_list,
@@ -18,9 +18,12 @@ from cdisc_rules_engine.utilities.utils import dates_overlap, parse_date
 import numpy as np
 import dask.dataframe as dd
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import re
 import operator
 from uuid import uuid4
+from cdisc_rules_engine.models.dataset.arrow_dataset import ArrowDataset
 from cdisc_rules_engine.models.dataset.dask_dataset import DaskDataset
 from cdisc_rules_engine.models.dataset.pandas_dataset import PandasDataset
 from cdisc_rules_engine.models.dataset.dataset_interface import DatasetInterface
@@ -88,8 +91,16 @@ class DataframeType(BaseType):
             return any(target_column in item for item in row if isinstance(item, list))
 
         column_exists = target_column in self.value.columns
+        table: Optional[pa.Table] = (
+            self.value.table if isinstance(self.value, ArrowDataset) else None
+        )
         if column_exists:
             return self.value.convert_to_series([True] * len(self.value))
+        elif table is not None and not any(
+            pa.types.is_list(field.type) for field in table.schema
+        ):
+            # rows of tables without list columns hold no lists
+            return self.value.convert_to_series([False] * len(self.value))
         else:
             exists_in_nested = self.value.apply(check_row, axis=1).any()
             return self.value.convert_to_series([exists_in_nested] * len(self.value))
@@ -160,6 +171,127 @@ class DataframeType(BaseType):
             return target_val != comparison_val
         return row[target] != comparison_data
 
+    def _get_categorical_column(self, column_name: str) -> Optional[pd.Series]:
+        """
+        Returns the column if it is a categorical column
+        of a non-empty pandas dataset, otherwise None.
+        """
+        if (
+            isinstance(self.value, PandasDataset)
+            and not isinstance(self.value, DaskDataset)
+            and not self.value.empty
+            and column_name in self.value.columns
+            and isinstance(self.value[column_name].dtype, pd.CategoricalDtype)
+        ):
+            return self.value[column_name]
+        return None
+
+    @staticmethod
+    def _apply_to_categories(column: pd.Series, function: Callable) -> pd.Series:
+        """
+        Applies the function once per category of a categorical column
+        and maps the results to the rows by category codes.
+        """
+        results = [function(category) for category in column.cat.categories]
+        codes: np.ndarray = column.cat.codes.to_numpy()
+        if (codes == -1).any():
+            # missing values have code -1 and take the last result
+            results.append(function(np.nan))
+        return pd.Series(np.array(results, dtype=bool)[codes], index=column.index)
+
+    def _get_arrow_string_column(self, column_name: str) -> Optional[pa.ChunkedArray]:
+        """
+        Returns the column if it is a string column
+        of a dataset backed by an Arrow table, otherwise None.
+        """
+        table: Optional[pa.Table] = (
+            self.value.table if isinstance(self.value, ArrowDataset) else None
+        )
+        if (
+            table is not None
+            and table.num_rows > 0
+            and column_name in table.column_names
+            and pa.types.is_string(table.schema.field(column_name).type)
+        ):
+            return table.column(column_name)
+        return None
+
+    @staticmethod
+    def _get_arrow_empty_mask(values: Union[pa.ChunkedArray, str, None]):
+        """
+        Returns True where the values are null or empty strings.
+        """
+        if isinstance(values, pa.ChunkedArray):
+            return pc.fill_null(pc.equal(values, ""), True)
+        return values is None or values == ""
+
+    def _arrow_equal(
+        self, column: pa.ChunkedArray, comparator: Union[pa.ChunkedArray, str, None]
+    ) -> np.ndarray:
+        """
+        Arrow version of _check_equality.
+        """
+        both_empty = pc.and_(
+            self._get_arrow_empty_mask(column), self._get_arrow_empty_mask(comparator)
+        )
+        equal = pc.fill_null(pc.equal(column, comparator), False)
+        return pc.and_not(equal, both_empty).to_numpy()
+
+    def _arrow_not_equal(
+        self, column: pa.ChunkedArray, comparator: Union[pa.ChunkedArray, str, None]
+    ) -> np.ndarray:
+        """
+        Arrow version of _check_inequality.
+        """
+        both_empty = pc.and_(
+            self._get_arrow_empty_mask(column), self._get_arrow_empty_mask(comparator)
+        )
+        not_equal = pc.fill_null(pc.not_equal(column, comparator), True)
+        return pc.and_not(not_equal, both_empty).to_numpy()
+
+    def _compare_rows(
+        self,
+        check: Callable,
+        target: str,
+        comparator,
+        value_is_literal: bool,
+        arrow_function: Callable = None,
+        **kwargs,
+    ) -> pd.Series:
+        """
+        Applies the row check of an equality operator.
+        The arrow_function is applied instead to Arrow string targets
+        compared with a string literal or an Arrow string column.
+        If the comparator is a literal, the check is applied
+        to the categories of a categorical target.
+        """
+        arrow_column = self._get_arrow_string_column(target)
+        if arrow_function and arrow_column is not None:
+            if comparator is None or isinstance(comparator, str):
+                arrow_comparator = (
+                    None
+                    if value_is_literal
+                    else self._get_arrow_string_column(comparator)
+                )
+                if arrow_comparator is not None:
+                    return pd.Series(arrow_function(arrow_column, arrow_comparator))
+                if value_is_literal or comparator not in self.value.columns:
+                    return pd.Series(arrow_function(arrow_column, comparator))
+        column = self._get_categorical_column(target)
+        if column is not None and (
+            value_is_literal or comparator not in self.value.columns
+        ):
+            return self._apply_to_categories(
+                column,
+                lambda value: check(
+                    {target: value}, target, comparator, True, **kwargs
+                ),
+            )
+        return self.value.apply(
+            lambda row: check(row, target, comparator, value_is_literal, **kwargs),
+            axis=1,
+        )
+
     @type_operator(FIELD_DATAFRAME)
     def equal_to(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
@@ -169,9 +301,12 @@ class DataframeType(BaseType):
             if not value_is_literal
             else other_value.get("comparator")
         )
-        return self.value.apply(
-            lambda row: self._check_equality(row, target, comparator, value_is_literal),
-            axis=1,
+        return self._compare_rows(
+            self._check_equality,
+            target,
+            comparator,
+            value_is_literal,
+            arrow_function=self._arrow_equal,
         ).astype(bool)
 
     @type_operator(FIELD_DATAFRAME)
@@ -183,11 +318,12 @@ class DataframeType(BaseType):
             if not value_is_literal
             else other_value.get("comparator")
         )
-        return self.value.apply(
-            lambda row: self._check_equality(
-                row, target, comparator, value_is_literal, case_insensitive=True
-            ),
-            axis=1,
+        return self._compare_rows(
+            self._check_equality,
+            target,
+            comparator,
+            value_is_literal,
+            case_insensitive=True,
         )
 
     @type_operator(FIELD_DATAFRAME)
@@ -199,11 +335,12 @@ class DataframeType(BaseType):
             if not value_is_literal
             else other_value.get("comparator")
         )
-        return self.value.apply(
-            lambda row: self._check_inequality(
-                row, target, comparator, value_is_literal, case_insensitive=True
-            ),
-            axis=1,
+        return self._compare_rows(
+            self._check_inequality,
+            target,
+            comparator,
+            value_is_literal,
+            case_insensitive=True,
         )
 
     @type_operator(FIELD_DATAFRAME)
@@ -215,11 +352,12 @@ class DataframeType(BaseType):
             if not value_is_literal
             else other_value.get("comparator")
         )
-        return self.value.apply(
-            lambda row: self._check_inequality(
-                row, target, comparator, value_is_literal
-            ),
-            axis=1,
+        return self._compare_rows(
+            self._check_inequality,
+            target,
+            comparator,
+            value_is_literal,
+            arrow_function=self._arrow_not_equal,
         )
 
     @type_operator(FIELD_DATAFRAME)
@@ -502,7 +640,16 @@ class DataframeType(BaseType):
             # column name provided
             comparator = self.replace_prefix(comparator)
         comparison_data = self.get_comparator_data(comparator, value_is_literal)
-        if self.is_column_of_iterables(comparison_data):
+        arrow_column = self._get_arrow_string_column(target)
+        if (
+            arrow_column is not None
+            and isinstance(comparison_data, list)
+            and all(isinstance(value, str) for value in comparison_data)
+        ):
+            results = pc.is_in(
+                arrow_column, value_set=pa.array(comparison_data, pa.string())
+            ).to_numpy()
+        elif self.is_column_of_iterables(comparison_data):
             results = vectorized_is_in(self.value[target], comparison_data)
         else:
             results = self.value[target].isin(comparison_data)
@@ -590,10 +737,30 @@ class DataframeType(BaseType):
         )
         return results
 
+    def _matches_regex_categories(
+        self, column: pd.Series, comparator: str, negate: bool = False
+    ) -> pd.Series:
+        """
+        Matches the categories of a categorical column against the regex.
+        Missing values do not match either way.
+        """
+
+        def check(value) -> bool:
+            converted = self._custom_str_conversion(value)
+            if pd.isna(converted):
+                return False
+            matched: bool = re.match(comparator, str(converted)) is not None
+            return not matched if negate else matched
+
+        return self._apply_to_categories(column, check)
+
     @type_operator(FIELD_DATAFRAME)
     def matches_regex(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         comparator = other_value.get("comparator")
+        column = self._get_categorical_column(target)
+        if column is not None:
+            return self._matches_regex_categories(column, comparator)
         converted_strings = self.value[target].map(
             lambda x: self._custom_str_conversion(x)
         )
@@ -606,6 +773,9 @@ class DataframeType(BaseType):
     def not_matches_regex(self, other_value):
         target = self.replace_prefix(other_value.get("target"))
         comparator = other_value.get("comparator")
+        column = self._get_categorical_column(target)
+        if column is not None:
+            return self._matches_regex_categories(column, comparator, negate=True)
         converted_strings = self.value[target].map(
             lambda x: self._custom_str_conversion(x)
         )
@@ -735,6 +905,12 @@ class DataframeType(BaseType):
     @type_operator(FIELD_DATAFRAME)
     def empty(self, other_value: dict):
         target = self.replace_prefix(other_value.get("target"))
+        column = self._get_categorical_column(target)
+        if column is not None:
+            # categories are hashable, so only empty strings and missing values match
+            return self._apply_to_categories(
+                column, lambda value: pd.isna(value) or value == ""
+            )
         results = np.where(self.value[target].isin(["", None, {None}]), True, False)
         return self.value.convert_to_series(results)
 
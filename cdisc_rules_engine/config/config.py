@@ -27,6 +27,20 @@ class ConfigService(ConfigInterface):
                 "CDISC_LIBRARY_API_KEY",
                 "DATA_SERVICE_TYPE",
                 "DATASET_SIZE_THRESHOLD",
+                "XPT_READER",
+                "DATASET_JSON_SCHEMA_VALIDATION",
+                "DATASET_JSON_SCHEMA_SAMPLE_SIZE",
+                "DATASET_IMPLEMENTATION",
+                "ARROW_DATASET_SIZE_THRESHOLD",
+                "DATASET_CACHE_FINGERPRINT",
+                "REDIS_DATASET_COMPRESSION",
+                "REDIS_DATASET_CHUNK_SIZE",
+                "REDIS_MAX_CONNECTIONS",
+                "REDIS_SERIALIZER",
+                "LOCAL_CACHE_SIZE",
+                "LOCAL_CACHE_TTL",
+                "LOCAL_CACHE_NEGATIVE_TTL",
+                "LOCAL_CACHE_NAMESPACE_TTLS",
             ]
 
         return cls._instance
@@ -45,3 +59,9 @@ class ConfigService(ConfigInterface):
             )
         except Exception:
             return self._default_dataset_size_threshold
+
+    def get_arrow_dataset_size_threshold(self):
+        try:
+            return float(self.getValue("ARROW_DATASET_SIZE_THRESHOLD"))
+        except Exception:
+            return None
@@ -1 +1,25 @@
 ALL_KEYWORD: str = "ALL"
+# operations that read only the dataset columns named in the operation
+COLUMN_PROJECTION_OPERATIONS = {
+    "dataset_names",
+    "distinct",
+    "domain_is_custom",
+    "domain_label",
+    "dy",
+    "extract_metadata",
+    "get_codelist_attributes",
+    "max",
+    "max_date",
+    "mean",
+    "min",
+    "min_date",
+    "record_count",
+    "study_domains",
+    "valid_codelist_dates",
+    "variable_count",
+    "variable_exists",
+    "variable_is_null",
+    "variable_value_count",
+}
+# variables the engine reads for any rule, e.g. to build error reports
+ENGINE_REFERENCED_VARIABLES = ("STUDYID", "DOMAIN", "USUBJID", "--SEQ")
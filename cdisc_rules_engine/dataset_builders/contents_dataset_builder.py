@@ -10,13 +10,13 @@ class ContentsDatasetBuilder(BaseDatasetBuilder):
         """
         Returns the contents of a file as a dataframe for evaluation.
         """
-        return self.data_service.get_dataset(dataset_name=self.dataset_path)
+        return self.data_service.get_dataset(dataset_name=self.dataset_path, **kwargs)
 
     def build_split_dataset(self, dataset_name, **kwargs):
         """
         Returns the contents of a file as a dataframe for evaluation.
         """
-        return self.data_service.get_dataset(dataset_name=dataset_name)
+        return self.data_service.get_dataset(dataset_name=dataset_name, **kwargs)
 
     def get_dataset(self, **kwargs):
         # If validating dataset content, ensure split datasets are handled.
@@ -0,0 +1,12 @@
+from cdisc_rules_engine.enums.base_enum import BaseEnum
+
+
+class DatasetFingerprintTypes(BaseEnum):
+    """
+    What the cache keys of datasets read from files include
+    besides the file path.
+    """
+
+    NONE = "none"
+    STAT = "stat"  # size and modification time of the file
+    CONTENT = "content"  # size and hash of the file contents
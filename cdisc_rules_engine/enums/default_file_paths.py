@@ -11,3 +11,4 @@ class DefaultFilePaths(BaseEnum):
     VARIABLE_CODELIST_CACHE_FILE = "variable_codelist_maps.pkl"
     CODELIST_TERM_MAP_CACHE_FILE = "codelist_term_maps.pkl"
     LOCAL_RULES_CACHE_FILE = "local_rules.pkl"
+    LIBRARY_CACHE_STORE_FILE = "library_cache.sqlite"
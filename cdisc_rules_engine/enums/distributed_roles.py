@@ -0,0 +1,6 @@
+from .base_enum import BaseEnum
+
+
+class DistributedRoles(BaseEnum):
+    COORDINATOR = "coordinator"
+    WORKER = "worker"
@@ -0,0 +1,12 @@
+from .base_enum import BaseEnum
+
+
+class SchedulingOptions(BaseEnum):
+    """
+    Defines how validation work is split into pool tasks.
+    RULE - one task per rule, each task walks every dataset.
+    DATASET - one task per dataset (domain), each task runs every rule.
+    """
+
+    RULE = "rule"
+    DATASET = "dataset"
@@ -23,6 +23,11 @@ class RuleExecutionError(EngineError):
     description = "Issue executing rule"
 
 
+class TaskBudgetExceededError(EngineError):
+    code = 500
+    description = "Validation exceeded its time or memory limit"
+
+
 class RuleFormatError(EngineError):
     code = 400
     description = "Improperly formatted rule"
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Iterable, List
+from typing import Dict, Iterable, List
+
+from cdisc_rules_engine.utilities.cache_stats import CacheStats
 
 
 class CacheServiceInterface(ABC):
@@ -8,7 +10,38 @@ class CacheServiceInterface(ABC):
     def get_instance(cls, **kwargs) -> "CacheServiceInterface":
         pass
 
-    def add(self, cache_key, data):
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Hits, misses, evictions and latency of the cache by key namespace.
+        """
+        if "_stats" not in self.__dict__:
+            self._stats = CacheStats(type(self).__name__)
+        return self._stats
+
+    def get_stats(self) -> Dict[str, dict]:
+        """
+        Returns {cache name: stats by namespace}.
+        Caches that wrap another cache add the stats of the wrapped cache.
+        """
+        return {type(self).__name__: self.stats.to_dict()}
+
+    def reset_stats(self):
+        self.stats.reset()
+
+    def __getstate__(self):
+        # stats are counted by each process separately,
+        # copies sent to worker processes start without them
+        state = self.__dict__.copy()
+        state.pop("_stats", None)
+        return state
+
+    def add(self, cache_key, data, size: int = None):
+        """
+        Saves data to cache. size is the memory size of the data
+        in bytes if the caller knows it, caches bounded by memory
+        size use it instead of estimating the size.
+        """
         raise NotImplementedError
 
     def add_batch(
@@ -28,12 +61,33 @@ class CacheServiceInterface(ABC):
         """
         raise NotImplementedError
 
+    async def async_add(self, cache_key, data, size: int = None):
+        """
+        Saves data to cache without blocking the event loop.
+        Caches that are not accessed over the network save it directly.
+        """
+        return self.add(cache_key, data, size)
+
+    async def async_add_batch(
+        self,
+        items: Iterable[dict],
+        cache_key_name: str,
+        pop_cache_key: bool = False,
+        prefix: str = "",
+    ):
+        return self.add_batch(
+            items, cache_key_name, pop_cache_key=pop_cache_key, prefix=prefix
+        )
+
     def get(self, cache_key):
         raise NotImplementedError
 
     def get_all(self, cache_keys: List[str]):
         raise NotImplementedError
 
+    async def async_get_all(self, cache_keys: List[str]):
+        return self.get_all(cache_keys)
+
     def get_all_by_prefix(self, prefix):
         raise NotImplementedError
 
@@ -19,5 +19,10 @@ class DataReaderInterface:
         """
         raise NotImplementedError
 
-    def from_file(self, file_path):
+    def from_file(self, file_path, columns=None):
+        """
+        Reads the dataset from the file.
+        If columns are given, only these columns are read,
+        names that do not exist in the file are ignored.
+        """
         raise NotImplementedError
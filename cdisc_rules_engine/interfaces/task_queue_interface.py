@@ -0,0 +1,123 @@
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Tuple
+
+
+class TaskQueueInterface(ABC):
+    """
+    Queue that distributes validation tasks between machines.
+
+    The coordinator publishes a job, that holds data shared
+    by all tasks, and the tasks of the job. Workers take tasks
+    one by one and put the results back to the queue.
+    Once all tasks are published, the coordinator closes the queue,
+    so that workers can stop when there are no tasks left.
+
+    A taken task stays claimed by the worker until its result is put.
+    Workers renew the claims of running tasks, claims that are not
+    renewed, e.g. because the worker was killed, are requeued
+    by the coordinator and the workers that wait for tasks.
+
+    One job runs in a queue at a time. The coordinator holds
+    the lease of the queue while its job runs and renews it,
+    so that another coordinator does not clear the running job.
+    """
+
+    @classmethod
+    @abstractmethod
+    def from_url(cls, url: str) -> "TaskQueueInterface":
+        """
+        Creates the queue from its url.
+        """
+
+    @abstractmethod
+    def acquire_lease(self, owner: str, timeout: float) -> bool:
+        """
+        Takes or renews the lease of the queue for the owner.
+        A lease that was not renewed for timeout seconds can be taken
+        by another owner. Returns False if the queue is leased
+        by another owner.
+        """
+
+    @abstractmethod
+    def release_lease(self, owner: str):
+        """
+        Releases the lease if it is held by the owner.
+        """
+
+    @abstractmethod
+    def publish_job(self, job: Any):
+        """
+        Publishes data shared by all tasks.
+        """
+
+    @abstractmethod
+    def get_job(self) -> Any:
+        """
+        Returns the published job or None if there is no job.
+        """
+
+    @abstractmethod
+    def put_task(self, task_id: str, task: Any):
+        """
+        Adds a task to the queue.
+        Tasks are taken in the order they were added.
+        """
+
+    @abstractmethod
+    def get_task(self, timeout: float) -> Optional[Tuple[str, Any]]:
+        """
+        Takes the next task from the queue.
+        Returns (task_id, task) or None if no task
+        was available within the timeout.
+        """
+
+    @abstractmethod
+    def touch_task(self, task_id: str):
+        """
+        Renews the claim of a task taken by this worker.
+        """
+
+    @abstractmethod
+    def requeue_stale_tasks(self, timeout: float) -> List[str]:
+        """
+        Returns tasks whose claims were not renewed
+        for timeout seconds to the queue.
+        Returns ids of the requeued tasks.
+        """
+
+    @abstractmethod
+    def has_claimed_tasks(self) -> bool:
+        """
+        Returns whether any taken task has no result yet.
+        """
+
+    @abstractmethod
+    def put_result(self, task_id: str, result: Any):
+        """
+        Adds result of the task to the queue and releases its claim.
+        """
+
+    @abstractmethod
+    def get_result(self, timeout: float) -> Optional[Tuple[str, Any]]:
+        """
+        Takes the next result from the queue.
+        Returns (task_id, result) or None if no result
+        was available within the timeout.
+        """
+
+    @abstractmethod
+    def close(self):
+        """
+        Marks that all tasks of the job are published.
+        """
+
+    @abstractmethod
+    def is_closed(self) -> bool:
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """
+        Removes the job, tasks, results and the closed mark.
+        The lease is kept.
+        """
@@ -2,8 +2,9 @@
 This module contains DB models related
 to dictionaries like WhoDrug, MedDra etc.
 """
+from .arrow_dataset import ArrowDataset
 from .dask_dataset import DaskDataset
 from .pandas_dataset import PandasDataset
 from .dataset_interface import DatasetInterface
 
-__all__ = ["DaskDataset", "PandasDataset", "DatasetInterface"]
+__all__ = ["ArrowDataset", "DaskDataset", "PandasDataset", "DatasetInterface"]
@@ -0,0 +1,265 @@
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from cdisc_rules_engine.models.dataset.pandas_dataset import PandasDataset
+
+# object columns holding these values are converted to Arrow and back unchanged
+CONVERTIBLE_OBJECT_TYPES = {"string", "empty", "floating", "integer", "boolean"}
+# numpy dtype kinds that are converted to Arrow and back unchanged
+CONVERTIBLE_DTYPE_KINDS = "biufmMO"
+
+
+class ArrowDataset(PandasDataset):
+    """
+    Dataset backed by an Apache Arrow table.
+
+    Columns are converted to pandas separately when they are accessed,
+    the whole table is converted only when a pandas operation needs it.
+    After that the dataset holds a pandas dataframe like PandasDataset.
+    Copies and slices of the table share its memory,
+    and tables can be written to and memory-mapped from Arrow IPC files.
+    """
+
+    def __init__(
+        self, data: Union[pa.Table, pd.DataFrame] = None, columns=None
+    ) -> None:
+        self._table: Optional[pa.Table] = None
+        self._frame: Optional[pd.DataFrame] = None
+        # columns converted to pandas, shared by the copies of the table
+        self._column_cache: Dict[str, pd.Series] = {}
+        if isinstance(data, pa.Table):
+            self._table = data
+            self.length = data.num_rows
+        else:
+            super().__init__(pd.DataFrame() if data is None else data, columns)
+
+    @property
+    def _data(self) -> pd.DataFrame:
+        if self._frame is None:
+            self._frame = self._to_pandas(self._table)
+            self._table = None
+            self._column_cache = {}
+        return self._frame
+
+    @_data.setter
+    def _data(self, data: pd.DataFrame):
+        self._frame = data
+        self._table = None
+        self._column_cache = {}
+
+    @property
+    def table(self) -> Optional[pa.Table]:
+        """
+        The Arrow table of the dataset,
+        None if the dataset was converted to pandas.
+        """
+        return self._table
+
+    @classmethod
+    def from_pandas(cls, data: pd.DataFrame) -> "ArrowDataset":
+        """
+        Converts the dataframe to an Arrow table.
+        Dataframes that would not be converted back unchanged are kept.
+        """
+        if cls._is_convertible(data):
+            try:
+                return cls(pa.Table.from_pandas(data, preserve_index=False))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                pass
+        return cls(data)
+
+    @classmethod
+    def from_ipc(cls, source: Union[str, bytes, memoryview, pa.Buffer]):
+        """
+        Reads an Arrow IPC file. Files are memory-mapped
+        and buffers are read without copying.
+        """
+        if isinstance(source, str):
+            source = pa.memory_map(source)
+        else:
+            source = pa.BufferReader(source)
+        return cls(pa.ipc.open_file(source).read_all())
+
+    def to_ipc(self, sink: Union[str, pa.NativeFile]):
+        """
+        Writes the dataset to an Arrow IPC file.
+        Raises ValueError if the dataset is not backed by an Arrow table.
+        """
+        if self._table is None:
+            raise ValueError("Only datasets backed by an Arrow table can be written")
+        with pa.ipc.new_file(sink, self._table.schema) as writer:
+            writer.write_table(self._table)
+
+    @staticmethod
+    def _is_convertible(data: pd.DataFrame) -> bool:
+        index = data.index
+        if not (
+            isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1
+        ):
+            return False
+        if (
+            data.columns.empty
+            or not data.columns.is_unique
+            or not all(isinstance(name, str) for name in data.columns)
+        ):
+            return False
+        for _, column in data.items():
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                continue
+            if (
+                not isinstance(column.dtype, np.dtype)
+                or column.dtype.kind not in CONVERTIBLE_DTYPE_KINDS
+            ):
+                return False
+            if column.dtype == object and not (
+                pd.api.types.infer_dtype(column.dropna()) in CONVERTIBLE_OBJECT_TYPES
+                # None and NaN are both null in Arrow
+                and column.isna().sum() == np.equal(column.values, None).sum()
+            ):
+                return False
+        return True
+
+    @staticmethod
+    def _to_pandas(table: pa.Table) -> pd.DataFrame:
+        data: pd.DataFrame = table.to_pandas(integer_object_nulls=True)
+        pandas_metadata: dict = table.schema.pandas_metadata or {}
+        for column_metadata in pandas_metadata.get("columns", []):
+            name = column_metadata["name"]
+            if (
+                column_metadata["numpy_type"] == "object"
+                and name in data
+                and data[name].dtype != object
+            ):
+                # numeric columns where missing values were None
+                column = data[name].astype(object)
+                data[name] = column.where(column.notna(), None)
+        return data
+
+    def _get_column(self, name: str) -> pd.Series:
+        if name not in self._column_cache:
+            data: pd.DataFrame = self._to_pandas(self._table.select([name]))
+            self._column_cache[name] = data[name]
+        return self._column_cache[name].copy()
+
+    @property
+    def columns(self):
+        if self._table is not None:
+            return pd.Index(self._table.column_names)
+        return self._data.columns
+
+    @columns.setter
+    def columns(self, columns):
+        self._data.columns = columns
+
+    @property
+    def index(self):
+        if self._table is not None:
+            return pd.RangeIndex(self._table.num_rows)
+        return self._data.index
+
+    @property
+    def empty(self):
+        if self._table is not None:
+            return self._table.num_rows == 0 or self._table.num_columns == 0
+        return self._data.empty
+
+    @property
+    def size(self) -> int:
+        if self._table is not None:
+            return self._table.nbytes
+        return super().size
+
+    def __getitem__(
+        self, item: Union[str, List[str]]
+    ) -> Union[pd.Series, pd.DataFrame]:
+        if self._table is not None:
+            if isinstance(item, str):
+                if item not in self._table.column_names:
+                    raise KeyError(item)
+                return self._get_column(item)
+            if self._is_list_of_columns(item):
+                return self._to_pandas(self._table.select(item))
+        return super().__getitem__(item)
+
+    def __len__(self):
+        if self._table is not None:
+            return self._table.num_rows
+        return super().__len__()
+
+    def __contains__(self, item: str) -> bool:
+        if self._table is not None:
+            return item in self._table.column_names
+        return super().__contains__(item)
+
+    def __deepcopy__(self, memo):
+        if self._table is not None:
+            # Arrow tables are immutable, the copy can share the memory
+            return self.copy()
+        return self.__class__(self._frame.copy())
+
+    def _is_list_of_columns(self, item) -> bool:
+        return (
+            isinstance(item, list)
+            and len(item) > 0
+            and all(
+                isinstance(name, str) and name in self._table.column_names
+                for name in item
+            )
+        )
+
+    def get(self, target: Union[str, List[str]], default=None):
+        if self._table is not None:
+            if isinstance(target, str):
+                return self[target] if target in self else default
+            if target is None or isinstance(target, (int, float)):
+                # column names of Arrow tables are strings
+                return default
+            if isinstance(target, list) and target:
+                return self[target] if self._is_list_of_columns(target) else default
+        return super().get(target, default)
+
+    def get_series_from_value(self, result):
+        if self._table is None:
+            return super().get_series_from_value(result)
+        if hasattr(result, "__iter__"):
+            return pd.Series([result] * len(self), index=self.index)
+        return pd.Series(result, index=self.index)
+
+    def len(self) -> int:
+        if self._table is not None:
+            return self._table.num_rows
+        return super().len()
+
+    def copy(self):
+        if self._table is not None:
+            dataset = self.__class__(self._table)
+            dataset._column_cache = self._column_cache
+            return dataset
+        return super().copy()
+
+    def slice(self, offset: int, length: int = None) -> "ArrowDataset":
+        """
+        Returns the rows from offset with a new index starting at 0.
+        Slices of an Arrow table share its memory.
+        """
+        if self._table is not None:
+            return self.__class__(self._table.slice(offset, length))
+        stop = None if length is None else offset + length
+        return self.__class__(self._data.iloc[offset:stop].reset_index(drop=True))
+
+    def get_error_rows(self, results) -> pd.DataFrame:
+        if self._table is None:
+            return super().get_error_rows(results)
+        index = pd.RangeIndex(self._table.num_rows)
+        if self.is_series(results):
+            results = results.reindex(index)
+        else:
+            results = pd.Series(results, index=index)
+        mask: np.ndarray = results.isin([True]).to_numpy()
+        error_rows = self._to_pandas(self._table.filter(pa.array(mask)))
+        error_rows.index = index[mask]
+        error_rows["results"] = results[mask].to_numpy()
+        return error_rows
@@ -76,7 +76,7 @@ class BaseDictionaryValidator:
                     "External Dictionary validation requires data service. None found"
                 )
             terms_dictionary = self.terms_factory.install_terms(self.path)
+            self.cache_service.add(self.path, terms_dictionary)
         self.term_dictionary = terms_dictionary
-        self.cache_service.add(self.path, terms_dictionary)
 
         return self.term_dictionary
@@ -1,5 +1,7 @@
 from collections import namedtuple
 
+from cdisc_rules_engine.enums.scheduling_options import SchedulingOptions
+
 Validation_args = namedtuple(
     "Validation_args",
     [
@@ -25,5 +27,39 @@ Validation_args = namedtuple(
         "local_rules_id",
         "progress",
         "define_xml_path",
+        "scheduling",
+        "max_task_time",
+        "max_task_memory",
+        "max_tasks_per_worker",
+        "worker_memory_watermark",
+        "stream_reports",
+        "distributed_role",
+        "task_queue",
+        "parquet_cache",
+        "parquet_cache_max_size",
+        "column_projection",
+        "categorical_threshold",
+        "operation_cache",
+        "operation_cache_max_size",
+        "cache_stats",
+        "task_queue_timeout",
+    ],
+    defaults=[
+        SchedulingOptions.RULE.value,
+        None,
+        None,
+        None,
+        None,
+        False,
+        None,
+        None,
+        None,
+        None,
+        False,
+        None,
+        None,
+        None,
+        None,
+        None,
     ],
 )
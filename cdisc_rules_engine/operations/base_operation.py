@@ -21,6 +21,7 @@ from cdisc_rules_engine.models.library_metadata_container import (
     LibraryMetadataContainer,
 )
 from cdisc_rules_engine.models.dataset.dataset_interface import DatasetInterface
+from cdisc_rules_engine.utilities.operation_result_store import OperationResultStore
 
 
 class BaseOperation:
@@ -43,8 +44,21 @@ class BaseOperation:
         """Perform operation calculations."""
         pass
 
-    def execute(self) -> DatasetInterface:
-        result = self._execute_operation()
+    def execute(
+        self,
+        result_store: OperationResultStore = None,
+        result_key: str = None,
+    ) -> DatasetInterface:
+        """
+        Adds the operation result to the evaluation dataset.
+        If a result store and a result key are given, the result
+        is read from the store or computed and added to the store.
+        """
+        result = result_store.get(result_key) if result_key else None
+        if result is None:
+            result = self._execute_operation()
+            if result_key:
+                result_store.add(result_key, result)
         return self._handle_operation_result(result)
 
     def _handle_operation_result(self, result) -> DatasetInterface:
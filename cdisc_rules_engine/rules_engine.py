@@ -14,6 +14,7 @@ from cdisc_rules_engine.exceptions.custom_exceptions import (
     RuleFormatError,
     VariableMetadataNotFoundError,
     FailedSchemaValidation,
+    TaskBudgetExceededError,
 )
 from cdisc_rules_engine.interfaces import (
     CacheServiceInterface,
@@ -37,10 +38,14 @@ from cdisc_rules_engine.utilities.data_processor import DataProcessor
 from cdisc_rules_engine.utilities.dataset_preprocessor import DatasetPreprocessor
 from cdisc_rules_engine.utilities.rule_processor import RuleProcessor
 from cdisc_rules_engine.utilities.utils import (
+    get_corresponding_datasets,
     is_split_dataset,
     serialize_rule,
 )
 from cdisc_rules_engine.dataset_builders import builder_factory
+from cdisc_rules_engine.dataset_builders.contents_dataset_builder import (
+    ContentsDatasetBuilder,
+)
 
 
 class RulesEngine:
@@ -57,6 +62,7 @@ class RulesEngine:
         self.library_metadata = kwargs.get("library_metadata")
         self.max_dataset_size = kwargs.get("max_dataset_size")
         self.dataset_paths = kwargs.get("dataset_paths")
+        self.categorical_threshold = kwargs.get("categorical_threshold")
         self.cache = cache or CacheServiceFactory(self.config).get_cache_service()
         data_service_factory = DataServiceFactory(
             self.config,
@@ -65,6 +71,7 @@ class RulesEngine:
             self.standard_version,
             self.library_metadata,
             self.max_dataset_size,
+            self.categorical_threshold,
         )
         self.dataset_implementation = data_service_factory.get_dataset_implementation()
         kwargs["dataset_implementation"] = self.dataset_implementation
@@ -72,7 +79,10 @@ class RulesEngine:
             self.dataset_paths
         )
         self.rule_processor = RuleProcessor(
-            self.data_service, self.cache, self.library_metadata
+            self.data_service,
+            self.cache,
+            self.library_metadata,
+            kwargs.get("operation_result_store"),
         )
         self.data_processor = DataProcessor(self.data_service, self.cache)
         self.standard = kwargs.get("standard")
@@ -85,6 +95,7 @@ class RulesEngine:
         self.medrt_path: str = kwargs.get("medrt_path")
         self.define_xml_path: str = kwargs.get("define_xml_path")
         self.validate_xml: bool = kwargs.get("validate_xml")
+        self.column_projection: bool = kwargs.get("column_projection", False)
 
     def get_schema(self):
         return export_rule_data(DatasetVariable, COREActions)
@@ -140,6 +151,17 @@ class RulesEngine:
                 output[rule.get("core_id")] = result
         return output
 
+    @staticmethod
+    def get_skipped_result(dataset_domain: str) -> List[dict]:
+        """
+        Returns the result of a rule that is not applicable to the domain.
+        """
+        error_obj: ValidationErrorContainer = ValidationErrorContainer(
+            status=ExecutionStatus.SKIPPED.value
+        )
+        error_obj.domain = dataset_domain
+        return [error_obj.to_representation()]
+
     def validate_single_rule(
         self,
         rule: dict,
@@ -183,11 +205,7 @@ class RulesEngine:
                     ]
             else:
                 logger.info(f"Skipped domain {dataset_domain}.")
-                error_obj: ValidationErrorContainer = ValidationErrorContainer(
-                    status=ExecutionStatus.SKIPPED.value
-                )
-                error_obj.domain = dataset_domain
-                return [error_obj.to_representation()]
+                return self.get_skipped_result(dataset_domain)
         except Exception as e:
             logger.trace(e, __name__)
             logger.error(
@@ -234,7 +252,21 @@ class RulesEngine:
         """
         kwargs = {}
         builder = self.get_dataset_builder(rule, dataset_path, datasets, domain)
-        dataset = builder.get_dataset()
+        columns = (
+            self.rule_processor.get_rule_columns(rule, domain)
+            if self.column_projection
+            else None
+        )
+        dataset = (
+            builder.get_dataset(columns=columns) if columns else builder.get_dataset()
+        )
+        if type(builder) is ContentsDatasetBuilder:
+            # the dataset holds the contents of the files
+            kwargs["dataset_files"] = [dataset_path] + [
+                item.get("original_path") or item.get("full_path")
+                for item in get_corresponding_datasets(datasets, domain)
+                if item.get("original_path") or item.get("full_path")
+            ]
         # Update rule for certain rule types
         # SPECIAL CASES FOR RULE TYPES ###############################
         # TODO: Handle these special cases better.
@@ -305,6 +337,7 @@ class RulesEngine:
         variable_codelist_map: dict = None,
         codelist_term_maps: list = None,
         ct_packages: list = None,
+        dataset_files: List[str] = None,
     ) -> List[str]:
         """
         Executes the given rule on a given dataset.
@@ -342,6 +375,7 @@ class RulesEngine:
             loinc_path=self.loinc_path,
             medrt_path=self.medrt_path,
             ct_packages=ct_packages,
+            dataset_files=dataset_files,
         )
         relationship_data = {}
         if domain is not None and self.rule_processor.is_relationship_dataset(domain):
@@ -414,6 +448,13 @@ class RulesEngine:
                 message=exception.message,
             )
             message = "rule execution error"
+        elif isinstance(exception, TaskBudgetExceededError):
+            error_obj = FailedValidationEntity(
+                dataset=os.path.basename(dataset_path),
+                error=TaskBudgetExceededError.description,
+                message=exception.message,
+            )
+            message = "rule execution error"
         elif isinstance(exception, AssertionError):
             error_obj = FailedValidationEntity(
                 dataset=os.path.basename(dataset_path),
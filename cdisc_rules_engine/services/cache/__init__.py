@@ -1,9 +1,17 @@
 from .cache_service_factory import CacheServiceFactory
 from .in_memory_cache_service import InMemoryCacheService
 from .redis_cache_service import RedisCacheService
+from .shared_memory_cache_service import SharedMemoryCacheService
+from .size_estimator import SizeEstimator
+from .task_local_cache_service import TaskLocalCacheService
+from .tiered_cache_service import TieredCacheService
 
 __all__ = [
     "CacheServiceFactory",
     "InMemoryCacheService",
     "RedisCacheService",
+    "SharedMemoryCacheService",
+    "SizeEstimator",
+    "TaskLocalCacheService",
+    "TieredCacheService",
 ]
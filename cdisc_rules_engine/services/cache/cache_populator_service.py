@@ -60,13 +60,25 @@ class CachePopulator:
             self.library_service.cache_library_json(LibraryEndpoints.PRODUCTS.value)
             self.library_service.cache_library_json(LibraryEndpoints.RULES.value)
             rules_lists: List[dict] = await self._get_rules_from_cdisc_library()
-            for rules in rules_lists:
-                self.cache.add_batch(
-                    rules.get("rules", []), "core_id", prefix=rules.get("key_prefix")
+            # items that are not needed later are written to cache
+            # while the next library resources are downloaded
+            pending_writes: List[asyncio.Future] = [
+                asyncio.ensure_future(
+                    self.cache.async_add_batch(
+                        rules.get("rules", []),
+                        "core_id",
+                        prefix=rules.get("key_prefix"),
+                    )
                 )
+                for rules in rules_lists
+            ]
             # save codelists to cache as a map of codelist to terms
             codelist_term_maps = await self._get_codelist_term_maps()
-            self.cache.add_batch(codelist_term_maps, "package")
+            pending_writes.append(
+                asyncio.ensure_future(
+                    self.cache.async_add_batch(codelist_term_maps, "package")
+                )
+            )
 
             # Add a list of all published ct packages to the cache
             available_packages = [
@@ -74,7 +86,7 @@ class CachePopulator:
                 for package in codelist_term_maps
                 if "package" in package
             ]
-            self.cache.add(PUBLISHED_CT_PACKAGES, available_packages)
+            await self.cache.async_add(PUBLISHED_CT_PACKAGES, available_packages)
 
             # save standard codelists to cache as a map of variable to allowed_values
             standards = self.library_service.get_all_tabulation_ig_standards()
@@ -82,25 +94,36 @@ class CachePopulator:
             standards.extend(self.library_service.get_all_analysis_ig_standards())
 
             variable_codelist_maps = await self._get_variable_codelist_maps(standards)
-            self.cache.add_batch(variable_codelist_maps, "name")
+            pending_writes.append(
+                asyncio.ensure_future(
+                    self.cache.async_add_batch(variable_codelist_maps, "name")
+                )
+            )
 
             # save details of all standards to cache
             standards_details: List[
                 dict
             ] = await self._async_get_details_of_all_standards(standards)
-            self.cache.add_batch(standards_details, "cache_key", pop_cache_key=True)
+            await self.cache.async_add_batch(
+                standards_details, "cache_key", pop_cache_key=True
+            )
 
             # save details of all standard's models to cache
             standards_models: Iterable[
                 dict
             ] = await self._async_get_details_of_all_standards_models(standards_details)
-            self.cache.add_batch(standards_models, "cache_key", pop_cache_key=True)
+            await self.cache.async_add_batch(
+                standards_models, "cache_key", pop_cache_key=True
+            )
 
             # save variables metadata to cache
             variables_metadata: Iterable[dict] = await self._get_variables_metadata(
                 standards
             )
-            self.cache.add_batch(variables_metadata, "cache_key", pop_cache_key=True)
+            await self.cache.async_add_batch(
+                variables_metadata, "cache_key", pop_cache_key=True
+            )
+            await asyncio.gather(*pending_writes)
         else:
             raise ValueError(
                 "Must Specify either local_rules_path and local_rules_id, remove_local_rules, or neither"
@@ -136,35 +159,41 @@ class CachePopulator:
             self._async_get_codelist_terms_map(package) for package in packages
         ]
         codelist_term_maps = await asyncio.gather(*coroutines)
-        self.cache.add_batch(codelist_term_maps, "package")
+        await self.cache.async_add_batch(codelist_term_maps, "package")
 
     async def load_available_ct_packages(self):
         packages = self.library_service.get_all_ct_packages()
         available_packages = [
             package.get("href", "").split("/")[-1] for package in packages
         ]
-        self.cache.add(PUBLISHED_CT_PACKAGES, available_packages)
+        await self.cache.async_add(PUBLISHED_CT_PACKAGES, available_packages)
 
     async def load_standard(self, standard: str, version: str):
         standards = [{"href": f"/mdr/{standard}/{version}"}]
         variable_codelist_maps = await self._get_variable_codelist_maps(standards)
-        self.cache.add_batch(variable_codelist_maps, "name")
+        await self.cache.async_add_batch(variable_codelist_maps, "name")
         # save details of all standards to cache
         standards_details: List[dict] = await self._async_get_details_of_all_standards(
             standards
         )
-        self.cache.add_batch(standards_details, "cache_key", pop_cache_key=True)
+        await self.cache.async_add_batch(
+            standards_details, "cache_key", pop_cache_key=True
+        )
 
         # save details of all standard's models to cache
         standards_models: Iterable[
             dict
         ] = await self._async_get_details_of_all_standards_models(standards_details)
-        self.cache.add_batch(standards_models, "cache_key", pop_cache_key=True)
+        await self.cache.async_add_batch(
+            standards_models, "cache_key", pop_cache_key=True
+        )
         # save variables metadata to cache
         variables_metadata: Iterable[dict] = await self._get_variables_metadata(
             standards
         )
-        self.cache.add_batch(variables_metadata, "cache_key", pop_cache_key=True)
+        await self.cache.async_add_batch(
+            variables_metadata, "cache_key", pop_cache_key=True
+        )
 
     def remove_specified_rules(self, cache):
         pickle_file = os.path.join(cache, "local_rules.pkl")
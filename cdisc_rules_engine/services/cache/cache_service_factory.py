@@ -4,12 +4,14 @@ from cdisc_rules_engine.interfaces import CacheServiceInterface, FactoryInterfac
 
 from .in_memory_cache_service import InMemoryCacheService
 from .redis_cache_service import RedisCacheService
+from .shared_memory_cache_service import SharedMemoryCacheService
 
 
 class CacheServiceFactory(FactoryInterface):
     _registered_services_map = {
         "redis": RedisCacheService,
         "in_memory": InMemoryCacheService,
+        "shared_memory": SharedMemoryCacheService,
     }
 
     def __init__(self, config):
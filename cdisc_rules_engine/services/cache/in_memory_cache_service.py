@@ -1,22 +1,74 @@
 import re
-from typing import List
-from pympler import asizeof
+import time
+from typing import Callable, List, Optional
 from cdisc_rules_engine.interfaces import (
     CacheServiceInterface,
 )
-from cdisc_rules_engine.models.dataset import DatasetInterface
+from cdisc_rules_engine.services.cache.key_index import KeyIndex
+from cdisc_rules_engine.services.cache.size_estimator import SizeEstimator
+from cdisc_rules_engine.utilities.cache_stats import DATASET_NAMESPACE
 from cachetools import LRUCache
 import psutil
 
 
-def get_data_size(dataset):
-    if isinstance(dataset, DatasetInterface):
-        return dataset.size
-    else:
-        return asizeof.asizeof(dataset)
+class SizedLRUCache(LRUCache):
+    """
+    LRUCache whose items can be added with a known size,
+    so the size of an item is not estimated again.
+    Keys are indexed for lookups by prefix.
+    on_evict is called with the key and size of each evicted item.
+    """
+
+    def __init__(
+        self,
+        maxsize,
+        getsizeof: Callable[[object], int],
+        on_evict: Optional[Callable[[object, int], None]] = None,
+    ):
+        super().__init__(maxsize, getsizeof=self._get_item_size)
+        self._estimate_size = getsizeof
+        self._on_evict = on_evict
+        # sizes of the items being added, by item id
+        self._item_sizes = {}
+        self._key_index = KeyIndex()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._key_index.add(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._key_index.remove(key)
+
+    def popitem(self):
+        size = self.currsize
+        key, value = super().popitem()
+        if self._on_evict:
+            self._on_evict(key, size - self.currsize)
+        return key, value
+
+    def keys_with_prefix(self, prefix: str) -> List[str]:
+        return self._key_index.keys_with_prefix(prefix)
+
+    def _get_item_size(self, value) -> int:
+        size = self._item_sizes.get(id(value))
+        return self._estimate_size(value) if size is None else size
+
+    def add(self, key, value, size: int):
+        self._item_sizes[id(value)] = size
+        try:
+            self[key] = value
+        finally:
+            self._item_sizes.pop(id(value), None)
 
 
 class InMemoryCacheService(CacheServiceInterface):
+    """
+    Keeps cache items in LRU caches bounded by memory size.
+    Item sizes are estimated by a SizeEstimator,
+    producers that know the size of an item can pass it to add.
+    """
+
     _instance = None
 
     @classmethod
@@ -25,24 +77,54 @@ class InMemoryCacheService(CacheServiceInterface):
             cls._instance = cls(**kwargs)
         return cls._instance
 
-    def __init__(self, max_size=None, **kwargs):
+    def __init__(self, max_size=None, size_estimator: SizeEstimator = None, **kwargs):
         self.max_size = max_size or psutil.virtual_memory().available * 0.25
-        self.cache = LRUCache(maxsize=self.max_size, getsizeof=asizeof.asizeof)
+        self.size_estimator = size_estimator or SizeEstimator()
+        self.cache = self._create_cache()
         self.max_dataset_cache_size = psutil.virtual_memory().available * 0.5
-        self.dataset_cache = LRUCache(
-            maxsize=self.max_dataset_cache_size, getsizeof=get_data_size
+        self.dataset_cache = SizedLRUCache(
+            maxsize=self.max_dataset_cache_size,
+            getsizeof=self.size_estimator,
+            on_evict=self._record_dataset_eviction,
+        )
+
+    def _create_cache(self) -> SizedLRUCache:
+        return SizedLRUCache(
+            maxsize=self.max_size,
+            getsizeof=self.size_estimator,
+            on_evict=self._record_eviction,
         )
 
-    def add(self, cache_key, data):
-        if get_data_size(data) > self.max_size:
+    def _record_eviction(self, cache_key, size: int):
+        self.stats.record_eviction(cache_key, size)
+
+    def _record_dataset_eviction(self, cache_key, size: int):
+        self.stats.record_eviction(cache_key, size, DATASET_NAMESPACE)
+
+    def add(self, cache_key, data, size: int = None):
+        start = time.perf_counter()
+        if size is None:
+            size = self.size_estimator(data)
+        if size > self.max_size:
             return
-        self.cache[cache_key] = data
+        self.cache.add(cache_key, data, size)
+        self.stats.record_add(cache_key, size, time.perf_counter() - start)
 
     def add_dataset(self, cache_key, data):
-        self.dataset_cache[cache_key] = data
+        start = time.perf_counter()
+        size = self.size_estimator(data)
+        self.dataset_cache.add(cache_key, data, size)
+        self.stats.record_add(
+            cache_key, size, time.perf_counter() - start, DATASET_NAMESPACE
+        )
 
     def get_dataset(self, cache_key):
-        return self.dataset_cache.get(cache_key, None)
+        start = time.perf_counter()
+        data = self.dataset_cache.get(cache_key, None)
+        self.stats.record_get(
+            cache_key, data is not None, time.perf_counter() - start, DATASET_NAMESPACE
+        )
+        return data
 
     def add_batch(
         self,
@@ -58,27 +140,29 @@ class InMemoryCacheService(CacheServiceInterface):
             self.add(prefix + cache_key, item)
 
     def get(self, cache_key):
-        return self.cache.get(cache_key, None)
+        start = time.perf_counter()
+        data = self.cache.get(cache_key, None)
+        self.stats.record_get(cache_key, data is not None, time.perf_counter() - start)
+        return data
 
     def get_all(self, cache_keys: List[str]):
-        return [self.cache.get(key) for key in cache_keys]
+        start = time.perf_counter()
+        values = [self.cache.get(key) for key in cache_keys]
+        self.stats.record_get_all(cache_keys, values, time.perf_counter() - start)
+        return values
 
     def get_all_by_prefix(self, prefix):
-        items = []
-        for key in self.cache:
-            if key.startswith(prefix):
-                items.append(self.cache[key])
-        return items
+        return [self.cache[key] for key in self.cache.keys_with_prefix(prefix)]
 
     def dataset_keys(self):
         return self.dataset_cache.keys()
 
     def filter_cache(self, prefix: str) -> dict:
-        return {k: self.cache[k] for k in self.cache.keys() if k.startswith(prefix)}
+        return {key: self.cache[key] for key in self.cache.keys_with_prefix(prefix)}
 
     def get_by_regex(self, regex: str) -> dict:
-        regex = regex.replace("*", ".*")
-        return {k: self.cache[k] for k in self.cache.keys() if re.search(regex, k)}
+        pattern = re.compile(regex.replace("*", ".*"))
+        return {k: self.cache[k] for k in self.cache.keys() if pattern.search(k)}
 
     def exists(self, cache_key):
         return cache_key in self.cache
@@ -88,13 +172,10 @@ class InMemoryCacheService(CacheServiceInterface):
 
     def clear_all(self, prefix: str = None):
         if prefix:
-            keys_to_remove = [
-                key for key in self.cache.keys() if key.startswith(prefix)
-            ]
-            for key in keys_to_remove:
+            for key in self.cache.keys_with_prefix(prefix):
                 self.clear(key)
         else:
-            self.cache = LRUCache(maxsize=self.max_size, getsizeof=asizeof.asizeof)
+            self.cache = self._create_cache()
 
     def add_all(self, data: dict):
         for key, val in data.items():
@@ -0,0 +1,55 @@
+import heapq
+from bisect import bisect_left
+from typing import Hashable, List, Set
+
+
+class KeyIndex:
+    """
+    Sorted index of string cache keys for lookups by prefix.
+
+    Keys added or removed since the last lookup are merged into
+    the sorted key list when the next lookup is made, so bulk
+    cache population does not pay for keeping the list sorted.
+    A lookup takes O(log n + matches) once the list is merged.
+    Keys that are not strings are not indexed.
+    """
+
+    def __init__(self):
+        self._keys: List[str] = []
+        self._added: Set[str] = set()
+        self._removed: Set[str] = set()
+
+    def add(self, key: Hashable):
+        if isinstance(key, str):
+            self._removed.discard(key)
+            self._added.add(key)
+
+    def remove(self, key: Hashable):
+        if isinstance(key, str):
+            self._added.discard(key)
+            self._removed.add(key)
+
+    def clear(self):
+        self._keys = []
+        self._added = set()
+        self._removed = set()
+
+    def keys_with_prefix(self, prefix: str) -> List[str]:
+        self._merge()
+        keys = []
+        for position in range(bisect_left(self._keys, prefix), len(self._keys)):
+            key: str = self._keys[position]
+            if not key.startswith(prefix):
+                break
+            keys.append(key)
+        return keys
+
+    def _merge(self):
+        if self._removed:
+            self._keys = [key for key in self._keys if key not in self._removed]
+            self._removed = set()
+        if self._added:
+            # keys added again after their removal are already in the list
+            new_keys = sorted(self._added.difference(self._keys))
+            self._keys = list(heapq.merge(self._keys, new_keys))
+            self._added = set()
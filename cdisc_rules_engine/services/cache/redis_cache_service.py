@@ -1,16 +1,80 @@
+import asyncio
 import pickle
-from typing import List
+import secrets
+import time
+from functools import partial
+from typing import List, Optional
 
+import pandas as pd
+import pyarrow as pa
 import redis
 
+from cdisc_rules_engine.models.dataset import ArrowDataset, PandasDataset
 from cdisc_rules_engine.services import logger
+from cdisc_rules_engine.services.cache.serializers import (
+    PickleSerializer,
+    get_serializer,
+)
+from cdisc_rules_engine.utilities.cache_stats import DATASET_NAMESPACE
 from cdisc_rules_engine.interfaces import (
     CacheServiceInterface,
     ConfigInterface,
 )
 
+# datasets are kept apart from other cache items, their headers describe
+# how the dataset is encoded and which chunk keys hold the encoded bytes
+DATASET_KEY_PREFIX = "dataset:"
+DATASET_CHUNK_KEY_PREFIX = "dataset_chunk:"
+# codecs supported by Arrow IPC files
+DATASET_COMPRESSION_CODECS = ("lz4", "zstd")
+DEFAULT_DATASET_COMPRESSION = "lz4"
+DEFAULT_DATASET_CHUNK_SIZE = 32 * 1024 * 1024
+# keys of cache items are listed in sets by namespace for lookups by prefix
+KEY_INDEX_PREFIX = "key_index:"
+# marks index sets that hold all keys of their namespace
+KEY_INDEX_COMPLETE_PREFIX = "key_index_complete:"
+# seconds after which an index set is completed again with a scan,
+# so that keys written without the index are found
+KEY_INDEX_SCAN_INTERVAL = 3600
+INTERNAL_KEY_PREFIXES = tuple(
+    prefix.encode("utf-8")
+    for prefix in (
+        DATASET_KEY_PREFIX,
+        DATASET_CHUNK_KEY_PREFIX,
+        KEY_INDEX_PREFIX,
+        KEY_INDEX_COMPLETE_PREFIX,
+    )
+)
+# number of keys read or deleted by one request
+KEY_BATCH_SIZE = 1000
+
 
 class RedisCacheService(CacheServiceInterface):
+    """
+    Cache service that keeps items in Redis.
+
+    Datasets are stored as Arrow IPC files, so each of them is decoded
+    once and shared by all engine hosts pointed at the same Redis.
+    IPC buffers are compressed with the codec set in
+    REDIS_DATASET_COMPRESSION (lz4 by default, "none" turns it off)
+    and split into values of REDIS_DATASET_CHUNK_SIZE bytes.
+    Dataframes that cannot be converted to Arrow unchanged
+    and other cached contents are pickled.
+
+    Other cache items are converted to bytes by the serializer,
+    set in REDIS_SERIALIZER (pickle by default, or pickle_lz4, pickle_zstd).
+    Connections are taken from a pool of REDIS_MAX_CONNECTIONS
+    connections per process, reads and writes of many items
+    are sent in pipelines of KEY_BATCH_SIZE commands.
+    Async methods run the requests in a thread,
+    so they do not block the event loop.
+    Keys are listed in index sets by namespace for lookups by prefix.
+    An index set is completed with a scan when it is first used
+    and every KEY_INDEX_SCAN_INTERVAL seconds.
+    Stats count the requests of this process,
+    keys evicted by the Redis server are not counted.
+    """
+
     _instance = None
 
     @classmethod
@@ -21,18 +85,175 @@ class RedisCacheService(CacheServiceInterface):
                 access_key=config.getValue("REDIS_ACCESS_KEY"),
                 port=config.getValue("REDIS_PORT", 6380),
                 ssl=kwargs.get("ssl", True),
+                dataset_compression=config.getValue("REDIS_DATASET_COMPRESSION")
+                or DEFAULT_DATASET_COMPRESSION,
+                dataset_chunk_size=int(
+                    config.getValue("REDIS_DATASET_CHUNK_SIZE")
+                    or DEFAULT_DATASET_CHUNK_SIZE
+                ),
+                max_connections=int(config.getValue("REDIS_MAX_CONNECTIONS") or 0)
+                or None,
+                serializer=get_serializer(
+                    config.getValue("REDIS_SERIALIZER") or "pickle"
+                ),
             )
             cls._instance = instance
         return cls._instance
 
-    def __init__(self, host_name: str, access_key: str, port: int, ssl: bool):
+    def __init__(
+        self,
+        host_name: str,
+        access_key: str,
+        port: int,
+        ssl: bool,
+        dataset_compression: Optional[str] = DEFAULT_DATASET_COMPRESSION,
+        dataset_chunk_size: int = DEFAULT_DATASET_CHUNK_SIZE,
+        max_connections: Optional[int] = None,
+        serializer: PickleSerializer = None,
+    ):
         self.client = redis.Redis(
-            host=host_name, port=port, db=0, password=access_key, ssl=ssl
+            host=host_name,
+            port=port,
+            db=0,
+            password=access_key,
+            ssl=ssl,
+            max_connections=max_connections,
+        )
+        self.serializer = serializer or PickleSerializer()
+        if dataset_compression and dataset_compression.lower() != "none":
+            if dataset_compression.lower() not in DATASET_COMPRESSION_CODECS:
+                raise ValueError(
+                    f"Dataset compression must be in {DATASET_COMPRESSION_CODECS}"
+                    f" or none, given dataset compression is {dataset_compression}"
+                )
+            self.dataset_compression: Optional[str] = dataset_compression.lower()
+        else:
+            self.dataset_compression: Optional[str] = None
+        if dataset_chunk_size <= 0:
+            raise ValueError("Dataset chunk size must be positive")
+        self.dataset_chunk_size = dataset_chunk_size
+
+    def add_dataset(self, cache_key, data):
+        start = time.perf_counter()
+        header, payload = self._encode_dataset(data)
+        chunk_key = f"{DATASET_CHUNK_KEY_PREFIX}{cache_key}:{secrets.token_hex(4)}"
+        header["chunk_key"] = chunk_key
+        header["chunks"] = 0
+        with self.client.pipeline() as pipe:
+            for offset in range(0, len(payload), self.dataset_chunk_size):
+                pipe.set(
+                    f"{chunk_key}:{header['chunks']}",
+                    payload[offset : offset + self.dataset_chunk_size],
+                )
+                header["chunks"] += 1
+            # the header is written after its chunks, readers do not see
+            # a dataset until all of it is stored. The replaced header
+            # is returned by the same command, so chunks of a dataset
+            # added by another host in the meantime are deleted too
+            pipe.set(f"{DATASET_KEY_PREFIX}{cache_key}", pickle.dumps(header), get=True)
+            previous_header: Optional[bytes] = pipe.execute()[-1]
+        if previous_header:
+            self._delete_dataset_chunks(pickle.loads(previous_header))
+        self.stats.record_add(
+            cache_key, len(payload), time.perf_counter() - start, DATASET_NAMESPACE
+        )
+        logger.info(
+            f"Added dataset to Redis cache. cache_key={cache_key}, "
+            f"format={header['format']}, size={len(payload)}, "
+            f"chunks={header['chunks']}"
         )
 
-    def add(self, cache_key, data):
-        data = pickle.dumps(data)
-        return self.client.set(cache_key, data)
+    def get_dataset(self, cache_key):
+        start = time.perf_counter()
+        data = self._read_dataset(cache_key)
+        self.stats.record_get(
+            cache_key, data is not None, time.perf_counter() - start, DATASET_NAMESPACE
+        )
+        return data
+
+    def _read_dataset(self, cache_key):
+        header: Optional[dict] = self._get_dataset_header(cache_key)
+        if header is None:
+            return None
+        chunks: list = (
+            self.client.mget(
+                [f"{header['chunk_key']}:{index}" for index in range(header["chunks"])]
+            )
+            if header["chunks"]
+            else []
+        )
+        if any(chunk is None for chunk in chunks):
+            # the dataset was replaced by another host in the meantime
+            return None
+        return self._decode_dataset(header, b"".join(chunks))
+
+    def dataset_keys(self):
+        return [
+            key.decode("utf-8")[len(DATASET_KEY_PREFIX) :]
+            for key in self.client.scan_iter(match=f"{DATASET_KEY_PREFIX}*")
+        ]
+
+    def _get_dataset_header(self, cache_key) -> Optional[dict]:
+        header = self.client.get(f"{DATASET_KEY_PREFIX}{cache_key}")
+        return pickle.loads(header) if header else None
+
+    def _delete_dataset_chunks(self, header: dict):
+        if header["chunks"]:
+            self.client.delete(
+                *[f"{header['chunk_key']}:{index}" for index in range(header["chunks"])]
+            )
+
+    def _encode_dataset(self, data):
+        """
+        Returns the header and encoded bytes of the dataset.
+        """
+        table: Optional[pa.Table] = None
+        if isinstance(data, ArrowDataset) and data.table is not None:
+            table, data_format = data.table, "arrow"
+        elif isinstance(data, PandasDataset) and isinstance(data.data, pd.DataFrame):
+            table, data_format = ArrowDataset.from_pandas(data.data).table, "pandas"
+        if table is not None:
+            sink = pa.BufferOutputStream()
+            options = pa.ipc.IpcWriteOptions(compression=self.dataset_compression)
+            with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+            return {"format": data_format}, memoryview(sink.getvalue())
+        payload: bytes = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        header = {"format": "pickle", "size": len(payload), "compression": None}
+        if self.dataset_compression:
+            header["compression"] = self.dataset_compression
+            payload = pa.compress(payload, self.dataset_compression, asbytes=True)
+        return header, memoryview(payload)
+
+    @staticmethod
+    def _decode_dataset(header: dict, payload: bytes):
+        if header["format"] == "arrow":
+            return ArrowDataset.from_ipc(payload)
+        if header["format"] == "pandas":
+            return PandasDataset(ArrowDataset.from_ipc(payload).data)
+        if header["compression"]:
+            payload = pa.decompress(
+                payload,
+                decompressed_size=header["size"],
+                codec=header["compression"],
+                asbytes=True,
+            )
+        return pickle.loads(payload)
+
+    def add(self, cache_key, data, size: int = None):
+        start = time.perf_counter()
+        data = self.serializer.dumps(data)
+        with self.client.pipeline() as pipe:
+            pipe.set(cache_key, data)
+            self._index_key(pipe, cache_key)
+            response = pipe.execute()[0]
+        self.stats.record_add(cache_key, len(data), time.perf_counter() - start)
+        return response
+
+    async def async_add(self, cache_key, data, size: int = None):
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(self.add, cache_key, data, size)
+        )
 
     def add_batch(
         self,
@@ -45,63 +266,220 @@ class RedisCacheService(CacheServiceInterface):
             f"Saving batch to Redis cache. items={items},"
             f" cache_key_name={cache_key_name}"
         )
-        with self.client.pipeline() as pipe:
-            for item in items:
-                cache_key: str = item.get(cache_key_name)
-                if cache_key:
-                    if pop_cache_key:
-                        item.pop(cache_key_name)
-                    pipe.set(prefix + cache_key, pickle.dumps(item))
-                else:
-                    logger.error(
-                        f"Unable to save item: {item}. Missing key: {cache_key_name}"
-                    )
-            response: list = pipe.execute()
+        values = {}
+        for item in items:
+            cache_key: str = item.get(cache_key_name)
+            if cache_key:
+                if pop_cache_key:
+                    item.pop(cache_key_name)
+                values[prefix + cache_key] = item
+            else:
+                logger.error(
+                    f"Unable to save item: {item}. Missing key: {cache_key_name}"
+                )
+        response: list = self._set_values(values)
         logger.info(
             f"Successfully saved batch to Redis cache. Redis response = {response}"
         )
 
+    async def async_add_batch(
+        self,
+        items: List[dict],
+        cache_key_name: str,
+        pop_cache_key: bool = False,
+        prefix: str = "",
+    ):
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(
+                self.add_batch,
+                items,
+                cache_key_name,
+                pop_cache_key=pop_cache_key,
+                prefix=prefix,
+            ),
+        )
+
     def get(self, cache_key):
+        start = time.perf_counter()
         cached_data = self.client.get(cache_key)
-        if cached_data:
-            return pickle.loads(cached_data)
-        else:
-            return None
+        data = self.serializer.loads(cached_data) if cached_data else None
+        self.stats.record_get(cache_key, data is not None, time.perf_counter() - start)
+        return data
 
     def get_all(self, cache_keys: List[str]):
-        return [
-            pickle.loads(cached_data) for cached_data in self.client.mget(cache_keys)
-        ]
+        """
+        Returns the values of the keys in the given order,
+        None for keys that do not exist.
+        """
+        values = []
+        for offset in range(0, len(cache_keys), KEY_BATCH_SIZE):
+            start = time.perf_counter()
+            batch: List[str] = cache_keys[offset : offset + KEY_BATCH_SIZE]
+            batch_values = [
+                None if cached_data is None else self.serializer.loads(cached_data)
+                for cached_data in self.client.mget(batch)
+            ]
+            self.stats.record_get_all(batch, batch_values, time.perf_counter() - start)
+            values.extend(batch_values)
+        return values
+
+    async def async_get_all(self, cache_keys: List[str]):
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.get_all, cache_keys
+        )
 
     def get_all_by_prefix(self, prefix):
-        keys = [key for key in self.client.scan_iter(match=f"{prefix}*")]
-        return self.get_all(keys)
+        return list(self._get_values(self._get_keys(prefix)).values())
 
     def exists(self, cache_key):
         return self.client.exists(cache_key)
 
     def clear(self, cache_key):
-        return self.client.delete(cache_key)
+        return self._unlink([cache_key])
 
     def clear_all(self, prefix: str = None):
-        if prefix:
-            prefix = f"{prefix}*"
         logger.info(f"Deleting all items with prefix = {prefix}")
-        for key in self.client.scan_iter(prefix):
-            self.client.delete(key)
+        if prefix:
+            return self._unlink(self._get_keys(prefix))
+        return self._unlink(list(self.client.scan_iter(count=KEY_BATCH_SIZE)))
 
     def filter_cache(self, prefix: str) -> dict:
-        keys = [
-            key.decode("utf-8") for key in self.client.scan_iter(match=f"{prefix}*")
-        ]
-        key_value_pairs = zip(keys, self.client.mget(keys))
-        return {key: pickle.loads(value) for key, value in key_value_pairs}
+        return {
+            key.decode("utf-8"): value
+            for key, value in self._get_values(self._get_keys(prefix)).items()
+        }
 
     def get_by_regex(self, regex: str) -> dict:
-        keys = [key for key in self.client.scan_iter(match=f"{regex}")]
-        key_value_pairs = zip(keys, self.client.mget(keys))
-        return {key: pickle.loads(value) for key, value in key_value_pairs}
+        keys = [
+            key
+            for key in self.client.scan_iter(match=f"{regex}", count=KEY_BATCH_SIZE)
+            if not key.startswith(INTERNAL_KEY_PREFIXES)
+        ]
+        return self._get_values(keys)
 
     def add_all(self, data: dict):
-        for key, val in data.items():
-            self.add(key, val)
+        self._set_values(data)
+
+    def _set_values(self, values: dict) -> list:
+        """
+        Writes the values in pipelines of KEY_BATCH_SIZE keys.
+        Returns responses to the SET commands.
+        """
+        response = []
+        items = list(values.items())
+        for offset in range(0, len(items), KEY_BATCH_SIZE):
+            start = time.perf_counter()
+            sizes = {}
+            with self.client.pipeline() as pipe:
+                for key, value in items[offset : offset + KEY_BATCH_SIZE]:
+                    data: bytes = self.serializer.dumps(value)
+                    sizes[key] = len(data)
+                    pipe.set(key, data)
+                    self._index_key(pipe, key)
+                response.extend(
+                    result for result in pipe.execute() if isinstance(result, bool)
+                )
+            seconds: float = time.perf_counter() - start
+            for key, size in sizes.items():
+                self.stats.record_add(key, size, seconds)
+        return response
+
+    @staticmethod
+    def _get_namespace(cache_key) -> Optional[str]:
+        """
+        Returns the part of the key up to its first "/",
+        keys with the same namespace are listed in one index set.
+        """
+        if isinstance(cache_key, bytes):
+            cache_key = cache_key.decode("utf-8")
+        position: int = cache_key.find("/")
+        return cache_key[: position + 1] if position >= 0 else None
+
+    def _index_key(self, pipe, cache_key):
+        namespace: Optional[str] = self._get_namespace(cache_key)
+        if namespace:
+            pipe.sadd(f"{KEY_INDEX_PREFIX}{namespace}", cache_key)
+
+    def _get_keys(self, prefix: str) -> List[bytes]:
+        """
+        Returns the keys that start with the prefix. Keys are read
+        from the index set of the prefix namespace,
+        keys without a namespace are found by scanning the key space.
+        """
+        namespace: Optional[str] = self._get_namespace(prefix)
+        if not namespace:
+            return self._scan_keys(prefix)
+        index_key = f"{KEY_INDEX_PREFIX}{namespace}"
+        if not self.client.exists(f"{KEY_INDEX_COMPLETE_PREFIX}{namespace}"):
+            self._complete_index(namespace)
+        return sorted(
+            key
+            for key in self.client.smembers(index_key)
+            if key.startswith(prefix.encode("utf-8"))
+        )
+
+    def _scan_keys(self, prefix: str) -> List[bytes]:
+        return [
+            key
+            for key in self.client.scan_iter(match=f"{prefix}*", count=KEY_BATCH_SIZE)
+            if not key.startswith(INTERNAL_KEY_PREFIXES)
+        ]
+
+    def _complete_index(self, namespace: str):
+        """
+        Adds keys of the namespace written without the index,
+        e.g. by previous versions, to its index set with one scan.
+        The index is marked complete for KEY_INDEX_SCAN_INTERVAL seconds.
+        """
+        index_key = f"{KEY_INDEX_PREFIX}{namespace}"
+        keys: List[bytes] = self._scan_keys(namespace)
+        for offset in range(0, len(keys), KEY_BATCH_SIZE):
+            self.client.sadd(index_key, *keys[offset : offset + KEY_BATCH_SIZE])
+        self.client.set(
+            f"{KEY_INDEX_COMPLETE_PREFIX}{namespace}", 1, ex=KEY_INDEX_SCAN_INTERVAL
+        )
+
+    def _get_values(self, keys: List[bytes]) -> dict:
+        """
+        Reads the keys in batches. Keys that no longer exist,
+        e.g. evicted by the server, are skipped and removed
+        from their index sets.
+        """
+        values = {}
+        for offset in range(0, len(keys), KEY_BATCH_SIZE):
+            batch: List[bytes] = keys[offset : offset + KEY_BATCH_SIZE]
+            missing_keys = []
+            for key, value in zip(batch, self.client.mget(batch)):
+                if value is None:
+                    missing_keys.append(key)
+                else:
+                    values[key] = self.serializer.loads(value)
+            if missing_keys:
+                self._remove_from_index(missing_keys)
+        return values
+
+    def _remove_from_index(self, keys: List):
+        with self.client.pipeline() as pipe:
+            for key in keys:
+                namespace: Optional[str] = self._get_namespace(key)
+                if namespace:
+                    pipe.srem(f"{KEY_INDEX_PREFIX}{namespace}", key)
+            pipe.execute()
+
+    def _unlink(self, keys: List) -> int:
+        """
+        Unlinks the keys in batches and removes them from their index sets.
+        Returns the number of removed keys.
+        """
+        removed_keys = 0
+        for offset in range(0, len(keys), KEY_BATCH_SIZE):
+            batch: list = keys[offset : offset + KEY_BATCH_SIZE]
+            with self.client.pipeline() as pipe:
+                pipe.unlink(*batch)
+                for key in batch:
+                    namespace: Optional[str] = self._get_namespace(key)
+                    if namespace:
+                        pipe.srem(f"{KEY_INDEX_PREFIX}{namespace}", key)
+                removed_keys += pipe.execute()[0]
+        return removed_keys
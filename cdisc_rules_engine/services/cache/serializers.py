@@ -0,0 +1,83 @@
+import pickle
+import struct
+from typing import Dict, Optional
+
+import pyarrow as pa
+
+# size of the uncompressed payload written in front of compressed values
+_SIZE_HEADER = struct.Struct("<Q")
+# first byte of compressed values by codec. Pickles start with
+# the PROTO opcode (0x80) or a printable opcode, never with these bytes.
+_CODEC_MARKERS: Dict[str, bytes] = {"lz4": b"\x01", "zstd": b"\x02"}
+_MARKER_CODECS: Dict[bytes, str] = {
+    marker: codec for codec, marker in _CODEC_MARKERS.items()
+}
+
+
+class PickleSerializer:
+    """
+    Converts cache values to bytes and back.
+    Serializers that implement dumps and loads
+    can be passed to cache services instead.
+
+    Values are decoded by their first byte, so values written
+    by any serializer of this module are read by all of them.
+    """
+
+    def __init__(self, protocol: int = pickle.HIGHEST_PROTOCOL):
+        self.protocol = protocol
+
+    def dumps(self, data) -> bytes:
+        return pickle.dumps(data, protocol=self.protocol)
+
+    def loads(self, data: bytes):
+        codec: Optional[str] = _MARKER_CODECS.get(data[:1])
+        if codec is None:
+            return pickle.loads(data)
+        (size,) = _SIZE_HEADER.unpack_from(data, 1)
+        return pickle.loads(
+            pa.decompress(
+                memoryview(data)[1 + _SIZE_HEADER.size :],
+                decompressed_size=size,
+                codec=codec,
+                asbytes=True,
+            )
+        )
+
+
+class CompressedPickleSerializer(PickleSerializer):
+    """
+    Compresses pickled values with an Arrow codec, lz4 or zstd.
+    Large values like CT packages and dictionaries
+    take several times fewer bytes to store and transfer.
+    """
+
+    def __init__(self, codec: str, protocol: int = pickle.HIGHEST_PROTOCOL):
+        super().__init__(protocol)
+        if codec not in _CODEC_MARKERS or not pa.Codec.is_available(codec):
+            raise ValueError(f"Compression codec {codec} is not available")
+        self.codec = codec
+
+    def dumps(self, data) -> bytes:
+        payload: bytes = super().dumps(data)
+        return (
+            _CODEC_MARKERS[self.codec]
+            + _SIZE_HEADER.pack(len(payload))
+            + pa.compress(payload, self.codec, asbytes=True)
+        )
+
+
+SERIALIZERS: Dict[str, PickleSerializer] = {
+    "pickle": PickleSerializer(),
+    "pickle_lz4": CompressedPickleSerializer("lz4"),
+    "pickle_zstd": CompressedPickleSerializer("zstd"),
+}
+
+
+def get_serializer(name: str) -> PickleSerializer:
+    if name.lower() not in SERIALIZERS:
+        raise ValueError(
+            f"Serializer must be in {list(SERIALIZERS.keys())}, "
+            f"given serializer is {name}"
+        )
+    return SERIALIZERS[name.lower()]
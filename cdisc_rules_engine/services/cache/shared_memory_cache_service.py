@@ -0,0 +1,417 @@
+import hashlib
+import pickle
+import secrets
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import psutil
+import pyarrow as pa
+
+from cdisc_rules_engine.interfaces import CacheServiceInterface
+from cdisc_rules_engine.models.dataset import ArrowDataset, PandasDataset
+from cdisc_rules_engine.services import logger
+from cdisc_rules_engine.services.cache.in_memory_cache_service import (
+    InMemoryCacheService,
+)
+from cdisc_rules_engine.utilities.cache_stats import (
+    DATASET_NAMESPACE,
+    merge_cache_stats,
+)
+
+# column buffers are aligned so that numpy views over them are aligned too
+BUFFER_ALIGNMENT = 64
+# numpy dtype kinds that can be viewed directly over a shared memory buffer
+ZERO_COPY_DTYPE_KINDS = "biufcmM"
+# blocks attached by the current process. Dataframes returned from the cache
+# hold views over these blocks, so the handles stay open
+# until the blocks are evicted.
+_attached_blocks: Dict[str, shared_memory.SharedMemory] = {}
+# handles of evicted blocks that are still used by dataframes of this process
+_evicted_blocks: List[shared_memory.SharedMemory] = []
+# object columns decoded by the current process, {block name: {offset: values}}
+_decoded_columns: Dict[str, Dict[int, np.ndarray]] = {}
+
+
+def _open_block(name: str, create: bool = False, size: int = 0):
+    block = shared_memory.SharedMemory(name=name, create=create, size=size)
+    # blocks must outlive the process that created or attached them,
+    # their lifetime is managed by SharedMemoryCacheService.release_shared_memory
+    resource_tracker.unregister(block._name, "shared_memory")
+    return block
+
+
+def _unlink_block(block: shared_memory.SharedMemory):
+    # unlink unregisters the block from the resource tracker
+    resource_tracker.register(block._name, "shared_memory")
+    block.unlink()
+
+
+def _close_block(block: shared_memory.SharedMemory) -> bool:
+    try:
+        block.close()
+    except BufferError:
+        # dataframes returned from the cache still hold views over the block
+        return False
+    return True
+
+
+def _detach_blocks(block_names: Iterable[str]):
+    """
+    Closes handles of the blocks in the current process.
+    Handles that are still used are closed by a later call.
+    """
+    for block_name in list(block_names):
+        block = _attached_blocks.pop(block_name, None)
+        _decoded_columns.pop(block_name, None)
+        if block is not None:
+            _evicted_blocks.append(block)
+    _evicted_blocks[:] = [block for block in _evicted_blocks if not _close_block(block)]
+
+
+def _align(offset: int) -> int:
+    return (offset + BUFFER_ALIGNMENT - 1) // BUFFER_ALIGNMENT * BUFFER_ALIGNMENT
+
+
+class SharedMemoryCacheService(CacheServiceInterface):
+    """
+    Cache service that keeps decoded datasets in OS shared memory.
+
+    Each pandas dataset is written into a single shared memory block
+    as a set of column buffers. Numeric, boolean and datetime columns
+    are attached by every process as read-only numpy views over the block,
+    so reading them does not copy or unpickle anything.
+    Columns that hold python objects cannot be shared by pandas
+    without a copy. Strings are stored in the same block as Arrow arrays,
+    other objects (mixed values, NaN in string columns) are pickled.
+    Each process decodes an object column once and reuses
+    the decoded read-only values for later reads of the dataset.
+
+    The index of stored blocks is shared between processes
+    (usually a SyncManager dict proxy), all other cache items
+    are delegated to the wrapped cache service.
+    Blocks are unlinked by release_shared_memory, which must be called
+    by the process that owns the cache once the validation is complete.
+    Every added dataset gets a new block. Before attaching a block,
+    a process closes its handles of blocks that are no longer indexed,
+    so that the memory of evicted blocks is freed once dataframes
+    of the process no longer use it.
+
+    Datasets backed by an Arrow table are stored as an Arrow IPC file,
+    all their columns are read without copying.
+    Stats count the datasets kept in shared memory,
+    evictions are counted by the process that removes the blocks.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls, **kwargs):
+        if cls._instance is None:
+            cls._instance = cls(InMemoryCacheService.get_instance(), {})
+        return cls._instance
+
+    def __init__(
+        self,
+        cache: CacheServiceInterface,
+        dataset_index,
+        max_dataset_cache_size: float = None,
+    ):
+        self.cache = cache
+        self.dataset_index = dataset_index
+        self.max_dataset_cache_size = (
+            max_dataset_cache_size or psutil.virtual_memory().available * 0.5
+        )
+        # short random token keeps block names of concurrent runs apart
+        self._namespace = secrets.token_hex(4)
+
+    def add_dataset(self, cache_key, data):
+        start = time.perf_counter()
+        if isinstance(data, ArrowDataset) and data.table is not None:
+            buffers, layout = self._encode_table(data)
+        elif isinstance(data, PandasDataset) and isinstance(data.data, pd.DataFrame):
+            buffers, layout = self._encode_dataframe(data.data)
+        else:
+            return self.cache.add_dataset(cache_key, data)
+        block_name = self._get_block_name(cache_key)
+        size = max(layout["nbytes"], 1)
+        if size > self.max_dataset_cache_size:
+            return
+        self._evict(size)
+        block = _open_block(block_name, create=True, size=size)
+        _attached_blocks[block_name] = block
+        for offset, buffer in buffers:
+            block.buf[offset : offset + len(buffer)] = buffer
+        layout["name"] = block_name
+        if self.dataset_index.setdefault(cache_key, layout)["name"] != block_name:
+            # the dataset was added by another process in the meantime
+            _unlink_block(block)
+            _detach_blocks([block_name])
+            return
+        self.stats.record_add(
+            cache_key, size, time.perf_counter() - start, DATASET_NAMESPACE
+        )
+        logger.info(
+            f"Added dataset to shared memory. cache_key={cache_key}, "
+            f"block={block_name}, size={size}"
+        )
+
+    def get_dataset(self, cache_key):
+        start = time.perf_counter()
+        layout: Optional[dict] = self.dataset_index.get(cache_key)
+        if layout is None:
+            data = self.cache.get_dataset(cache_key)
+            self.stats.record_get(
+                cache_key,
+                data is not None,
+                time.perf_counter() - start,
+                DATASET_NAMESPACE,
+            )
+            return data
+        if layout["name"] not in _attached_blocks:
+            self._detach_evicted_blocks()
+        try:
+            block = self._attach(layout["name"])
+        except FileNotFoundError:
+            # the block was evicted by another process
+            self.stats.record_get(
+                cache_key, False, time.perf_counter() - start, DATASET_NAMESPACE
+            )
+            return None
+        if layout.get("format") == "arrow":
+            data = ArrowDataset.from_ipc(block.buf[: layout["nbytes"]])
+        else:
+            data = PandasDataset(self._decode_dataframe(block, layout))
+        self.stats.record_get(
+            cache_key, True, time.perf_counter() - start, DATASET_NAMESPACE
+        )
+        return data
+
+    def dataset_keys(self):
+        return list(self.dataset_index.keys())
+
+    def release_shared_memory(self):
+        """
+        Unlinks all shared memory blocks created for this cache.
+        """
+        for cache_key in list(self.dataset_index.keys()):
+            self._remove_block(cache_key)
+
+    def _get_block_name(self, cache_key: str) -> str:
+        # names are kept short to fit platform limits on shared memory names,
+        # the random suffix keeps handles of an evicted block from being reused
+        # when the dataset is added again
+        key_hash = hashlib.sha1(str(cache_key).encode("utf-8")).hexdigest()[:10]
+        return f"core{self._namespace}{key_hash}{secrets.token_hex(3)}"
+
+    def _attach(self, block_name: str) -> shared_memory.SharedMemory:
+        block = _attached_blocks.get(block_name)
+        if block is None:
+            block = _open_block(block_name)
+            _attached_blocks[block_name] = block
+        return block
+
+    def _detach_evicted_blocks(self):
+        """
+        Closes handles of blocks removed from the index by any process.
+        """
+        indexed_names = {layout["name"] for layout in self.dataset_index.values()}
+        _detach_blocks(
+            block_name
+            for block_name in _attached_blocks
+            if block_name not in indexed_names
+        )
+
+    def _evict(self, required_size: int):
+        """
+        Removes the oldest datasets until the new dataset fits into the cache.
+        """
+        layouts = list(self.dataset_index.items())
+        used_size = sum(layout["nbytes"] for _, layout in layouts)
+        for cache_key, layout in layouts:
+            if used_size + required_size <= self.max_dataset_cache_size:
+                break
+            self._remove_block(cache_key)
+            used_size -= layout["nbytes"]
+            self.stats.record_eviction(cache_key, layout["nbytes"], DATASET_NAMESPACE)
+
+    def _remove_block(self, cache_key: str):
+        layout: Optional[dict] = self.dataset_index.pop(cache_key, None)
+        if layout is None:
+            return
+        try:
+            _unlink_block(self._attach(layout["name"]))
+        except FileNotFoundError:
+            pass
+        _detach_blocks([layout["name"]])
+
+    @staticmethod
+    def _encode_table(dataset: ArrowDataset):
+        sink = pa.BufferOutputStream()
+        dataset.to_ipc(sink)
+        buffer: pa.Buffer = sink.getvalue()
+        buffers = [(0, memoryview(buffer).cast("B"))]
+        return buffers, {"format": "arrow", "nbytes": buffer.size}
+
+    @staticmethod
+    def _encode_dataframe(dataframe: pd.DataFrame):
+        """
+        Converts a dataframe to a list of (offset, buffer) pairs
+        and a layout describing how to read the columns back.
+        """
+        buffers = []
+        columns = []
+        offset = 0
+        for position in range(dataframe.shape[1]):
+            series: pd.Series = dataframe.iloc[:, position]
+            values = series.values
+            if isinstance(values, np.ndarray) and values.dtype.kind in (
+                ZERO_COPY_DTYPE_KINDS
+            ):
+                buffer = memoryview(np.ascontiguousarray(values).view(np.uint8))
+                kind = "array"
+                dtype = values.dtype.str
+            else:
+                buffer, kind = SharedMemoryCacheService._encode_objects(values)
+                dtype = None
+            columns.append((series.name, kind, dtype, offset, len(buffer)))
+            buffers.append((offset, buffer))
+            offset = _align(offset + len(buffer))
+        index = None
+        if not isinstance(dataframe.index, pd.RangeIndex):
+            buffer = pickle.dumps(dataframe.index, protocol=pickle.HIGHEST_PROTOCOL)
+            index = (offset, len(buffer))
+            buffers.append((offset, buffer))
+            offset += len(buffer)
+        layout = {
+            "columns": columns,
+            "index": index,
+            "length": len(dataframe),
+            "nbytes": offset,
+        }
+        return buffers, layout
+
+    @staticmethod
+    def _encode_objects(values) -> Tuple[Any, str]:
+        """
+        Converts object column values to a buffer and its kind.
+        Strings and None are stored as an Arrow array,
+        values that Arrow would change are pickled.
+        """
+        try:
+            array = pa.array(values, from_pandas=False)
+        except pa.ArrowException:
+            array = None
+        if isinstance(array, pa.Array) and pa.types.is_string(array.type):
+            batch = pa.record_batch([array], names=["values"])
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, batch.schema) as writer:
+                writer.write_batch(batch)
+            return memoryview(sink.getvalue()).cast("B"), "arrow"
+        return pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL), "pickle"
+
+    @staticmethod
+    def _decode_objects(
+        block: shared_memory.SharedMemory, kind: str, offset: int, nbytes: int
+    ) -> np.ndarray:
+        """
+        Returns the object column values, decoded once per process.
+        """
+        decoded_columns = _decoded_columns.setdefault(block.name, {})
+        values: Optional[np.ndarray] = decoded_columns.get(offset)
+        if values is None:
+            buffer = block.buf[offset : offset + nbytes]
+            if kind == "arrow":
+                reader = pa.ipc.open_stream(pa.py_buffer(buffer))
+                values = reader.read_all().column(0).to_numpy(zero_copy_only=False)
+            else:
+                values = pickle.loads(buffer)
+            if isinstance(values, np.ndarray):
+                values.flags.writeable = False
+            decoded_columns[offset] = values
+        return values
+
+    @staticmethod
+    def _decode_dataframe(
+        block: shared_memory.SharedMemory, layout: dict
+    ) -> pd.DataFrame:
+        length: int = layout["length"]
+        data = {}
+        for name, kind, dtype, offset, nbytes in layout["columns"]:
+            if kind == "array":
+                # the arrow buffer holds an export of the block while views
+                # over it are used, so the block can not be closed under them
+                values = np.frombuffer(
+                    pa.py_buffer(block.buf[offset : offset + nbytes]),
+                    dtype=np.dtype(dtype),
+                    count=length,
+                )
+                values.flags.writeable = False
+            else:
+                values = SharedMemoryCacheService._decode_objects(
+                    block, kind, offset, nbytes
+                )
+            data[name] = values
+        if layout["index"]:
+            offset, nbytes = layout["index"]
+            index = pickle.loads(block.buf[offset : offset + nbytes])
+        else:
+            index = pd.RangeIndex(length)
+        # copy=False keeps the numpy views as separate, non-consolidated blocks
+        return pd.DataFrame(
+            data,
+            index=index,
+            columns=[column[0] for column in layout["columns"]],
+            copy=False,
+        )
+
+    def add(self, cache_key, data, size: int = None):
+        return self.cache.add(cache_key, data, size=size)
+
+    def add_batch(
+        self,
+        items: List[dict],
+        cache_key_name: str,
+        pop_cache_key: bool = False,
+        prefix: str = "",
+    ):
+        return self.cache.add_batch(
+            items, cache_key_name, pop_cache_key=pop_cache_key, prefix=prefix
+        )
+
+    def get(self, cache_key):
+        return self.cache.get(cache_key)
+
+    def get_all(self, cache_keys: List[str]):
+        return self.cache.get_all(cache_keys)
+
+    def get_all_by_prefix(self, prefix):
+        return self.cache.get_all_by_prefix(prefix)
+
+    def exists(self, cache_key):
+        return self.cache.exists(cache_key)
+
+    def clear(self, cache_key):
+        self._remove_block(cache_key)
+        return self.cache.clear(cache_key)
+
+    def clear_all(self, prefix: str = None):
+        if not prefix:
+            self.release_shared_memory()
+        return self.cache.clear_all(prefix)
+
+    def add_all(self, data: dict):
+        return self.cache.add_all(data)
+
+    def filter_cache(self, prefix: str) -> dict:
+        return self.cache.filter_cache(prefix)
+
+    def get_by_regex(self, regex: str) -> dict:
+        return self.cache.get_by_regex(regex)
+
+    def get_stats(self):
+        stats = super().get_stats()
+        merge_cache_stats(stats, self.cache.get_stats())
+        return stats
@@ -0,0 +1,106 @@
+import sys
+from itertools import islice
+from typing import Callable, Dict, Iterable, Type, Union
+
+import numpy as np
+import pandas as pd
+from pympler import asizeof
+
+from cdisc_rules_engine.models.dataset import DatasetInterface
+
+
+def get_dataset_size(data: DatasetInterface) -> int:
+    return data.size
+
+
+def get_dataframe_size(data: Union[pd.DataFrame, pd.Series]) -> int:
+    return int(np.sum(data.memory_usage(deep=True)))
+
+
+def get_array_size(data: np.ndarray) -> int:
+    return data.nbytes
+
+
+class SizeEstimator:
+    """
+    Estimates the memory size of cache items in bytes.
+
+    pympler.asizeof walks every object referenced by an item,
+    which takes seconds for CT packages and dictionaries.
+    The estimator uses the size reported by datasets, dataframes
+    and numpy arrays, and estimates the size of large containers
+    from a sample of their items.
+    Smaller containers and objects are walked item by item
+    down to max_depth, deeper objects are measured with asizeof.
+
+    Estimators for other types are added with register.
+    """
+
+    def __init__(self, sample_size: int = 100, max_depth: int = 8):
+        self.sample_size = sample_size
+        self.max_depth = max_depth
+        self._estimators: Dict[Type, Callable[[object], int]] = {
+            DatasetInterface: get_dataset_size,
+            pd.DataFrame: get_dataframe_size,
+            pd.Series: get_dataframe_size,
+            np.ndarray: get_array_size,
+        }
+
+    def register(self, data_type: Type, estimator: Callable[[object], int]):
+        """
+        Uses the estimator for instances of the type and its subclasses.
+        """
+        self._estimators[data_type] = estimator
+
+    def __call__(self, data) -> int:
+        return self.estimate(data)
+
+    def estimate(self, data) -> int:
+        return self._estimate(data, 0, set())
+
+    def _estimate(self, data, depth: int, seen: set) -> int:
+        # objects referenced more than once, like dictionary keys
+        # shared by many records, are counted once
+        if id(data) in seen:
+            return 0
+        seen.add(id(data))
+        for data_type, estimator in self._estimators.items():
+            if isinstance(data, data_type):
+                return estimator(data)
+        if isinstance(data, (str, bytes, int, float, bool)) or data is None:
+            return sys.getsizeof(data)
+        if depth >= self.max_depth:
+            return asizeof.asizeof(data)
+        if isinstance(data, dict):
+            return sys.getsizeof(data) + self._estimate_items(
+                data.items(),
+                len(data),
+                lambda item: self._estimate(item[0], depth + 1, seen)
+                + self._estimate(item[1], depth + 1, seen),
+            )
+        if isinstance(data, (list, tuple, set, frozenset)):
+            return sys.getsizeof(data) + self._estimate_items(
+                data, len(data), lambda item: self._estimate(item, depth + 1, seen)
+            )
+        if hasattr(data, "__dict__") and not isinstance(data, type):
+            return sys.getsizeof(data) + self._estimate(vars(data), depth + 1, seen)
+        return asizeof.asizeof(data)
+
+    def _estimate_items(
+        self, items: Iterable, length: int, estimate_item: Callable[[object], int]
+    ) -> int:
+        """
+        Returns the size of the items of a container.
+        Above sample_size items the size is extrapolated
+        from items spread evenly over the container.
+        """
+        if length <= self.sample_size:
+            sample = items
+        else:
+            sample = islice(items, 0, None, length // self.sample_size)
+        sizes = [estimate_item(item) for item in sample]
+        if not sizes:
+            return 0
+        if length <= self.sample_size:
+            return sum(sizes)
+        return int(sum(sizes) / len(sizes) * length)
@@ -0,0 +1,109 @@
+import time
+from typing import List
+
+from cdisc_rules_engine.interfaces import CacheServiceInterface
+from cdisc_rules_engine.utilities.cache_stats import (
+    DATASET_NAMESPACE,
+    merge_cache_stats,
+)
+
+
+class TaskLocalCacheService(CacheServiceInterface):
+    """
+    Wraps a shared cache service (usually a SyncManager proxy)
+    and keeps datasets read during a task in process-local memory.
+
+    Every dataset lookup against a proxied cache pickles the whole
+    dataset across the manager pipe. When one task runs many rules
+    against the same dataset, the dataset is fetched from the shared
+    cache once and served from local memory afterwards.
+    Datasets are still written through to the shared cache,
+    so other processes can reuse them.
+
+    Local datasets live until release_datasets is called,
+    which is expected to happen at the end of each task.
+    Stats count dataset lookups served from local memory as hits.
+    """
+
+    def __init__(self, shared_cache: CacheServiceInterface):
+        self.shared_cache = shared_cache
+        self._datasets = {}
+
+    @classmethod
+    def get_instance(cls, shared_cache: CacheServiceInterface, **kwargs):
+        return cls(shared_cache)
+
+    def release_datasets(self):
+        self._datasets.clear()
+
+    def add_dataset(self, cache_key, data):
+        start = time.perf_counter()
+        self._datasets[cache_key] = data
+        self.shared_cache.add_dataset(cache_key, data)
+        self.stats.record_add(
+            cache_key,
+            getattr(data, "size", None),
+            time.perf_counter() - start,
+            DATASET_NAMESPACE,
+        )
+
+    def get_dataset(self, cache_key):
+        start = time.perf_counter()
+        data = self._datasets.get(cache_key)
+        is_local: bool = data is not None
+        if data is None:
+            data = self.shared_cache.get_dataset(cache_key)
+            if data is not None:
+                self._datasets[cache_key] = data
+        self.stats.record_get(
+            cache_key, is_local, time.perf_counter() - start, DATASET_NAMESPACE
+        )
+        return data
+
+    def add(self, cache_key, data, size: int = None):
+        return self.shared_cache.add(cache_key, data, size=size)
+
+    def add_batch(
+        self,
+        items: List[dict],
+        cache_key_name: str,
+        pop_cache_key: bool = False,
+        prefix: str = "",
+    ):
+        return self.shared_cache.add_batch(
+            items, cache_key_name, pop_cache_key=pop_cache_key, prefix=prefix
+        )
+
+    def get(self, cache_key):
+        return self.shared_cache.get(cache_key)
+
+    def get_all(self, cache_keys: List[str]):
+        return self.shared_cache.get_all(cache_keys)
+
+    def get_all_by_prefix(self, prefix):
+        return self.shared_cache.get_all_by_prefix(prefix)
+
+    def exists(self, cache_key):
+        return self.shared_cache.exists(cache_key)
+
+    def clear(self, cache_key):
+        self._datasets.pop(cache_key, None)
+        return self.shared_cache.clear(cache_key)
+
+    def clear_all(self, prefix: str = None):
+        self.release_datasets()
+        return self.shared_cache.clear_all(prefix)
+
+    def add_all(self, data: dict):
+        return self.shared_cache.add_all(data)
+
+    def filter_cache(self, prefix: str) -> dict:
+        return self.shared_cache.filter_cache(prefix)
+
+    def get_by_regex(self, regex: str) -> dict:
+        return self.shared_cache.get_by_regex(regex)
+
+    def get_stats(self):
+        stats = super().get_stats()
+        merge_cache_stats(stats, self.shared_cache.get_stats())
+        return stats
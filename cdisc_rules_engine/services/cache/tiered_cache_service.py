@@ -0,0 +1,220 @@
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import pandas as pd
+
+from cdisc_rules_engine.interfaces import CacheServiceInterface
+from cdisc_rules_engine.models.dataset.dataset_interface import DatasetInterface
+from cdisc_rules_engine.services.cache.in_memory_cache_service import SizedLRUCache
+from cdisc_rules_engine.services.cache.size_estimator import SizeEstimator
+from cdisc_rules_engine.utilities.cache_stats import merge_cache_stats
+
+DEFAULT_LOCAL_CACHE_SIZE = 64 * 1024 * 1024
+
+
+class _Entry(NamedTuple):
+    value: object
+    # monotonic time after which the entry is stale, None if it never is
+    expires_at: Optional[float]
+    found: bool
+
+
+def _copy_value(data):
+    # operations add columns to the datasets they read,
+    # so each reader gets its own copy like values read from L2
+    if isinstance(data, (DatasetInterface, pd.DataFrame, pd.Series)):
+        return data.copy()
+    return data
+
+
+class TieredCacheService(CacheServiceInterface):
+    """
+    Keeps a bounded process-local LRU cache (L1) in front of
+    a shared cache service (L2, usually a SyncManager proxy or Redis).
+
+    Reads are served from L1 and fall through to L2 on a miss,
+    the value read from L2 is kept in L1. Writes go to both caches.
+    Entries expire after ttl seconds, or after the ttl of the longest
+    namespace (key prefix) in namespace_ttls that matches the key,
+    None means entries do not expire.
+    Keys not found in L2 are remembered for negative_ttl seconds,
+    so repeated lookups of missing keys do not reach L2 either.
+
+    Datasets and queries by prefix or regex are not cached in L1.
+    Dataframes, like operation results, are copied when they are
+    added to and read from L1, so changes made by one reader
+    are not seen by the others.
+    Stats count lookups served from L1 as hits,
+    and evictions and stored bytes of L1.
+    """
+
+    def __init__(
+        self,
+        shared_cache: CacheServiceInterface,
+        max_size: int = DEFAULT_LOCAL_CACHE_SIZE,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+        namespace_ttls: Dict[str, Optional[float]] = None,
+        size_estimator: SizeEstimator = None,
+    ):
+        self.shared_cache = shared_cache
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # longer namespaces are matched first
+        self.namespace_ttls = dict(
+            sorted(
+                (namespace_ttls or {}).items(),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            )
+        )
+        self.size_estimator = size_estimator or SizeEstimator()
+        self._cache = SizedLRUCache(
+            maxsize=max_size,
+            getsizeof=self._get_entry_size,
+            on_evict=self._record_eviction,
+        )
+
+    @classmethod
+    def get_instance(cls, shared_cache: CacheServiceInterface, **kwargs):
+        return cls(shared_cache, **kwargs)
+
+    def _record_eviction(self, cache_key, size: int):
+        self.stats.record_eviction(cache_key, size)
+
+    def _get_entry_size(self, entry: _Entry) -> int:
+        return self.size_estimator(entry.value)
+
+    def _get_ttl(self, cache_key) -> Optional[float]:
+        for namespace, ttl in self.namespace_ttls.items():
+            if str(cache_key).startswith(namespace):
+                return ttl
+        return self.ttl
+
+    def _get_local_entry(self, cache_key) -> Optional[_Entry]:
+        entry: Optional[_Entry] = self._cache.get(cache_key)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._cache.pop(cache_key, None)
+            return None
+        return entry
+
+    def _add_local_entry(self, cache_key, data, size: int = None):
+        start = time.perf_counter()
+        if data is None:
+            if not self.negative_ttl:
+                self._cache.pop(cache_key, None)
+                return
+            ttl, found = self.negative_ttl, False
+        else:
+            ttl, found = self._get_ttl(cache_key), True
+        if size is None:
+            size = self.size_estimator(data)
+        if size > self.max_size:
+            self._cache.pop(cache_key, None)
+            return
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._cache.add(cache_key, _Entry(_copy_value(data), expires_at, found), size)
+        self.stats.record_add(cache_key, size, time.perf_counter() - start)
+
+    def _remove_local_entries(self, cache_keys: Iterable):
+        for cache_key in cache_keys:
+            self._cache.pop(cache_key, None)
+
+    def add(self, cache_key, data, size: int = None):
+        result = self.shared_cache.add(cache_key, data, size=size)
+        self._add_local_entry(cache_key, data, size)
+        return result
+
+    def add_batch(
+        self,
+        items: List[dict],
+        cache_key_name: str,
+        pop_cache_key: bool = False,
+        prefix: str = "",
+    ):
+        # keys are read before the shared cache pops them from the items
+        self._remove_local_entries(
+            prefix + item[cache_key_name] for item in items if item.get(cache_key_name)
+        )
+        return self.shared_cache.add_batch(
+            items, cache_key_name, pop_cache_key=pop_cache_key, prefix=prefix
+        )
+
+    def add_all(self, data: dict):
+        self._remove_local_entries(data.keys())
+        return self.shared_cache.add_all(data)
+
+    def get(self, cache_key):
+        start = time.perf_counter()
+        entry: Optional[_Entry] = self._get_local_entry(cache_key)
+        if entry is not None:
+            self.stats.record_get(cache_key, True, time.perf_counter() - start)
+            return _copy_value(entry.value)
+        data = self.shared_cache.get(cache_key)
+        self.stats.record_get(cache_key, False, time.perf_counter() - start)
+        self._add_local_entry(cache_key, data)
+        return data
+
+    def get_all(self, cache_keys: List[str]):
+        start = time.perf_counter()
+        entries = {key: self._get_local_entry(key) for key in cache_keys}
+        missing_keys = [key for key, entry in entries.items() if entry is None]
+        # keys missing from L1 are read from L2 in one request
+        shared_values = (
+            dict(zip(missing_keys, self.shared_cache.get_all(missing_keys)))
+            if missing_keys
+            else {}
+        )
+        self.stats.record_get_all(
+            cache_keys,
+            [entries[key] for key in cache_keys],
+            time.perf_counter() - start,
+        )
+        for key, data in shared_values.items():
+            self._add_local_entry(key, data)
+        return [
+            shared_values[key]
+            if entries[key] is None
+            else _copy_value(entries[key].value)
+            for key in cache_keys
+        ]
+
+    def exists(self, cache_key):
+        entry: Optional[_Entry] = self._get_local_entry(cache_key)
+        if entry is not None:
+            return entry.found
+        return self.shared_cache.exists(cache_key)
+
+    def clear(self, cache_key):
+        self._cache.pop(cache_key, None)
+        return self.shared_cache.clear(cache_key)
+
+    def clear_all(self, prefix: str = None):
+        if prefix:
+            self._remove_local_entries(self._cache.keys_with_prefix(prefix))
+        else:
+            self._cache.clear()
+        return self.shared_cache.clear_all(prefix)
+
+    def add_dataset(self, cache_key, data):
+        return self.shared_cache.add_dataset(cache_key, data)
+
+    def get_dataset(self, cache_key):
+        return self.shared_cache.get_dataset(cache_key)
+
+    def get_all_by_prefix(self, prefix):
+        return self.shared_cache.get_all_by_prefix(prefix)
+
+    def filter_cache(self, prefix: str) -> dict:
+        return self.shared_cache.filter_cache(prefix)
+
+    def get_by_regex(self, regex: str) -> dict:
+        return self.shared_cache.get_by_regex(regex)
+
+    def get_stats(self):
+        stats = super().get_stats()
+        merge_cache_stats(stats, self.shared_cache.get_stats())
+        return stats
@@ -1,7 +1,14 @@
 from .data_reader_factory import DataReaderFactory
 from .xpt_reader import XPTReader
+from .native_xpt_reader import NativeXPTReader
 from .parquet_reader import ParquetReader
 from .json_reader import DatasetJSONReader
 
 
-__all__ = ["DataReaderFactory", "XPTReader", "DatasetJSONReader", "ParquetReader"]
+__all__ = [
+    "DataReaderFactory",
+    "XPTReader",
+    "NativeXPTReader",
+    "DatasetJSONReader",
+    "ParquetReader",
+]
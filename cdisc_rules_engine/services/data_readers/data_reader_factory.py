@@ -1,10 +1,11 @@
-from typing import Type
+from typing import Dict, Type
 
 from cdisc_rules_engine.interfaces import (
     DataReaderInterface,
     FactoryInterface,
 )
 from cdisc_rules_engine.services.data_readers.xpt_reader import XPTReader
+from cdisc_rules_engine.services.data_readers.native_xpt_reader import NativeXPTReader
 from cdisc_rules_engine.services.data_readers.json_reader import DatasetJSONReader
 from cdisc_rules_engine.services.data_readers.parquet_reader import ParquetReader
 from cdisc_rules_engine.services.data_readers.usdm_json_reader import USDMJSONReader
@@ -15,14 +16,25 @@ from cdisc_rules_engine.models.dataset import PandasDataset
 class DataReaderFactory(FactoryInterface):
     _reader_map = {
         DataFormatTypes.XPT.value: XPTReader,
+        "XPT_NATIVE": NativeXPTReader,
         DataFormatTypes.PARQUET.value: ParquetReader,
         DataFormatTypes.JSON.value: DatasetJSONReader,
         DataFormatTypes.USDM.value: USDMJSONReader,
     }
 
-    def __init__(self, service_name: str = None, dataset_implementation=PandasDataset):
+    def __init__(
+        self,
+        service_name: str = None,
+        dataset_implementation=PandasDataset,
+        reader_names: Dict[str, str] = None,
+    ):
+        """
+        :param reader_names: Names of registered services used instead of
+            the services with the given names, e.g. {"XPT": "XPT_NATIVE"}.
+        """
         self._default_service_name = service_name
         self.dataset_implementation = dataset_implementation
+        self._reader_names = reader_names or {}
 
     @classmethod
     def register_service(cls, name: str, service: Type[DataReaderInterface]):
@@ -40,6 +52,7 @@ class DataReaderFactory(FactoryInterface):
         Get instance of service that matches searched implementation
         """
         service_name = name or self._default_service_name
+        service_name = self._reader_names.get(service_name, service_name)
         if service_name in self._reader_map:
             return self._reader_map[service_name](self.dataset_implementation)
         raise ValueError(
@@ -0,0 +1,113 @@
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype, DatetimeTZDtype, infer_dtype
+
+DECIMALS = 15
+SCALE = 10.0**DECIMALS
+# round(x, 15) returns x itself when the spacing of floats near x
+# is greater than 1e-15, which holds for abs(x) >= 8
+EXACT_MAGNITUDE = 8.0
+# constant used to split a float into two halves of 26 bits
+SPLITTER = 2.0**27 + 1
+# margin for the rounding error of the distance to the nearest integer
+HALF = 0.5 - 2.0**-20
+FLOAT_INFERRED_TYPES = ("floating", "mixed-integer-float", "mixed-integer", "mixed")
+
+
+def format_floats(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rounds float values of the dataframe to 15 decimal places,
+    the result is the same as applying round(x, 15) to every float value.
+
+    Only columns that can hold floats are processed. Float columns
+    are rounded as whole arrays, object columns are rounded
+    element-wise if they contain floats. Integer, boolean, datetime
+    and categorical columns are not changed.
+    """
+    formatted_columns = {}
+    for index, (_, column) in enumerate(dataframe.items()):
+        formatted = _format_column(column)
+        if formatted is not column:
+            formatted_columns[index] = formatted
+    if not formatted_columns:
+        return dataframe
+    dataframe = dataframe.copy(deep=False)
+    for index, column in formatted_columns.items():
+        dataframe.isetitem(index, column)
+    return dataframe
+
+
+def _format_column(column: pd.Series) -> pd.Series:
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        return _from_array(column, round_floats(column.to_numpy(np.float64)))
+    if dtype == object:
+        inferred_type: str = infer_dtype(column, skipna=True)
+        if inferred_type == "floating":
+            return _from_array(column, round_floats(column.to_numpy(np.float64)))
+        if inferred_type in FLOAT_INFERRED_TYPES:
+            return column.map(_round_value)
+        return column
+    if isinstance(dtype, (CategoricalDtype, DatetimeTZDtype)) or isinstance(
+        dtype, np.dtype
+    ):
+        return column
+    # nullable extension columns are converted to object columns of values
+    return column.map(_round_value)
+
+
+def round_floats(values: np.ndarray) -> np.ndarray:
+    """
+    Rounds a float64 array to 15 decimal places, the result
+    is the same as applying round(x, 15) to every value.
+
+    Values are scaled by 10 ** 15 and rounded to integers.
+    The scaling can move a value that is close to a half
+    to the other side of it, so the exact rounding error of the scaling
+    is calculated and values that are too close to a half
+    are rounded with round().
+    """
+    magnitude = np.abs(values)
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled = values * SCALE
+        integers = np.rint(scaled)
+        rounded = integers / SCALE
+        exact = (magnitude >= EXACT_MAGNITUDE) | ~np.isfinite(values)
+        distance = (scaled - integers) + _get_product_error(values, SCALE, scaled)
+        ambiguous = ~exact & (rounded != values) & (np.abs(distance) >= HALF)
+    rounded[exact] = values[exact]
+    for index in np.flatnonzero(ambiguous):
+        rounded[index] = round(float(values[index]), DECIMALS)
+    return rounded
+
+
+def _get_product_error(
+    values: np.ndarray, factor: float, product: np.ndarray
+) -> np.ndarray:
+    """
+    Returns values * factor - product calculated without rounding
+    (Dekker's product).
+    """
+    values_high, values_low = _split(values)
+    factor_high, factor_low = _split(factor)
+    return (
+        (values_high * factor_high - product)
+        + values_high * factor_low
+        + values_low * factor_high
+    ) + values_low * factor_low
+
+
+def _split(values):
+    scaled = values * SPLITTER
+    high = scaled - (scaled - values)
+    return high, values - high
+
+
+def _round_value(value: Any) -> Any:
+    return round(value, DECIMALS) if isinstance(value, float) else value
+
+
+def _from_array(column: pd.Series, values: np.ndarray) -> pd.Series:
+    return pd.Series(values, index=column.index, name=column.name)
@@ -1,6 +1,7 @@
+from typing import Iterator, List, Optional, Tuple
+
 import pandas as pd
 import dask.dataframe as dd
-import os
 import json
 import jsonschema
 
@@ -10,16 +11,24 @@ from cdisc_rules_engine.interfaces import (
 
 from cdisc_rules_engine.models.dataset.dask_dataset import DaskDataset
 from cdisc_rules_engine.models.dataset.pandas_dataset import PandasDataset
+from cdisc_rules_engine.services.dataset_json_schema_validator import (
+    DatasetJSONSchemaValidator,
+)
+from cdisc_rules_engine.services.data_readers.float_formatting import format_floats
+from cdisc_rules_engine.utilities.json_stream_reader import JSONStreamReader
+from pandas.api.types import infer_dtype
 import tempfile
 
+CONTAINER_KEYS = ("clinicalData", "referenceData", "itemGroupData")
+NUMERIC_TYPES = ("integer", "float", "double", "decimal")
+
 
 class DatasetJSONReader(DataReaderInterface):
+    # number of rows kept in memory while the file is streamed
+    chunk_size = 20000
+
     def get_schema(self) -> dict:
-        with open(
-            os.path.join("resources", "schema", "dataset.schema.json")
-        ) as schemajson:
-            schema = schemajson.read()
-        return json.loads(schema)
+        return DatasetJSONSchemaValidator.get_instance().schema
 
     def get_data_key(self, dataset_json: dict) -> str:
         if "clinicalData" in dataset_json:
@@ -31,7 +40,9 @@ class DatasetJSONReader(DataReaderInterface):
             datasetjson = json.load(file)
         return datasetjson
 
-    def parse_items_data(self, dataset_json: dict, data_key: str) -> pd.DataFrame:
+    def parse_items_data(
+        self, dataset_json: dict, data_key: str, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         items_data = next(
             (
                 d
@@ -40,38 +51,141 @@ class DatasetJSONReader(DataReaderInterface):
             ),
             {},
         )
-        return pd.DataFrame(
-            [item[1:] for item in items_data.get("itemData", [])],
-            columns=[item["name"] for item in items_data.get("items", [])[1:]],
+        return self._create_chunk(
+            items_data.get("items", []), items_data.get("itemData", []), columns
         )
 
-    def _raw_dataset_from_file(self, file_path) -> pd.DataFrame:
-        # Load Dataset-JSON Schema
-        schema = self.get_schema()
-        datasetjson = self.read_json_file(file_path)
+    def iter_chunks(
+        self,
+        file_path: str,
+        columns: Optional[List[str]] = None,
+        typed: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streams rows of itemData into data frames of chunk_size rows,
+        so that the document is never loaded as a whole.
+        Numeric columns that are empty in a chunk are float,
+        so that chunks can be concatenated. If typed is True,
+        all numeric columns are float and character columns are strings.
+        The document without the rows except the first ones
+        is validated against the schema after the last chunk.
+        """
+        schema_validator = DatasetJSONSchemaValidator.get_instance()
+        header = {}
+        rows = []
+        number_of_chunks = 0
+        with open(file_path, "r") as file:
+            for item_group, row in self._iter_rows(JSONStreamReader(file), header):
+                if len(item_group["itemData"]) < schema_validator.sample_size:
+                    # the first rows are validated with the header
+                    item_group["itemData"].append(row)
+                rows.append(row)
+                if len(rows) >= self.chunk_size and "items" in item_group:
+                    yield format_floats(
+                        self._create_chunk(item_group["items"], rows, columns, typed)
+                    )
+                    number_of_chunks += 1
+                    rows = []
+        if rows or not number_of_chunks:
+            items: List[dict] = self._get_items_data(header).get("items", [])
+            yield format_floats(self._create_chunk(items, rows, columns, typed))
+        schema_validator.validate(file_path, header)
 
-        jsonschema.validate(datasetjson, schema)
-        data_key = self.get_data_key(datasetjson)
-        df = self.parse_items_data(datasetjson, data_key)
-        return df.applymap(lambda x: round(x, 15) if isinstance(x, float) else x)
+    def _iter_rows(
+        self, reader: JSONStreamReader, document: dict, is_item_group_data=False
+    ) -> Iterator[Tuple[dict, list]]:
+        """
+        Reads the object into the document except rows of itemData,
+        which are yielded with the item group they belong to.
+        """
+        for key in reader.iter_object():
+            if key == "itemData" and reader.peek() == "[":
+                document[key] = []
+                for _ in reader.iter_array():
+                    yield document, reader.read_value()
+            elif (is_item_group_data or key in CONTAINER_KEYS) and (
+                reader.peek() == "{"
+            ):
+                document[key] = {}
+                yield from self._iter_rows(
+                    reader, document[key], key == "itemGroupData"
+                )
+            else:
+                document[key] = reader.read_value()
 
-    def from_file(self, file_path):
+    def _get_items_data(self, dataset_json: dict) -> dict:
+        return next(
+            (
+                d
+                for d in dataset_json.get(self.get_data_key(dataset_json), {})
+                .get("itemGroupData", {})
+                .values()
+                if "items" in d
+            ),
+            {},
+        )
+
+    @staticmethod
+    def _create_chunk(
+        items: List[dict],
+        rows: List[list],
+        columns: Optional[List[str]],
+        typed: bool = False,
+    ) -> pd.DataFrame:
+        # the first item of each record is the record id
+        selected_items: List[Tuple[int, dict]] = [
+            (index, item)
+            for index, item in enumerate(items)
+            if index and (columns is None or item["name"] in columns)
+        ]
+        if columns is None:
+            data = [row[1:] for row in rows]
+        else:
+            data = [[row[index] for index, _ in selected_items] for row in rows]
+        chunk = pd.DataFrame(data, columns=[item["name"] for _, item in selected_items])
+        for _, item in selected_items:
+            column: pd.Series = chunk[item["name"]]
+            if item.get("type") in NUMERIC_TYPES:
+                if typed or column.isna().all():
+                    chunk[item["name"]] = column.astype(float)
+            elif typed and infer_dtype(column, skipna=True) not in ("string", "empty"):
+                chunk[item["name"]] = column.map(
+                    lambda value: None if pd.isna(value) else str(value)
+                )
+        return chunk
+
+    def _raw_dataset_from_file(
+        self, file_path, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        return pd.concat(self.iter_chunks(file_path, columns), ignore_index=True)
+
+    def from_file(self, file_path, columns: Optional[List[str]] = None):
         try:
-            df = self._raw_dataset_from_file(file_path)
-            if self.dataset_implementation == PandasDataset:
-                return PandasDataset(df)
-            else:
+            df = self._raw_dataset_from_file(file_path, columns)
+            if self.dataset_implementation == DaskDataset:
                 return DaskDataset(
                     dd.from_pandas(df, npartitions=4), length=len(df.index)
                 )
+            else:
+                return PandasDataset(df)
         except jsonschema.exceptions.ValidationError:
             return PandasDataset(pd.DataFrame())
 
     def to_parquet(self, file_path: str) -> (int, str):
+        """
+        Converts the file chunk by chunk.
+        """
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".parquet")
-        df = self._raw_dataset_from_file(file_path)
-        df.to_parquet(temp_file.name)
-        return len(df.index), temp_file.name
+        num_rows = 0
+        for index, chunk in enumerate(self.iter_chunks(file_path, typed=True)):
+            chunk.to_parquet(
+                temp_file.name,
+                engine="fastparquet",
+                object_encoding="utf8",
+                append=index > 0,
+            )
+            num_rows += len(chunk.index)
+        return num_rows, temp_file.name
 
     def read(self, data):
         pass
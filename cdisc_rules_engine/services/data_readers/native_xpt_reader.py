@@ -0,0 +1,229 @@
+import tempfile
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from cdisc_rules_engine.interfaces import (
+    DataReaderInterface,
+)
+from cdisc_rules_engine.models.dataset import PandasDataset
+from cdisc_rules_engine.services.data_readers.float_formatting import format_floats
+from cdisc_rules_engine.services.data_readers.xpt_header_reader import (
+    XPTHeader,
+    XPTHeaderReader,
+    XPTVariable,
+)
+from cdisc_rules_engine.services.data_readers.xpt_reader import XPTReader
+
+# first byte of SAS missing values: ".", "_" and "A" - "Z"
+MISSING_VALUE_MARKERS = np.zeros(256, dtype=bool)
+MISSING_VALUE_MARKERS[[ord("."), ord("_"), *range(ord("A"), ord("Z") + 1)]] = True
+# number of leading bits of a mantissa that do not fit into a double,
+# by the first hex digit of the mantissa
+MANTISSA_SHIFT = np.array([0, 0, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 3, 3, 3, 3])
+MANTISSA_MASK = np.uint64(0x00FFFFFFFFFFFFFF)
+
+
+class XPTMemoryMappedFile:
+    """
+    Memory-mapped observations of a SAS XPORT version 5 file.
+
+    Rows are viewed as a NumPy structured array built from
+    the NAMESTR records, so observations are not read until a column
+    is accessed.
+    Columns are decoded as whole arrays on first access:
+    IBM floats are converted to doubles and strings are trimmed
+    and decoded, the same way as pandas.read_sas does it.
+    Rows are counted by XPTHeaderReader, which unlike pandas.read_sas
+    does not mistake the padding of the last record for rows.
+    """
+
+    def __init__(self, file_path: str, encoding: str = "utf-8"):
+        """
+        Raises ValueError if the file is not a version 5 transport file.
+        """
+        self._encoding = encoding
+        self._header: XPTHeader = XPTHeaderReader(file_path).read()
+        self._variables: Dict[str, XPTVariable] = {
+            variable.name: variable for variable in self._header.variables
+        }
+        self._columns: Dict[str, np.ndarray] = {}
+        dtype = np.dtype(
+            {
+                "names": [f"v{index}" for index in range(len(self._variables))],
+                "formats": [
+                    f"S{variable.length}" for variable in self._header.variables
+                ],
+                "offsets": [variable.position for variable in self._header.variables],
+                "itemsize": self._header.row_length,
+            }
+        )
+        number_of_rows = self._header.number_of_rows
+        self._rows: np.ndarray = (
+            np.memmap(
+                file_path,
+                dtype=dtype,
+                mode="r",
+                offset=self._header.data_offset,
+                shape=(number_of_rows,),
+            )
+            if number_of_rows
+            else np.empty(0, dtype=dtype)
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __enter__(self) -> "XPTMemoryMappedFile":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._variables)
+
+    def get_column(self, name: str) -> np.ndarray:
+        """
+        Returns decoded values of the column.
+        The column is decoded once and kept for the next calls.
+        """
+        if name not in self._columns:
+            self._columns[name] = self._decode_column(name, self._rows)
+        return self._columns[name]
+
+    def to_dataframe(
+        self,
+        columns: Optional[List[str]] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Returns rows from start to stop as a dataframe.
+        If columns are given, only these columns are decoded,
+        names that do not exist in the file are ignored.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        names = [name for name in self._variables if columns is None or name in columns]
+        if start == 0 and stop == len(self):
+            data = {name: self.get_column(name) for name in names}
+        else:
+            rows = self._rows[start:stop]
+            data = {name: self._decode_column(name, rows) for name in names}
+        return pd.DataFrame(data, index=pd.RangeIndex(start, stop), columns=names)
+
+    def close(self):
+        """
+        Closes the memory map. Decoded columns do not refer to it.
+        """
+        mmap = getattr(self._rows, "_mmap", None)
+        self._rows = np.empty(0, dtype=self._rows.dtype)
+        if mmap is not None:
+            mmap.close()
+
+    def _decode_column(self, name: str, rows: np.ndarray) -> np.ndarray:
+        index = list(self._variables).index(name)
+        variable = self._variables[name]
+        values = np.ascontiguousarray(rows[f"v{index}"])
+        if variable.type == "double":
+            return self._decode_floats(
+                values.view(np.uint8).reshape(len(rows), variable.length)
+            )
+        return self._decode_strings(values, self._encoding)
+
+    @staticmethod
+    def _decode_floats(raw: np.ndarray) -> np.ndarray:
+        """
+        Converts IBM floats to doubles. Floats shorter than 8 bytes
+        are padded with zeros. Mantissas are truncated to 53 bits,
+        as pandas.read_sas does it, and missing values are returned as NaN.
+        """
+        padded = np.zeros((len(raw), 8), dtype=np.uint8)
+        padded[:, : raw.shape[1]] = raw
+        values = padded.view(">u8").ravel().astype(np.uint64)
+        mantissa = values & MANTISSA_MASK
+        exponent = ((values >> np.uint64(56)) & np.uint64(0x7F)).astype(np.int64)
+        shift = MANTISSA_SHIFT[(mantissa >> np.uint64(52)).astype(np.int64)]
+        result = np.ldexp(
+            (mantissa >> shift.astype(np.uint64)).astype(np.float64),
+            4 * (exponent - 64) - 56 + shift,
+        )
+        result[values >> np.uint64(63) == 1] *= -1
+        result[(mantissa == 0) & MISSING_VALUE_MARKERS[padded[:, 0]]] = np.nan
+        return result
+
+    @classmethod
+    def _decode_strings(cls, values: np.ndarray, encoding: str) -> np.ndarray:
+        """
+        Trims and decodes strings, the result is the same as
+        value.rstrip().decode(encoding) for every value.
+        Values of a column repeat a lot, so each distinct value
+        is decoded once and all rows refer to the same string object.
+        """
+        codes = cls._factorize(values)
+        number_of_uniques = codes.max() + 1 if len(codes) else 0
+        first_rows = np.empty(number_of_uniques, dtype=np.int64)
+        first_rows[codes[::-1]] = np.arange(len(codes) - 1, -1, -1)
+        decoded = np.empty(number_of_uniques, dtype=object)
+        decoded[:] = [value.rstrip().decode(encoding) for value in values[first_rows]]
+        return decoded[codes]
+
+    @staticmethod
+    def _factorize(values: np.ndarray) -> np.ndarray:
+        """
+        Returns codes of distinct values of a bytes array.
+        Values are split into 8-byte integers that are factorized
+        by hashing, which is faster than sorting the bytes.
+        """
+        length = values.dtype.itemsize
+        padded = np.zeros((len(values), -(-length // 8) * 8), dtype=np.uint8)
+        padded[:, :length] = values.view(np.uint8).reshape(len(values), length)
+        parts = padded.view(np.uint64)
+        codes, _ = pd.factorize(parts[:, 0])
+        for index in range(1, parts.shape[1]):
+            part_codes, part_uniques = pd.factorize(parts[:, index])
+            codes, _ = pd.factorize(codes * len(part_uniques) + part_codes)
+        return codes
+
+
+class NativeXPTReader(DataReaderInterface):
+    """
+    Reads SAS XPORT version 5 files with XPTMemoryMappedFile
+    instead of pandas.read_sas. The result is the same as the result
+    of XPTReader. In-memory data and files of other versions
+    are read with XPTReader.
+
+    The reader is registered as the XPT_NATIVE service
+    and is used for XPT files if XPT_READER is set to XPT_NATIVE.
+    """
+
+    chunk_size = 20000
+
+    def read(self, data):
+        return XPTReader(self.dataset_implementation).read(data)
+
+    def from_file(self, file_path, columns: Optional[List[str]] = None):
+        try:
+            xpt_file = XPTMemoryMappedFile(file_path)
+        except ValueError:
+            return XPTReader(self.dataset_implementation).from_file(file_path, columns)
+        with xpt_file:
+            data = xpt_file.to_dataframe(columns)
+        return PandasDataset(format_floats(data))
+
+    def to_parquet(self, file_path: str) -> (int, str):
+        try:
+            xpt_file = XPTMemoryMappedFile(file_path)
+        except ValueError:
+            return XPTReader(self.dataset_implementation).to_parquet(file_path)
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".parquet")
+        number_of_rows = len(xpt_file)
+        with xpt_file:
+            for start in range(0, number_of_rows, self.chunk_size):
+                chunk = format_floats(
+                    xpt_file.to_dataframe(start=start, stop=start + self.chunk_size)
+                )
+                chunk.to_parquet(temp_file.name, engine="fastparquet", append=start > 0)
+        return number_of_rows, temp_file.name
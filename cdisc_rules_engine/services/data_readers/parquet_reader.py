@@ -1,39 +1,56 @@
 from io import BytesIO
-from typing import Union
+from typing import List, Optional
 
 import pandas as pd
 import dask.dataframe as dd
+import fastparquet
 from cdisc_rules_engine.models.dataset import PandasDataset, DaskDataset
 
 from cdisc_rules_engine.interfaces import (
     DataReaderInterface,
 )
+from cdisc_rules_engine.services.data_readers.float_formatting import format_floats
 
 
 class ParquetReader(DataReaderInterface):
     def read(self, data):
         df = pd.read_parquet(BytesIO(data), engine="fastparquet", encoding="utf-8")
-        df = self._format_floats(df)
+        df = format_floats(df)
         return df
 
-    def _read_pandas(self, file_path):
-        data = pd.read_parquet(file_path, engine="fastparquet", encoding="utf-8")
-        return PandasDataset(self._format_floats(data))
+    def _read_pandas(self, file_path, columns: Optional[List[str]] = None):
+        data = pd.read_parquet(
+            file_path,
+            engine="fastparquet",
+            encoding="utf-8",
+            columns=self._get_existing_columns(file_path, columns),
+        )
+        return PandasDataset(format_floats(data))
 
-    def from_file(self, file_path):
+    def from_file(self, file_path, columns: Optional[List[str]] = None):
         type_to_reader_map = {
             PandasDataset: self._read_pandas,
             DaskDataset: self._read_dask,
         }
         return type_to_reader_map.get(self.dataset_implementation, self._read_pandas)(
-            file_path
+            file_path, columns
         )
 
-    def _format_floats(
-        self, dataframe: Union[pd.DataFrame, dd.DataFrame]
-    ) -> Union[pd.DataFrame, dd.DataFrame]:
-        return dataframe.applymap(lambda x: round(x, 15) if isinstance(x, float) else x)
-
-    def _read_dask(self, file_path):
-        data = dd.read_parquet(file_path)
-        return DaskDataset(data)
+    @staticmethod
+    def _get_existing_columns(
+        file_path: str, columns: Optional[List[str]]
+    ) -> Optional[List[str]]:
+        """
+        Returns the given columns that exist in the file.
+        Parquet readers fail on columns that do not exist.
+        """
+        if columns is None:
+            return None
+        file_columns: List[str] = fastparquet.ParquetFile(file_path).columns
+        return [column for column in file_columns if column in set(columns)]
+
+    def _read_dask(self, file_path, columns: Optional[List[str]] = None):
+        data = dd.read_parquet(
+            file_path, columns=self._get_existing_columns(file_path, columns)
+        )
+        return DaskDataset(data.map_partitions(format_floats, meta=data._meta))
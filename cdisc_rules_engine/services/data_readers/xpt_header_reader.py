@@ -0,0 +1,215 @@
+import math
+import os
+import struct
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+RECORD_LENGTH = 80
+LIBRARY_HEADER = b"HEADER RECORD*******LIBRARY HEADER RECORD!!!!!!!"
+MEMBER_HEADER = b"HEADER RECORD*******MEMBER  HEADER RECORD!!!!!!!"
+NAMESTR_HEADER = b"HEADER RECORD*******NAMESTR HEADER RECORD!!!!!!!"
+OBS_HEADER = b"HEADER RECORD*******OBS     HEADER RECORD!!!!!!!"
+# ntype, nhfun, nlng, nvar0, nname, nlabel, nform, nfl, nfd, nfj,
+# nfill, niform, nifl, nifd, npos. The rest of the record is unused.
+NAMESTR = struct.Struct(">hhhh8s40s8shhh2s8shhl")
+MONTHS = [
+    "JAN",
+    "FEB",
+    "MAR",
+    "APR",
+    "MAY",
+    "JUN",
+    "JUL",
+    "AUG",
+    "SEP",
+    "OCT",
+    "NOV",
+    "DEC",
+]
+ENCODING = "cp1252"
+
+
+@dataclass
+class XPTVariable:
+    """
+    Variable described by a NAMESTR record.
+    """
+
+    name: str
+    label: Optional[str]
+    type: str
+    length: int
+    format: str
+    position: int
+
+
+@dataclass
+class XPTHeader:
+    """
+    Header of the first member of a SAS XPORT version 5 file.
+    """
+
+    dataset_name: str
+    dataset_label: Optional[str]
+    created: datetime
+    modified: datetime
+    variables: List[XPTVariable]
+    data_offset: int
+    row_length: int
+    number_of_rows: int
+    first_row: Optional[bytes]
+
+    def get_first_row_value(self, variable_name: str) -> Optional[str]:
+        """
+        Returns value of a character variable in the first row.
+        """
+        for variable in self.variables:
+            if variable.name == variable_name and self.first_row is not None:
+                value = self.first_row[
+                    variable.position : variable.position + variable.length
+                ]
+                return value.decode(ENCODING, errors="replace").rstrip(" ")
+        return None
+
+
+class XPTHeaderReader:
+    """
+    Reads SAS XPORT version 5 headers without reading the observations.
+    The number of observations is calculated from the file size,
+    so only the header and the last records of the file are read.
+    """
+
+    def __init__(self, file_path: str):
+        self._file_path = file_path
+
+    def read(self) -> XPTHeader:
+        """
+        Raises ValueError if the file is not a version 5 transport file.
+        """
+        with open(self._file_path, "rb") as file:
+            records = file.read(8 * RECORD_LENGTH)
+            if len(records) < 8 * RECORD_LENGTH or not records.startswith(
+                LIBRARY_HEADER
+            ):
+                raise ValueError(f"{self._file_path} is not a SAS XPORT version 5 file")
+            member_header = self._get_record(records, 3)
+            member_data = self._get_record(records, 5)
+            member_data_2 = self._get_record(records, 6)
+            namestr_header = self._get_record(records, 7)
+            if not (
+                member_header.startswith(MEMBER_HEADER)
+                and namestr_header.startswith(NAMESTR_HEADER)
+            ):
+                raise ValueError(f"{self._file_path} has invalid member headers")
+            namestr_length = int(member_header[74:78])
+            number_of_variables = int(namestr_header[54:58])
+            namestr_block_length = (
+                math.ceil(number_of_variables * namestr_length / RECORD_LENGTH)
+                * RECORD_LENGTH
+            )
+            namestr_block = file.read(namestr_block_length)
+            if not file.read(RECORD_LENGTH).startswith(OBS_HEADER):
+                raise ValueError(f"{self._file_path} has no observation header")
+            variables = [
+                self._parse_namestr(namestr_block[offset : offset + namestr_length])
+                for offset in range(
+                    0, number_of_variables * namestr_length, namestr_length
+                )
+            ]
+            data_offset = file.tell()
+            row_length = sum(variable.length for variable in variables)
+            number_of_rows = self._count_rows(file, data_offset, row_length)
+            first_row = None
+            if number_of_rows:
+                file.seek(data_offset)
+                first_row = file.read(row_length)
+        return XPTHeader(
+            dataset_name=self._decode(member_data[8:16]),
+            dataset_label=self._decode(member_data_2[32:72]) or None,
+            created=self._parse_datetime(member_data[64:80]),
+            modified=self._parse_datetime(member_data_2[0:16]),
+            variables=variables,
+            data_offset=data_offset,
+            row_length=row_length,
+            number_of_rows=number_of_rows,
+            first_row=first_row,
+        )
+
+    def _count_rows(self, file, data_offset: int, row_length: int) -> int:
+        """
+        The last record is padded with blanks up to 80 bytes,
+        so the padding can look like blank rows when rows are short.
+        Blank rows at the end of the file are not counted.
+        """
+        if not row_length:
+            return 0
+        number_of_rows = (os.path.getsize(self._file_path) - data_offset) // row_length
+        while number_of_rows:
+            file.seek(data_offset + (number_of_rows - 1) * row_length)
+            if file.read(row_length).strip(b" "):
+                break
+            number_of_rows -= 1
+        return number_of_rows
+
+    @classmethod
+    def _parse_namestr(cls, namestr: bytes) -> XPTVariable:
+        (
+            variable_type,
+            _,
+            length,
+            _,
+            name,
+            label,
+            format_name,
+            format_length,
+            format_decimals,
+            _,
+            _,
+            _,
+            _,
+            _,
+            position,
+        ) = NAMESTR.unpack(namestr[: NAMESTR.size])
+        return XPTVariable(
+            name=cls._decode(name),
+            label=cls._decode(label) or None,
+            type="double" if variable_type == 1 else "string",
+            length=length,
+            format=cls._get_format(
+                cls._decode(format_name), format_length, format_decimals
+            ),
+            position=position,
+        )
+
+    @staticmethod
+    def _get_format(name: str, length: int, decimals: int) -> str:
+        if decimals:
+            return f"{name}{length}.{decimals}"
+        if length:
+            return f"{name}{length}"
+        return name
+
+    @staticmethod
+    def _get_record(records: bytes, index: int) -> bytes:
+        return records[index * RECORD_LENGTH : (index + 1) * RECORD_LENGTH]
+
+    @staticmethod
+    def _decode(value: bytes) -> str:
+        return value.decode(ENCODING, errors="replace").strip(" \x00")
+
+    @staticmethod
+    def _parse_datetime(value: bytes) -> datetime:
+        """
+        Parses datetime in ddMMMyy:hh:mm:ss format.
+        """
+        text = value.decode("ascii")
+        year = int(text[5:7])
+        return datetime(
+            year + (1900 if year >= 69 else 2000),
+            MONTHS.index(text[2:5].upper()) + 1,
+            int(text[0:2]),
+            int(text[8:10]),
+            int(text[11:13]),
+            int(text[14:16]),
+        )
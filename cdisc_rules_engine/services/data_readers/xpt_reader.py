@@ -1,23 +1,32 @@
 from io import BytesIO
+from typing import List, Optional
 
 import pandas as pd
+import pyreadstat
 from cdisc_rules_engine.models.dataset import PandasDataset
 import tempfile
 
 from cdisc_rules_engine.interfaces import (
     DataReaderInterface,
 )
+from cdisc_rules_engine.services.data_readers.float_formatting import format_floats
 
 
 class XPTReader(DataReaderInterface):
     def read(self, data):
         df = pd.read_sas(BytesIO(data), format="xport", encoding="utf-8")
-        df = self._format_floats(df)
+        df = format_floats(df)
         return df
 
-    def _read_pandas(self, file_path):
-        data = pd.read_sas(file_path, format="xport", encoding="utf-8")
-        return PandasDataset(self._format_floats(data))
+    def _read_pandas(self, file_path, columns: Optional[List[str]] = None):
+        if columns is None:
+            data = pd.read_sas(file_path, format="xport", encoding="utf-8")
+        else:
+            # pyreadstat decodes only the requested columns
+            data, _ = pyreadstat.read_xport(
+                file_path, usecols=columns, disable_datetime_conversion=True
+            )
+        return PandasDataset(format_floats(data))
 
     def to_parquet(self, file_path: str) -> str:
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".parquet")
@@ -25,7 +34,7 @@ class XPTReader(DataReaderInterface):
         created = False
         num_rows = 0
         for chunk in dataset:
-            self._format_floats(chunk)
+            chunk = format_floats(chunk)
             num_rows += len(chunk)
             if not created:
                 chunk.to_parquet(temp_file.name, engine="fastparquet")
@@ -34,8 +43,5 @@ class XPTReader(DataReaderInterface):
                 chunk.to_parquet(temp_file.name, engine="fastparquet", append=True)
         return num_rows, temp_file.name
 
-    def from_file(self, file_path):
-        return self._read_pandas(file_path)
-
-    def _format_floats(self, dataframe: pd.DataFrame) -> pd.DataFrame:
-        return dataframe.applymap(lambda x: round(x, 15) if isinstance(x, float) else x)
+    def from_file(self, file_path, columns: Optional[List[str]] = None):
+        return self._read_pandas(file_path, columns)
@@ -1,4 +1,5 @@
 import asyncio
+import copy
 from abc import ABC
 from functools import wraps, partial
 from typing import Callable, List, Optional, Iterable, Iterator
@@ -20,6 +21,7 @@ from cdisc_rules_engine.constants.classes import (
     INTERVENTIONS,
     RELATIONSHIP,
 )
+from cdisc_rules_engine.enums.dataset_fingerprint_types import DatasetFingerprintTypes
 from cdisc_rules_engine.models.dataset_types import DatasetTypes
 from cdisc_rules_engine.services import logger
 from cdisc_rules_engine.services.cdisc_library_service import CDISCLibraryService
@@ -27,12 +29,51 @@ from cdisc_rules_engine.services.data_readers import DataReaderFactory
 from cdisc_rules_engine.utilities.utils import (
     convert_library_class_name_to_ct_class,
     get_dataset_cache_key_from_path,
+    get_projected_dataset_cache_key,
     get_directory_path,
+    get_file_fingerprint,
     search_in_list_of_dicts,
 )
 from cdisc_rules_engine.utilities.sdtm_utilities import get_class_and_domain_metadata
 from cdisc_rules_engine.models.dataset.dataset_interface import DatasetInterface
-from cdisc_rules_engine.models.dataset import PandasDataset, DaskDataset
+from cdisc_rules_engine.models.dataset import ArrowDataset, PandasDataset, DaskDataset
+
+
+def project_dataset(dataset: DatasetInterface, columns: List[str]) -> DatasetInterface:
+    """
+    Returns a copy of the dataset with the given columns,
+    columns that do not exist in the dataset are ignored.
+    """
+    selected_columns = set(columns)
+    if isinstance(dataset, ArrowDataset) and dataset.table is not None:
+        return ArrowDataset(
+            dataset.table.select(
+                [column for column in dataset.columns if column in selected_columns]
+            )
+        )
+    projected_dataset = copy.copy(dataset)
+    projected_dataset.data = dataset.data[
+        [column for column in dataset.columns if column in selected_columns]
+    ]
+    return projected_dataset
+
+
+def get_dataset_fingerprint(
+    dataset_name: str, fingerprint_type: Optional[str]
+) -> Optional[str]:
+    """
+    Returns the fingerprint of the dataset file or None
+    if the dataset is not a local file.
+    """
+    if fingerprint_type == DatasetFingerprintTypes.NONE.value:
+        return None
+    try:
+        return get_file_fingerprint(
+            dataset_name,
+            content_hash=fingerprint_type == DatasetFingerprintTypes.CONTENT.value,
+        )
+    except (OSError, TypeError, ValueError):
+        return None
 
 
 def cached_dataset(dataset_type: str):
@@ -43,6 +84,13 @@ def cached_dataset(dataset_type: str):
     if needed dataset exists in cache.
     Bear in mind that wrapped functions have to be
     called with kwargs in order to support cache key template.
+
+    If the function is called with columns kwarg, the dataset
+    is projected from the cached full dataset when it exists,
+    otherwise the projected dataset is cached under its own key.
+
+    Keys of datasets read from files include the fingerprint
+    of the file, so a file changed at the same path is read again.
     """
     if not DatasetTypes.contains(dataset_type):
         raise ValueError(f"Invalid dataset type: {dataset_type}")
@@ -56,7 +104,23 @@ def cached_dataset(dataset_type: str):
                 f"Downloading dataset from storage. dataset_name={dataset_name},"
                 f" wrapped function={func.__name__}"
             )
-            cache_key: str = get_dataset_cache_key_from_path(dataset_name, dataset_type)
+            cache_key: str = get_dataset_cache_key_from_path(
+                dataset_name,
+                dataset_type,
+                get_dataset_fingerprint(
+                    dataset_name, getattr(instance, "dataset_fingerprint_type", None)
+                ),
+            )
+            columns: Optional[List[str]] = kwargs.get("columns")
+            if columns is not None:
+                cache_data = instance.cache_service.get_dataset(cache_key)
+                if cache_data is not None:
+                    logger.info(
+                        f'Dataset "{dataset_name}" was found in cache.'
+                        f" cache_key={cache_key}"
+                    )
+                    return project_dataset(cache_data, columns)
+                cache_key = get_projected_dataset_cache_key(cache_key, columns)
             cache_data = instance.cache_service.get_dataset(cache_key)
             if cache_data is not None:
                 logger.info(
@@ -102,6 +166,12 @@ class BaseDataService(DataServiceInterface, ABC):
         self.dataset_implementation = kwargs.get(
             "dataset_implementation", PandasDataset
         )
+        self.categorical_threshold: Optional[float] = kwargs.get(
+            "categorical_threshold"
+        )
+        self.dataset_fingerprint_type: str = kwargs.get(
+            "dataset_fingerprint_type", DatasetFingerprintTypes.STAT.value
+        )
 
     def get_dataset_by_type(
         self, dataset_name: str, dataset_type: str, **params
@@ -324,6 +394,28 @@ class BaseDataService(DataServiceInterface, ABC):
         numeric_columns = dataset.data.select_dtypes(include=np.number).columns
         dataset[numeric_columns] = dataset.data[numeric_columns].replace(np.nan, None)
 
+    def _convert_strings_to_categorical(self, dataset: DatasetInterface):
+        """
+        Converts low-cardinality string columns to categoricals
+        if categorical_threshold is set.
+        A column is converted if the ratio of its distinct values
+        to its rows does not exceed the threshold.
+        Columns with missing values are kept as they are,
+        because a categorical does not distinguish None from NaN.
+        """
+        data: pd.DataFrame = dataset.data
+        if not self.categorical_threshold or not isinstance(data, pd.DataFrame):
+            return
+        max_distinct_values: float = self.categorical_threshold * len(data.index)
+        for position, column_name in enumerate(data.columns):
+            column: pd.Series = data.iloc[:, position]
+            if (
+                column.dtype == object
+                and pd.api.types.infer_dtype(column, skipna=False) == "string"
+                and column.nunique() <= max_distinct_values
+            ):
+                data.isetitem(position, column.astype("category"))
+
     @staticmethod
     def _replace_nans_in_specified_cols_with_none(
         dataset: DatasetInterface, column_names: Iterable
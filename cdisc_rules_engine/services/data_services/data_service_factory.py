@@ -1,13 +1,14 @@
 from typing import Iterable, List, Type
 
 from cdisc_rules_engine.dummy_models.dummy_dataset import DummyDataset
+from cdisc_rules_engine.enums.dataset_fingerprint_types import DatasetFingerprintTypes
 from cdisc_rules_engine.interfaces import (
     CacheServiceInterface,
     ConfigInterface,
     DataServiceInterface,
     FactoryInterface,
 )
-from cdisc_rules_engine.models.dataset import DaskDataset, PandasDataset
+from cdisc_rules_engine.models.dataset import ArrowDataset, DaskDataset, PandasDataset
 
 
 from . import DummyDataService, LocalDataService, USDMDataService
@@ -23,6 +24,11 @@ class DataServiceFactory(FactoryInterface):
         "dummy": DummyDataService,
         "usdm": USDMDataService,
     }
+    _dataset_implementations_map = {
+        "pandas": PandasDataset,
+        "arrow": ArrowDataset,
+        "dask": DaskDataset,
+    }
 
     def __init__(
         self,
@@ -32,6 +38,7 @@ class DataServiceFactory(FactoryInterface):
         standard_version: str = None,
         library_metadata: LibraryMetadataContainer = None,
         max_dataset_size: int = 0,
+        categorical_threshold: float = None,
     ):
         if config.getValue("DATA_SERVICE_TYPE"):
             self.data_service_name = config.getValue("DATA_SERVICE_TYPE")
@@ -45,7 +52,11 @@ class DataServiceFactory(FactoryInterface):
         self.standard_version = standard_version
         self.library_metadata = library_metadata
         self.max_dataset_size = max_dataset_size
+        self.categorical_threshold = categorical_threshold
         self.dataset_size_threshold = self.config.get_dataset_size_threshold()
+        self.arrow_dataset_size_threshold = (
+            self.config.get_arrow_dataset_size_threshold()
+        )
 
     def get_data_service(
         self, dataset_paths: Iterable[str] = []
@@ -59,6 +70,7 @@ class DataServiceFactory(FactoryInterface):
                 library_metadata=self.library_metadata,
                 dataset_path=dataset_paths[0],
                 dataset_implementation=self.get_dataset_implementation(),
+                dataset_fingerprint_type=self.get_dataset_fingerprint_type(),
             )
         else:
             """Get local Directory data service"""
@@ -69,6 +81,8 @@ class DataServiceFactory(FactoryInterface):
                 library_metadata=self.library_metadata,
                 dataset_paths=dataset_paths,
                 dataset_implementation=self.get_dataset_implementation(),
+                categorical_threshold=self.categorical_threshold,
+                dataset_fingerprint_type=self.get_dataset_fingerprint_type(),
             )
 
     def get_dummy_data_service(self, data: List[DummyDataset]) -> DataServiceInterface:
@@ -88,6 +102,16 @@ class DataServiceFactory(FactoryInterface):
 
         :returns DatasetInterface.__class__
         """
+        implementation_name = self.config.getValue("DATASET_IMPLEMENTATION")
+        if implementation_name:
+            if implementation_name.lower() not in self._dataset_implementations_map:
+                raise ValueError(
+                    "Dataset implementation must be in "
+                    f"{list(self._dataset_implementations_map.keys())}, "
+                    f"given dataset implementation is {implementation_name}"
+                )
+            logger.info(f"Using {implementation_name.upper()} dataset implementation")
+            return self._dataset_implementations_map[implementation_name.lower()]
         if (
             self.max_dataset_size
             and self.max_dataset_size >= self.dataset_size_threshold
@@ -95,9 +119,32 @@ class DataServiceFactory(FactoryInterface):
             # Use large dataset class
             logger.info("Using DASK dataset implementation")
             return DaskDataset
+        if (
+            self.max_dataset_size
+            and self.arrow_dataset_size_threshold is not None
+            and self.max_dataset_size >= self.arrow_dataset_size_threshold
+        ):
+            logger.info("Using ARROW dataset implementation")
+            return ArrowDataset
         logger.info("Using PANDAS dataset implementation")
         return PandasDataset
 
+    def get_dataset_fingerprint_type(self) -> str:
+        """
+        Gets what cache keys of datasets read from files include
+        besides the file path, set in DATASET_CACHE_FINGERPRINT.
+        """
+        fingerprint_type = self.config.getValue("DATASET_CACHE_FINGERPRINT")
+        if not fingerprint_type:
+            return DatasetFingerprintTypes.STAT.value
+        if not DatasetFingerprintTypes.contains(fingerprint_type.lower()):
+            raise ValueError(
+                "Dataset cache fingerprint must be in "
+                f"{sorted(DatasetFingerprintTypes.values())}, "
+                f"given dataset cache fingerprint is {fingerprint_type}"
+            )
+        return fingerprint_type.lower()
+
     @classmethod
     def register_service(cls, name: str, service: Type[DataServiceInterface]) -> None:
         """
@@ -1,6 +1,6 @@
 import os
 from io import IOBase
-from typing import Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from cdisc_rules_engine.interfaces import CacheServiceInterface, ConfigInterface
 from cdisc_rules_engine.models.dataset_metadata import DatasetMetadata
@@ -24,7 +24,7 @@ from cdisc_rules_engine.utilities.utils import (
 from .base_data_service import BaseDataService, cached_dataset
 from cdisc_rules_engine.enums.dataformat_types import DataFormatTypes
 from cdisc_rules_engine.models.dataset.dataset_interface import DatasetInterface
-from cdisc_rules_engine.models.dataset import PandasDataset
+from cdisc_rules_engine.models.dataset import ArrowDataset, PandasDataset
 import re
 
 
@@ -56,7 +56,8 @@ class LocalDataService(BaseDataService):
                 reader_factory=DataReaderFactory(
                     dataset_implementation=kwargs.get(
                         "dataset_implementation", PandasDataset
-                    )
+                    ),
+                    reader_names=cls._get_reader_names(config),
                 ),
                 config=config,
                 **kwargs,
@@ -64,6 +65,15 @@ class LocalDataService(BaseDataService):
             cls._instance = service
         return cls._instance
 
+    @staticmethod
+    def _get_reader_names(config: ConfigInterface) -> Dict[str, str]:
+        """
+        XPT files are read with the reader set in XPT_READER
+        if it is set, e.g. XPT_READER=XPT_NATIVE.
+        """
+        xpt_reader = config.getValue("XPT_READER") if config else None
+        return {DataFormatTypes.XPT.value: xpt_reader} if xpt_reader else {}
+
     def has_all_files(self, prefix: str, file_names: List[str]) -> bool:
         files = [
             f.lower()
@@ -83,12 +93,17 @@ class LocalDataService(BaseDataService):
         return None
 
     @cached_dataset(DatasetTypes.CONTENTS.value)
-    def get_dataset(self, dataset_name: str, **params) -> DatasetInterface:
+    def get_dataset(
+        self, dataset_name: str, columns: Optional[List[str]] = None, **params
+    ) -> DatasetInterface:
         reader = self._reader_factory.get_service(
             extract_file_name_from_path_string(dataset_name).split(".")[1].upper()
         )
-        df = reader.from_file(dataset_name)
+        df = reader.from_file(dataset_name, columns)
         self._replace_nans_in_numeric_cols_with_none(df)
+        self._convert_strings_to_categorical(df)
+        if self.dataset_implementation == ArrowDataset:
+            df = ArrowDataset.from_pandas(df.data)
         return df
 
     @cached_dataset(DatasetTypes.METADATA.value)
@@ -0,0 +1,71 @@
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+import jsonschema
+
+from cdisc_rules_engine.config import config
+from cdisc_rules_engine.utilities.utils import get_file_fingerprint
+
+SCHEMA_PATH = os.path.join("resources", "schema", "dataset.schema.json")
+
+
+class DatasetJSONSchemaValidator:
+    """
+    Validates Dataset-JSON files against the Dataset-JSON schema.
+    The schema is loaded and compiled once per process.
+
+    By default only the structure of a file is validated:
+    readers pass the document without rows except the first sample_size rows.
+    In strict mode the whole file is loaded and validated instead.
+    The mode is set with DATASET_JSON_SCHEMA_VALIDATION=strict
+    and the sample size with DATASET_JSON_SCHEMA_SAMPLE_SIZE.
+
+    Results are cached by file fingerprint, so a file is validated once
+    even if both its metadata and its contents are read.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, sample_size: int = 1, strict: bool = False):
+        with open(SCHEMA_PATH) as schema_file:
+            self.schema: dict = json.load(schema_file)
+        validator_class = jsonschema.validators.validator_for(self.schema)
+        validator_class.check_schema(self.schema)
+        self._validator = validator_class(self.schema)
+        self.sample_size = max(sample_size, 1)
+        self.strict = strict
+        self._errors: Dict[str, Optional[jsonschema.ValidationError]] = {}
+
+    @classmethod
+    def get_instance(cls) -> "DatasetJSONSchemaValidator":
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls(
+                    sample_size=int(
+                        config.getValue("DATASET_JSON_SCHEMA_SAMPLE_SIZE") or 1
+                    ),
+                    strict=config.getValue("DATASET_JSON_SCHEMA_VALIDATION")
+                    == "strict",
+                )
+        return cls._instance
+
+    def validate(self, file_path: str, document: dict):
+        """
+        Validates the file. The document is the part of the file
+        read by the caller, it is not used in strict mode.
+        Raises jsonschema.ValidationError if the file is not valid.
+        """
+        fingerprint: str = get_file_fingerprint(file_path)
+        if fingerprint not in self._errors:
+            if self.strict:
+                with open(file_path) as file:
+                    document = json.load(file)
+            self._errors[fingerprint] = jsonschema.exceptions.best_match(
+                self._validator.iter_errors(document)
+            )
+        error = self._errors[fingerprint]
+        if error is not None:
+            raise error
@@ -1,10 +1,17 @@
-import os
-import json
+import itertools
 import jsonschema
 
 
 from cdisc_rules_engine.services import logger
 from cdisc_rules_engine.services.adam_variable_reader import AdamVariableReader
+from cdisc_rules_engine.services.dataset_json_schema_validator import (
+    DatasetJSONSchemaValidator,
+)
+from cdisc_rules_engine.utilities.json_stream_reader import JSONStreamReader
+
+DATA_KEYS = ("clinicalData", "referenceData")
+REQUIRED_KEYS = {"creationDateTime", "datasetJSONVersion"}
+REQUIRED_ITEM_GROUP_KEYS = {"records", "name", "label", "items"}
 
 
 class DatasetJSONMetadataReader:
@@ -21,19 +28,15 @@ class DatasetJSONMetadataReader:
     def read(self) -> dict:
         """
         Extracts metadata from .json file.
+        Only the first rows of the data are read and validated
+        against the schema.
         """
-        # Load Dataset-JSON Schema
-        with open(
-            os.path.join("resources", "schema", "dataset.schema.json")
-        ) as schemajson:
-            schema = schemajson.read()
-        schema = json.loads(schema)
-
-        with open(self._file_path, "r") as file:
-            datasetjson = json.load(file)
+        datasetjson = self._read_header()
 
         try:
-            jsonschema.validate(datasetjson, schema)
+            DatasetJSONSchemaValidator.get_instance().validate(
+                self._file_path, datasetjson
+            )
 
             if "clinicalData" in datasetjson:
                 data_key = "clinicalData"
@@ -111,6 +114,70 @@ class DatasetJSONMetadataReader:
                 "dataset_modification_date": "",
             }
 
+    def _read_header(self) -> dict:
+        """
+        Reads the document without the rows of itemData
+        except the first rows, which are validated with it.
+        Reading stops after these rows when the metadata
+        has already been read, which is the usual order of keys.
+        """
+        header = {}
+        with open(self._file_path, "r") as file:
+            reader = JSONStreamReader(file)
+            if reader.peek() != "{":
+                # not a Dataset-JSON document, fails the schema validation
+                return reader.read_value()
+            for key in reader.iter_object():
+                if key not in DATA_KEYS or reader.peek() != "{":
+                    header[key] = reader.read_value()
+                    continue
+                header[key] = {}
+                if self._read_data(reader, header, header[key]):
+                    break
+        return header
+
+    def _read_data(self, reader: JSONStreamReader, header: dict, data: dict) -> bool:
+        """
+        Returns True if reading has stopped after the first rows.
+        """
+        for key in reader.iter_object():
+            if key != "itemGroupData" or reader.peek() != "{":
+                data[key] = reader.read_value()
+                continue
+            data[key] = {}
+            for item_group_oid in reader.iter_object():
+                if reader.peek() != "{":
+                    data[key][item_group_oid] = reader.read_value()
+                    continue
+                data[key][item_group_oid] = item_group = {}
+                if self._read_item_group(reader, header, item_group):
+                    return True
+        return False
+
+    @staticmethod
+    def _read_item_group(
+        reader: JSONStreamReader, header: dict, item_group: dict
+    ) -> bool:
+        """
+        Returns True if reading has stopped after the first rows.
+        """
+        sample_size: int = DatasetJSONSchemaValidator.get_instance().sample_size
+        for key in reader.iter_object():
+            if key != "itemData" or reader.peek() != "[":
+                item_group[key] = reader.read_value()
+                continue
+            rows = reader.iter_array()
+            item_group[key] = [
+                reader.read_value() for _ in itertools.islice(rows, sample_size)
+            ]
+            if REQUIRED_ITEM_GROUP_KEYS <= item_group.keys() and (
+                REQUIRED_KEYS <= header.keys()
+            ):
+                return True
+            for _ in rows:
+                reader.skip_value()
+        return False
+
     def _extract_domain_name(self, data):
         index_domain = next(
             (
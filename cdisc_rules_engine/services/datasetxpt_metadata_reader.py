@@ -3,6 +3,9 @@ import pyreadstat
 from cdisc_rules_engine.services import logger
 from cdisc_rules_engine.config import config
 from cdisc_rules_engine.services.adam_variable_reader import AdamVariableReader
+from cdisc_rules_engine.services.data_readers.xpt_header_reader import (
+    XPTHeaderReader,
+)
 import os
 
 
@@ -30,12 +33,52 @@ class DatasetXPTMetadataReader:
     def read(self) -> dict:
         """
         Extracts metadata from binary contents of .xpt file.
+        Version 5 files are read from the header, other files
+        are read with pyreadstat.
         """
+        try:
+            self._metadata_container = self._read_header_records()
+        except ValueError:
+            self._metadata_container = self._read_with_pyreadstat()
+        self._domain_name = self._metadata_container["domain_name"]
+        self._convert_variable_types()
+        self._metadata_container["adam_info"] = self._extract_adam_info(
+            self._metadata_container["variable_names"]
+        )
+        logger.info(f"Extracted dataset metadata. metadata={self._metadata_container}")
+        return self._metadata_container
+
+    def _read_header_records(self) -> dict:
+        """
+        Reads metadata from the header records without reading observations.
+        """
+        header = XPTHeaderReader(self._file_path).read()
+        return {
+            "variable_labels": [variable.label for variable in header.variables],
+            "variable_names": [variable.name for variable in header.variables],
+            "variable_formats": [variable.format for variable in header.variables],
+            "variable_name_to_label_map": {
+                variable.name: variable.label for variable in header.variables
+            },
+            "variable_name_to_data_type_map": {
+                variable.name: variable.type for variable in header.variables
+            },
+            "variable_name_to_size_map": {
+                variable.name: variable.length for variable in header.variables
+            },
+            "number_of_variables": len(header.variables),
+            "dataset_label": header.dataset_label,
+            "dataset_length": header.number_of_rows,
+            "domain_name": header.get_first_row_value("DOMAIN"),
+            "dataset_name": self._dataset_name,
+            "dataset_modification_date": header.modified.isoformat(),
+        }
+
+    def _read_with_pyreadstat(self) -> dict:
         dataset, metadata = pyreadstat.read_xport(
             self._file_path, row_limit=self.row_limit
         )
-        self._domain_name = self._extract_domain_name(dataset)
-        self._metadata_container = {
+        metadata_container = {
             "variable_labels": list(metadata.column_labels),
             "variable_names": list(metadata.column_names),
             "variable_formats": [
@@ -48,22 +91,13 @@ class DatasetXPTMetadataReader:
             "number_of_variables": metadata.number_columns,
             "dataset_label": metadata.file_label,
             "dataset_length": metadata.number_rows,
-            "domain_name": self._domain_name,
+            "domain_name": self._extract_domain_name(dataset),
             "dataset_name": self._dataset_name,
             "dataset_modification_date": metadata.modification_time.isoformat(),
         }
-
         if self._estimate_dataset_length:
-            self._metadata_container[
-                "dataset_length"
-            ] = self._calculate_dataset_length()
-        self._domain_name = self._extract_domain_name(dataset)
-        self._convert_variable_types()
-        self._metadata_container["adam_info"] = self._extract_adam_info(
-            self._metadata_container["variable_names"]
-        )
-        logger.info(f"Extracted dataset metadata. metadata={self._metadata_container}")
-        return self._metadata_container
+            metadata_container["dataset_length"] = self._calculate_dataset_length()
+        return metadata_container
 
     def _extract_domain_name(self, df):
         try:
@@ -31,6 +31,32 @@ class BaseReport(ABC):
         self._args = args
         self._template = template
         self._output_name: str = f"{self._args.output}.{self._file_format}"
+        # report data of results added one by one with add_result
+        self._summary_data: List = []
+        self._detailed_data: List = []
+        self._rules_report_data: List = []
+
+    def add_result(self, validation_result: RuleValidationResult):
+        """
+        Adds a validation result to the report while the validation is running.
+        Only the data needed for the report is kept,
+        so the result can be released afterwards.
+        """
+        self._summary_data.extend(self._generate_summary_items(validation_result))
+        self._add_error_details(
+            validation_result, self._generate_error_details(validation_result)
+        )
+        self._rules_report_data.append(
+            self._generate_rules_report_item(validation_result)
+        )
+
+    def _add_error_details(
+        self, validation_result: RuleValidationResult, error_details: List
+    ):
+        self._detailed_data.extend(error_details)
+
+    def set_elapsed_time(self, elapsed_time: float):
+        self._elapsed_time = elapsed_time
 
     def get_summary_data(self) -> List[List]:
         """
@@ -45,47 +71,55 @@ class BaseReport(ABC):
             "Explanation"
         ]
         """
-        summary_data = []
+        summary_data = list(self._summary_data)
         for validation_result in self._results:
-            if validation_result.execution_status == "success":
-                for result in validation_result.results or []:
-                    dataset = result.get("dataset")
-                    domain = result.get("domain")
-                    if (
-                        result.get("errors")
-                        and result.get("executionStatus") == "success"
-                    ):
-                        summary_item = {
-                            "dataset": dataset,
-                            "domain": domain,
-                            "core_id": validation_result.id,
-                            "message": result.get("message"),
-                            "issues": len(result.get("errors")),
-                        }
-
-                        if self._item_type == "list":
-                            summary_data.extend([[*summary_item.values()]])
-                        elif self._item_type == "dict":
-                            summary_data.extend([summary_item])
+            summary_data.extend(self._generate_summary_items(validation_result))
 
         return sorted(
             summary_data,
-            key=lambda x: (x[0], x[1])
-            if (self._item_type == "list")
-            else (x["dataset"], x["core_id"]),
+            key=lambda x: (
+                (x[0], x[1])
+                if (self._item_type == "list")
+                else (x["dataset"], x["core_id"])
+            ),
         )
 
+    def _generate_summary_items(
+        self, validation_result: RuleValidationResult
+    ) -> List[Union[list, dict]]:
+        summary_items = []
+        if validation_result.execution_status == "success":
+            for result in validation_result.results or []:
+                dataset = result.get("dataset")
+                domain = result.get("domain")
+                if result.get("errors") and result.get("executionStatus") == "success":
+                    summary_item = {
+                        "dataset": dataset,
+                        "domain": domain,
+                        "core_id": validation_result.id,
+                        "message": result.get("message"),
+                        "issues": len(result.get("errors")),
+                    }
+
+                    if self._item_type == "list":
+                        summary_items.append([*summary_item.values()])
+                    elif self._item_type == "dict":
+                        summary_items.append(summary_item)
+        return summary_items
+
     def get_detailed_data(self) -> List[List]:
-        detailed_data = []
+        detailed_data = list(self._detailed_data)
         for validation_result in self._results:
             detailed_data = detailed_data + self._generate_error_details(
                 validation_result
             )
         return sorted(
             detailed_data,
-            key=lambda x: (x[0], x[3])
-            if (self._item_type == "list")
-            else (x["core_id"], x["dataset"]),
+            key=lambda x: (
+                (x[0], x[3])
+                if (self._item_type == "list")
+                else (x["core_id"], x["dataset"])
+            ),
         )
 
     def _generate_error_details(
@@ -157,29 +191,35 @@ class BaseReport(ABC):
             "Status"
         ]
         """
-        rules_report = []
+        rules_report = list(self._rules_report_data)
         for validation_result in self._results:
-            rules_item = {
-                "core_id": validation_result.id,
-                "version": "1",
-                "cdisc_rule_id": validation_result.cdisc_rule_id,
-                "fda_rule_id": validation_result.fda_rule_id,
-                "pmda_rule_id": validation_result.pmda_rule_id,
-                "message": validation_result.message,
-                "status": ExecutionStatus.SUCCESS.value.upper()
-                if validation_result.execution_status == ExecutionStatus.SUCCESS.value
-                else ExecutionStatus.SKIPPED.value.upper(),
-            }
-            if self._item_type == "list":
-                rules_report.append([*rules_item.values()])
-            elif self._item_type == "dict":
-                rules_report.append(rules_item)
+            rules_report.append(self._generate_rules_report_item(validation_result))
 
         return sorted(
             rules_report,
             key=lambda x: x[0] if (self._item_type == "list") else x["core_id"],
         )
 
+    def _generate_rules_report_item(
+        self, validation_result: RuleValidationResult
+    ) -> Union[list, dict]:
+        rules_item = {
+            "core_id": validation_result.id,
+            "version": "1",
+            "cdisc_rule_id": validation_result.cdisc_rule_id,
+            "fda_rule_id": validation_result.fda_rule_id,
+            "pmda_rule_id": validation_result.pmda_rule_id,
+            "message": validation_result.message,
+            "status": (
+                ExecutionStatus.SUCCESS.value.upper()
+                if validation_result.execution_status == ExecutionStatus.SUCCESS.value
+                else ExecutionStatus.SKIPPED.value.upper()
+            ),
+        }
+        if self._item_type == "list":
+            return [*rules_item.values()]
+        return rules_item
+
     @property
     @abstractmethod
     def _file_format(self) -> str:
@@ -1,6 +1,8 @@
+import itertools
 import json
+import tempfile
 from datetime import datetime
-from typing import BinaryIO, List, Optional, Iterable
+from typing import BinaryIO, IO, List, Optional, Iterable, Tuple
 
 from cdisc_rules_engine.enums.report_types import ReportTypes
 from cdisc_rules_engine.models.rule_validation_result import RuleValidationResult
@@ -31,6 +33,74 @@ class JsonReport(BaseReport):
             datasets, dataset_paths, validation_results, elapsed_time, args, template
         )
         self._item_type = "dict"
+        # issue details (or raw results) of results added with add_result
+        # are written to a temporary file instead of being kept in memory
+        self._streamed_items_file: Optional[IO[bytes]] = None
+        self._streamed_items_index: List[Tuple[str, int]] = []
+
+    def add_result(self, validation_result: RuleValidationResult):
+        if self._args.raw_report:
+            self._write_streamed_item(
+                validation_result.id, validation_result.to_representation()
+            )
+        else:
+            super().add_result(validation_result)
+
+    def _add_error_details(
+        self, validation_result: RuleValidationResult, error_details: List
+    ):
+        if error_details:
+            self._write_streamed_item(validation_result.id, error_details)
+
+    def _write_streamed_item(self, core_id: str, item):
+        if self._streamed_items_file is None:
+            self._streamed_items_file = tempfile.TemporaryFile()
+        self._streamed_items_index.append((core_id, self._streamed_items_file.tell()))
+        self._streamed_items_file.write(json.dumps(item).encode("utf-8") + b"\n")
+
+    def _read_streamed_item(self, offset: int):
+        self._streamed_items_file.seek(offset)
+        return json.loads(self._streamed_items_file.readline())
+
+    def _iter_streamed_items(self) -> Iterable:
+        """
+        Reads items from the temporary file.
+        Raw results are returned in the order they were added.
+        Issue details are returned in the order of get_detailed_data.
+        Only details of a single rule are held in memory at a time.
+        """
+        if self._args.raw_report:
+            for _, offset in self._streamed_items_index:
+                yield self._read_streamed_item(offset)
+            return
+        index = sorted(self._streamed_items_index, key=lambda item: item[0])
+        for _, rule_items in itertools.groupby(index, key=lambda item: item[0]):
+            error_details = []
+            for _, offset in rule_items:
+                error_details.extend(self._read_streamed_item(offset))
+            yield from sorted(error_details, key=lambda x: (x["core_id"], x["dataset"]))
+
+    def _dump_streamed_report(self, report_data: dict, f):
+        """
+        Writes the report in the same format as json.dump,
+        streaming the items of the temporary file into it.
+        """
+        streamed_key = "results_data" if self._args.raw_report else "Issue_Details"
+        f.write("{")
+        for key_index, (key, value) in enumerate(report_data.items()):
+            if key_index:
+                f.write(", ")
+            f.write(f"{json.dumps(key)}: ")
+            if key != streamed_key:
+                json.dump(value, f)
+                continue
+            f.write("[")
+            for item_index, item in enumerate(self._iter_streamed_items()):
+                if item_index:
+                    f.write(", ")
+                json.dump(item, f)
+            f.write("]")
+        f.write("}")
 
     @property
     def _file_format(self) -> str:
@@ -96,4 +166,10 @@ class JsonReport(BaseReport):
             raw_report=self._args.raw_report,
         )
         with open(self._output_name, "w") as f:
-            json.dump(report_data, f)
+            if self._streamed_items_file is None:
+                json.dump(report_data, f)
+            else:
+                self._dump_streamed_report(report_data, f)
+                self._streamed_items_file.close()
+                self._streamed_items_file = None
+                self._streamed_items_index = []
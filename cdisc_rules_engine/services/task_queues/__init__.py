@@ -0,0 +1,9 @@
+from .file_system_task_queue import FileSystemTaskQueue
+from .redis_task_queue import RedisTaskQueue
+from .task_queue_factory import TaskQueueFactory
+
+__all__ = [
+    "FileSystemTaskQueue",
+    "RedisTaskQueue",
+    "TaskQueueFactory",
+]
@@ -0,0 +1,222 @@
+import os
+import pickle
+import shutil
+import time
+import uuid
+from typing import Any, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from cdisc_rules_engine.interfaces import TaskQueueInterface
+
+
+class FileSystemTaskQueue(TaskQueueInterface):
+    """
+    Task queue stored in a directory, which can be shared
+    between machines through a network file system.
+
+    Each task and result is a pickled file. Files are written
+    under a temporary name and renamed, so that readers never see
+    partially written files. A task is claimed by renaming it
+    into the claimed directory, which succeeds for one worker only.
+    The claimed file is kept until the result is put,
+    its modification time is the time the claim was last renewed.
+    The lease file holds the owner of the lease and is created
+    exclusively, so that only one owner takes a free lease.
+    """
+
+    TASKS_DIRECTORY = "tasks"
+    CLAIMED_DIRECTORY = "claimed"
+    RESULTS_DIRECTORY = "results"
+    JOB_FILE = "job.pkl"
+    CLOSED_FILE = "closed"
+    LEASE_FILE = "lease"
+    FILE_EXTENSION = ".pkl"
+
+    def __init__(self, path: str, poll_interval: float = 0.1):
+        self.path = path
+        self.poll_interval = poll_interval
+        for directory in (
+            self.TASKS_DIRECTORY,
+            self.CLAIMED_DIRECTORY,
+            self.RESULTS_DIRECTORY,
+        ):
+            os.makedirs(os.path.join(self.path, directory), exist_ok=True)
+
+    @classmethod
+    def from_url(cls, url: str) -> "FileSystemTaskQueue":
+        parsed_url = urlparse(url)
+        if parsed_url.scheme == "file":
+            return cls(url2pathname(parsed_url.path))
+        return cls(url)
+
+    def acquire_lease(self, owner: str, timeout: float) -> bool:
+        lease_path = os.path.join(self.path, self.LEASE_FILE)
+        try:
+            with open(lease_path, "r", encoding="utf-8") as f:
+                lease_owner = f.read()
+            lease_time = os.path.getmtime(lease_path)
+        except FileNotFoundError:
+            lease_owner = None
+        if lease_owner == owner:
+            os.utime(lease_path)
+            return True
+        if lease_owner is not None:
+            if time.time() - lease_time < timeout:
+                return False
+            # the stale lease is moved away by one owner only
+            stale_path = f"{lease_path}.{uuid.uuid4().hex}.tmp"
+            try:
+                os.rename(lease_path, stale_path)
+            except FileNotFoundError:
+                return False
+            os.remove(stale_path)
+        try:
+            with open(lease_path, "x", encoding="utf-8") as f:
+                f.write(owner)
+        except FileExistsError:
+            return False
+        return True
+
+    def release_lease(self, owner: str):
+        lease_path = os.path.join(self.path, self.LEASE_FILE)
+        try:
+            with open(lease_path, "r", encoding="utf-8") as f:
+                if f.read() != owner:
+                    return
+            os.remove(lease_path)
+        except FileNotFoundError:
+            pass
+
+    def publish_job(self, job: Any):
+        self._write(os.path.join(self.path, self.JOB_FILE), job)
+
+    def get_job(self) -> Any:
+        try:
+            return self._read(os.path.join(self.path, self.JOB_FILE))
+        except FileNotFoundError:
+            return None
+
+    def put_task(self, task_id: str, task: Any):
+        self._write(self._get_file_path(self.TASKS_DIRECTORY, task_id), task)
+
+    def get_task(self, timeout: float) -> Optional[Tuple[str, Any]]:
+        deadline = time.monotonic() + timeout
+        while True:
+            for task_id in self._list_ids(self.TASKS_DIRECTORY):
+                claimed_path = self._get_file_path(self.CLAIMED_DIRECTORY, task_id)
+                try:
+                    os.rename(
+                        self._get_file_path(self.TASKS_DIRECTORY, task_id),
+                        claimed_path,
+                    )
+                except FileNotFoundError:
+                    # the task was claimed by another worker
+                    continue
+                try:
+                    os.utime(claimed_path)
+                    task = self._read(claimed_path)
+                except FileNotFoundError:
+                    # the claim was considered stale and requeued
+                    continue
+                return task_id, task
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.poll_interval)
+
+    def touch_task(self, task_id: str):
+        try:
+            os.utime(self._get_file_path(self.CLAIMED_DIRECTORY, task_id))
+        except FileNotFoundError:
+            pass
+
+    def requeue_stale_tasks(self, timeout: float) -> List[str]:
+        requeued_tasks = []
+        for task_id in self._list_ids(self.CLAIMED_DIRECTORY):
+            claimed_path = self._get_file_path(self.CLAIMED_DIRECTORY, task_id)
+            try:
+                if time.time() - os.path.getmtime(claimed_path) < timeout:
+                    continue
+                os.rename(
+                    claimed_path, self._get_file_path(self.TASKS_DIRECTORY, task_id)
+                )
+            except FileNotFoundError:
+                # the result was put in the meantime
+                continue
+            requeued_tasks.append(task_id)
+        return requeued_tasks
+
+    def has_claimed_tasks(self) -> bool:
+        return bool(self._list_ids(self.CLAIMED_DIRECTORY))
+
+    def put_result(self, task_id: str, result: Any):
+        self._write(self._get_file_path(self.RESULTS_DIRECTORY, task_id), result)
+        try:
+            os.remove(self._get_file_path(self.CLAIMED_DIRECTORY, task_id))
+        except FileNotFoundError:
+            pass
+
+    def get_result(self, timeout: float) -> Optional[Tuple[str, Any]]:
+        deadline = time.monotonic() + timeout
+        while True:
+            task_ids = self._list_ids(self.RESULTS_DIRECTORY)
+            if task_ids:
+                result_path = self._get_file_path(self.RESULTS_DIRECTORY, task_ids[0])
+                result = self._read(result_path)
+                os.remove(result_path)
+                return task_ids[0], result
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.poll_interval)
+
+    def close(self):
+        open(os.path.join(self.path, self.CLOSED_FILE), "w").close()
+
+    def is_closed(self) -> bool:
+        return os.path.exists(os.path.join(self.path, self.CLOSED_FILE))
+
+    def clear(self):
+        for directory in (
+            self.TASKS_DIRECTORY,
+            self.CLAIMED_DIRECTORY,
+            self.RESULTS_DIRECTORY,
+        ):
+            directory_path = os.path.join(self.path, directory)
+            shutil.rmtree(directory_path, ignore_errors=True)
+            os.makedirs(directory_path, exist_ok=True)
+        for file_name in (self.JOB_FILE, self.CLOSED_FILE):
+            try:
+                os.remove(os.path.join(self.path, file_name))
+            except FileNotFoundError:
+                pass
+
+    def _get_file_path(self, directory: str, task_id: str) -> str:
+        return os.path.join(self.path, directory, f"{task_id}{self.FILE_EXTENSION}")
+
+    def _list_ids(self, directory: str) -> List[str]:
+        """
+        Returns ids of the files in the directory in the order of ids.
+        Temporary files are skipped.
+        """
+        try:
+            file_names = os.listdir(os.path.join(self.path, directory))
+        except FileNotFoundError:
+            # the queue is being cleared
+            return []
+        return sorted(
+            file_name[: -len(self.FILE_EXTENSION)]
+            for file_name in file_names
+            if file_name.endswith(self.FILE_EXTENSION)
+        )
+
+    @staticmethod
+    def _write(file_path: str, value: Any):
+        temp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, file_path)
+
+    @staticmethod
+    def _read(file_path: str) -> Any:
+        with open(file_path, "rb") as f:
+            return pickle.load(f)
@@ -0,0 +1,188 @@
+import math
+import pickle
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+import redis
+
+from cdisc_rules_engine.interfaces import TaskQueueInterface
+
+
+class RedisTaskQueue(TaskQueueInterface):
+    """
+    Task queue stored in Redis lists.
+    Any server that implements the Redis protocol can be used.
+    Keys of the queue start with the queue name,
+    so that several queues can share one server.
+
+    Tasks are moved atomically from the tasks list to the claimed list
+    when they are taken and removed from it when their result is put.
+    Claim renewal times are kept in a hash by task id
+    and measured with the clock of the server.
+    The lease is a key that holds its owner and expires
+    when it is not renewed.
+    """
+
+    DEFAULT_QUEUE_NAME = "cdisc_rules_engine"
+
+    def __init__(self, client, queue_name: str = DEFAULT_QUEUE_NAME):
+        self.client = client
+        self.queue_name = queue_name
+        # {task id: claimed list item} of tasks taken by this worker
+        self._claimed_items: Dict[str, bytes] = {}
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisTaskQueue":
+        """
+        Creates the queue from a redis url.
+        The queue name can be given in the "queue" query parameter:
+        redis://localhost:6379/0?queue=name
+        """
+        parsed_url = urlparse(url)
+        query = parse_qsl(parsed_url.query)
+        queue_name = cls.DEFAULT_QUEUE_NAME
+        for key, value in query:
+            if key == "queue":
+                queue_name = value
+        client_url = urlunparse(
+            parsed_url._replace(
+                query=urlencode(
+                    [(key, value) for key, value in query if key != "queue"]
+                )
+            )
+        )
+        return cls(redis.Redis.from_url(client_url), queue_name)
+
+    @property
+    def job_key(self) -> str:
+        return f"{self.queue_name}:job"
+
+    @property
+    def tasks_key(self) -> str:
+        return f"{self.queue_name}:tasks"
+
+    @property
+    def claimed_key(self) -> str:
+        return f"{self.queue_name}:claimed"
+
+    @property
+    def claim_times_key(self) -> str:
+        return f"{self.queue_name}:claim_times"
+
+    @property
+    def results_key(self) -> str:
+        return f"{self.queue_name}:results"
+
+    @property
+    def closed_key(self) -> str:
+        return f"{self.queue_name}:closed"
+
+    @property
+    def lease_key(self) -> str:
+        return f"{self.queue_name}:lease"
+
+    def acquire_lease(self, owner: str, timeout: float) -> bool:
+        expiry: int = self._get_timeout(timeout)
+        if self.client.set(self.lease_key, owner, nx=True, ex=expiry):
+            return True
+        lease_owner: Optional[bytes] = self.client.get(self.lease_key)
+        if lease_owner != owner.encode():
+            return False
+        return bool(self.client.expire(self.lease_key, expiry))
+
+    def release_lease(self, owner: str):
+        if self.client.get(self.lease_key) == owner.encode():
+            self.client.delete(self.lease_key)
+
+    def publish_job(self, job: Any):
+        self.client.set(self.job_key, self._dumps(job))
+
+    def get_job(self) -> Any:
+        value = self.client.get(self.job_key)
+        return pickle.loads(value) if value is not None else None
+
+    def put_task(self, task_id: str, task: Any):
+        # tasks are taken from the tail of the list
+        self.client.lpush(self.tasks_key, self._dumps((task_id, task)))
+
+    def get_task(self, timeout: float) -> Optional[Tuple[str, Any]]:
+        item: Optional[bytes] = self.client.brpoplpush(
+            self.tasks_key, self.claimed_key, timeout=self._get_timeout(timeout)
+        )
+        if item is None:
+            return None
+        task_id, task = pickle.loads(item)
+        self._claimed_items[task_id] = item
+        self.touch_task(task_id)
+        return task_id, task
+
+    def touch_task(self, task_id: str):
+        self.client.hset(self.claim_times_key, task_id, self._get_server_time())
+
+    def requeue_stale_tasks(self, timeout: float) -> List[str]:
+        server_time: float = self._get_server_time()
+        claim_times: Dict[bytes, bytes] = self.client.hgetall(self.claim_times_key)
+        requeued_tasks = []
+        for item in self.client.lrange(self.claimed_key, 0, -1):
+            task_id, _ = pickle.loads(item)
+            claim_time: Optional[bytes] = claim_times.get(task_id.encode())
+            if claim_time is None:
+                # the worker has not recorded the claim time yet
+                self.client.hsetnx(self.claim_times_key, task_id, server_time)
+                continue
+            if server_time - float(claim_time) < timeout:
+                continue
+            # the task is requeued only if its result was not put in the meantime
+            if self.client.lrem(self.claimed_key, 1, item):
+                self.client.rpush(self.tasks_key, item)
+                self.client.hdel(self.claim_times_key, task_id)
+                requeued_tasks.append(task_id)
+        return requeued_tasks
+
+    def has_claimed_tasks(self) -> bool:
+        return bool(self.client.llen(self.claimed_key))
+
+    def put_result(self, task_id: str, result: Any):
+        self.client.rpush(self.results_key, self._dumps((task_id, result)))
+        item: Optional[bytes] = self._claimed_items.pop(task_id, None)
+        if item is not None:
+            self.client.lrem(self.claimed_key, 1, item)
+        self.client.hdel(self.claim_times_key, task_id)
+
+    def get_result(self, timeout: float) -> Optional[Tuple[str, Any]]:
+        return self._pop(self.results_key, timeout)
+
+    def close(self):
+        self.client.set(self.closed_key, 1)
+
+    def is_closed(self) -> bool:
+        return bool(self.client.exists(self.closed_key))
+
+    def clear(self):
+        self.client.delete(
+            self.job_key,
+            self.tasks_key,
+            self.claimed_key,
+            self.claim_times_key,
+            self.results_key,
+            self.closed_key,
+        )
+
+    def _pop(self, key: str, timeout: float) -> Optional[Tuple[str, Any]]:
+        item = self.client.blpop([key], timeout=self._get_timeout(timeout))
+        if item is None:
+            return None
+        return pickle.loads(item[1])
+
+    def _get_server_time(self) -> float:
+        seconds, microseconds = self.client.time()
+        return seconds + microseconds / 1_000_000
+
+    @staticmethod
+    def _get_timeout(timeout: float) -> int:
+        # timeout of 0 blocks forever, so wait at least a second
+        return max(1, math.ceil(timeout))
+
+    @staticmethod
+    def _dumps(value: Any) -> bytes:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
@@ -0,0 +1,45 @@
+from typing import Type
+from urllib.parse import urlparse
+
+from cdisc_rules_engine.interfaces import FactoryInterface, TaskQueueInterface
+
+from .file_system_task_queue import FileSystemTaskQueue
+from .redis_task_queue import RedisTaskQueue
+
+
+class TaskQueueFactory(FactoryInterface):
+    """
+    Creates task queues from urls. The queue type is selected
+    by the url scheme, urls without a scheme are directory paths.
+    """
+
+    _registered_services_map = {
+        "file": FileSystemTaskQueue,
+        "redis": RedisTaskQueue,
+        "rediss": RedisTaskQueue,
+    }
+
+    def __init__(self, url: str):
+        self.url = url
+        scheme: str = urlparse(url).scheme
+        # windows paths are parsed with the drive letter as the scheme
+        self.task_queue_name = scheme if len(scheme) > 1 else "file"
+
+    def get_task_queue(self) -> TaskQueueInterface:
+        return self.get_service()
+
+    @classmethod
+    def register_service(cls, name: str, service: Type[TaskQueueInterface]):
+        if not name:
+            raise ValueError("Service name must not be empty!")
+        if not issubclass(service, TaskQueueInterface):
+            raise TypeError("Implementation of TaskQueueInterface required!")
+        cls._registered_services_map[name] = service
+
+    def get_service(self, name: str = None, **kwargs) -> TaskQueueInterface:
+        service_name = name or self.task_queue_name
+        if service_name in self._registered_services_map:
+            return self._registered_services_map[service_name].from_url(self.url)
+        raise ValueError(
+            f"Task queue type must be in {list(self._registered_services_map.keys())}"
+        )
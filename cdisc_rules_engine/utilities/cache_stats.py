@@ -0,0 +1,198 @@
+import os
+import weakref
+from typing import Dict, Iterable, List, Optional
+
+# upper bounds in seconds of the latency histogram buckets,
+# the last bucket counts slower operations
+LATENCY_BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0)
+LATENCY_BUCKET_LABELS = tuple(
+    [f"<={bound * 1000:g}ms" for bound in LATENCY_BUCKETS]
+    + [f">{LATENCY_BUCKETS[-1] * 1000:g}ms"]
+)
+# namespace of the datasets added with add_dataset
+DATASET_NAMESPACE = "datasets"
+# namespace of keys without a "/"
+DEFAULT_NAMESPACE = "other"
+# keys of further namespaces are counted in DEFAULT_NAMESPACE,
+# so keys built from file paths do not create a namespace each
+MAX_NAMESPACES = 64
+
+COUNTERS = ("hits", "misses", "evictions", "bytes_stored", "bytes_evicted")
+HISTOGRAMS = ("get_latency", "add_latency")
+
+# stats of the caches created in the current process
+_process_stats: "weakref.WeakSet[CacheStats]" = weakref.WeakSet()
+
+
+def get_cache_namespace(cache_key) -> str:
+    """
+    Returns the part of the key before its first "/",
+    like standards, models, rules or operations.
+    """
+    if isinstance(cache_key, bytes):
+        cache_key = cache_key.decode("utf-8", errors="replace")
+    namespace, separator, _ = str(cache_key).partition("/")
+    return namespace if separator and namespace else DEFAULT_NAMESPACE
+
+
+def _get_bucket(seconds: float) -> int:
+    for bucket, bound in enumerate(LATENCY_BUCKETS):
+        if seconds <= bound:
+            return bucket
+    return len(LATENCY_BUCKETS)
+
+
+class CacheStats:
+    """
+    Counts cache hits, misses, evictions, stored and evicted bytes
+    and histograms of get and add latency by namespace of the cache keys.
+
+    Stats are plain dictionaries, so they can be returned
+    from worker processes and cache manager proxies
+    and merged into the stats of the parent process.
+    Copies of the stats inherited by forked processes start from zero.
+    """
+
+    def __init__(self, cache_name: str = None):
+        self.cache_name = cache_name
+        self._namespaces: Dict[str, dict] = {}
+        self._pid: int = os.getpid()
+        self._register()
+
+    def _register(self):
+        # stats of caches are listed for pop_process_cache_stats
+        if self.cache_name:
+            _process_stats.add(self)
+
+    def _check_process(self):
+        if self._pid != os.getpid():
+            self._namespaces = {}
+            self._pid = os.getpid()
+            self._register()
+
+    def _get_namespace_stats(self, cache_key, namespace: str = None) -> dict:
+        self._check_process()
+        namespace = namespace or get_cache_namespace(cache_key)
+        stats: Optional[dict] = self._namespaces.get(namespace)
+        if stats is None:
+            if (
+                len(self._namespaces) >= MAX_NAMESPACES
+                and namespace != DEFAULT_NAMESPACE
+            ):
+                return self._get_namespace_stats(None, DEFAULT_NAMESPACE)
+            stats = self._namespaces[namespace] = {
+                **{counter: 0 for counter in COUNTERS},
+                **{
+                    histogram: [0] * len(LATENCY_BUCKET_LABELS)
+                    for histogram in HISTOGRAMS
+                },
+            }
+        return stats
+
+    def record_get(self, cache_key, hit: bool, seconds: float, namespace: str = None):
+        stats: dict = self._get_namespace_stats(cache_key, namespace)
+        stats["hits" if hit else "misses"] += 1
+        stats["get_latency"][_get_bucket(seconds)] += 1
+
+    def record_get_all(self, cache_keys: Iterable, values: Iterable, seconds: float):
+        """
+        Records a lookup of many keys. Each key is counted
+        with the latency of the whole lookup.
+        """
+        for cache_key, value in zip(cache_keys, values):
+            self.record_get(cache_key, value is not None, seconds)
+
+    def record_add(
+        self,
+        cache_key,
+        size: Optional[int],
+        seconds: float,
+        namespace: str = None,
+    ):
+        stats: dict = self._get_namespace_stats(cache_key, namespace)
+        stats["bytes_stored"] += int(size or 0)
+        stats["add_latency"][_get_bucket(seconds)] += 1
+
+    def record_eviction(self, cache_key, size: Optional[int], namespace: str = None):
+        stats: dict = self._get_namespace_stats(cache_key, namespace)
+        stats["evictions"] += 1
+        stats["bytes_evicted"] += int(size or 0)
+
+    def to_dict(self) -> Dict[str, dict]:
+        self._check_process()
+        return {
+            namespace: {
+                **{counter: stats[counter] for counter in COUNTERS},
+                **{
+                    histogram: dict(zip(LATENCY_BUCKET_LABELS, stats[histogram]))
+                    for histogram in HISTOGRAMS
+                },
+            }
+            for namespace, stats in sorted(self._namespaces.items())
+        }
+
+    def merge(self, stats: Dict[str, dict]):
+        """
+        Adds stats returned by to_dict of another cache.
+        """
+        for namespace, namespace_stats in stats.items():
+            target: dict = self._get_namespace_stats(None, namespace)
+            for counter in COUNTERS:
+                target[counter] += namespace_stats.get(counter, 0)
+            for histogram in HISTOGRAMS:
+                counts: dict = namespace_stats.get(histogram, {})
+                for bucket, label in enumerate(LATENCY_BUCKET_LABELS):
+                    target[histogram][bucket] += counts.get(label, 0)
+
+    def reset(self):
+        self._namespaces = {}
+
+
+def merge_cache_stats(target: Dict[str, dict], source: Dict[str, dict]):
+    """
+    Merges stats of cache layers, {cache name: CacheStats.to_dict()},
+    from source into target.
+    """
+    for cache_name, stats in source.items():
+        if not stats:
+            continue
+        cache_stats = CacheStats()
+        cache_stats.merge(target.get(cache_name, {}))
+        cache_stats.merge(stats)
+        target[cache_name] = cache_stats.to_dict()
+
+
+def pop_process_cache_stats() -> Dict[str, dict]:
+    """
+    Returns {cache name: stats} of the caches created in the current process
+    and resets them, so each lookup is reported once.
+    """
+    stats = {}
+    for cache_stats in list(_process_stats):
+        merge_cache_stats(stats, {cache_stats.cache_name: cache_stats.to_dict()})
+        cache_stats.reset()
+    return {
+        cache_name: namespaces for cache_name, namespaces in stats.items() if namespaces
+    }
+
+
+def format_cache_stats(stats: Dict[str, dict]) -> List[str]:
+    """
+    Returns a line per cache layer and namespace like:
+    InMemoryCacheService standards: 10 hits, 2 misses (83.3% hit ratio), ...
+    """
+    lines = []
+    for cache_name, namespaces in stats.items():
+        for namespace, namespace_stats in namespaces.items():
+            lookups: int = namespace_stats["hits"] + namespace_stats["misses"]
+            hit_ratio: str = (
+                f"{namespace_stats['hits'] / lookups:.1%}" if lookups else "n/a"
+            )
+            lines.append(
+                f"{cache_name} {namespace}: {namespace_stats['hits']} hits, "
+                f"{namespace_stats['misses']} misses ({hit_ratio} hit ratio), "
+                f"{namespace_stats['evictions']} evictions, "
+                f"{namespace_stats['bytes_stored'] / 2 ** 20:.1f} MB stored, "
+                f"{namespace_stats['bytes_evicted'] / 2 ** 20:.1f} MB evicted"
+            )
+    return lines
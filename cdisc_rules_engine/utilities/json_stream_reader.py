@@ -0,0 +1,155 @@
+import json
+import re
+from typing import Any, Iterator, TextIO
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+STRUCTURE = re.compile(r'[\[\]{}"]')
+STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+NUMBER_CONTINUATION = re.compile(r"[0-9eE+\-.]*\Z")
+
+
+class JSONStreamReader:
+    """
+    Pull parser that reads a JSON document from a text file in chunks,
+    so that parts of a large document can be read or skipped
+    without loading the whole document.
+
+    Objects and arrays are traversed with iter_object and iter_array.
+    Each key or element they yield has to be consumed with read_value,
+    skip_value or a nested iter_object / iter_array call
+    before the next one is requested.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = 1024**2):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._position = 0
+        self._end_of_file = False
+        self._decoder = json.JSONDecoder()
+
+    def peek(self) -> str:
+        """
+        Returns the next non-whitespace character without consuming it.
+        Returns an empty string at the end of the file.
+        """
+        while True:
+            self._position = WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._load():
+                return ""
+
+    def read_value(self) -> Any:
+        """
+        Reads the next value.
+        The value is kept in memory, so it should be small.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._load():
+                    continue
+                raise
+            # a number at the end of the buffer can continue in the next chunk
+            if NUMBER_CONTINUATION.match(self._buffer, end) and self._load():
+                continue
+            self._position = end
+            return value
+
+    def skip_value(self):
+        """
+        Skips the next value without decoding it.
+        """
+        if self.peek() not in ("[", "{"):
+            self.read_value()
+            return
+        depth = 0
+        while True:
+            match = STRUCTURE.search(self._buffer, self._position)
+            if match is None:
+                self._position = len(self._buffer)
+                self._load_or_raise("Unterminated value")
+                continue
+            if match.group() == '"':
+                string = STRING.match(self._buffer, match.start())
+                if string is None:
+                    self._position = match.start()
+                    self._load_or_raise("Unterminated string")
+                    continue
+                self._position = string.end()
+                continue
+            self._position = match.end()
+            depth += 1 if match.group() in ("[", "{") else -1
+            if depth == 0:
+                return
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterates over keys of the next object.
+        """
+        self._consume("{")
+        if self.peek() == "}":
+            self._position += 1
+            return
+        while True:
+            key = self.read_value()
+            self._consume(":")
+            yield key
+            if self._consume_separator("}"):
+                return
+
+    def iter_array(self) -> Iterator[int]:
+        """
+        Iterates over indexes of elements of the next array.
+        """
+        self._consume("[")
+        if self.peek() == "]":
+            self._position += 1
+            return
+        index = 0
+        while True:
+            yield index
+            if self._consume_separator("]"):
+                return
+            index += 1
+
+    def _consume_separator(self, closing_character: str) -> bool:
+        """
+        Consumes a comma or the closing character.
+        Returns True if the closing character was consumed.
+        """
+        character = self.peek()
+        if character not in (",", closing_character):
+            raise self._error(f"Expecting ',' or '{closing_character}'")
+        self._position += 1
+        return character == closing_character
+
+    def _consume(self, character: str):
+        if self.peek() != character:
+            raise self._error(f"Expecting '{character}'")
+        self._position += 1
+
+    def _load(self) -> bool:
+        """
+        Reads the next chunk of the file and drops the consumed part
+        of the buffer. Returns False at the end of the file.
+        """
+        if self._end_of_file:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._end_of_file = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _load_or_raise(self, message: str):
+        if not self._load():
+            raise self._error(message)
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
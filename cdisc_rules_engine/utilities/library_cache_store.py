@@ -0,0 +1,304 @@
+import os
+import pickle
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+from cdisc_rules_engine.enums.default_file_paths import DefaultFilePaths
+from cdisc_rules_engine.models.library_metadata_container import (
+    LibraryMetadataContainer,
+)
+from cdisc_rules_engine.services import logger
+from cdisc_rules_engine.utilities.utils import get_file_fingerprint
+
+# changes when the database must be rebuilt after an update
+LIBRARY_CACHE_STORE_VERSION = 1
+
+# collections of the store and the cache files they are read from
+RULES = "rules"
+LOCAL_RULES = "local_rules"
+STANDARDS = "standards"
+MODELS = "models"
+VARIABLE_CODELIST_MAPS = "variable_codelist_maps"
+VARIABLES_METADATA = "variables_metadata"
+COLLECTION_FILES = {
+    RULES: DefaultFilePaths.RULES_CACHE_FILE.value,
+    LOCAL_RULES: DefaultFilePaths.LOCAL_RULES_CACHE_FILE.value,
+    STANDARDS: DefaultFilePaths.STANDARD_DETAILS_CACHE_FILE.value,
+    MODELS: DefaultFilePaths.STANDARD_MODELS_CACHE_FILE.value,
+    VARIABLE_CODELIST_MAPS: DefaultFilePaths.VARIABLE_CODELIST_CACHE_FILE.value,
+    VARIABLES_METADATA: DefaultFilePaths.VARIABLE_METADATA_CACHE_FILE.value,
+}
+
+# stores opened by the current process, by cache directory
+_stores: Dict[str, "LibraryCacheStore"] = {}
+
+
+class LibraryCacheStore:
+    """
+    Indexed copy of the library cache files in an SQLite database.
+
+    rules.pkl, standards_details.pkl and the other cache files
+    map cache keys to items, and each of them is unpickled as a whole
+    to read a few items. The store keeps every item in its own row,
+    so a validation reads only the rules, standard and model it needs.
+    Collections are copied from the cache files by update
+    when the files are added or changed (by update-cache),
+    files are not read again while they are unchanged.
+
+    CT packages are already stored in a file per package,
+    they are read from their files when they are requested.
+    Decoded items are kept by the store, so repeated lookups
+    in a process, like lookups of every validation task, are not decoded again.
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self.database_path = os.path.join(
+            cache_path, DefaultFilePaths.LIBRARY_CACHE_STORE_FILE.value
+        )
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._items: Dict[tuple, object] = {}
+
+    @classmethod
+    def get_instance(cls, cache_path: str) -> "LibraryCacheStore":
+        """
+        Returns the store of the cache directory opened by this process.
+        """
+        store = _stores.get(cache_path)
+        if store is None:
+            store = _stores[cache_path] = cls(cache_path)
+        return store
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # connections must not be shared with forked processes
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.database_path, timeout=60)
+            self._pid = os.getpid()
+            self._create_tables()
+        return self._connection
+
+    def _create_tables(self):
+        connection = self._connection
+        (version,) = connection.execute("PRAGMA user_version").fetchone()
+        if version == LIBRARY_CACHE_STORE_VERSION:
+            return
+        with connection:
+            connection.execute("DROP TABLE IF EXISTS items")
+            connection.execute("DROP TABLE IF EXISTS sources")
+            connection.execute(
+                "CREATE TABLE items (collection TEXT, key TEXT, position INTEGER, "
+                "value BLOB, PRIMARY KEY (collection, key)) WITHOUT ROWID"
+            )
+            connection.execute(
+                "CREATE TABLE sources (collection TEXT PRIMARY KEY, fingerprint TEXT)"
+            )
+            connection.execute(f"PRAGMA user_version = {LIBRARY_CACHE_STORE_VERSION}")
+
+    def update(self) -> List[str]:
+        """
+        Copies the cache files that were changed since the last update.
+        Collections of removed files are emptied.
+        Returns the names of the updated collections.
+        """
+        sources = dict(
+            self.connection.execute("SELECT collection, fingerprint FROM sources")
+        )
+        updated_collections = []
+        for collection, file_name in COLLECTION_FILES.items():
+            file_path = os.path.join(self.cache_path, file_name)
+            try:
+                fingerprint: Optional[str] = get_file_fingerprint(file_path)
+            except FileNotFoundError:
+                fingerprint = None
+            if fingerprint == sources.get(collection):
+                continue
+            items: dict = {}
+            if fingerprint:
+                with open(file_path, "rb") as f:
+                    items = pickle.load(f)
+            self._replace_collection(collection, items, fingerprint)
+            updated_collections.append(collection)
+        if updated_collections:
+            self._items = {}
+            logger.info(
+                f"Updated library cache store {self.database_path}: "
+                f"{', '.join(updated_collections)}"
+            )
+        return updated_collections
+
+    def _replace_collection(
+        self, collection: str, items: dict, fingerprint: Optional[str]
+    ):
+        with self.connection as connection:
+            connection.execute("DELETE FROM items WHERE collection = ?", (collection,))
+            connection.executemany(
+                "INSERT INTO items VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        collection,
+                        key,
+                        position,
+                        pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+                    )
+                    for position, (key, value) in enumerate(items.items())
+                ),
+            )
+            if fingerprint:
+                connection.execute(
+                    "INSERT OR REPLACE INTO sources VALUES (?, ?)",
+                    (collection, fingerprint),
+                )
+            else:
+                connection.execute(
+                    "DELETE FROM sources WHERE collection = ?", (collection,)
+                )
+
+    def has_collection(self, collection: str) -> bool:
+        """
+        Returns whether the collection was copied from its cache file.
+        """
+        row = self.connection.execute(
+            "SELECT 1 FROM sources WHERE collection = ?", (collection,)
+        ).fetchone()
+        return row is not None
+
+    def get(self, collection: str, key: str, default=None):
+        """
+        Returns the item or default if it is not found.
+        The item is decoded once per process and shared by the callers.
+        """
+        if (collection, key) not in self._items:
+            row = self.connection.execute(
+                "SELECT value FROM items WHERE collection = ? AND key = ?",
+                (collection, key),
+            ).fetchone()
+            if row is None:
+                return default
+            self._items[(collection, key)] = pickle.loads(row[0])
+        return self._items[(collection, key)]
+
+    def get_many(self, collection: str, keys: Iterable[str]) -> dict:
+        """
+        Returns {key: item} of the found keys.
+        Items are decoded for each call, so callers may change them.
+        """
+        items = {}
+        for key in keys:
+            row = self.connection.execute(
+                "SELECT value FROM items WHERE collection = ? AND key = ?",
+                (collection, key),
+            ).fetchone()
+            if row is not None:
+                items[key] = pickle.loads(row[0])
+        return items
+
+    def get_by_prefix(self, collection: str, prefix: str) -> dict:
+        """
+        Returns {key: item} of the keys that start with the prefix,
+        in the order of the cache file.
+        """
+        rows = self.connection.execute(
+            "SELECT key, value FROM items WHERE collection = ? "
+            "AND key >= ? AND key < ? ORDER BY position",
+            (collection, prefix, prefix + "\U0010ffff"),
+        )
+        return {key: pickle.loads(value) for key, value in rows}
+
+    def get_ct_package_names(self) -> List[str]:
+        return [
+            file_name.split(".")[0]
+            for file_name in next(os.walk(self.cache_path), (None, None, []))[2]
+            if "ct-" in file_name
+        ]
+
+    def get_ct_package(self, package: str):
+        """
+        Returns the CT package or None if it is not found.
+        """
+        if (None, package) not in self._items:
+            try:
+                with open(os.path.join(self.cache_path, f"{package}.pkl"), "rb") as f:
+                    self._items[(None, package)] = pickle.load(f)
+            except FileNotFoundError:
+                return None
+        return self._items[(None, package)]
+
+
+class StoredLibraryMetadataContainer(LibraryMetadataContainer):
+    """
+    Library metadata that is read from a LibraryCacheStore when it is used.
+
+    Copies sent to worker processes hold the keys of the metadata
+    instead of the metadata, each process reads it from the store once.
+    Metadata replaced with the setters is sent with the copies.
+    """
+
+    # container attributes and the store collections they are read from
+    STORED_ATTRIBUTES = {
+        "_standard_metadata": STANDARDS,
+        "_model_metadata": MODELS,
+        "_variable_codelist_map": VARIABLE_CODELIST_MAPS,
+        "_variables_metadata": VARIABLES_METADATA,
+    }
+
+    def __init__(
+        self,
+        store: LibraryCacheStore,
+        keys: Dict[str, Optional[str]],
+        ct_packages: Iterable[str] = (),
+        published_ct_packages: Iterable[str] = (),
+    ):
+        self._store = store
+        # {attribute: key in the store}
+        self._keys = keys
+        self._ct_packages = list(ct_packages)
+        self._published_ct_packages = set(published_ct_packages)
+
+    def __getattr__(self, name: str):
+        # called for attributes that have not been read from the store yet
+        if name in self.STORED_ATTRIBUTES:
+            key: Optional[str] = self._keys.get(name)
+            value = (
+                self._store.get(self.STORED_ATTRIBUTES[name], key)
+                if key is not None
+                else None
+            )
+            if value is None and name in ("_standard_metadata", "_model_metadata"):
+                value = {}
+            setattr(self, name, value)
+            return value
+        if name == "_ct_package_metadata":
+            self._ct_package_metadata = {}
+            for package in self._ct_packages:
+                data = self._store.get_ct_package(package)
+                if data is not None:
+                    self._ct_package_metadata[package] = data
+            return self._ct_package_metadata
+        raise AttributeError(name)
+
+    def __getstate__(self):
+        state = {
+            "cache_path": self._store.cache_path,
+            "keys": self._keys,
+            "ct_packages": self._ct_packages,
+            "published_ct_packages": self._published_ct_packages,
+        }
+        for name, collection in self.STORED_ATTRIBUTES.items():
+            value = self.__dict__.get(name)
+            key: Optional[str] = self._keys.get(name)
+            if value is not None and (
+                key is None or value is not self._store.get(collection, key)
+            ):
+                state[name] = value
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__init__(
+            LibraryCacheStore.get_instance(state.pop("cache_path")),
+            state.pop("keys"),
+            state.pop("ct_packages"),
+            state.pop("published_ct_packages"),
+        )
+        self.__dict__.update(state)
@@ -0,0 +1,269 @@
+import hashlib
+import json
+import os
+import pickle
+import uuid
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from cdisc_rules_engine.models.operation_params import OperationParams
+from cdisc_rules_engine.services import logger
+from cdisc_rules_engine.utilities.utils import get_file_fingerprint
+from version import __version__
+
+# changes when stored results must not be reused after an update
+OPERATION_RESULT_STORE_VERSION = 1
+
+# what the result of an operation depends on
+# besides the operation parameters and the library metadata
+STUDY_LISTING = "study_listing"  # domains and file names of the study datasets
+STUDY_CONTENTS = "study_contents"  # contents of all study datasets
+DATASET = "dataset"  # contents of the dataset the operation is applied to
+LIBRARY = "library"  # nothing else
+
+# operations whose results are kept between runs
+STORED_OPERATIONS = {
+    "study_domains": STUDY_LISTING,
+    "dataset_names": STUDY_LISTING,
+    "variable_value_count": STUDY_CONTENTS,
+    "variable_count": STUDY_CONTENTS,
+    "expected_variables": LIBRARY,
+    "required_variables": LIBRARY,
+    "permissible_variables": LIBRARY,
+    "distinct": DATASET,
+    "record_count": DATASET,
+    "max": DATASET,
+    "min": DATASET,
+    "mean": DATASET,
+    "max_date": DATASET,
+    "min_date": DATASET,
+}
+
+# operation parameters that are part of the key of a result
+KEY_PARAMS = (
+    "operation_id",
+    "operation_name",
+    "domain",
+    "standard",
+    "standard_version",
+    "ct_packages",
+    "ct_attribute",
+    "ct_version",
+    "target",
+    "original_target",
+    "grouping",
+    "grouping_aliases",
+    "filter",
+    "key_name",
+    "key_value",
+    "attribute_name",
+    "case_sensitive",
+)
+
+STORED_RESULT_TYPES = (
+    set,
+    frozenset,
+    list,
+    tuple,
+    dict,
+    str,
+    int,
+    float,
+    np.generic,
+    pd.DataFrame,
+    pd.Series,
+)
+
+
+class OperationResultStore:
+    """
+    Directory with rule operation results kept between runs.
+
+    A result is addressed by a key built from the operation parameters,
+    the library metadata files and the fingerprints (path, size and
+    modification time) of the dataset files the operation reads,
+    so results are reused only while all of them are unchanged.
+    Which files an operation reads is listed in STORED_OPERATIONS,
+    results of other operations are not stored.
+
+    When the directory grows above max_size bytes,
+    the least recently used results are removed.
+    """
+
+    RESULT_FILE_EXTENSION = ".pkl"
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: Optional[int] = None,
+        library_files: Iterable[str] = (),
+    ):
+        self.directory = directory
+        self.max_size = max_size
+        self.library_fingerprint: str = hashlib.sha1(
+            ";".join(
+                sorted(get_file_fingerprint(path) for path in library_files)
+            ).encode()
+        ).hexdigest()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_key(
+        self,
+        operation_params: OperationParams,
+        dataset_files: Iterable[str] = None,
+    ) -> Optional[str]:
+        """
+        Returns the key of the operation result or None
+        if results of the operation are not stored.
+        dataset_files are the files of the dataset
+        the operation is applied to.
+        """
+        scope: Optional[str] = STORED_OPERATIONS.get(operation_params.operation_name)
+        if scope is None:
+            return None
+        if scope == STUDY_LISTING:
+            inputs = sorted(
+                (dataset.get("domain") or "", dataset.get("filename") or "")
+                for dataset in operation_params.datasets
+            )
+        elif scope == STUDY_CONTENTS:
+            inputs = self._get_fingerprints(
+                self._get_dataset_path(operation_params, dataset)
+                for dataset in operation_params.datasets
+            )
+        elif scope == DATASET:
+            inputs = self._get_fingerprints(dataset_files) if dataset_files else None
+        else:
+            inputs = []
+        if inputs is None:
+            return None
+        if scope == DATASET:
+            # the result depends on how the dataset holds the operation columns
+            inputs = {
+                "files": inputs,
+                "dtypes": self._get_dtypes(operation_params),
+            }
+        key_data = {
+            "engine_version": __version__,
+            "store_version": OPERATION_RESULT_STORE_VERSION,
+            "library": self.library_fingerprint,
+            "params": {name: getattr(operation_params, name) for name in KEY_PARAMS},
+            "inputs": inputs,
+        }
+        return hashlib.sha1(
+            json.dumps(key_data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def get(self, key: str):
+        """
+        Returns the stored result or None if it is not found.
+        """
+        result_path: str = self._get_result_path(key)
+        try:
+            with open(result_path, "rb") as f:
+                result = pickle.load(f)
+            # modification time of the result file marks its last use
+            os.utime(result_path)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        return result
+
+    def add(self, key: str, result) -> bool:
+        """
+        Stores the result. Results that are not plain python,
+        numpy or pandas objects, like lazy dask collections, are not stored.
+        Returns True if the result has been stored.
+        """
+        if not isinstance(result, STORED_RESULT_TYPES):
+            return False
+        result_path: str = self._get_result_path(key)
+        temp_path: str = f"{result_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, result_path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.info(f"Operation result is not stored. key={key}, error={e}")
+            self._remove_file(temp_path)
+            return False
+        return True
+
+    def evict(self) -> List[str]:
+        """
+        Removes the least recently used results until the store
+        fits into max_size. Returns keys of the removed results.
+        """
+        if not self.max_size:
+            return []
+        entries = self._get_entries()
+        total_size: int = sum(size for _, size, _ in entries)
+        removed_keys = []
+        for _, size, key in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            self._remove_file(self._get_result_path(key))
+            total_size -= size
+            removed_keys.append(key)
+        if removed_keys:
+            logger.info(f"Removed {len(removed_keys)} operation results from the store")
+        return removed_keys
+
+    @staticmethod
+    def _get_dataset_path(operation_params: OperationParams, dataset: dict) -> str:
+        return (
+            dataset.get("original_path")
+            or dataset.get("full_path")
+            or os.path.join(operation_params.directory_path, dataset.get("filename"))
+        )
+
+    @staticmethod
+    def _get_dtypes(operation_params: OperationParams) -> dict:
+        dataframe = operation_params.dataframe
+        columns = [operation_params.target, *(operation_params.grouping or [])]
+        return {
+            "dataset": type(dataframe).__name__,
+            "columns": {
+                column: str(dataframe[column].dtype)
+                for column in columns
+                if column and column in dataframe
+            },
+        }
+
+    @staticmethod
+    def _get_fingerprints(file_paths: Iterable[str]) -> Optional[List[str]]:
+        """
+        Returns sorted fingerprints of the files,
+        None if a file cannot be found.
+        """
+        try:
+            return sorted({get_file_fingerprint(path) for path in file_paths})
+        except OSError:
+            return None
+
+    def _get_entries(self) -> List[Tuple[float, int, str]]:
+        """
+        Returns (last use time, size, key) of each result.
+        """
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if not file_name.endswith(self.RESULT_FILE_EXTENSION):
+                continue
+            key: str = file_name[: -len(self.RESULT_FILE_EXTENSION)]
+            try:
+                file_stat = os.stat(self._get_result_path(key))
+            except FileNotFoundError:
+                continue
+            entries.append((file_stat.st_mtime, file_stat.st_size, key))
+        return entries
+
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _get_result_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{self.RESULT_FILE_EXTENSION}")
@@ -0,0 +1,121 @@
+import json
+import os
+import shutil
+import uuid
+from typing import Iterable, List, Optional, Tuple
+
+from cdisc_rules_engine.services import logger
+from cdisc_rules_engine.utilities.utils import get_file_fingerprint
+
+# changes when converted files must not be reused after an update
+PARQUET_CONVERSION_VERSION = 1
+
+
+class ParquetConversionCache:
+    """
+    Directory with parquet files converted from datasets.
+    Converted files are kept between runs, so that
+    unchanged datasets are not converted again.
+
+    Files are addressed by the fingerprint of the source dataset
+    (path, size and modification time). Each parquet file has
+    a metadata file next to it with the number of rows.
+    When the directory grows above max_size bytes,
+    the least recently used files are removed.
+    """
+
+    PARQUET_FILE_EXTENSION = ".parquet"
+    METADATA_FILE_EXTENSION = ".json"
+
+    def __init__(self, directory: str, max_size: Optional[int] = None):
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_key(self, file_path: str) -> str:
+        return f"{get_file_fingerprint(file_path)}_v{PARQUET_CONVERSION_VERSION}"
+
+    def get(self, file_path: str) -> Optional[Tuple[int, str]]:
+        """
+        Returns the number of rows and the path of the converted file
+        or None if the dataset has not been converted.
+        """
+        key: str = self.get_key(file_path)
+        parquet_path: str = self._get_parquet_path(key)
+        try:
+            with open(self._get_metadata_path(key), "r", encoding="utf-8") as f:
+                num_rows: int = json.load(f)["num_rows"]
+            # modification time of the parquet file marks its last use
+            os.utime(parquet_path)
+        except (OSError, ValueError, KeyError):
+            return None
+        return num_rows, parquet_path
+
+    def add(self, file_path: str, num_rows: int, converted_path: str) -> str:
+        """
+        Moves the converted file to the cache directory.
+        Returns the new path of the converted file.
+        """
+        key: str = self.get_key(file_path)
+        parquet_path: str = self._get_parquet_path(key)
+        temp_path: str = f"{parquet_path}.{uuid.uuid4().hex}.tmp"
+        shutil.move(converted_path, temp_path)
+        os.replace(temp_path, parquet_path)
+        metadata_temp_path: str = f"{self._get_metadata_path(key)}.tmp"
+        with open(metadata_temp_path, "w", encoding="utf-8") as f:
+            json.dump({"num_rows": num_rows, "source": file_path}, f)
+        os.replace(metadata_temp_path, self._get_metadata_path(key))
+        return parquet_path
+
+    def evict(self, used_paths: Iterable[str] = ()) -> List[str]:
+        """
+        Removes the least recently used files until the cache
+        fits into max_size. Files of the current run are kept.
+        Returns paths of the removed files.
+        """
+        if not self.max_size:
+            return []
+        used_paths = {os.path.abspath(path) for path in used_paths}
+        entries = self._get_entries()
+        total_size: int = sum(size for _, size, _ in entries)
+        removed_paths = []
+        for _, size, key in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            parquet_path: str = self._get_parquet_path(key)
+            if os.path.abspath(parquet_path) in used_paths:
+                continue
+            self._remove(key)
+            total_size -= size
+            removed_paths.append(parquet_path)
+            logger.info(f"Removed converted dataset {parquet_path} from the cache")
+        return removed_paths
+
+    def _get_entries(self) -> List[Tuple[float, int, str]]:
+        """
+        Returns (last use time, size, key) of each converted file.
+        """
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if not file_name.endswith(self.PARQUET_FILE_EXTENSION):
+                continue
+            key: str = file_name[: -len(self.PARQUET_FILE_EXTENSION)]
+            try:
+                file_stat = os.stat(self._get_parquet_path(key))
+            except FileNotFoundError:
+                continue
+            entries.append((file_stat.st_mtime, file_stat.st_size, key))
+        return entries
+
+    def _remove(self, key: str):
+        for path in (self._get_metadata_path(key), self._get_parquet_path(key)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _get_parquet_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{self.PARQUET_FILE_EXTENSION}")
+
+    def _get_metadata_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}{self.METADATA_FILE_EXTENSION}")
@@ -15,13 +15,19 @@ from cdisc_rules_engine.constants.domains import (
     APFA_DOMAIN,
     SUPPLEMENTARY_DOMAINS,
 )
-from cdisc_rules_engine.constants.rule_constants import ALL_KEYWORD
+from cdisc_rules_engine.constants.rule_constants import (
+    ALL_KEYWORD,
+    COLUMN_PROJECTION_OPERATIONS,
+    ENGINE_REFERENCED_VARIABLES,
+)
+from cdisc_rules_engine.enums.rule_types import RuleTypes
 from cdisc_rules_engine.interfaces import ConditionInterface
 from cdisc_rules_engine.models.operation_params import OperationParams
 from cdisc_rules_engine.models.rule_conditions import AllowedConditionsKeys
 from cdisc_rules_engine.operations import operations_factory
 from cdisc_rules_engine.services import logger
 from cdisc_rules_engine.utilities.data_processor import DataProcessor
+from cdisc_rules_engine.utilities.operation_result_store import OperationResultStore
 from cdisc_rules_engine.utilities.utils import (
     get_directory_path,
     get_operations_cache_key,
@@ -33,11 +39,16 @@ from cdisc_rules_engine.utilities.utils import (
 
 class RuleProcessor:
     def __init__(
-        self, data_service, cache, library_metadata: LibraryMetadataContainer = None
+        self,
+        data_service,
+        cache,
+        library_metadata: LibraryMetadataContainer = None,
+        operation_result_store: OperationResultStore = None,
     ):
         self.data_service = data_service
         self.cache = cache
         self.library_metadata = library_metadata
+        self.operation_result_store = operation_result_store
 
     @classmethod
     def rule_applies_to_domain(
@@ -171,6 +182,29 @@ class RuleProcessor:
         We filter out non-detectable classes here, so that rule authors
         can specify them without it affecting if the rule runs or not.
         """
+        if not self.is_dataset_class_required(rule):
+            return True
+        class_name = self.get_dataset_class(file_path, datasets, domain)
+        return self.rule_applies_to_dataset_class(rule, class_name)
+
+    @staticmethod
+    def is_dataset_class_required(rule: dict) -> bool:
+        """
+        Returns True if the dataset class is needed
+        to check whether the rule applies to a dataset.
+        """
+        classes = rule.get("classes") or {}
+        included_classes = classes.get("Include", [])
+        if ALL_KEYWORD in included_classes:
+            return False
+        return bool(included_classes or classes.get("Exclude", []))
+
+    @staticmethod
+    def rule_applies_to_dataset_class(rule: dict, class_name: Optional[str]) -> bool:
+        """
+        Checks included and excluded classes of the rule
+        against an already detected dataset class.
+        """
         classes = rule.get("classes") or {}
         included_classes = classes.get("Include", [])
         excluded_classes = classes.get("Exclude", [])
@@ -179,24 +213,12 @@ class RuleProcessor:
         if included_classes:
             if ALL_KEYWORD in included_classes:
                 return True
-            variables = self.data_service.get_variables_metadata(
-                dataset_name=file_path, datasets=datasets
-            ).data.variable_name
-            class_name = self.data_service.get_dataset_class(
-                variables, file_path, datasets, domain
-            )
             if (class_name not in included_classes) and not (
                 class_name == FINDINGS_ABOUT and FINDINGS in included_classes
             ):
                 is_included = False
 
         if excluded_classes:
-            variables = self.data_service.get_variables_metadata(
-                dataset_name=file_path, datasets=datasets
-            ).data.variable_name
-            class_name = self.data_service.get_dataset_class(
-                variables, file_path, datasets, domain
-            )
             if class_name and (
                 (class_name in excluded_classes)
                 or (class_name == FINDINGS_ABOUT and FINDINGS in excluded_classes)
@@ -204,6 +226,16 @@ class RuleProcessor:
                 is_excluded = True
         return is_included and not is_excluded
 
+    def get_dataset_class(
+        self, file_path: str, datasets: List[dict], domain: str
+    ) -> Optional[str]:
+        variables = self.data_service.get_variables_metadata(
+            dataset_name=file_path, datasets=datasets
+        ).data.variable_name
+        return self.data_service.get_dataset_class(
+            variables, file_path, datasets, domain
+        )
+
     def valid_rule_structure(self, rule) -> bool:
         required_keys = ["standards", "core_id"]
         for key in required_keys:
@@ -225,12 +257,18 @@ class RuleProcessor:
         """
         Applies rule operations to the dataset.
         Returns the processed dataset. Operation result is appended as a new column.
+        dataset_files kwarg lists the files the dataset has been read from,
+        if the dataset holds the contents of these files.
         """
         operations: List[dict] = rule.get("operations") or []
         if not operations:
             # stop function execution if no operations have been provided
             return dataset
 
+        # datasets merged with other datasets are not keyed by their files
+        dataset_files: Optional[List[str]] = (
+            None if rule.get("datasets") else kwargs.get("dataset_files")
+        )
         dataset_copy = dataset.copy()
         previous_operations = []
         for operation in operations:
@@ -280,7 +318,11 @@ class RuleProcessor:
 
             # execute operation
             dataset_copy = self._execute_operation(
-                operation_params, dataset_copy, previous_operations
+                operation_params,
+                dataset_copy,
+                previous_operations,
+                # results of previous operations are not keyed by files
+                None if previous_operations else dataset_files,
             )
             previous_operations.append(operation_params.operation_name)
 
@@ -295,11 +337,14 @@ class RuleProcessor:
         operation_params: OperationParams,
         dataset: DatasetInterface,
         previous_operations: List[str] = [],
+        dataset_files: List[str] = None,
     ):
         """
         Internal method that executes the given operation.
         Checks the cache first, if the operation result is not found
         in cache -> executes it and adds to the cache.
+        If the processor has an operation result store,
+        results kept by previous runs are reused.
         """
         # check cache
         cache_key = get_operations_cache_key(
@@ -331,6 +376,7 @@ class RuleProcessor:
             operation_params.dataframe = self.data_service.get_dataset(
                 dataset_name=file_path
             )
+            dataset_files = [file_path]
 
         # call the operation
         operation = operations_factory.get_service(
@@ -341,7 +387,15 @@ class RuleProcessor:
             data_service=self.data_service,
             library_metadata=self.library_metadata,
         )
-        result = operation.execute()
+        if self.operation_result_store and not DataProcessor.is_dummy_data(
+            self.data_service
+        ):
+            result = operation.execute(
+                self.operation_result_store,
+                self.operation_result_store.get_key(operation_params, dataset_files),
+            )
+        else:
+            result = operation.execute()
         if not DataProcessor.is_dummy_data(self.data_service):
             self.cache.add(cache_key, result)
         return result
@@ -538,6 +592,58 @@ class RuleProcessor:
                 target_names.append(comparator)
         return target_names
 
+    def get_rule_columns(self, rule: dict, domain: str) -> Optional[List[str]]:
+        """
+        Returns names of the domain dataset columns the rule can reference.
+        Names are collected from conditions, operations, output variables
+        and match keys, -- is replaced with the domain name.
+        The list can contain names that do not exist in the dataset.
+
+        Returns None if the rule may need columns that are not named
+        in the rule: metadata and define checks, conditions applied
+        to all variables, operations that read all columns
+        and relationship datasets, which reference columns by values.
+        """
+        if rule.get("rule_type") in RuleTypes.values() or self.is_relationship_dataset(
+            domain
+        ):
+            return None
+        referenced_values: List[str] = list(ENGINE_REFERENCED_VARIABLES)
+        referenced_values.extend(rule.get("output_variables") or [])
+        for condition in rule["conditions"].values():
+            if "target" not in condition.get("value", {}) or (
+                self.get_operator_related_pattern(condition.get("operator"), "")
+            ):
+                return None
+            referenced_values.extend(self._collect_strings(condition["value"]))
+        for operation in rule.get("operations") or []:
+            if operation.get("operator") not in COLUMN_PROJECTION_OPERATIONS:
+                return None
+            referenced_values.extend(self._collect_strings(operation))
+        for domain_details in rule.get("datasets") or []:
+            if self.is_relationship_dataset(domain_details.get("domain_name", "")):
+                return None
+            referenced_values.extend(self._collect_strings(domain_details))
+        columns: Set[str] = set()
+        for value in referenced_values:
+            # variables of merged datasets are referenced as DOMAIN.VARIABLE
+            for name in (value, value.rsplit(".", 1)[-1]):
+                columns.add(name.replace("--", domain))
+        return sorted(columns)
+
+    @classmethod
+    def _collect_strings(cls, value) -> List[str]:
+        """
+        Returns all strings found in nested dicts and lists.
+        """
+        if isinstance(value, str):
+            return [value]
+        if isinstance(value, dict):
+            value = list(value.values())
+        if isinstance(value, (list, tuple)):
+            return [string for item in value for string in cls._collect_strings(item)]
+        return []
+
     @staticmethod
     def get_operator_related_pattern(operator: str, target: str) -> Optional[str]:
         # {operator: pattern} mapping
@@ -0,0 +1,111 @@
+import json
+import os
+from typing import Dict, List, Optional
+
+from cdisc_rules_engine.enums.rule_types import RuleTypes
+from cdisc_rules_engine.services import logger
+
+RULE_TIMING_HISTORY_FILE = "rule_timing_history.json"
+
+# static estimates in seconds, used for rules without timing history
+BASE_RULE_COST = 0.01
+OPERATION_COST = 0.02
+# operations that read every dataset of the study
+STUDY_WIDE_OPERATIONS = {"variable_count", "variable_value_count"}
+STUDY_WIDE_OPERATION_COST = 0.5
+JOIN_COST = 0.1
+# rule types that do not process dataset records,
+# so their cost does not depend on the dataset size
+METADATA_RULE_TYPES = {
+    RuleTypes.DATASET_METADATA_CHECK.value,
+    RuleTypes.DATASET_METADATA_CHECK_AGAINST_DEFINE.value,
+    RuleTypes.DEFINE_ITEM_GROUP_METADATA_CHECK.value,
+    RuleTypes.DEFINE_ITEM_METADATA_CHECK.value,
+    RuleTypes.DEFINE_ITEM_METADATA_CHECK_AGAINST_LIBRARY.value,
+    RuleTypes.DOMAIN_PRESENCE_CHECK.value,
+    RuleTypes.VARIABLE_METADATA_CHECK.value,
+    RuleTypes.VARIABLE_METADATA_CHECK_AGAINST_DEFINE.value,
+    RuleTypes.VARIABLE_METADATA_CHECK_AGAINST_LIBRARY.value,
+}
+# weight of the latest measurement in the stored moving average
+LATEST_DURATION_WEIGHT = 0.5
+
+
+def estimate_rule_duration(rule: dict, dataset: dict) -> float:
+    """
+    Returns a rough estimate of the time needed
+    to validate the rule against the dataset.
+    """
+    cost = BASE_RULE_COST
+    for operation in rule.get("operations") or []:
+        if operation.get("operator") in STUDY_WIDE_OPERATIONS:
+            cost += STUDY_WIDE_OPERATION_COST
+        else:
+            cost += OPERATION_COST
+    cost += JOIN_COST * len(rule.get("datasets") or [])
+    if rule.get("rule_type") in METADATA_RULE_TYPES:
+        return cost
+    size_in_mb = (dataset.get("size") or 0) / 1024**2
+    return cost * (1 + size_in_mb)
+
+
+class RuleTimingHistory:
+    """
+    Stores validation durations of rules per domain between runs.
+    The durations are used to start the most expensive
+    validation tasks first.
+    """
+
+    def __init__(self, durations: Dict[str, Dict[str, float]] = None):
+        self.durations = durations or {}
+
+    @classmethod
+    def load(cls, path: str) -> "RuleTimingHistory":
+        if not os.path.isfile(path):
+            return cls()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load rule timing history {path}. Error: {e}")
+            return cls()
+
+    def save(self, path: str):
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.durations, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to save rule timing history {path}. Error: {e}")
+
+    def add(self, core_id: str, domain: str, duration: float):
+        rule_durations = self.durations.setdefault(core_id, {})
+        previous_duration: Optional[float] = rule_durations.get(domain)
+        if previous_duration is not None:
+            duration = (
+                LATEST_DURATION_WEIGHT * duration
+                + (1 - LATEST_DURATION_WEIGHT) * previous_duration
+            )
+        rule_durations[domain] = duration
+
+    def get(self, core_id: str, domain: str) -> Optional[float]:
+        return self.durations.get(core_id, {}).get(domain)
+
+    def estimate(self, rule: dict, dataset: dict) -> float:
+        """
+        Returns the recorded duration of the rule for the domain.
+        If the domain was not validated before, the average duration
+        of the rule for other domains is used, and the static estimate
+        is used for rules that have no history.
+        """
+        rule_durations = self.durations.get(rule.get("core_id"), {})
+        duration: Optional[float] = rule_durations.get(dataset.get("domain"))
+        if duration is not None:
+            return duration
+        if rule_durations:
+            return sum(rule_durations.values()) / len(rule_durations)
+        return estimate_rule_duration(rule, dataset)
+
+    def estimate_total(self, rule: dict, datasets: List[dict]) -> float:
+        return sum(self.estimate(rule, dataset) for dataset in datasets)
@@ -0,0 +1,97 @@
+import _thread
+import signal
+import threading
+import time
+from typing import Optional
+
+import psutil
+
+from cdisc_rules_engine.exceptions.custom_exceptions import TaskBudgetExceededError
+from cdisc_rules_engine.services import logger
+
+
+def get_memory_usage() -> int:
+    """
+    Returns resident memory of the current process in bytes.
+    """
+    return psutil.Process().memory_info().rss
+
+
+class TaskBudget:
+    """
+    Context manager that limits the wall-clock time
+    and the resident memory of the code it wraps.
+
+    A watchdog thread checks the limits and interrupts the main thread
+    when a limit is exceeded. The interruption is delivered as
+    TaskBudgetExceededError raised in the wrapped code.
+    Python delivers the interruption between bytecode instructions,
+    so a long running call into compiled code (for example a pandas merge)
+    is interrupted once the call returns.
+    The main thread is interrupted again every check interval
+    until the wrapped code exits, so the task is stopped even if
+    an exception handler inside it catches the error and carries on.
+
+    Budgets are enforced only in the main thread of a process,
+    which is where pool workers execute their tasks.
+    """
+
+    def __init__(
+        self,
+        max_seconds: Optional[float] = None,
+        max_memory: Optional[int] = None,
+        check_interval: float = 0.1,
+    ):
+        self.max_seconds = max_seconds
+        self.max_memory = max_memory
+        self.check_interval = check_interval
+        self._exceeded_message: Optional[str] = None
+        self._stop_event = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+        self._previous_handler = None
+
+    def __enter__(self):
+        if not (self.max_seconds or self.max_memory):
+            return self
+        if threading.current_thread() is not threading.main_thread():
+            logger.warning("Task budget can only be enforced in the main thread")
+            return self
+        self._exceeded_message = None
+        self._stop_event.clear()
+        self._previous_handler = signal.signal(signal.SIGINT, self._handle_interrupt)
+        self._watchdog = threading.Thread(target=self._watch, daemon=True)
+        self._watchdog.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._watchdog is None:
+            return
+        self._stop_event.set()
+        self._watchdog.join()
+        self._watchdog = None
+        signal.signal(signal.SIGINT, self._previous_handler)
+
+    def _watch(self):
+        start = time.monotonic()
+        while not self._stop_event.wait(self.check_interval):
+            if self.max_seconds and time.monotonic() - start > self.max_seconds:
+                self._exceeded_message = (
+                    f"Validation exceeded the time limit of {self.max_seconds} seconds"
+                )
+            elif self.max_memory and get_memory_usage() > self.max_memory:
+                self._exceeded_message = (
+                    f"Validation exceeded the memory limit of {self.max_memory} bytes"
+                )
+            if self._exceeded_message:
+                _thread.interrupt_main()
+
+    def _handle_interrupt(self, signum, frame):
+        if self._exceeded_message:
+            if self._stop_event.is_set():
+                # the wrapped code has already exited
+                return
+            raise TaskBudgetExceededError(self._exceeded_message)
+        # a real interrupt from the user
+        if callable(self._previous_handler):
+            return self._previous_handler(signum, frame)
+        return signal.default_int_handler(signum, frame)
@@ -2,10 +2,13 @@
 This module contains utility functions
 that can be reused.
 """
+
 import copy
+import hashlib
 import os
 import re
 from datetime import datetime
+from functools import lru_cache, partial
 from typing import Callable, List, Optional, Set, Union
 from uuid import UUID
 from cdisc_rules_engine.services import logger
@@ -125,10 +128,64 @@ def get_dataset_cache_key_from_study(
     return dataset_path
 
 
-def get_dataset_cache_key_from_path(dataset_path: str, dataset_type: str) -> str:
-    return DATASET_CACHE_KEY_TEMPLATE.format(
+def get_dataset_cache_key_from_path(
+    dataset_path: str, dataset_type: str, fingerprint: str = None
+) -> str:
+    """
+    Returns {dataset_path}_{dataset_type} cache key of a dataset.
+    If the fingerprint of the dataset file is passed, it is appended,
+    so entries cached before the file was changed are not found.
+    """
+    cache_key: str = DATASET_CACHE_KEY_TEMPLATE.format(
         dataset_path=dataset_path, dataset_type=dataset_type
     )
+    if fingerprint:
+        cache_key = f"{cache_key}_{fingerprint}"
+    return cache_key
+
+
+def get_projected_dataset_cache_key(cache_key: str, columns: List[str]) -> str:
+    """
+    Returns cache key of a dataset that contains only the given columns.
+    """
+    columns_hash: str = hashlib.sha1(",".join(sorted(columns)).encode()).hexdigest()
+    return f"{cache_key}_columns_{columns_hash[:16]}"
+
+
+def get_file_fingerprint(file_path: str, content_hash: bool = False) -> str:
+    """
+    Returns a key that identifies contents of the file without reading it.
+    The key changes when the file is moved, resized or modified.
+
+    With content_hash the key is built from a hash of the file contents
+    instead of its modification time, so it also changes when the file
+    is rewritten within the resolution of the modification time
+    and does not change when the file is touched or copied unchanged.
+    The file is read again only when its status change time changes.
+    """
+    file_path = os.path.abspath(file_path)
+    file_stat = os.stat(file_path)
+    if content_hash:
+        version: str = _get_file_content_hash(
+            file_path, file_stat.st_ino, file_stat.st_size, file_stat.st_ctime_ns
+        )
+    else:
+        version: str = str(file_stat.st_mtime_ns)
+    return hashlib.sha1(
+        f"{file_path}:{file_stat.st_size}:{version}".encode()
+    ).hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _get_file_content_hash(
+    file_path: str, inode: int, size: int, change_time: int
+) -> str:
+    # status of the file is a part of the lru_cache key
+    file_hash = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for chunk in iter(partial(f.read, 1024 * 1024), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
 
 
 def is_supp_domain(dataset_domain: str) -> bool:
@@ -11,16 +11,19 @@ import click
 from pathlib import Path
 from cdisc_rules_engine.config import config
 from cdisc_rules_engine.enums.default_file_paths import DefaultFilePaths
+from cdisc_rules_engine.enums.distributed_roles import DistributedRoles
 from cdisc_rules_engine.enums.progress_parameter_options import ProgressParameterOptions
 from cdisc_rules_engine.enums.report_types import ReportTypes
+from cdisc_rules_engine.enums.scheduling_options import SchedulingOptions
 from cdisc_rules_engine.enums.dataformat_types import DataFormatTypes
 from cdisc_rules_engine.models.validation_args import Validation_args
 from cdisc_rules_engine.models.test_args import TestArgs
-from scripts.run_validation import run_validation
+from scripts.run_validation import run_validation, run_validation_worker
 from scripts.test_rule import test as test_rule
 from cdisc_rules_engine.services.cache.cache_populator_service import CachePopulator
 from cdisc_rules_engine.services.cache.cache_service_factory import CacheServiceFactory
 from cdisc_rules_engine.services.cdisc_library_service import CDISCLibraryService
+from cdisc_rules_engine.utilities.library_cache_store import LibraryCacheStore
 from cdisc_rules_engine.utilities.utils import (
     generate_report_filename,
     get_rules_cache_key,
@@ -45,6 +48,37 @@ def valid_data_file(data_path: list) -> Tuple[list, set]:
         return file_list, found_formats
 
 
+def get_dataset_paths(ctx, logger, data: str, dataset_path: Tuple[str]) -> list:
+    if data:
+        if dataset_path:
+            logger.error(
+                "Argument --dataset-path cannot be used together with argument --data"
+            )
+            ctx.exit()
+        dataset_paths, found_formats = valid_data_file(
+            [str(Path(data).joinpath(fn)) for fn in os.listdir(data)]
+        )
+        if len(found_formats) > 1:
+            logger.error(
+                f"Argument --data contains more than one allowed file format ({', '.join(found_formats)})."  # noqa: E501
+            )
+            ctx.exit()
+    elif dataset_path:
+        dataset_paths, found_formats = valid_data_file([dp for dp in dataset_path])
+        if len(found_formats) > 1:
+            logger.error(
+                f"Argument --dataset_path contains more than one allowed file format ({', '.join(found_formats)})."  # noqa: E501
+            )
+            ctx.exit()
+    else:
+        logger.error(
+            "You must pass one of the following arguments: --dataset-path, --data"
+        )
+        # no need to define dataset_paths here, the program execution will stop
+        ctx.exit()
+    return dataset_paths
+
+
 @click.group()
 def cli():
     pass
@@ -193,6 +227,154 @@ def cli():
     ),
 )
 @click.option("-dxp", "--define-xml-path", required=False, help="Path to Define-XML")
+@click.option(
+    "-sch",
+    "--scheduling",
+    default=SchedulingOptions.RULE.value,
+    type=click.Choice(SchedulingOptions.values()),
+    help=(
+        "Defines how validation work is split between parallel processes. "
+        "rule - each process validates one rule against all datasets. "
+        "dataset - each process loads one dataset and validates all rules against it."
+    ),
+)
+@click.option(
+    "--max-task-time",
+    type=float,
+    required=False,
+    help=(
+        "Time limit in seconds for validating a rule against a dataset. "
+        "Validations that exceed the limit are reported as execution errors"
+    ),
+)
+@click.option(
+    "--max-task-memory",
+    type=int,
+    required=False,
+    help=(
+        "Memory limit in megabytes of a worker process while validating a rule "
+        "against a dataset. Validations that exceed the limit "
+        "are reported as execution errors"
+    ),
+)
+@click.option(
+    "--max-tasks-per-worker",
+    type=click.IntRange(min=1),
+    required=False,
+    help="Number of tasks a worker process completes before it is replaced",
+)
+@click.option(
+    "--worker-memory-watermark",
+    type=int,
+    required=False,
+    help=(
+        "Memory usage in megabytes of a worker process "
+        "above which the worker processes are replaced"
+    ),
+)
+@click.option(
+    "--stream-reports",
+    is_flag=True,
+    default=False,
+    help=(
+        "Add results to the reports as soon as each rule is validated, "
+        "instead of keeping all results in memory until the validation completes"
+    ),
+)
+@click.option(
+    "--distributed-role",
+    required=False,
+    type=click.Choice(DistributedRoles.values()),
+    help=(
+        "Runs the validation on several machines. "
+        "coordinator - publishes validation tasks to the task queue "
+        "and builds the reports from the results. "
+        "worker - validates tasks taken from the task queue, "
+        "dataset and rule options are taken from the coordinator. "
+        "Dataset paths must be accessible from all machines"
+    ),
+)
+@click.option(
+    "--task-queue",
+    required=False,
+    help=(
+        "Task queue used by --distributed-role. "
+        "A path to a shared directory, file:///path/to/directory "
+        "or redis://host:port/db?queue=name"
+    ),
+)
+@click.option(
+    "--task-queue-timeout",
+    type=click.IntRange(min=1),
+    required=False,
+    default=3600,
+    help=(
+        "Seconds the coordinator waits for the next task result "
+        "before the validation fails"
+    ),
+)
+@click.option(
+    "--parquet-cache",
+    required=False,
+    help=(
+        "Directory where datasets converted to parquet for large dataset "
+        "validation are kept between runs. Unchanged datasets are not converted again. "
+        "Required for large datasets with --distributed-role coordinator, "
+        "the directory must be shared with the workers"
+    ),
+)
+@click.option(
+    "--parquet-cache-max-size",
+    type=int,
+    required=False,
+    help=(
+        "Size limit in megabytes of the --parquet-cache directory. "
+        "Least recently used files are removed above the limit"
+    ),
+)
+@click.option(
+    "--column-projection",
+    is_flag=True,
+    default=False,
+    help=(
+        "Load only the dataset columns referenced by a rule. "
+        "Rules that may reference other columns load all columns"
+    ),
+)
+@click.option(
+    "--categorical-threshold",
+    type=click.FloatRange(0, 1, min_open=True),
+    required=False,
+    help=(
+        "Load string columns as categoricals if the ratio of their "
+        "distinct values to rows does not exceed the threshold, e.g. 0.5"
+    ),
+)
+@click.option(
+    "--operation-cache",
+    required=False,
+    help=(
+        "Directory where results of rule operations are kept between runs. "
+        "Results are reused while the datasets they are computed from are unchanged"
+    ),
+)
+@click.option(
+    "--operation-cache-max-size",
+    type=int,
+    required=False,
+    help=(
+        "Size limit in megabytes of the --operation-cache directory. "
+        "Least recently used results are removed above the limit"
+    ),
+)
+@click.option(
+    "--cache-stats",
+    required=False,
+    help=(
+        "JSON file where hits, misses, evictions and latency "
+        "of the caches by key namespace are written after the validation"
+    ),
+)
 @click.pass_context
 def validate(
     ctx,
@@ -219,6 +401,22 @@ def validate(
     local_rules_id: str,
     progress: str,
     define_xml_path: str,
+    scheduling: str,
+    max_task_time: float,
+    max_task_memory: int,
+    max_tasks_per_worker: int,
+    worker_memory_watermark: int,
+    stream_reports: bool,
+    distributed_role: str,
+    task_queue: str,
+    task_queue_timeout: int,
+    parquet_cache: str,
+    parquet_cache_max_size: int,
+    column_projection: bool,
+    categorical_threshold: float,
+    operation_cache: str,
+    operation_cache_max_size: int,
+    cache_stats: str,
 ):
     """
     Validate data using CDISC Rules Engine
@@ -242,60 +440,60 @@ def validate(
 
     print(os.path.dirname(__file__))
 
-    if data:
-        if dataset_path:
-            logger.error(
-                "Argument --dataset-path cannot be used together with argument --data"
-            )
-            ctx.exit()
-        dataset_paths, found_formats = valid_data_file(
-            [str(Path(data).joinpath(fn)) for fn in os.listdir(data)]
-        )
-        if len(found_formats) > 1:
-            logger.error(
-                f"Argument --data contains more than one allowed file format ({', '.join(found_formats)})."  # noqa: E501
-            )
-            ctx.exit()
-    elif dataset_path:
-        dataset_paths, found_formats = valid_data_file([dp for dp in dataset_path])
-        if len(found_formats) > 1:
-            logger.error(
-                f"Argument --dataset_path contains more than one allowed file format ({', '.join(found_formats)})."  # noqa: E501
-            )
-            ctx.exit()
-    else:
-        logger.error(
-            "You must pass one of the following arguments: --dataset-path, --data"
-        )
-        # no need to define dataset_paths here, the program execution will stop
+    if distributed_role and not task_queue:
+        logger.error("Argument --distributed-role requires argument --task-queue")
         ctx.exit()
 
-    run_validation(
-        Validation_args(
-            cache_path,
-            pool_size,
-            dataset_paths,
-            log_level,
-            report_template,
-            standard,
-            version,
-            set(controlled_terminology_package),  # avoiding duplicates
-            output,
-            set(output_format),  # avoiding duplicates
-            raw_report,
-            define_version,
-            whodrug,
-            meddra,
-            loinc,
-            medrt,
-            rules,
-            local_rules,
-            local_rules_cache,
-            local_rules_id,
-            progress,
-            define_xml_path,
-        )
+    if distributed_role == DistributedRoles.WORKER.value:
+        # datasets of the validation are published by the coordinator
+        dataset_paths = []
+    else:
+        dataset_paths = get_dataset_paths(ctx, logger, data, dataset_path)
+
+    validation_args = Validation_args(
+        cache_path,
+        pool_size,
+        dataset_paths,
+        log_level,
+        report_template,
+        standard,
+        version,
+        set(controlled_terminology_package),  # avoiding duplicates
+        output,
+        set(output_format),  # avoiding duplicates
+        raw_report,
+        define_version,
+        whodrug,
+        meddra,
+        loinc,
+        medrt,
+        rules,
+        local_rules,
+        local_rules_cache,
+        local_rules_id,
+        progress,
+        define_xml_path,
+        scheduling,
+        max_task_time,
+        max_task_memory,
+        max_tasks_per_worker,
+        worker_memory_watermark,
+        stream_reports,
+        distributed_role,
+        task_queue,
+        parquet_cache,
+        parquet_cache_max_size,
+        column_projection,
+        categorical_threshold,
+        operation_cache,
+        operation_cache_max_size,
+        cache_stats,
+        task_queue_timeout,
     )
+    if distributed_role == DistributedRoles.WORKER.value:
+        run_validation_worker(validation_args)
+    else:
+        run_validation(validation_args)
 
 
 @click.command()
@@ -386,6 +584,8 @@ def update_cache(
                 cache_path, DefaultFilePaths.VARIABLE_METADATA_CACHE_FILE.value
             )
         )
+    # index the saved cache files, so validations do not load them as a whole
+    LibraryCacheStore(cache_path).update()
     print("Cache updated successfully")
 
 
@@ -0,0 +1,86 @@
+"""
+Compares the latency of adding CT packages and dictionaries
+to InMemoryCacheService when item sizes are measured
+with pympler.asizeof and when they are estimated with SizeEstimator.
+
+Usage:
+    python -m scripts.benchmark_cache_insert -c resources/cache/sdtmct-2023-12-15.pkl
+        --meddra path/to/meddra --whodrug path/to/whodrug
+"""
+
+import argparse
+import pickle
+import time
+from typing import Callable, Dict
+
+from pympler import asizeof
+
+from cdisc_rules_engine.config import config
+from cdisc_rules_engine.models.dictionaries import DictionaryTypes
+from cdisc_rules_engine.models.dictionaries.get_dictionary_terms import (
+    extract_dictionary_terms,
+)
+from cdisc_rules_engine.services.cache import InMemoryCacheService, SizeEstimator
+from cdisc_rules_engine.services.data_services import DataServiceFactory
+
+
+def measure(function: Callable, repeat: int) -> float:
+    """
+    Returns the best time of the given number of runs in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def load_payloads(args) -> Dict[str, object]:
+    payloads = {}
+    for file_path in args.cache_files or []:
+        with open(file_path, "rb") as file:
+            payloads[file_path] = pickle.load(file)
+    cache = InMemoryCacheService()
+    data_service = DataServiceFactory(config, cache).get_data_service()
+    for dictionary_type in DictionaryTypes:
+        directory_path = getattr(args, dictionary_type.value, None)
+        if directory_path:
+            payloads[dictionary_type.value] = extract_dictionary_terms(
+                data_service, dictionary_type, directory_path
+            )
+    return payloads
+
+
+def benchmark_payload(name: str, payload, repeat: int):
+    estimator = SizeEstimator()
+    print(
+        f"{name}: asizeof {asizeof.asizeof(payload) / 2 ** 20:.1f} MB, "
+        f"estimated {estimator(payload) / 2 ** 20:.1f} MB"
+    )
+    caches = {
+        "asizeof": InMemoryCacheService(size_estimator=asizeof.asizeof),
+        "SizeEstimator": InMemoryCacheService(size_estimator=estimator),
+    }
+    for cache_name, cache in caches.items():
+        seconds = measure(lambda: cache.add(name, payload), repeat)
+        print(f"  {cache_name:<14} insert: {seconds * 1000:10.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-c", "--cache-files", nargs="*", help="Pickled cache files, e.g. CT packages"
+    )
+    for dictionary_type in DictionaryTypes:
+        parser.add_argument(
+            f"--{dictionary_type.value}", help=f"{dictionary_type.value} directory"
+        )
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    args = parser.parse_args()
+    for name, payload in load_payloads(args).items():
+        benchmark_payload(name, payload, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares the serializers of RedisCacheService on cached CT packages:
+size of the stored values and time to serialize and deserialize them.
+With --host, also measures the latency of writing the packages to
+a Redis server and reading them back one by one and in one batch.
+
+Usage:
+    python -m scripts.benchmark_redis_cache -c resources/cache/sdtmct-2023-12-15.pkl
+        --host localhost --port 6379
+"""
+
+import argparse
+import pickle
+from typing import Dict
+
+from cdisc_rules_engine.services.cache import RedisCacheService
+from cdisc_rules_engine.services.cache.serializers import SERIALIZERS
+from scripts.benchmark_cache_insert import measure
+
+
+def load_payloads(args) -> Dict[str, object]:
+    payloads = {}
+    for file_path in args.cache_files:
+        with open(file_path, "rb") as file:
+            payloads[file_path] = pickle.load(file)
+    return payloads
+
+
+def benchmark_serializers(payloads: Dict[str, object], repeat: int):
+    for name, payload in payloads.items():
+        print(name)
+        for serializer_name, serializer in SERIALIZERS.items():
+            data: bytes = serializer.dumps(payload)
+            dumps_seconds = measure(lambda: serializer.dumps(payload), repeat)
+            loads_seconds = measure(lambda: serializer.loads(data), repeat)
+            print(
+                f"  {serializer_name:<12} {len(data) / 2 ** 20:8.1f} MB, "
+                f"dumps {dumps_seconds * 1000:8.1f} ms, "
+                f"loads {loads_seconds * 1000:8.1f} ms"
+            )
+
+
+def benchmark_server(payloads: Dict[str, object], args):
+    keys = [f"benchmark/{name}" for name in payloads]
+    for serializer_name, serializer in SERIALIZERS.items():
+        cache = RedisCacheService(
+            args.host, args.password, args.port, args.ssl, serializer=serializer
+        )
+        write_seconds = measure(
+            lambda: cache.add_all(dict(zip(keys, payloads.values()))), args.repeat
+        )
+        get_seconds = measure(lambda: [cache.get(key) for key in keys], args.repeat)
+        get_all_seconds = measure(lambda: cache.get_all(keys), args.repeat)
+        print(
+            f"{serializer_name:<12} write {write_seconds * 1000:8.1f} ms, "
+            f"get {get_seconds * 1000:8.1f} ms, "
+            f"get_all {get_all_seconds * 1000:8.1f} ms"
+        )
+        cache.clear_all("benchmark/")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-c",
+        "--cache-files",
+        nargs="+",
+        required=True,
+        help="Pickled cache files, e.g. CT packages",
+    )
+    parser.add_argument("--host", help="Redis host, serializers only if not given")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--password", default="")
+    parser.add_argument("--ssl", action="store_true")
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    args = parser.parse_args()
+    payloads = load_payloads(args)
+    benchmark_serializers(payloads, args.repeat)
+    if args.host:
+        benchmark_server(payloads, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares reading XPT files with XPTReader (pandas.read_sas)
+and with NativeXPTReader.
+
+Usage:
+    python -m scripts.benchmark_xpt_readers path/to/lb.xpt [path/to/ae.xpt ...]
+"""
+
+import argparse
+import time
+from typing import Callable, List, Optional
+
+from cdisc_rules_engine.interfaces import DataReaderInterface
+from cdisc_rules_engine.services.data_readers import NativeXPTReader, XPTReader
+
+
+def measure(function: Callable, repeat: int) -> float:
+    """
+    Returns the best time of the given number of runs in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark_file(file_path: str, columns: Optional[List[str]], repeat: int):
+    readers: List[DataReaderInterface] = [XPTReader(), NativeXPTReader()]
+    number_of_rows = len(NativeXPTReader().from_file(file_path).data)
+    print(f"{file_path}: {number_of_rows} rows")
+    for reader in readers:
+        row = f"  {type(reader).__name__:<16}"
+        row += f" all columns: {measure(lambda: reader.from_file(file_path), repeat):8.3f} s"
+        if columns:
+            seconds = measure(lambda: reader.from_file(file_path, columns), repeat)
+            row += f"  {len(columns)} columns: {seconds:8.3f} s"
+        print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("file_paths", nargs="+")
+    parser.add_argument(
+        "-c", "--columns", nargs="*", help="Columns to read in the projected run"
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    args = parser.parse_args()
+    for file_path in args.file_paths:
+        benchmark_file(file_path, args.columns, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,34 @@
 import itertools
+import json
+import queue
+import threading
 import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
 from functools import partial
 from multiprocessing import Pool
 from multiprocessing.managers import SyncManager
-from typing import List, Iterable, Callable
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import dask
 
 from cdisc_rules_engine.config import config
+from cdisc_rules_engine.enums.distributed_roles import DistributedRoles
 from cdisc_rules_engine.enums.progress_parameter_options import ProgressParameterOptions
+from cdisc_rules_engine.enums.scheduling_options import SchedulingOptions
+from cdisc_rules_engine.exceptions.custom_exceptions import TaskBudgetExceededError
+from cdisc_rules_engine.interfaces import CacheServiceInterface, TaskQueueInterface
 from cdisc_rules_engine.models.library_metadata_container import (
     LibraryMetadataContainer,
 )
@@ -18,20 +40,44 @@ from cdisc_rules_engine.services import logger as engine_logger
 from cdisc_rules_engine.services.cache import (
     InMemoryCacheService,
     RedisCacheService,
+    TaskLocalCacheService,
 )
+from cdisc_rules_engine.services.data_readers import DataReaderFactory
 from cdisc_rules_engine.services.data_services import (
     DataServiceFactory,
 )
-from cdisc_rules_engine.models.dataset import PandasDataset
+from cdisc_rules_engine.services.task_queues import TaskQueueFactory
+from cdisc_rules_engine.models.dataset import DaskDataset
 from scripts.script_utils import (
     fill_cache_with_dictionaries,
     get_cache_service,
+    get_local_cache_service,
+    release_cache_service,
     get_library_metadata_from_cache,
     get_rules,
     get_datasets,
     get_max_dataset_size,
 )
 from cdisc_rules_engine.services.reporting import BaseReport, ReportFactory
+from cdisc_rules_engine.utilities.cache_stats import (
+    format_cache_stats,
+    merge_cache_stats,
+    pop_process_cache_stats,
+)
+from cdisc_rules_engine.utilities.rule_processor import RuleProcessor
+from cdisc_rules_engine.utilities.task_budget import TaskBudget, get_memory_usage
+from cdisc_rules_engine.utilities.rule_timing_history import (
+    RULE_TIMING_HISTORY_FILE,
+    RuleTimingHistory,
+)
+from cdisc_rules_engine.utilities.operation_result_store import OperationResultStore
+from cdisc_rules_engine.utilities.parquet_conversion_cache import (
+    ParquetConversionCache,
+)
+from cdisc_rules_engine.utilities.utils import (
+    extract_file_name_from_path_string,
+    is_split_dataset,
+)
 from cdisc_rules_engine.utilities.progress_displayers import get_progress_displayer
 from warnings import simplefilter
 import os
@@ -50,18 +96,29 @@ class CacheManager(SyncManager):
     pass
 
 
-def validate_single_rule(
+# seconds to wait for a task or a result before checking the queue state
+TASK_QUEUE_POLL_TIMEOUT = 5
+# seconds after which a claimed task that was not renewed is requeued
+TASK_CLAIM_TIMEOUT = 60
+# seconds between renewals of the claim of a running task
+TASK_CLAIM_RENEWAL_INTERVAL = 10
+
+
+# process-local cache in front of the shared cache, created once per worker process
+_process_cache: CacheServiceInterface = None
+# cache wrapper used by dataset tasks, created once per worker process
+_task_local_cache: TaskLocalCacheService = None
+# operation result stores by directory, created once per process
+_operation_result_stores: Dict[tuple, OperationResultStore] = {}
+
+
+def get_rules_engine(
     cache,
     datasets,
     args: Validation_args,
     library_metadata: LibraryMetadataContainer,
-    rule: dict = None,
-):
-    rule["conditions"] = ConditionCompositeFactory.get_condition_composite(
-        rule["conditions"]
-    )
+) -> RulesEngine:
     max_dataset_size = max(datasets, key=lambda x: x["size"])["size"]
-    # call rule engine
     engine = RulesEngine(
         cache=cache,
         standard=args.standard,
@@ -75,20 +132,111 @@ def validate_single_rule(
         library_metadata=library_metadata,
         max_dataset_size=max_dataset_size,
         dataset_paths=args.dataset_paths,
+        column_projection=args.column_projection,
+        categorical_threshold=args.categorical_threshold,
+        operation_result_store=get_operation_result_store(args),
     )
+    # the data service is a process singleton, forked workers inherit
+    # the one created by the parent, so options of the validation
+    # that change how datasets are read are applied to it
+    engine.data_service.categorical_threshold = args.categorical_threshold
+    return engine
+
+
+@contextmanager
+def use_task_cache(engine: RulesEngine, cache: CacheServiceInterface):
+    """
+    Reads datasets of the task through the task cache.
+    Data services are singletons within a process, and forked workers
+    inherit the data service of the parent created around the shared cache,
+    so the data service of the engine is switched to the task cache
+    while the task runs and switched back afterwards.
+    """
+    data_service = engine.data_service
+    previous_cache: CacheServiceInterface = data_service.cache_service
+    data_service.cache_service = cache
+    try:
+        yield
+    finally:
+        data_service.cache_service = previous_cache
+
+
+def validate_rule_on_dataset(
+    engine: RulesEngine,
+    rule: dict,
+    dataset: dict,
+    datasets: List[dict],
+    args: Validation_args,
+    timings: List[Tuple[str, str, float]] = None,
+) -> List[dict]:
+    """
+    Validates the rule against the dataset within the time
+    and memory limits of a task.
+    If timings list is given, (core_id, domain, duration)
+    of the validation is appended to it.
+    """
+    start = time.perf_counter()
+    try:
+        with TaskBudget(args.max_task_time, megabytes_to_bytes(args.max_task_memory)):
+            result = engine.validate_single_rule(
+                rule, dataset["full_path"], datasets, dataset["domain"]
+            )
+    except TaskBudgetExceededError as e:
+        # the limit was exceeded outside of the engine error handling
+        error_obj = engine.handle_validation_exceptions(
+            e, dataset["full_path"], dataset["full_path"]
+        )
+        error_obj.domain = dataset["domain"]
+        result = [error_obj.to_representation()]
+    if timings is not None:
+        timings.append(
+            (rule["core_id"], dataset["domain"], time.perf_counter() - start)
+        )
+    return result
+
+
+def validate_single_rule(
+    cache,
+    datasets,
+    args: Validation_args,
+    library_metadata: LibraryMetadataContainer,
+    rule: dict = None,
+    rule_domains: Set[str] = None,
+    timings: List[Tuple[str, str, float]] = None,
+):
+    """
+    Runs the rule against every domain.
+    If rule_domains are given, the rule is validated only
+    against these domains, other domains are reported as skipped.
+    If timings list is given, (core_id, domain, duration)
+    of each validated domain are appended to it.
+    """
+    # the rule of the caller is not changed, so that it can be validated again
+    rule = {
+        **rule,
+        "conditions": ConditionCompositeFactory.get_condition_composite(
+            rule["conditions"]
+        ),
+    }
+    # call rule engine
+    engine = get_rules_engine(cache, datasets, args, library_metadata)
     results = []
     validated_domains = set()
-    for dataset in datasets:
-        # Check if the domain has been validated before
-        # This addresses the case where a domain is split
-        # and appears multiple times within the list of datasets
-        if dataset["domain"] not in validated_domains:
-            validated_domains.add(dataset["domain"])
-            results.append(
-                engine.validate_single_rule(
-                    rule, dataset["full_path"], datasets, dataset["domain"]
+    with use_task_cache(engine, cache):
+        for dataset in datasets:
+            # Check if the domain has been validated before
+            # This addresses the case where a domain is split
+            # and appears multiple times within the list of datasets
+            if dataset["domain"] not in validated_domains:
+                validated_domains.add(dataset["domain"])
+                if rule_domains is not None and dataset["domain"] not in rule_domains:
+                    results.append(RulesEngine.get_skipped_result(dataset["domain"]))
+                    continue
+                results.append(
+                    validate_rule_on_dataset(
+                        engine, rule, dataset, datasets, args, timings
+                    )
                 )
-            )
 
     results = list(itertools.chain(*results))
     if args.progress == ProgressParameterOptions.VERBOSE_OUTPUT.value:
@@ -96,6 +244,599 @@ def validate_single_rule(
     return RuleValidationResult(rule, results)
 
 
+def validate_rule_task(
+    cache,
+    datasets,
+    args: Validation_args,
+    library_metadata: LibraryMetadataContainer,
+    task: Tuple[dict, Set[str]] = None,
+) -> Tuple[RuleValidationResult, List[Tuple[str, str, float]]]:
+    """
+    Validates a rule against the domains it applies to.
+    Returns the validation result and the validation durations.
+    """
+    rule, rule_domains = task
+    timings = []
+    result = validate_single_rule(
+        get_process_cache(cache),
+        datasets,
+        args,
+        library_metadata,
+        rule,
+        rule_domains,
+        timings,
+    )
+    return result, timings
+
+
+def get_process_cache(shared_cache) -> CacheServiceInterface:
+    """
+    Returns the process-local cache in front of the shared cache,
+    so values read by one task are not read across processes again.
+    """
+    global _process_cache
+    if _process_cache is None:
+        _process_cache = get_local_cache_service(shared_cache)
+    return _process_cache
+
+
+def get_task_local_cache(shared_cache) -> TaskLocalCacheService:
+    """
+    Returns the task local cache of the current process.
+    The same cache wrapper is reused by every task the process runs,
+    its datasets are released at the end of each task.
+    """
+    global _task_local_cache
+    if _task_local_cache is None:
+        _task_local_cache = TaskLocalCacheService(get_process_cache(shared_cache))
+    return _task_local_cache
+
+
+def validate_single_dataset(
+    cache,
+    datasets,
+    args: Validation_args,
+    library_metadata: LibraryMetadataContainer,
+    rules: List[dict],
+    rule_domains: List[Set[str]],
+    dataset: dict = None,
+    timings: List[Tuple[str, str, float]] = None,
+) -> Tuple[str, List[List[dict]]]:
+    """
+    Runs every rule against a single dataset (domain).
+    The dataset is read once and kept in process memory
+    while the rules of the task are executed.
+    Rules that do not apply to the domain according to rule_domains
+    are reported as skipped without being validated.
+    Returns the dataset domain and a list of results
+    for each rule, in the order of the given rules.
+    If timings list is given, (core_id, domain, duration)
+    of each validated rule are appended to it.
+    """
+    task_cache = get_task_local_cache(cache)
+    engine = get_rules_engine(task_cache, datasets, args, library_metadata)
+    results = []
+    try:
+        with use_task_cache(engine, task_cache):
+            for rule, domains in zip(rules, rule_domains):
+                if dataset["domain"] not in domains:
+                    results.append(RulesEngine.get_skipped_result(dataset["domain"]))
+                    continue
+                rule = {
+                    **rule,
+                    "conditions": ConditionCompositeFactory.get_condition_composite(
+                        rule["conditions"]
+                    ),
+                }
+                results.append(
+                    validate_rule_on_dataset(
+                        engine, rule, dataset, datasets, args, timings
+                    )
+                )
+    finally:
+        task_cache.release_datasets()
+    if args.progress == ProgressParameterOptions.VERBOSE_OUTPUT.value:
+        engine_logger.log(f"{dataset['domain']} validation complete")
+    return dataset["domain"], results
+
+
+def validate_dataset_task(
+    cache,
+    datasets,
+    args: Validation_args,
+    library_metadata: LibraryMetadataContainer,
+    rules: List[dict],
+    rule_domains: List[Set[str]],
+    dataset: dict = None,
+) -> Tuple[Tuple[str, List[List[dict]]], List[Tuple[str, str, float]]]:
+    """
+    Validates all applicable rules against a dataset.
+    Returns the validation result and the validation durations.
+    """
+    timings = []
+    result = validate_single_dataset(
+        cache, datasets, args, library_metadata, rules, rule_domains, dataset, timings
+    )
+    return result, timings
+
+
+def add_results_to_reports(
+    reporting_services: List[BaseReport],
+    validation_results: Iterable[RuleValidationResult],
+) -> Iterable[RuleValidationResult]:
+    """
+    Adds validation results to the reports and yields them
+    without the results of each dataset, which are no longer needed.
+    """
+    for validation_result in validation_results:
+        for reporting_service in reporting_services:
+            reporting_service.add_result(validation_result)
+        validation_result.results = []
+        yield validation_result
+
+
+def record_timings(
+    timing_history: RuleTimingHistory, task_results: Iterable[Tuple[Any, list]]
+) -> Iterable[Any]:
+    """
+    Stores validation durations returned by the tasks
+    and yields the validation results.
+    """
+    for result, timings in task_results:
+        for core_id, domain, duration in timings:
+            timing_history.add(core_id, domain, duration)
+        yield result
+
+
+def megabytes_to_bytes(value: Optional[int]) -> Optional[int]:
+    return value * 1024**2 if value else None
+
+
+def run_task_with_memory_usage(
+    func: Callable, task: Any
+) -> Tuple[Any, int, Dict[str, dict]]:
+    """
+    Runs the task and returns its result together with
+    the memory usage of the worker and stats of its caches.
+    """
+    return func(task), get_memory_usage(), pop_process_cache_stats()
+
+
+def run_tasks(
+    create_pool: Callable[[], Pool],
+    pool_size: int,
+    func: Callable,
+    tasks: List[Any],
+    memory_watermark: Optional[int] = None,
+    cache_stats: Optional[Dict[str, dict]] = None,
+) -> Iterator[Any]:
+    """
+    Runs the tasks in a process pool and yields results in completion order.
+    Tasks are submitted in the given order.
+    If cache_stats dict is given, stats of the worker caches are merged into it.
+
+    If a worker reports memory usage above the watermark,
+    the pool stops receiving new tasks. Once the running tasks complete,
+    the pool is replaced with a new one, so that memory
+    held by the old workers is returned to the system.
+    """
+    pending_tasks = deque(tasks)
+    # keep workers busy while the parent handles results
+    max_running_tasks: int = pool_size * 2
+    while pending_tasks:
+        completed = queue.Queue()
+        running_tasks = 0
+        recycle_pool = False
+        with create_pool() as pool:
+            while running_tasks or (pending_tasks and not recycle_pool):
+                while (
+                    pending_tasks
+                    and not recycle_pool
+                    and running_tasks < max_running_tasks
+                ):
+                    pool.apply_async(
+                        run_task_with_memory_usage,
+                        (func, pending_tasks.popleft()),
+                        callback=lambda value: completed.put((True, value)),
+                        error_callback=lambda error: completed.put((False, error)),
+                    )
+                    running_tasks += 1
+                is_successful, value = completed.get()
+                running_tasks -= 1
+                if not is_successful:
+                    raise value
+                result, memory_usage, worker_cache_stats = value
+                if cache_stats is not None:
+                    merge_cache_stats(cache_stats, worker_cache_stats)
+                if memory_watermark and memory_usage > memory_watermark:
+                    if not recycle_pool and pending_tasks:
+                        engine_logger.info(
+                            "Worker memory usage is above the watermark, "
+                            "restarting the worker pool"
+                        )
+                    recycle_pool = True
+                yield result
+
+
+def get_task_function(
+    cache,
+    job: dict,
+    library_metadata: LibraryMetadataContainer,
+) -> Callable:
+    """
+    Returns the function that validates a single task of the job.
+    The job holds validation args, datasets, rules
+    and domains each rule applies to.
+    """
+    args: Validation_args = job["args"]
+    if args.scheduling == SchedulingOptions.DATASET.value:
+        return partial(
+            validate_dataset_task,
+            cache,
+            job["datasets"],
+            args,
+            library_metadata,
+            job["rules"],
+            job["rule_domains"],
+        )
+    return partial(validate_rule_task, cache, job["datasets"], args, library_metadata)
+
+
+def run_distributed_tasks(
+    task_queue: TaskQueueInterface,
+    job: dict,
+    tasks: List[Any],
+    timeout: Optional[float] = None,
+) -> Iterator[Any]:
+    """
+    Publishes the job and its tasks to the task queue
+    and yields results returned by the workers in completion order.
+    Tasks are published in the given order.
+    Tasks of workers that stopped renewing their claims are requeued,
+    and a task validated twice is yielded once.
+    The queue is leased while the job runs, RuntimeError is raised
+    if it is leased by another coordinator.
+    Raises TimeoutError if no result is received for timeout seconds.
+    """
+    job_id: str = uuid.uuid4().hex
+    if not task_queue.acquire_lease(job_id, TASK_CLAIM_TIMEOUT):
+        raise RuntimeError(
+            "The task queue is used by another coordinator, "
+            "use a separate task queue for each validation"
+        )
+    try:
+        yield from collect_distributed_results(task_queue, job_id, job, tasks, timeout)
+    finally:
+        task_queue.release_lease(job_id)
+
+
+def collect_distributed_results(
+    task_queue: TaskQueueInterface,
+    job_id: str,
+    job: dict,
+    tasks: List[Any],
+    timeout: Optional[float],
+) -> Iterator[Any]:
+    """
+    Publishes the job to the leased task queue and yields
+    results of its tasks. The lease is renewed while waiting.
+    """
+    task_queue.clear()
+    task_queue.publish_job((job_id, job))
+    # zero padded ids keep the order of tasks in the queue
+    remaining_task_ids: Set[str] = set()
+    for index, task in enumerate(tasks):
+        task_id = f"{index:08d}"
+        task_queue.put_task(task_id, (job_id, task))
+        remaining_task_ids.add(task_id)
+    task_queue.close()
+    engine_logger.info(f"Published {len(tasks)} tasks to the task queue")
+    last_result_time: float = time.monotonic()
+    while remaining_task_ids:
+        if not task_queue.acquire_lease(job_id, TASK_CLAIM_TIMEOUT):
+            raise RuntimeError("The lease of the task queue was taken")
+        item = task_queue.get_result(TASK_QUEUE_POLL_TIMEOUT)
+        if item is None:
+            for task_id in task_queue.requeue_stale_tasks(TASK_CLAIM_TIMEOUT):
+                engine_logger.warning(
+                    f"Task {task_id} was not renewed by its worker, requeued"
+                )
+            if timeout and time.monotonic() - last_result_time > timeout:
+                raise TimeoutError(
+                    f"No task result was received for {timeout} seconds, "
+                    f"{len(remaining_task_ids)} tasks are not validated"
+                )
+            continue
+        last_result_time = time.monotonic()
+        task_id, (is_successful, value) = item
+        if task_id not in remaining_task_ids:
+            # the task was requeued and validated again
+            continue
+        if not is_successful:
+            raise RuntimeError(f"Task {task_id} failed on a worker: {value}")
+        remaining_task_ids.remove(task_id)
+        yield value
+
+
+def run_queue_task(
+    task_queue: TaskQueueInterface, task_id: str, task_function: Callable, task: Any
+) -> Any:
+    """
+    Runs the task and renews its claim in the task queue
+    until the task is complete.
+    """
+    is_complete = threading.Event()
+
+    def renew_claim():
+        while not is_complete.wait(TASK_CLAIM_RENEWAL_INTERVAL):
+            try:
+                task_queue.touch_task(task_id)
+            except Exception as e:
+                engine_logger.error(f"Could not renew task {task_id}. Error: {e}")
+
+    renewal_thread = threading.Thread(target=renew_claim, daemon=True)
+    renewal_thread.start()
+    try:
+        return task_function(task)
+    finally:
+        is_complete.set()
+        renewal_thread.join()
+
+
+def process_queue_tasks(
+    task_queue: TaskQueueInterface,
+    create_task_function: Callable[[dict], Callable],
+) -> int:
+    """
+    Takes tasks from the task queue, validates them and puts
+    the results back until the queue is closed and all its tasks
+    are validated. While waiting, tasks of workers that stopped
+    renewing their claims are requeued.
+    The task function is created once per published job.
+    Returns the number of processed tasks.
+    """
+    current_job_id: Optional[str] = None
+    task_function: Optional[Callable] = None
+    processed_tasks: int = 0
+    while True:
+        item = task_queue.get_task(TASK_QUEUE_POLL_TIMEOUT)
+        if item is None:
+            if task_queue.is_closed() and not task_queue.has_claimed_tasks():
+                return processed_tasks
+            task_queue.requeue_stale_tasks(TASK_CLAIM_TIMEOUT)
+            continue
+        task_id, (job_id, task) = item
+        try:
+            if job_id != current_job_id:
+                # jobs whose task function fails are created again by the next task
+                published_job_id, job = task_queue.get_job()
+                task_function = create_task_function(job)
+                current_job_id = published_job_id
+            result = (True, run_queue_task(task_queue, task_id, task_function, task))
+        except Exception as e:
+            engine_logger.error(f"Task {task_id} failed. Error: {e}")
+            result = (False, f"{type(e).__name__}: {e}")
+        task_queue.put_result(task_id, result)
+        processed_tasks += 1
+
+
+def run_queue_worker(shared_cache, task_queue_url: str, cache_path: str, _) -> int:
+    """
+    Processes tasks of the task queue in a worker process.
+    Library metadata is loaded from the cache of this machine.
+    """
+    library_metadata_by_job = {}
+
+    def create_task_function(job: dict) -> Callable:
+        job_args: Validation_args = job["args"]._replace(cache=cache_path)
+        job_key = (job_args.standard, job_args.version, job_args.define_version)
+        if job_key not in library_metadata_by_job:
+            library_metadata_by_job.clear()
+            library_metadata_by_job[job_key] = get_library_metadata_from_cache(job_args)
+            fill_cache_with_dictionaries(shared_cache, job_args)
+        return get_task_function(
+            shared_cache,
+            {**job, "args": job_args},
+            library_metadata_by_job[job_key],
+        )
+
+    return process_queue_tasks(
+        TaskQueueFactory(task_queue_url).get_task_queue(), create_task_function
+    )
+
+
+def run_validation_worker(args: Validation_args):
+    """
+    Validates tasks published by a coordinator to the task queue.
+    Each worker process takes tasks from the queue independently.
+    The worker stops when all tasks of the published job are taken.
+    """
+    set_log_level(args)
+    CacheManager.register("RedisCacheService", RedisCacheService)
+    CacheManager.register("InMemoryCacheService", InMemoryCacheService)
+    manager = CacheManager()
+    manager.start()
+    shared_cache = get_cache_service(manager)
+    try:
+        initializer = partial(
+            initialize_logger, engine_logger.disabled, engine_logger._logger.level
+        )
+        pool_size: int = args.pool_size or os.cpu_count()
+        engine_logger.info(f"Waiting for tasks from the task queue: {args.task_queue}")
+        with Pool(pool_size, initializer=initializer) as pool:
+            processed_tasks = pool.map(
+                partial(run_queue_worker, shared_cache, args.task_queue, args.cache),
+                range(pool_size),
+            )
+        engine_logger.info(f"Processed {sum(processed_tasks)} tasks")
+    finally:
+        release_cache_service(shared_cache)
+
+
+def get_unique_domain_datasets(datasets: List[dict]) -> List[dict]:
+    """
+    Returns the first dataset of each domain.
+    Split domains appear multiple times within the list of datasets,
+    but are validated only once.
+    """
+    domain_datasets = {}
+    for dataset in datasets:
+        domain_datasets.setdefault(dataset["domain"], dataset)
+    return list(domain_datasets.values())
+
+
+def get_rule_domains(
+    rule_processor: RuleProcessor, rules: List[dict], datasets: List[dict]
+) -> List[Set[str]]:
+    """
+    Computes the rule x dataset applicability matrix before validation.
+    Returns the set of domains each rule applies to,
+    in the order of the given rules.
+
+    The checks match RuleProcessor.is_suitable_for_validation,
+    but the class of each dataset is detected only once.
+    If the class cannot be detected, the rule is considered applicable
+    and the worker repeats the check and reports the error.
+    """
+    domain_datasets = get_unique_domain_datasets(datasets)
+    dataset_classes = {}
+
+    def class_check(rule: dict, dataset: dict) -> bool:
+        if not rule_processor.is_dataset_class_required(rule):
+            return True
+        domain: str = dataset["domain"]
+        if domain not in dataset_classes:
+            try:
+                dataset_classes[domain] = rule_processor.get_dataset_class(
+                    dataset["full_path"], datasets, domain
+                )
+            except Exception as e:
+                engine_logger.info(f"Failed to detect class of {domain}. Error: {e}")
+                dataset_classes[domain] = e
+        if isinstance(dataset_classes[domain], Exception):
+            return True
+        return rule_processor.rule_applies_to_dataset_class(
+            rule, dataset_classes[domain]
+        )
+
+    split_domains = {
+        dataset["domain"]
+        for dataset in domain_datasets
+        if is_split_dataset(datasets, dataset["domain"])
+    }
+    rule_domains = []
+    for rule in rules:
+        if not rule_processor.valid_rule_structure(rule):
+            rule_domains.append(set())
+            continue
+        rule_domains.append(
+            {
+                dataset["domain"]
+                for dataset in domain_datasets
+                if rule_processor.rule_applies_to_domain(
+                    dataset["domain"], rule, dataset["domain"] in split_domains
+                )
+                and class_check(rule, dataset)
+            }
+        )
+    return rule_domains
+
+
+def get_rule_tasks(
+    rules: List[dict],
+    rule_domains: List[Set[str]],
+    domain_datasets: List[dict],
+    timing_history: RuleTimingHistory,
+) -> Tuple[List[Tuple[dict, Set[str]]], List[RuleValidationResult]]:
+    """
+    Returns rule tasks ordered from the most to the least expensive,
+    so that long running rules do not start at the end of the validation.
+    Results of rules that do not apply to any domain
+    are returned without creating a task.
+    """
+    rule_tasks = []
+    skipped_results = []
+    for rule, domains in zip(rules, rule_domains):
+        if domains:
+            rule_tasks.append((rule, domains))
+        else:
+            results = [
+                RulesEngine.get_skipped_result(dataset["domain"])
+                for dataset in domain_datasets
+            ]
+            skipped_results.append(
+                RuleValidationResult(rule, list(itertools.chain(*results)))
+            )
+    rule_tasks.sort(
+        key=lambda task: timing_history.estimate_total(
+            task[0],
+            [dataset for dataset in domain_datasets if dataset["domain"] in task[1]],
+        ),
+        reverse=True,
+    )
+    return rule_tasks, skipped_results
+
+
+def get_dataset_tasks(
+    rules: List[dict],
+    rule_domains: List[Set[str]],
+    domain_datasets: List[dict],
+    timing_history: RuleTimingHistory,
+) -> Tuple[List[dict], List[Tuple[str, List[List[dict]]]]]:
+    """
+    Returns dataset tasks ordered from the most to the least expensive.
+    Results of datasets that no rule applies to
+    are returned without creating a task.
+    """
+    dataset_costs = {}
+    skipped_results = []
+    for dataset in domain_datasets:
+        dataset_rules = [
+            rule
+            for rule, domains in zip(rules, rule_domains)
+            if dataset["domain"] in domains
+        ]
+        if dataset_rules:
+            dataset_costs[dataset["domain"]] = sum(
+                timing_history.estimate(rule, dataset) for rule in dataset_rules
+            )
+        else:
+            skipped_results.append(
+                (
+                    dataset["domain"],
+                    [RulesEngine.get_skipped_result(dataset["domain"]) for _ in rules],
+                )
+            )
+    dataset_tasks = sorted(
+        (dataset for dataset in domain_datasets if dataset["domain"] in dataset_costs),
+        key=lambda dataset: dataset_costs[dataset["domain"]],
+        reverse=True,
+    )
+    return dataset_tasks, skipped_results
+
+
+def merge_dataset_results(
+    rules: List[dict],
+    domain_datasets: List[dict],
+    dataset_results: Iterable[Tuple[str, List[List[dict]]]],
+) -> List[RuleValidationResult]:
+    """
+    Converts results of dataset tasks into one RuleValidationResult per rule.
+    Results of each rule are ordered by the order of datasets.
+    """
+    results_by_domain = dict(dataset_results)
+    validation_results = []
+    for rule_index, rule in enumerate(rules):
+        rule_results = itertools.chain(
+            *(
+                results_by_domain[dataset["domain"]][rule_index]
+                for dataset in domain_datasets
+            )
+        )
+        validation_results.append(RuleValidationResult(rule, list(rule_results)))
+    return validation_results
+
+
 def set_log_level(args):
     if args.log_level.lower() == "disabled":
         engine_logger.disabled = True
@@ -114,6 +855,163 @@ def initialize_logger(disabled, log_level):
         engine_logger.setLevel(log_level)
 
 
+def get_conversion_cache(args: Validation_args) -> Optional[ParquetConversionCache]:
+    if not args.parquet_cache:
+        if args.distributed_role == DistributedRoles.COORDINATOR.value:
+            # converted files must be readable by the workers on other machines
+            raise ValueError(
+                "Large datasets validated by distributed workers are converted "
+                "to parquet, --parquet-cache must be a directory shared "
+                "with the workers"
+            )
+        return None
+    return ParquetConversionCache(
+        args.parquet_cache, megabytes_to_bytes(args.parquet_cache_max_size)
+    )
+
+
+def get_operation_result_store(
+    args: Validation_args,
+) -> Optional[OperationResultStore]:
+    """
+    Returns the operation result store of args.
+    The store is created once per process, so the library metadata files
+    are listed and fingerprinted once instead of for every task.
+    """
+    if not args.operation_cache:
+        return None
+    store_key = (args.operation_cache, args.operation_cache_max_size, args.cache)
+    if store_key not in _operation_result_stores:
+        # results are invalidated when the library metadata files change
+        library_files = [
+            os.path.join(args.cache, file_name)
+            for file_name in sorted(os.listdir(args.cache))
+            if file_name.endswith(".pkl")
+        ]
+        _operation_result_stores[store_key] = OperationResultStore(
+            args.operation_cache,
+            megabytes_to_bytes(args.operation_cache_max_size),
+            library_files,
+        )
+    return _operation_result_stores[store_key]
+
+
+def convert_dataset_to_parquet(file_path: str) -> Tuple[int, str]:
+    """
+    Converts a dataset file to a parquet temp file.
+    Returns the number of rows and the path of the parquet file.
+    """
+    reader = DataReaderFactory().get_service(
+        extract_file_name_from_path_string(file_path).split(".")[1].upper()
+    )
+    return reader.to_parquet(file_path)
+
+
+def convert_datasets_to_parquet(
+    datasets: List[dict],
+    pool_size: int,
+    conversion_cache: Optional[ParquetConversionCache] = None,
+) -> List[str]:
+    """
+    Converts datasets to parquet files in parallel and updates their paths.
+    If the conversion cache is given, files converted by previous runs
+    are reused and new files are kept in the cache.
+    Returns paths of the created temp files.
+    """
+    engine_logger.warning(
+        "Large datasets must use parquet format, converting all datasets to parquet"
+    )
+    converted_files = {}
+    pending_paths = []
+    for dataset in datasets:
+        file_path = dataset.get("full_path")
+        if file_path.endswith(".parquet"):
+            continue
+        cached_file = conversion_cache.get(file_path) if conversion_cache else None
+        if cached_file:
+            engine_logger.info(f"Using converted dataset {cached_file[1]}")
+            converted_files[file_path] = cached_file
+        else:
+            pending_paths.append(file_path)
+    created_files = []
+    if pending_paths:
+        with Pool(min(pool_size, len(pending_paths))) as pool:
+            for file_path, (num_rows, new_file) in zip(
+                pending_paths, pool.imap(convert_dataset_to_parquet, pending_paths)
+            ):
+                if conversion_cache:
+                    new_file = conversion_cache.add(file_path, num_rows, new_file)
+                else:
+                    created_files.append(new_file)
+                converted_files[file_path] = (num_rows, new_file)
+    if conversion_cache:
+        conversion_cache.evict(new_file for _, new_file in converted_files.values())
+    for dataset in datasets:
+        file_path = dataset.get("full_path")
+        if file_path in converted_files:
+            dataset["length"], dataset["full_path"] = converted_files[file_path]
+            dataset["original_path"] = file_path
+    return created_files
+
+
+def get_task_executor(
+    args: Validation_args,
+    job: dict,
+    task_function: Callable,
+    initializer: Callable,
+    cache_stats: Optional[Dict[str, dict]] = None,
+) -> Callable[[List[Any]], Iterator[Any]]:
+    """
+    Returns the function that runs validation tasks
+    either in a local process pool or on distributed workers.
+    Stats of the caches of local workers are merged into cache_stats.
+    """
+    if args.distributed_role == DistributedRoles.COORDINATOR.value:
+        return partial(
+            run_distributed_tasks,
+            TaskQueueFactory(args.task_queue).get_task_queue(),
+            job,
+            timeout=args.task_queue_timeout,
+        )
+    create_pool = partial(
+        Pool,
+        args.pool_size,
+        initializer=initializer,
+        maxtasksperchild=args.max_tasks_per_worker,
+    )
+    return partial(
+        run_tasks,
+        create_pool,
+        args.pool_size or os.cpu_count(),
+        task_function,
+        memory_watermark=megabytes_to_bytes(args.worker_memory_watermark),
+        cache_stats=cache_stats,
+    )
+
+
+def report_cache_stats(args: Validation_args, cache_stats: Dict[str, dict]):
+    """
+    Logs cache stats with verbose progress
+    and writes them to the args.cache_stats JSON file.
+    """
+    if args.progress == ProgressParameterOptions.VERBOSE_OUTPUT.value:
+        for line in format_cache_stats(cache_stats):
+            engine_logger.log(line)
+    if args.cache_stats:
+        with open(args.cache_stats, "w") as file:
+            json.dump(cache_stats, file, indent=2)
+
+
+def remove_intermediate_files(created_files: List[str]):
+    """
+    Deletes files created for the validation, e.g. parquet conversions.
+    """
+    engine_logger.info("Cleaning up intermediate files")
+    for file in created_files:
+        engine_logger.info(f"Deleting file {file}")
+        os.remove(file)
+
+
 def run_validation(args: Validation_args):
     set_log_level(args)
     # fill cache
@@ -122,70 +1020,122 @@ def run_validation(args: Validation_args):
     manager = CacheManager()
     manager.start()
     shared_cache = get_cache_service(manager)
-    engine_logger.info(f"Populating cache, cache path: {args.cache}")
-    rules = get_rules(args)
-    library_metadata: LibraryMetadataContainer = get_library_metadata_from_cache(args)
-    # install dictionaries if needed
-    fill_cache_with_dictionaries(shared_cache, args)
-    max_dataset_size = get_max_dataset_size(args.dataset_paths)
-    standard = args.standard
-    standard_version = args.version.replace(".", "-")
-    data_service = DataServiceFactory(
-        config,
-        shared_cache,
-        max_dataset_size=max_dataset_size,
-        standard=standard,
-        standard_version=standard_version,
-        library_metadata=library_metadata,
-    ).get_data_service()
-    large_dataset_validation: bool = (
-        data_service.dataset_implementation != PandasDataset
-    )
-    datasets = get_datasets(data_service, args.dataset_paths)
-    created_files = []
-    if large_dataset_validation:
-        # convert all files to parquet temp files
-        engine_logger.warning(
-            "Large datasets must use parquet format, converting all datasets to parquet"
+    try:
+        engine_logger.info(f"Populating cache, cache path: {args.cache}")
+        rules = get_rules(args)
+        library_metadata: LibraryMetadataContainer = get_library_metadata_from_cache(
+            args
         )
-        for dataset in datasets:
-            file_path = dataset.get("full_path")
-            if file_path.endswith(".parquet"):
-                continue
-            num_rows, new_file = data_service.to_parquet(file_path)
-            created_files.append(new_file)
-            dataset["full_path"] = new_file
-            dataset["length"] = num_rows
-            dataset["original_path"] = file_path
-    engine_logger.info(f"Running {len(rules)} rules against {len(datasets)} datasets")
-    start = time.time()
-    results = []
-    # instantiate logger in each child process to maintain log level
-    initializer = partial(
-        initialize_logger, engine_logger.disabled, engine_logger._logger.level
-    )
-    # run each rule in a separate process
-    with Pool(args.pool_size, initializer=initializer) as pool:
-        validation_results: Iterable[RuleValidationResult] = pool.imap_unordered(
-            partial(
-                validate_single_rule, shared_cache, datasets, args, library_metadata
-            ),
-            rules,
+        # install dictionaries if needed
+        fill_cache_with_dictionaries(shared_cache, args)
+        max_dataset_size = get_max_dataset_size(args.dataset_paths)
+        standard = args.standard
+        standard_version = args.version.replace(".", "-")
+        data_service = DataServiceFactory(
+            config,
+            shared_cache,
+            max_dataset_size=max_dataset_size,
+            standard=standard,
+            standard_version=standard_version,
+            library_metadata=library_metadata,
+            categorical_threshold=args.categorical_threshold,
+        ).get_data_service()
+        large_dataset_validation: bool = (
+            data_service.dataset_implementation == DaskDataset
         )
+        datasets = get_datasets(data_service, args.dataset_paths)
+        created_files = []
+        if large_dataset_validation:
+            created_files = convert_datasets_to_parquet(
+                datasets, args.pool_size or os.cpu_count(), get_conversion_cache(args)
+            )
+        engine_logger.info(
+            f"Running {len(rules)} rules against {len(datasets)} datasets"
+        )
+        start = time.time()
+        results = []
+        # instantiate logger in each child process to maintain log level
+        initializer = partial(
+            initialize_logger, engine_logger.disabled, engine_logger._logger.level
+        )
+        # find applicable rule and dataset pairs before starting the workers,
+        # so that tasks are not created for pairs that are skipped
+        rule_processor = RuleProcessor(data_service, shared_cache, library_metadata)
+        # dask thread pools do not survive forking of the worker processes,
+        # so large datasets are computed without threads in this process
+        with dask.config.set(scheduler="synchronous"):
+            rule_domains = get_rule_domains(rule_processor, rules, datasets)
+        domain_datasets = get_unique_domain_datasets(datasets)
+        timing_history_path = os.path.join(args.cache, RULE_TIMING_HISTORY_FILE)
+        timing_history = RuleTimingHistory.load(timing_history_path)
+        job = {
+            "args": args,
+            "datasets": datasets,
+            "rules": rules,
+            "rule_domains": rule_domains,
+        }
+        cache_stats: Dict[str, dict] = {}
+        execute_tasks: Callable[[List[Any]], Iterator[Any]] = get_task_executor(
+            args,
+            job,
+            get_task_function(shared_cache, job, library_metadata),
+            initializer,
+            cache_stats,
+        )
+        reporting_services: List[BaseReport] = []
+        if args.stream_reports:
+            # results are added to the reports as soon as they are received
+            reporting_services = ReportFactory(
+                datasets, [], 0, args, data_service
+            ).get_report_services()
         progress_handler: Callable = get_progress_displayer(args)
-        results = progress_handler(rules, validation_results, results)
+        if args.scheduling == SchedulingOptions.DATASET.value:
+            # run all rules of each dataset in a separate process
+            dataset_tasks, dataset_results = get_dataset_tasks(
+                rules, rule_domains, domain_datasets, timing_history
+            )
+            task_results = execute_tasks(dataset_tasks)
+            dataset_results = progress_handler(
+                dataset_tasks,
+                record_timings(timing_history, task_results),
+                dataset_results,
+            )
+            results = merge_dataset_results(rules, domain_datasets, dataset_results)
+            if args.stream_reports:
+                # results of a rule are complete only after all dataset tasks
+                results = list(add_results_to_reports(reporting_services, results))
+        else:
+            # run each rule in a separate process
+            rule_tasks, results = get_rule_tasks(
+                rules, rule_domains, domain_datasets, timing_history
+            )
+            task_results = execute_tasks(rule_tasks)
+            task_results = record_timings(timing_history, task_results)
+            if args.stream_reports:
+                results = list(add_results_to_reports(reporting_services, results))
+                task_results = add_results_to_reports(reporting_services, task_results)
+            results = progress_handler(rule_tasks, task_results, results)
+        timing_history.save(timing_history_path)
+        operation_result_store = get_operation_result_store(args)
+        if operation_result_store:
+            operation_result_store.evict()
 
-    # build all desired reports
-    end = time.time()
-    elapsed_time = end - start
-    reporting_factory = ReportFactory(
-        datasets, results, elapsed_time, args, data_service
-    )
-    reporting_services: List[BaseReport] = reporting_factory.get_report_services()
-    for reporting_service in reporting_services:
-        reporting_service.write_report(args.define_xml_path)
+        # build all desired reports
+        end = time.time()
+        elapsed_time = end - start
+        if not args.stream_reports:
+            reporting_services = ReportFactory(
+                datasets, results, elapsed_time, args, data_service
+            ).get_report_services()
+        for reporting_service in reporting_services:
+            reporting_service.set_elapsed_time(elapsed_time)
+            reporting_service.write_report(args.define_xml_path)
+        # stats of the caches of this process are reset when they are merged,
+        # so only stats of the cache manager process are added by the proxies
+        merge_cache_stats(cache_stats, pop_process_cache_stats())
+        merge_cache_stats(cache_stats, shared_cache.get_stats())
+        report_cache_stats(args, cache_stats)
 
-    engine_logger.info("Cleaning up intermediate files")
-    for file in created_files:
-        engine_logger.info(f"Deleting file {file}")
-        os.remove(file)
+        remove_intermediate_files(created_files)
+    finally:
+        release_cache_service(shared_cache)
@@ -6,20 +6,33 @@ from cdisc_rules_engine.interfaces.data_service_interface import DataServiceInte
 from cdisc_rules_engine.models.library_metadata_container import (
     LibraryMetadataContainer,
 )
+from cdisc_rules_engine.services.cache import (
+    SharedMemoryCacheService,
+    TieredCacheService,
+)
 from cdisc_rules_engine.services.data_services import (
     DataServiceFactory,
 )
-from typing import List, Iterable
+from typing import List, Iterable, Optional
 from cdisc_rules_engine.config import config
 from cdisc_rules_engine.services import logger as engine_logger
 import os
 import pickle
+import sqlite3
 from cdisc_rules_engine.models.dictionaries import DictionaryTypes
 from cdisc_rules_engine.models.dictionaries.get_dictionary_terms import (
     extract_dictionary_terms,
 )
 from cdisc_rules_engine.models.rule import Rule
+from cdisc_rules_engine.utilities.library_cache_store import (
+    LOCAL_RULES,
+    RULES,
+    STANDARDS,
+    LibraryCacheStore,
+    StoredLibraryMetadataContainer,
+)
 from cdisc_rules_engine.utilities.utils import (
+    get_local_cache_key,
     get_rules_cache_key,
     get_standard_details_cache_key,
     get_model_details_cache_key_from_ig,
@@ -28,7 +41,26 @@ from cdisc_rules_engine.utilities.utils import (
 )
 
 
+def get_library_cache_store(args) -> Optional[LibraryCacheStore]:
+    """
+    Returns the library cache store of args.cache updated with
+    the changed cache files, or None if the store cannot be opened,
+    e.g. in a read-only cache directory.
+    """
+    store = LibraryCacheStore.get_instance(args.cache)
+    try:
+        store.update()
+    except (sqlite3.Error, OSError) as e:
+        engine_logger.warning(f"Library cache store is not available: {e}")
+        return None
+    return store
+
+
 def get_library_metadata_from_cache(args) -> LibraryMetadataContainer:
+    store: Optional[LibraryCacheStore] = get_library_cache_store(args)
+    if store and store.has_collection(STANDARDS):
+        return get_library_metadata_from_store(store, args)
+
     standards_file = os.path.join(args.cache, "standards_details.pkl")
     models_file = os.path.join(args.cache, "standards_models.pkl")
     variables_codelist_file = os.path.join(args.cache, "variable_codelist_maps.pkl")
@@ -87,6 +119,43 @@ def get_library_metadata_from_cache(args) -> LibraryMetadataContainer:
     )
 
 
+def get_library_metadata_from_store(
+    store: LibraryCacheStore, args
+) -> StoredLibraryMetadataContainer:
+    """
+    Returns library metadata of the standard and CT packages of args
+    that is read from the store when it is used.
+    """
+    standard_details_cache_key = get_standard_details_cache_key(
+        args.standard, args.version.replace(".", "-")
+    )
+    standard_metadata = store.get(STANDARDS, standard_details_cache_key)
+    keys = {
+        "_standard_metadata": standard_details_cache_key,
+        "_model_metadata": (
+            get_model_details_cache_key_from_ig(standard_metadata)
+            if standard_metadata
+            else None
+        ),
+        "_variable_codelist_map": get_standard_codelist_cache_key(
+            args.standard, args.version
+        ),
+        "_variables_metadata": get_library_variables_metadata_cache_key(
+            args.standard, args.version
+        ),
+    }
+    published_ct_packages = store.get_ct_package_names()
+    ct_packages = [
+        ct_version
+        for ct_version in published_ct_packages
+        if args.controlled_terminology_package
+        and ct_version in args.controlled_terminology_package
+    ]
+    return StoredLibraryMetadataContainer(
+        store, keys, ct_packages, published_ct_packages
+    )
+
+
 def fill_cache_with_dictionaries(cache: CacheServiceInterface, args):
     """
     Extracts file contents from provided dictionaries files
@@ -116,10 +185,54 @@ def get_cache_service(manager):
         return manager.RedisCacheService(
             config.getValue("REDIS_HOST_NAME"), config.getValue("REDIS_ACCESS_KEY")
         )
+    elif cache_service_type == "shared_memory":
+        # datasets are stored in shared memory blocks indexed by a shared dict,
+        # other cache items are kept in the in-memory cache of the manager
+        return SharedMemoryCacheService(manager.InMemoryCacheService(), manager.dict())
     else:
         return manager.InMemoryCacheService()
 
 
+def get_local_cache_service(
+    shared_cache: CacheServiceInterface,
+) -> CacheServiceInterface:
+    """
+    Returns a process-local cache in front of the shared cache.
+    LOCAL_CACHE_SIZE sets its size in megabytes (64 by default, 0 disables it),
+    LOCAL_CACHE_TTL and LOCAL_CACHE_NEGATIVE_TTL set in seconds
+    how long values and missing keys are kept,
+    LOCAL_CACHE_NAMESPACE_TTLS sets the ttl of key prefixes,
+    e.g. "standards/=3600;models/=3600".
+    """
+    size = float(config.getValue("LOCAL_CACHE_SIZE") or 64)
+    if not size:
+        return shared_cache
+    ttl = config.getValue("LOCAL_CACHE_TTL")
+    negative_ttl = config.getValue("LOCAL_CACHE_NEGATIVE_TTL")
+    namespace_ttls = {}
+    for namespace_ttl in (config.getValue("LOCAL_CACHE_NAMESPACE_TTLS") or "").split(
+        ";"
+    ):
+        if namespace_ttl.strip():
+            namespace, namespace_ttl = namespace_ttl.rsplit("=", 1)
+            namespace_ttls[namespace.strip()] = float(namespace_ttl)
+    return TieredCacheService(
+        shared_cache,
+        max_size=int(size * 1024 * 1024),
+        ttl=float(ttl) if ttl else None,
+        negative_ttl=float(negative_ttl) if negative_ttl else 60,
+        namespace_ttls=namespace_ttls,
+    )
+
+
+def release_cache_service(cache: CacheServiceInterface):
+    """
+    Frees resources that outlive the processes using the cache.
+    """
+    if isinstance(cache, SharedMemoryCacheService):
+        cache.release_shared_memory()
+
+
 def get_rules(args) -> List[dict]:
     return (
         load_rules_from_local(args) if args.local_rules else load_rules_from_cache(args)
@@ -133,20 +246,45 @@ def rule_cache_file(args) -> str:
         return os.path.join(args.cache, "rules.pkl")
 
 
-def load_rules_from_cache(args) -> List[dict]:
-    core_ids = set()
-    rules_file = rule_cache_file(args)
-    rules = []
-    rules_data = {}
+def load_rules_file(rules_file: str) -> Optional[dict]:
     try:
         with open(rules_file, "rb") as f:
-            rules_data = pickle.load(f)
+            return pickle.load(f)
     except FileNotFoundError:
         engine_logger.error(f"Rules file not found: {rules_file}")
-        return []
     except Exception as e:
         engine_logger.error(f"Error loading rules file: {e}")
-        return []
+    return None
+
+
+def load_rules_from_store(store: LibraryCacheStore, collection: str, args) -> dict:
+    """
+    Returns {cache key: rule} of the rules of the validation
+    without reading the other rules of the store.
+    """
+    if args.local_rules_id:
+        return store.get_by_prefix(collection, get_local_cache_key(args.local_rules_id))
+    version: str = args.version.replace(".", "-")
+    if args.rules:
+        return store.get_many(
+            collection,
+            [get_rules_cache_key(args.standard, version, rule) for rule in args.rules],
+        )
+    return store.get_by_prefix(collection, get_rules_cache_key(args.standard, version))
+
+
+def load_rules_from_cache(args) -> List[dict]:
+    core_ids = set()
+    rules_file = rule_cache_file(args)
+    rules = []
+    collection = LOCAL_RULES if args.local_rules_cache else RULES
+    store: Optional[LibraryCacheStore] = get_library_cache_store(args)
+    if store and store.has_collection(collection):
+        rules_data = load_rules_from_store(store, collection, args)
+    else:
+        rules_data = load_rules_file(rules_file)
+        if rules_data is None:
+            return []
 
     if args.local_rules_id:
         local_prefix = f"local/{args.local_rules_id}/"
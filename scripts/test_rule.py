@@ -30,6 +30,7 @@ from cdisc_rules_engine.utilities.utils import generate_report_filename
 from scripts.script_utils import (
     fill_cache_with_dictionaries,
     get_cache_service,
+    release_cache_service,
     get_library_metadata_from_cache,
 )
 from cdisc_rules_engine.utilities.utils import get_directory_path
@@ -121,80 +122,85 @@ def test(args: TestArgs):
     manager = CacheManager()
     manager.start()
     shared_cache = get_cache_service(manager)
-    library_metadata: LibraryMetadataContainer = get_library_metadata_from_cache(args)
-    # install dictionaries if needed
-    fill_cache_with_dictionaries(shared_cache, args)
-    with open(args.rule, "r", encoding="utf-8") as f:
-        rules = [Rule.from_cdisc_metadata(json.load(f))]
-    with open(args.dataset_path, "r") as f:
-        data_json = json.load(f)
-    datasets = [DummyDataset(data) for data in data_json.get("datasets", [])]
-    data_service_factory = DataServiceFactory(
-        config, shared_cache, args.standard, args.version
-    )
-    dummy_data_service = data_service_factory.get_dummy_data_service(datasets)
-    data_service = data_service_factory.get_data_service()
+    try:
+        library_metadata: LibraryMetadataContainer = get_library_metadata_from_cache(
+            args
+        )
+        # install dictionaries if needed
+        fill_cache_with_dictionaries(shared_cache, args)
+        with open(args.rule, "r", encoding="utf-8") as f:
+            rules = [Rule.from_cdisc_metadata(json.load(f))]
+        with open(args.dataset_path, "r") as f:
+            data_json = json.load(f)
+        datasets = [DummyDataset(data) for data in data_json.get("datasets", [])]
+        data_service_factory = DataServiceFactory(
+            config, shared_cache, args.standard, args.version
+        )
+        dummy_data_service = data_service_factory.get_dummy_data_service(datasets)
+        data_service = data_service_factory.get_data_service()
 
-    start = time.time()
-    results = []
-    # run each rule in a separate process
-    with Pool(10) as pool:
-        with click.progressbar(
-            length=len(rules),
-            fill_char=click.style("\u2588", fg="green"),
-            empty_char=click.style("-", fg="white", dim=True),
-            show_eta=False,
-        ) as bar:
-            for rule_result in pool.imap_unordered(
-                partial(
-                    validate_single_rule,
-                    shared_cache,
-                    "",
-                    args,
-                    datasets,
-                    library_metadata,
-                ),
-                rules,
-            ):
-                results.append(rule_result)
-                bar.update(1)
+        start = time.time()
+        results = []
+        # run each rule in a separate process
+        with Pool(10) as pool:
+            with click.progressbar(
+                length=len(rules),
+                fill_char=click.style("\u2588", fg="green"),
+                empty_char=click.style("-", fg="white", dim=True),
+                show_eta=False,
+            ) as bar:
+                for rule_result in pool.imap_unordered(
+                    partial(
+                        validate_single_rule,
+                        shared_cache,
+                        "",
+                        args,
+                        datasets,
+                        library_metadata,
+                    ),
+                    rules,
+                ):
+                    results.append(rule_result)
+                    bar.update(1)
 
-    end = time.time()
-    elapsed_time = end - start
-    output_file = generate_report_filename(datetime.now().isoformat())
+        end = time.time()
+        elapsed_time = end - start
+        output_file = generate_report_filename(datetime.now().isoformat())
 
-    validation_args = Validation_args(
-        None,
-        None,
-        [args.dataset_path],
-        None,
-        os.path.join("resources", "templates", "report-template.xlsx"),
-        args.standard,
-        args.version,
-        args.controlled_terminology_package,
-        output_file,
-        ["XLSX"],
-        None,
-        args.define_version,
-        args.meddra,
-        args.whodrug,
-        args.loinc,
-        args.medrt,
-        rules,
-        None,
-        None,
-        None,
-        ProgressParameterOptions.BAR.value,
-        args.define_xml_path,
-    )
-    reporting_factory = ReportFactory(
-        dummy_data_service.get_datasets(),
-        results,
-        elapsed_time,
-        validation_args,
-        data_service,
-    )
-    reporting_services: List[BaseReport] = reporting_factory.get_report_services()
-    for reporting_service in reporting_services:
-        reporting_service.write_report(define_xml_path=args.define_xml_path)
+        validation_args = Validation_args(
+            None,
+            None,
+            [args.dataset_path],
+            None,
+            os.path.join("resources", "templates", "report-template.xlsx"),
+            args.standard,
+            args.version,
+            args.controlled_terminology_package,
+            output_file,
+            ["XLSX"],
+            None,
+            args.define_version,
+            args.meddra,
+            args.whodrug,
+            args.loinc,
+            args.medrt,
+            rules,
+            None,
+            None,
+            None,
+            ProgressParameterOptions.BAR.value,
+            args.define_xml_path,
+        )
+        reporting_factory = ReportFactory(
+            dummy_data_service.get_datasets(),
+            results,
+            elapsed_time,
+            validation_args,
+            data_service,
+        )
+        reporting_services: List[BaseReport] = reporting_factory.get_report_services()
+        for reporting_service in reporting_services:
+            reporting_service.write_report(define_xml_path=args.define_xml_path)
+    finally:
+        release_cache_service(shared_cache)
     print(f"Output: {output_file}")
@@ -1,6 +1,7 @@
 from cdisc_rules_engine.check_operators.dataframe_operators import DataframeType
 import pytest
 
+from cdisc_rules_engine.models.dataset.arrow_dataset import ArrowDataset
 from cdisc_rules_engine.models.dataset.pandas_dataset import PandasDataset
 from cdisc_rules_engine.models.dataset.dask_dataset import DaskDataset
 
@@ -315,3 +316,33 @@ def test_is_not_contained_by_case_insensitive(
         {"target": "target", "comparator": comparator}
     )
     assert result.equals(df.convert_to_series(expected_result))
+
+
+@pytest.mark.parametrize(
+    "comparator, expected_result",
+    [
+        (["A", "C"], [True, False, True, True]),
+        ("VAR2", [True, True, False, True]),
+    ],
+)
+def test_is_contained_by_categorical_column(comparator, expected_result):
+    df = PandasDataset.from_dict(
+        {"target": ["A", "B", "C", "A"], "VAR2": ["A", "B", "D", "A"]}
+    )
+    df["target"] = df["target"].astype("category")
+    dataframe_operator = DataframeType({"value": df})
+    result = dataframe_operator.is_contained_by(
+        {"target": "target", "comparator": comparator}
+    )
+    assert result.tolist() == expected_result
+
+
+def test_is_contained_by_arrow_dataset():
+    df = ArrowDataset.from_pandas(
+        PandasDataset.from_dict({"target": ["A", "B", None, "D"]}).data
+    )
+    result = DataframeType({"value": df}).is_contained_by(
+        {"target": "target", "comparator": ["A", "D"]}
+    )
+    assert result.tolist() == [True, False, False, True]
+    assert df.table is not None
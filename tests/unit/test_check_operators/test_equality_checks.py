@@ -1,5 +1,9 @@
+from unittest.mock import patch
+
 from cdisc_rules_engine.check_operators.dataframe_operators import DataframeType
+import pandas as pd
 import pytest
+from cdisc_rules_engine.models.dataset.arrow_dataset import ArrowDataset
 from cdisc_rules_engine.models.dataset.dask_dataset import DaskDataset
 
 from cdisc_rules_engine.models.dataset.pandas_dataset import PandasDataset
@@ -127,3 +131,83 @@ def test_not_equal_to_case_insensitive(data, comparator, dataset_type, expected_
         {"target": "target", "comparator": comparator}
     )
     assert result.equals(df.convert_to_series(expected_result))
+
+
+@pytest.mark.parametrize(
+    "operator, comparator, value_is_literal",
+    [
+        ("equal_to", "B", False),
+        ("equal_to", "", False),
+        ("equal_to", "VAR2", True),
+        ("not_equal_to", "B", False),
+        ("not_equal_to", None, False),
+        ("equal_to_case_insensitive", "b", False),
+        ("not_equal_to_case_insensitive", "b", False),
+        ("equal_to", "VAR2", False),
+    ],
+)
+def test_equality_of_categorical_column(operator, comparator, value_is_literal):
+    data = {"target": ["A", "B", "", "b", "B"], "VAR2": ["A", "C", "", "b", "VAR2"]}
+    expected = getattr(
+        DataframeType({"value": PandasDataset.from_dict(data)}), operator
+    )(
+        {
+            "target": "target",
+            "comparator": comparator,
+            "value_is_literal": value_is_literal,
+        }
+    )
+    df = PandasDataset.from_dict(data)
+    df["target"] = df["target"].astype("category")
+    result = getattr(DataframeType({"value": df}), operator)(
+        {
+            "target": "target",
+            "comparator": comparator,
+            "value_is_literal": value_is_literal,
+        }
+    )
+    assert result.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize(
+    "operator, comparator, value_is_literal",
+    [
+        ("equal_to", "B", False),
+        ("equal_to", "", False),
+        ("equal_to", "VAR2", False),
+        ("equal_to", "VAR2", True),
+        ("not_equal_to", "B", False),
+        ("not_equal_to", None, False),
+        ("not_equal_to", "VAR2", False),
+    ],
+)
+def test_equality_of_arrow_dataset(operator, comparator, value_is_literal):
+    data = {
+        "target": ["A", "B", "", None, "B"],
+        "VAR2": ["A", "C", None, None, "VAR2"],
+    }
+    params = {
+        "target": "target",
+        "comparator": comparator,
+        "value_is_literal": value_is_literal,
+    }
+    expected = getattr(
+        DataframeType({"value": PandasDataset.from_dict(data)}), operator
+    )(params)
+    df = ArrowDataset.from_pandas(pd.DataFrame(data))
+    result = getattr(DataframeType({"value": df}), operator)(params)
+    assert result.tolist() == expected.tolist()
+    # compared with Arrow compute functions without converting the table
+    assert df.table is not None
+
+
+def test_equal_to_categorical_column_applies_check_to_categories():
+    df = PandasDataset.from_dict({"target": ["A", "B"] * 50})
+    df["target"] = df["target"].astype("category")
+    dataframe_type = DataframeType({"value": df})
+    with patch.object(
+        DataframeType, "_check_equality", wraps=dataframe_type._check_equality
+    ) as check_equality:
+        result = dataframe_type.equal_to({"target": "target", "comparator": "B"})
+    assert check_equality.call_count == 2
+    assert result.tolist() == [False, True] * 50
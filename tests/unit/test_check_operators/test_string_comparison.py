@@ -305,6 +305,16 @@ def test_non_empty(data, dataset_type, expected_result):
     assert result.equals(df.convert_to_series(expected_result))
 
 
+def test_empty_categorical_column():
+    df = PandasDataset.from_dict({"target": ["Att", "", None, "Att", ""]})
+    df["target"] = df["target"].astype("category")
+    dataframe_type = DataframeType({"value": df})
+    result = dataframe_type.empty({"target": "target"})
+    assert result.tolist() == [False, True, True, False, True]
+    result = dataframe_type.non_empty({"target": "target"})
+    assert result.tolist() == [True, False, False, True, False]
+
+
 @pytest.mark.parametrize(
     "data,comparator,prefix,dataset_type,expected_result",
     [
@@ -703,3 +713,15 @@ def test_not_matches_regex(data, comparator, dataset_type, expected_result):
         {"target": "target", "comparator": comparator}
     )
     assert result.equals(df.convert_to_series(expected_result))
+
+
+def test_matches_regex_categorical_column():
+    df = PandasDataset.from_dict({"target": ["AE1", "AE", "XAE2", "AE1"]})
+    df["target"] = df["target"].astype("category")
+    dataframe_type = DataframeType({"value": df})
+    result = dataframe_type.matches_regex({"target": "target", "comparator": r"^AE\d"})
+    assert result.tolist() == [True, False, False, True]
+    result = dataframe_type.not_matches_regex(
+        {"target": "target", "comparator": r"^AE\d"}
+    )
+    assert result.tolist() == [False, True, True, False]
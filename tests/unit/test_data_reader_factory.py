@@ -1,7 +1,11 @@
 from unittest.mock import MagicMock
 
 from cdisc_rules_engine.interfaces import DataReaderInterface
-from cdisc_rules_engine.services.data_readers import DataReaderFactory
+from cdisc_rules_engine.services.data_readers import (
+    DataReaderFactory,
+    DatasetJSONReader,
+    NativeXPTReader,
+)
 
 
 def test_get_registered_service():
@@ -22,3 +26,12 @@ def test_get_registered_service():
     DataReaderFactory.register_service(service_name, new_service_class)
     factory = DataReaderFactory()
     assert isinstance(factory.get_service(service_name), new_service_class)
+
+
+def test_get_service_with_reader_names():
+    """
+    Unit test that checks that a format is read with the reader set for it.
+    """
+    factory = DataReaderFactory(reader_names={"XPT": "XPT_NATIVE"})
+    assert isinstance(factory.get_service("XPT"), NativeXPTReader)
+    assert isinstance(factory.get_service("JSON"), DatasetJSONReader)
@@ -9,6 +9,7 @@ import pytest
 import os
 from cdisc_rules_engine.models.dataset_metadata import DatasetMetadata
 from cdisc_rules_engine.models.dataset_types import DatasetTypes
+from cdisc_rules_engine.services.cache import InMemoryCacheService
 from cdisc_rules_engine.services.data_services import cached_dataset, LocalDataService
 from cdisc_rules_engine.utilities.utils import get_dataset_cache_key_from_path
 from cdisc_rules_engine.constants.classes import (
@@ -334,3 +335,36 @@ def test_cached_data_empty_cache():
             test_dataset_name, DatasetTypes.CONTENTS.value
         ): test_df
     }, "New dataset was not added to the cache"
+
+
+@pytest.mark.parametrize(
+    "fingerprint_type, expected_contents",
+    [
+        ("stat", b"modified data"),
+        ("content", b"modified data"),
+        ("none", b"data"),
+    ],
+)
+def test_cached_data_changed_file(fingerprint_type, expected_contents, tmp_path):
+    """
+    Unit test for cached_data decorator.
+    Checks that a file changed at the same path is read again
+    unless the cache keys do not include fingerprints.
+    """
+
+    @cached_dataset(DatasetTypes.CONTENTS.value)
+    def to_be_decorated(instance, dataset_name: str):
+        with open(dataset_name, "rb") as f:
+            return f.read()
+
+    dataset_path = tmp_path / "ae.xpt"
+    dataset_path.write_bytes(b"data")
+    instance_to_pass = Mock(
+        cache_service=InMemoryCacheService(), dataset_fingerprint_type=fingerprint_type
+    )
+    assert to_be_decorated(instance_to_pass, dataset_name=str(dataset_path)) == b"data"
+    dataset_path.write_bytes(b"modified data")
+    assert (
+        to_be_decorated(instance_to_pass, dataset_name=str(dataset_path))
+        == expected_contents
+    )
@@ -0,0 +1,75 @@
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import jsonschema
+import pytest
+
+from cdisc_rules_engine.services.dataset_json_schema_validator import (
+    DatasetJSONSchemaValidator,
+)
+from cdisc_rules_engine.services.datasetjson_metadata_reader import (
+    DatasetJSONMetadataReader,
+)
+
+test_dataset_path: str = f"{os.path.dirname(__file__)}/../resources/test_dataset.json"
+
+
+@pytest.fixture
+def invalid_third_row_path(tmp_path) -> str:
+    with open(test_dataset_path) as file:
+        dataset_json = json.load(file)
+    item_group = next(iter(dataset_json["clinicalData"]["itemGroupData"].values()))
+    item_group["itemData"][2][1] = {"value": "not allowed"}
+    file_path = tmp_path / "ex.json"
+    file_path.write_text(json.dumps(dataset_json))
+    return str(file_path)
+
+
+def get_sample(file_path: str, sample_size: int) -> dict:
+    with open(file_path) as file:
+        dataset_json = json.load(file)
+    for item_group in dataset_json["clinicalData"]["itemGroupData"].values():
+        item_group["itemData"] = item_group["itemData"][:sample_size]
+    return dataset_json
+
+
+def test_validate_sample(invalid_third_row_path: str):
+    validator = DatasetJSONSchemaValidator(sample_size=2)
+    validator.validate(invalid_third_row_path, get_sample(invalid_third_row_path, 2))
+
+
+@pytest.mark.parametrize(
+    "sample_size, strict",
+    [(3, False), (1, True)],
+)
+def test_validate_invalid(invalid_third_row_path: str, sample_size: int, strict: bool):
+    validator = DatasetJSONSchemaValidator(sample_size=sample_size, strict=strict)
+    with pytest.raises(jsonschema.ValidationError):
+        validator.validate(
+            invalid_third_row_path, get_sample(invalid_third_row_path, sample_size)
+        )
+
+
+def test_validate_caches_results(invalid_third_row_path: str):
+    validator = DatasetJSONSchemaValidator(sample_size=3)
+    document: dict = get_sample(invalid_third_row_path, 3)
+    validator._validator = MagicMock(wraps=validator._validator)
+    for _ in range(2):
+        with pytest.raises(jsonschema.ValidationError):
+            validator.validate(invalid_third_row_path, document)
+    validator.validate(test_dataset_path, get_sample(test_dataset_path, 3))
+    validator.validate(test_dataset_path, get_sample(test_dataset_path, 3))
+    assert validator._validator.iter_errors.call_count == 2
+
+
+def test_metadata_reader_uses_sample_size(invalid_third_row_path: str):
+    with patch.object(
+        DatasetJSONSchemaValidator,
+        "get_instance",
+        return_value=DatasetJSONSchemaValidator(sample_size=3),
+    ):
+        metadata: dict = DatasetJSONMetadataReader(
+            invalid_third_row_path, "ex.json"
+        ).read()
+    assert metadata["number_of_variables"] == 0
@@ -1,6 +1,7 @@
 """
 This module contains unit tests for DatasetJSONMetadataReader class.
 """
+import json
 import os
 
 from cdisc_rules_engine.services.datasetjson_metadata_reader import (
@@ -74,3 +75,31 @@ def test_read_metadata_with_variable_formats():
         "",
         "",
     ]
+
+
+def test_read_metadata_reads_only_first_row(tmp_path):
+    """
+    Reading stops after the first row of itemData,
+    the rest of the file is not parsed.
+    """
+    test_dataset_path: str = (
+        f"{os.path.dirname(__file__)}/../resources/test_dataset.json"
+    )
+    with open(test_dataset_path) as file:
+        dataset_json = json.load(file)
+    item_group = dataset_json["clinicalData"]["itemGroupData"]["EX"]
+    first_row = item_group.pop("itemData")[0]
+    item_group["itemData"] = "ROWS"
+    content = json.dumps(dataset_json).replace(
+        '"ROWS"', f"[{json.dumps(first_row)}, this is not parsed"
+    )
+    truncated_dataset_path = str(tmp_path / "ex.json")
+    with open(truncated_dataset_path, "w") as file:
+        file.write(content)
+
+    reader = DatasetJSONMetadataReader(truncated_dataset_path, file_name="ex.json")
+    metadata: dict = reader.read()
+
+    assert metadata["domain_name"] == "EX"
+    assert metadata["dataset_length"] == item_group["records"]
+    assert metadata["number_of_variables"] == 18
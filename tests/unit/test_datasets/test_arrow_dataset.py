@@ -0,0 +1,110 @@
+import copy
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from cdisc_rules_engine.models.dataset import ArrowDataset, DaskDataset, PandasDataset
+from cdisc_rules_engine.services.data_services import DataServiceFactory
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "USUBJID": ["1", "2", None],
+            "AESEQ": pd.Series([1, None, 3], dtype=object),
+            "AESTDY": [1.5, np.nan, 2.0],
+        }
+    )
+
+
+def test_from_pandas_round_trip(data: pd.DataFrame):
+    dataset = ArrowDataset.from_pandas(data)
+    assert isinstance(dataset.table, pa.Table)
+    assert dataset.columns.tolist() == ["USUBJID", "AESEQ", "AESTDY"]
+    assert len(dataset) == 3
+    assert "AESEQ" in dataset
+    assert dataset["AESEQ"].tolist() == [1, None, 3]
+    assert dataset["USUBJID"].tolist() == ["1", "2", None]
+    # columns are converted without converting the table
+    assert dataset.table is not None
+    pd.testing.assert_frame_equal(dataset.data, data)
+    assert dataset.table is None
+
+
+def test_from_pandas_keeps_not_convertible_dataframe():
+    data = pd.DataFrame({"A": [1, "a", None]}, index=[2, 3, 4])
+    dataset = ArrowDataset.from_pandas(data)
+    assert dataset.table is None
+    pd.testing.assert_frame_equal(dataset.data, data)
+
+
+def test_copies_share_table(data: pd.DataFrame):
+    dataset = ArrowDataset.from_pandas(data)
+    for dataset_copy in (dataset.copy(), copy.deepcopy(dataset)):
+        assert dataset_copy.table is dataset.table
+        dataset_copy["AESEQ"] = 0
+        assert dataset_copy.table is None
+    assert dataset["AESEQ"].tolist() == [1, None, 3]
+
+
+def test_slice(data: pd.DataFrame):
+    dataset = ArrowDataset.from_pandas(data).slice(1, 2)
+    assert dataset.table is not None
+    assert dataset.index.tolist() == [0, 1]
+    assert dataset["AESTDY"].tolist()[1] == 2.0
+
+
+def test_get_error_rows(data: pd.DataFrame):
+    dataset = ArrowDataset.from_pandas(data)
+    error_rows = dataset.get_error_rows(pd.Series([False, True, True]))
+    expected = PandasDataset(data).get_error_rows(pd.Series([False, True, True]))
+    pd.testing.assert_frame_equal(error_rows, expected)
+    assert dataset.table is not None
+
+
+def test_ipc_round_trip(data: pd.DataFrame, tmp_path):
+    dataset = ArrowDataset.from_pandas(data)
+    file_path = str(tmp_path / "ae.arrow")
+    dataset.to_ipc(file_path)
+    pd.testing.assert_frame_equal(ArrowDataset.from_ipc(file_path).data, data)
+    sink = pa.BufferOutputStream()
+    dataset.to_ipc(sink)
+    pd.testing.assert_frame_equal(ArrowDataset.from_ipc(sink.getvalue()).data, data)
+    with pytest.raises(ValueError):
+        ArrowDataset(data).to_ipc(file_path)
+
+
+@pytest.mark.parametrize(
+    "config_values, max_dataset_size, expected_implementation",
+    [
+        ({"DATASET_IMPLEMENTATION": "arrow"}, None, ArrowDataset),
+        ({"DATASET_IMPLEMENTATION": "Pandas"}, 10**12, PandasDataset),
+        ({"ARROW_DATASET_SIZE_THRESHOLD": "1000"}, 1000, ArrowDataset),
+        ({"ARROW_DATASET_SIZE_THRESHOLD": "1000"}, 999, PandasDataset),
+        ({"ARROW_DATASET_SIZE_THRESHOLD": "1000"}, 10**12, DaskDataset),
+    ],
+)
+def test_get_dataset_implementation(
+    config_values: dict, max_dataset_size: int, expected_implementation
+):
+    config = MagicMock()
+    config.getValue.side_effect = config_values.get
+    config.get_dataset_size_threshold.return_value = 10**11
+    config.get_arrow_dataset_size_threshold.return_value = (
+        float(config_values["ARROW_DATASET_SIZE_THRESHOLD"])
+        if "ARROW_DATASET_SIZE_THRESHOLD" in config_values
+        else None
+    )
+    factory = DataServiceFactory(config, MagicMock(), max_dataset_size=max_dataset_size)
+    assert factory.get_dataset_implementation() == expected_implementation
+
+
+def test_get_dataset_implementation_unknown_name():
+    config = MagicMock()
+    config.getValue.side_effect = {"DATASET_IMPLEMENTATION": "spark"}.get
+    with pytest.raises(ValueError):
+        DataServiceFactory(config, MagicMock()).get_dataset_implementation()
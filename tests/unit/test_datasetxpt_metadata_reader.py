@@ -3,6 +3,10 @@ This module contains unit tests for DatasetMetadataReader class.
 """
 import os
 from unittest.mock import patch
+
+import pandas as pd
+import pyreadstat
+
 from cdisc_rules_engine.services.datasetxpt_metadata_reader import (
     DatasetXPTMetadataReader,
 )
@@ -176,3 +180,25 @@ def test_calculate_dataset_length_with_mocked_header():
         dataset_length = reader._calculate_dataset_length()
 
     assert dataset_length == expected_length
+
+
+def test_read_metadata_version_8(tmp_path):
+    """
+    Files that are not version 5 transport files are read with pyreadstat.
+    """
+    test_dataset_path = str(tmp_path / "dm.xpt")
+    pyreadstat.write_xport(
+        pd.DataFrame({"DOMAIN": ["DM", "DM"], "AGE": [30.0, 40.0]}),
+        test_dataset_path,
+        file_format_version=8,
+        column_labels=["Domain Abbreviation", "Age"],
+    )
+    reader = DatasetXPTMetadataReader(test_dataset_path, file_name="dm.xpt")
+    metadata: dict = reader.read()
+    assert metadata["domain_name"] == "DM"
+    assert metadata["dataset_length"] == 2
+    assert metadata["variable_names"] == ["DOMAIN", "AGE"]
+    assert metadata["variable_name_to_data_type_map"] == {
+        "DOMAIN": "Char",
+        "AGE": "Num",
+    }
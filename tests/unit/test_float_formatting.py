@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cdisc_rules_engine.services.data_readers.float_formatting import (
+    format_floats,
+    round_floats,
+)
+
+
+def round_values(values: np.ndarray) -> np.ndarray:
+    return np.array([round(value, 15) for value in values.tolist()])
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.random.default_rng(0).uniform(-10, 10, 10000),
+        np.random.default_rng(0).standard_normal(10000) * 1e6,
+        # values close to a half after scaling by 10 ** 15
+        (np.arange(10000) + 0.5) / 1e15,
+        (np.arange(10000) + 0.5) / 1e15 + 4.0,
+        (np.arange(10000) + 0.5) / 1e15 + 7.0,
+        np.array([0.1 + 0.2, -1e-16, 0.0, -0.0, 5e-324, 1e308, np.inf, -np.inf]),
+    ],
+)
+def test_round_floats(values: np.ndarray):
+    expected = round_values(values)
+    assert round_floats(values).view(np.int64).tolist() == (
+        expected.view(np.int64).tolist()
+    )
+
+
+def test_round_floats_nan():
+    assert np.isnan(round_floats(np.array([np.nan]))).all()
+
+
+def test_format_floats():
+    dataframe = pd.DataFrame(
+        {
+            "float": [0.1 + 0.2, None],
+            "integer": [1, 2],
+            "string": ["A", None],
+            "mixed": ["A", 0.1 + 0.2],
+            "category": pd.Categorical(["A", "B"]),
+        }
+    )
+    expected = dataframe.applymap(lambda x: round(x, 15) if isinstance(x, float) else x)
+    formatted = format_floats(dataframe)
+    assert formatted["float"].tolist()[0] == 0.3
+    assert formatted["mixed"].tolist() == ["A", 0.3]
+    for column in ("float", "integer", "string", "mixed"):
+        assert formatted[column].equals(expected[column])
+    # categorical columns are not converted to object columns
+    assert formatted["category"].dtype == "category"
+    # the original dataframe is not changed
+    assert dataframe["float"].tolist()[0] == 0.1 + 0.2
+
+
+def test_format_floats_without_floats():
+    dataframe = pd.DataFrame({"integer": [1, 2], "string": ["A", "B"]})
+    assert format_floats(dataframe) is dataframe
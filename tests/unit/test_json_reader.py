@@ -1,5 +1,8 @@
+import json
 import os
 
+import pandas as pd
+
 from cdisc_rules_engine.services.data_readers.json_reader import DatasetJSONReader
 
 
@@ -15,3 +18,97 @@ def test_from_file():
         Verify that the rounding of incredibly small values to 0 is applied.
         """
         assert value == 0 or abs(value) > 10**-16
+
+
+def test_from_file_columns():
+    test_dataset_path: str = (
+        f"{os.path.dirname(__file__)}/../resources/test_dataset.json"
+    )
+    reader = DatasetJSONReader()
+    dataframe = reader.from_file(test_dataset_path)
+    projected_dataframe = reader.from_file(
+        test_dataset_path, ["EXDOSE", "STUDYID", "NOTEXIST"]
+    )
+    assert list(projected_dataframe.columns) == ["STUDYID", "EXDOSE"]
+    assert projected_dataframe["EXDOSE"].equals(dataframe["EXDOSE"])
+
+
+def test_iter_chunks():
+    test_dataset_path: str = (
+        f"{os.path.dirname(__file__)}/../resources/test_dataset.json"
+    )
+    reader = DatasetJSONReader()
+    dataframe = reader.from_file(test_dataset_path).data
+    reader.chunk_size = 100
+    chunks = list(reader.iter_chunks(test_dataset_path))
+    assert [len(chunk.index) for chunk in chunks] == [100] * 5 + [91]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), dataframe)
+
+
+def test_iter_chunks_items_after_rows(tmp_path):
+    """
+    Rows are kept until the items are read.
+    """
+    dataset_path = str(tmp_path / "ae.json")
+    with open(dataset_path, "w") as file:
+        json.dump(
+            {
+                "creationDateTime": "2023-07-31T14:44:09",
+                "datasetJSONVersion": "1.0.0",
+                "clinicalData": {
+                    "itemGroupData": {
+                        "AE": {
+                            "itemData": [[1, "AE", None], [2, "AE", 3]],
+                            "records": 2,
+                            "name": "AE",
+                            "label": "Adverse Events",
+                            "items": [
+                                {
+                                    "OID": "ITEMGROUPDATASEQ",
+                                    "name": "ITEMGROUPDATASEQ",
+                                    "label": "Record identifier",
+                                    "type": "integer",
+                                },
+                                {
+                                    "OID": "IT.AE.DOMAIN",
+                                    "name": "DOMAIN",
+                                    "label": "Domain Abbreviation",
+                                    "type": "string",
+                                },
+                                {
+                                    "OID": "IT.AE.AESTDY",
+                                    "name": "AESTDY",
+                                    "label": "Study Day of Start of Adverse Event",
+                                    "type": "integer",
+                                },
+                            ],
+                        }
+                    }
+                },
+            },
+            file,
+        )
+    reader = DatasetJSONReader()
+    reader.chunk_size = 1
+    chunks = list(reader.iter_chunks(dataset_path))
+    assert len(chunks) == 1
+    assert chunks[0]["DOMAIN"].tolist() == ["AE", "AE"]
+    assert chunks[0]["AESTDY"].tolist()[1] == 3
+
+
+def test_to_parquet():
+    test_dataset_path: str = (
+        f"{os.path.dirname(__file__)}/../resources/test_dataset.json"
+    )
+    reader = DatasetJSONReader()
+    dataframe = reader.from_file(test_dataset_path).data
+    reader.chunk_size = 100
+    num_rows, parquet_path = reader.to_parquet(test_dataset_path)
+    try:
+        converted_dataframe = pd.read_parquet(parquet_path, engine="fastparquet")
+    finally:
+        os.remove(parquet_path)
+    assert num_rows == len(dataframe.index) == len(converted_dataframe.index)
+    assert converted_dataframe["EXSEQ"].dtype == float
+    assert converted_dataframe["EXSEQ"].tolist() == dataframe["EXSEQ"].tolist()
+    assert converted_dataframe["USUBJID"].tolist() == dataframe["USUBJID"].tolist()
@@ -4,6 +4,8 @@ from unittest.mock import MagicMock
 import pytest
 from cdisc_rules_engine.config.config import ConfigService
 
+from cdisc_rules_engine.services.cache import InMemoryCacheService
+from cdisc_rules_engine.services.data_readers import DataReaderFactory
 from cdisc_rules_engine.services.data_services import LocalDataService
 from cdisc_rules_engine.models.dataset import PandasDataset
 
@@ -83,3 +85,41 @@ def test_get_variables_metdata(dataset_implementation):
     ]
     for key in expected_keys:
         assert key in data
+
+
+def test_get_dataset_columns():
+    dataset_path = f"{os.path.dirname(__file__)}/../resources/test_dataset.xpt"
+    cache = InMemoryCacheService()
+    data_service = LocalDataService(
+        cache, DataReaderFactory(dataset_implementation=PandasDataset), ConfigService()
+    )
+    data = data_service.get_dataset(
+        dataset_name=dataset_path, columns=["EXDOSE", "STUDYID", "NOTEXIST"]
+    )
+    assert list(data.columns) == ["STUDYID", "EXDOSE"]
+    # the projected dataset is cached separately from the full dataset
+    full_data = data_service.get_dataset(dataset_name=dataset_path)
+    full_columns = list(full_data.columns)
+    assert len(full_columns) > 2
+    # once the full dataset is cached, projections are taken from it
+    data = data_service.get_dataset(dataset_name=dataset_path, columns=["EXDOSE"])
+    assert list(data.columns) == ["EXDOSE"]
+    assert list(full_data.columns) == full_columns
+
+
+def test_get_dataset_categorical_threshold():
+    dataset_path = f"{os.path.dirname(__file__)}/../resources/test_dataset.xpt"
+    data_service = LocalDataService(
+        InMemoryCacheService(),
+        DataReaderFactory(dataset_implementation=PandasDataset),
+        ConfigService(),
+        categorical_threshold=0.1,
+    )
+    data = data_service.get_dataset(dataset_name=dataset_path)
+    expected = DataReaderFactory().get_service("XPT").from_file(dataset_path)
+    assert data["USUBJID"].dtype == "category"
+    assert data["EXTRT"].dtype == "category"
+    # 665 distinct values in 1583 rows
+    assert data["EXSTDTC"].dtype == object
+    assert data["EXDOSE"].dtype == expected["EXDOSE"].dtype
+    assert data.data.astype(object).equals(expected.data.astype(object))
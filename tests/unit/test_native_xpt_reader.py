@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pyreadstat
+import pytest
+
+from cdisc_rules_engine.services.data_readers.native_xpt_reader import (
+    NativeXPTReader,
+    XPTMemoryMappedFile,
+)
+from cdisc_rules_engine.services.data_readers.xpt_reader import XPTReader
+
+
+@pytest.mark.parametrize("file_name", ["test_dataset.xpt", "test_adam_dataset.xpt"])
+def test_from_file(file_name: str):
+    test_dataset_path: str = f"{os.path.dirname(__file__)}/../resources/{file_name}"
+    dataframe = NativeXPTReader().from_file(test_dataset_path).data
+    expected = XPTReader().from_file(test_dataset_path).data
+    pd.testing.assert_frame_equal(dataframe, expected)
+
+
+def test_from_file_columns():
+    test_dataset_path: str = (
+        f"{os.path.dirname(__file__)}/../resources/test_dataset.xpt"
+    )
+    dataframe = (
+        NativeXPTReader()
+        .from_file(test_dataset_path, ["EXDOSE", "USUBJID", "NOTEXIST"])
+        .data
+    )
+    expected = XPTReader().from_file(test_dataset_path).data
+    assert list(dataframe.columns) == ["USUBJID", "EXDOSE"]
+    pd.testing.assert_frame_equal(dataframe, expected[["USUBJID", "EXDOSE"]])
+
+
+def test_decode_values(tmp_path):
+    file_path = str(tmp_path / "dm.xpt")
+    pyreadstat.write_xport(
+        pd.DataFrame(
+            {
+                "AGE": [45.0, -0.1, np.nan, 0.0, 1e-30],
+                "ARM": ["Placebo  ", "", "Drug é", " A", "B"],
+            }
+        ),
+        file_path,
+        file_format_version=5,
+    )
+    with XPTMemoryMappedFile(file_path) as xpt_file:
+        assert xpt_file.columns == ["AGE", "ARM"]
+        assert len(xpt_file) == 5
+        ages = xpt_file.get_column("AGE")
+        # columns are decoded once
+        assert xpt_file.get_column("AGE") is ages
+        assert ages[[0, 1, 3, 4]].tolist() == pytest.approx([45.0, -0.1, 0.0, 1e-30])
+        assert np.isnan(ages[2])
+        assert xpt_file.get_column("ARM").tolist() == [
+            "Placebo",
+            "",
+            "Drug é",
+            " A",
+            "B",
+        ]
+
+
+def test_to_parquet(monkeypatch):
+    test_dataset_path: str = (
+        f"{os.path.dirname(__file__)}/../resources/test_dataset.xpt"
+    )
+    monkeypatch.setattr(NativeXPTReader, "chunk_size", 500)
+    num_rows, parquet_path = NativeXPTReader().to_parquet(test_dataset_path)
+    try:
+        dataframe = pd.read_parquet(parquet_path)
+    finally:
+        os.remove(parquet_path)
+    expected = XPTReader().from_file(test_dataset_path).data
+    assert num_rows == len(expected.index)
+    pd.testing.assert_frame_equal(dataframe.reset_index(drop=True), expected)
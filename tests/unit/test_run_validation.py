@@ -0,0 +1,515 @@
+import json
+import os
+import shutil
+import threading
+from multiprocessing import Pool, shared_memory
+from unittest.mock import MagicMock
+
+import pytest
+
+import scripts.run_validation
+from cdisc_rules_engine.config import config
+from cdisc_rules_engine.models.validation_args import Validation_args
+from cdisc_rules_engine.rules_engine import RulesEngine
+from cdisc_rules_engine.services.cache import InMemoryCacheService, TieredCacheService
+from cdisc_rules_engine.services.data_services import (
+    DataServiceFactory,
+    LocalDataService,
+)
+from cdisc_rules_engine.services.task_queues import FileSystemTaskQueue
+from cdisc_rules_engine.utilities.parquet_conversion_cache import (
+    ParquetConversionCache,
+)
+
+from cdisc_rules_engine.utilities.rule_processor import RuleProcessor
+from cdisc_rules_engine.utilities.rule_timing_history import RuleTimingHistory
+from scripts.run_validation import (
+    convert_datasets_to_parquet,
+    get_conversion_cache,
+    get_dataset_tasks,
+    get_operation_result_store,
+    get_rule_domains,
+    get_rules_engine,
+    get_rule_tasks,
+    get_unique_domain_datasets,
+    merge_dataset_results,
+    process_queue_tasks,
+    run_distributed_tasks,
+    report_cache_stats,
+    run_tasks,
+    run_validation,
+    validate_single_dataset,
+)
+from scripts.script_utils import get_local_cache_service
+
+
+def test_get_unique_domain_datasets_skips_split_datasets():
+    datasets = [
+        {"domain": "QS", "filename": "qs1.xpt"},
+        {"domain": "AE", "filename": "ae.xpt"},
+        {"domain": "QS", "filename": "qs2.xpt"},
+    ]
+    assert get_unique_domain_datasets(datasets) == [
+        {"domain": "QS", "filename": "qs1.xpt"},
+        {"domain": "AE", "filename": "ae.xpt"},
+    ]
+
+
+def test_merge_dataset_results_orders_results_by_dataset():
+    rules = [
+        {"core_id": "CORE-000001", "actions": []},
+        {"core_id": "CORE-000002", "actions": []},
+    ]
+    domain_datasets = [{"domain": "AE"}, {"domain": "DM"}]
+    dataset_results = [
+        (
+            "DM",
+            [
+                [{"domain": "DM", "executionStatus": "success", "errors": []}],
+                [{"domain": "DM", "executionStatus": "skipped"}],
+            ],
+        ),
+        (
+            "AE",
+            [
+                [{"domain": "AE", "executionStatus": "skipped"}],
+                [{"domain": "AE", "executionStatus": "skipped"}],
+            ],
+        ),
+    ]
+    results = merge_dataset_results(rules, domain_datasets, dataset_results)
+    assert [result.id for result in results] == ["CORE-000001", "CORE-000002"]
+    assert [item["domain"] for item in results[0].results] == ["AE", "DM"]
+    assert results[0].execution_status == "success"
+    assert results[1].execution_status == "skipped"
+
+
+def test_get_rule_domains():
+    datasets = [
+        {"domain": "AE", "filename": "ae.xpt", "full_path": "ae.xpt"},
+        {"domain": "LB", "filename": "lb.xpt", "full_path": "lb.xpt"},
+        {"domain": "DM", "filename": "dm.xpt", "full_path": "dm.xpt"},
+    ]
+    data_service = MagicMock()
+    data_service.get_dataset_class.side_effect = lambda variables, path, *args: {
+        "ae.xpt": "EVENTS",
+        "lb.xpt": "FINDINGS",
+        "dm.xpt": "SPECIAL PURPOSE",
+    }[path]
+    rules = [
+        {
+            "core_id": "CORE-000001",
+            "standards": [],
+            "domains": {"Include": ["AE", "LB"]},
+        },
+        {
+            "core_id": "CORE-000002",
+            "standards": [],
+            "domains": {"Include": ["ALL"]},
+            "classes": {"Include": ["FINDINGS"]},
+        },
+        {
+            "core_id": "CORE-000003",
+            "standards": [],
+            "domains": {"Include": ["ALL"]},
+            "classes": {"Exclude": ["EVENTS"]},
+        },
+        {"core_id": "CORE-000004", "domains": {"Include": ["ALL"]}},
+    ]
+    rule_domains = get_rule_domains(
+        RuleProcessor(data_service, MagicMock()), rules, datasets
+    )
+    assert rule_domains == [{"AE", "LB"}, {"LB"}, {"LB", "DM"}, set()]
+    # the class of each dataset is detected once
+    assert data_service.get_dataset_class.call_count == 3
+
+
+def test_get_rule_domains_class_detection_failure():
+    datasets = [{"domain": "AE", "filename": "ae.xpt", "full_path": "ae.xpt"}]
+    data_service = MagicMock()
+    data_service.get_variables_metadata.side_effect = Exception("metadata error")
+    rules = [
+        {
+            "core_id": "CORE-000001",
+            "standards": [],
+            "domains": {"Include": ["ALL"]},
+            "classes": {"Include": ["FINDINGS"]},
+        }
+    ]
+    assert get_rule_domains(
+        RuleProcessor(data_service, MagicMock()), rules, datasets
+    ) == [{"AE"}]
+
+
+def test_get_rule_tasks_orders_rules_by_cost():
+    rules = [
+        {"core_id": "CORE-000001", "actions": []},
+        {"core_id": "CORE-000002", "actions": []},
+        {"core_id": "CORE-000003", "actions": []},
+    ]
+    domain_datasets = [{"domain": "AE"}, {"domain": "DM"}]
+    timing_history = RuleTimingHistory(
+        {"CORE-000001": {"AE": 1.0}, "CORE-000002": {"AE": 1.0, "DM": 5.0}}
+    )
+    rule_tasks, skipped_results = get_rule_tasks(
+        rules, [{"AE"}, {"AE", "DM"}, set()], domain_datasets, timing_history
+    )
+    assert [rule["core_id"] for rule, _ in rule_tasks] == [
+        "CORE-000002",
+        "CORE-000001",
+    ]
+    assert [result.id for result in skipped_results] == ["CORE-000003"]
+    assert [item["domain"] for item in skipped_results[0].results] == ["AE", "DM"]
+    assert skipped_results[0].execution_status == "skipped"
+
+
+def test_get_dataset_tasks_orders_datasets_by_cost():
+    rules = [{"core_id": "CORE-000001"}, {"core_id": "CORE-000002"}]
+    domain_datasets = [{"domain": "AE"}, {"domain": "DM"}, {"domain": "LB"}]
+    timing_history = RuleTimingHistory(
+        {
+            "CORE-000001": {"AE": 1.0, "DM": 1.0},
+            "CORE-000002": {"AE": 1.0, "DM": 4.0},
+        }
+    )
+    dataset_tasks, skipped_results = get_dataset_tasks(
+        rules, [{"AE", "DM"}, {"AE", "DM"}], domain_datasets, timing_history
+    )
+    assert dataset_tasks == [{"domain": "DM"}, {"domain": "AE"}]
+    assert [domain for domain, _ in skipped_results] == ["LB"]
+    assert len(skipped_results[0][1]) == 2
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+def test_run_tasks_recycles_pool_above_memory_watermark():
+    pools = []
+
+    def create_pool():
+        pool = Pool(2)
+        pools.append(pool)
+        return pool
+
+    results = run_tasks(create_pool, 2, square, [1, 2, 3, 4, 5], memory_watermark=1)
+    assert sorted(results) == [1, 4, 9, 16, 25]
+    # every completed task reports memory above the watermark,
+    # so the pool is replaced after each batch of running tasks
+    assert len(pools) > 1
+
+
+def test_run_tasks_without_watermark():
+    pools = []
+
+    def create_pool():
+        pool = Pool(2)
+        pools.append(pool)
+        return pool
+
+    results = run_tasks(create_pool, 2, square, [1, 2, 3, 4, 5])
+    assert sorted(results) == [1, 4, 9, 16, 25]
+    assert len(pools) == 1
+
+
+def test_run_tasks_merges_cache_stats():
+    cache_stats = {"InMemoryCacheService": {}}
+    results = run_tasks(lambda: Pool(2), 2, square, [1, 2, 3], cache_stats=cache_stats)
+    assert sorted(results) == [1, 4, 9]
+    # workers without caches report no stats
+    assert cache_stats == {"InMemoryCacheService": {}}
+
+
+def test_report_cache_stats(tmp_path):
+    cache = InMemoryCacheService(max_size=10**6)
+    cache.add("standards/sdtmig/3-4", {})
+    cache.get("standards/sdtmig/3-4")
+    stats_path = str(tmp_path / "cache_stats.json")
+    args = MagicMock(progress="verbose", cache_stats=stats_path)
+    report_cache_stats(args, cache.get_stats())
+    with open(stats_path) as file:
+        stats = json.load(file)
+    assert stats["InMemoryCacheService"]["standards"]["hits"] == 1
+
+
+def run_queue_workers(task_queue, create_task_function, count: int = 2):
+    workers = [
+        threading.Thread(
+            target=process_queue_tasks, args=(task_queue, create_task_function)
+        )
+        for _ in range(count)
+    ]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+def test_run_distributed_tasks(tmp_path):
+    task_queue = FileSystemTaskQueue(str(tmp_path), poll_interval=0.01)
+    workers = run_queue_workers(task_queue, lambda job: lambda x: x ** job["power"])
+    results = run_distributed_tasks(task_queue, {"power": 2}, [1, 2, 3, 4, 5])
+    assert sorted(results) == [1, 4, 9, 16, 25]
+    for worker in workers:
+        worker.join()
+    assert task_queue.is_closed()
+
+
+def test_process_queue_tasks_creates_task_function_once(tmp_path):
+    task_queue = FileSystemTaskQueue(str(tmp_path), poll_interval=0.01)
+    created_jobs = []
+
+    def create_task_function(job):
+        created_jobs.append(job)
+        return lambda x: x * 2
+
+    task_queue.publish_job(("job", {"rules": []}))
+    for index in range(3):
+        task_queue.put_task(f"{index:08d}", ("job", index))
+    task_queue.close()
+    assert process_queue_tasks(task_queue, create_task_function) == 3
+    assert created_jobs == [{"rules": []}]
+
+
+def test_run_distributed_tasks_worker_error(tmp_path):
+    task_queue = FileSystemTaskQueue(str(tmp_path), poll_interval=0.01)
+    workers = run_queue_workers(task_queue, lambda job: lambda x: 1 / x, count=1)
+    with pytest.raises(RuntimeError, match="ZeroDivisionError"):
+        list(run_distributed_tasks(task_queue, {}, [1, 0]))
+    for worker in workers:
+        worker.join()
+
+
+def test_run_distributed_tasks_requeues_lost_tasks(tmp_path, monkeypatch):
+    monkeypatch.setattr(scripts.run_validation, "TASK_QUEUE_POLL_TIMEOUT", 0.05)
+    monkeypatch.setattr(scripts.run_validation, "TASK_CLAIM_TIMEOUT", 0.2)
+    task_queue = FileSystemTaskQueue(str(tmp_path), poll_interval=0.01)
+    # a worker that is killed after taking a task
+    killed_worker = threading.Thread(target=task_queue.get_task, args=(5,))
+    killed_worker.start()
+    results = []
+    coordinator = threading.Thread(
+        target=lambda: results.extend(
+            run_distributed_tasks(task_queue, {"power": 2}, [1, 2, 3], timeout=5)
+        )
+    )
+    coordinator.start()
+    killed_worker.join()
+    workers = run_queue_workers(task_queue, lambda job: lambda x: x ** job["power"])
+    coordinator.join()
+    assert sorted(results) == [1, 4, 9]
+    for worker in workers:
+        worker.join()
+
+
+def test_run_distributed_tasks_timeout(tmp_path, monkeypatch):
+    monkeypatch.setattr(scripts.run_validation, "TASK_QUEUE_POLL_TIMEOUT", 0.05)
+    task_queue = FileSystemTaskQueue(str(tmp_path), poll_interval=0.01)
+    with pytest.raises(TimeoutError):
+        list(run_distributed_tasks(task_queue, {}, [1], timeout=0.1))
+
+
+def test_run_distributed_tasks_queue_in_use(tmp_path):
+    task_queue = FileSystemTaskQueue(str(tmp_path), poll_interval=0.01)
+    task_queue.acquire_lease("running job", 60)
+    task_queue.publish_job("running job")
+    with pytest.raises(RuntimeError, match="another coordinator"):
+        list(run_distributed_tasks(task_queue, {}, [1]))
+    # the running job is not cleared
+    assert task_queue.get_job() == "running job"
+
+
+def test_convert_datasets_to_parquet_reuses_converted_files(tmp_path):
+    dataset_path = str(tmp_path / "test_dataset.xpt")
+    shutil.copy(
+        os.path.join(os.path.dirname(__file__), "..", "resources", "test_dataset.xpt"),
+        dataset_path,
+    )
+    conversion_cache = ParquetConversionCache(str(tmp_path / "cache"))
+    datasets = [{"full_path": dataset_path}]
+    assert convert_datasets_to_parquet(datasets, 2, conversion_cache) == []
+    converted_path = datasets[0]["full_path"]
+    assert converted_path.startswith(str(tmp_path / "cache"))
+    assert datasets[0]["original_path"] == dataset_path
+    assert datasets[0]["length"] > 0
+    # the second run uses the converted file
+    datasets = [{"full_path": dataset_path}]
+    os.utime(converted_path, (0, 0))
+    convert_datasets_to_parquet(datasets, 2, conversion_cache)
+    assert datasets[0]["full_path"] == converted_path
+    assert os.path.getmtime(converted_path) > 0
+
+
+def test_convert_datasets_to_parquet_without_cache(tmp_path):
+    dataset_path = os.path.join(
+        os.path.dirname(__file__), "..", "resources", "test_dataset.xpt"
+    )
+    datasets = [{"full_path": dataset_path}]
+    created_files = convert_datasets_to_parquet(datasets, 2)
+    try:
+        assert created_files == [datasets[0]["full_path"]]
+    finally:
+        for file in created_files:
+            os.remove(file)
+
+
+def test_get_conversion_cache_of_coordinator(tmp_path):
+    args = MagicMock(
+        parquet_cache=None, parquet_cache_max_size=None, distributed_role=None
+    )
+    assert get_conversion_cache(args) is None
+    # workers on other machines can not read local temp files
+    args.distributed_role = "coordinator"
+    with pytest.raises(ValueError, match="--parquet-cache"):
+        get_conversion_cache(args)
+    args.parquet_cache = str(tmp_path)
+    assert isinstance(get_conversion_cache(args), ParquetConversionCache)
+
+
+def test_get_local_cache_service(monkeypatch):
+    shared_cache = InMemoryCacheService()
+    monkeypatch.setenv("LOCAL_CACHE_SIZE", "1")
+    monkeypatch.setenv("LOCAL_CACHE_NAMESPACE_TTLS", "standards/=3600; models/=60")
+    cache = get_local_cache_service(shared_cache)
+    assert isinstance(cache, TieredCacheService)
+    assert cache.max_size == 1024 * 1024
+    assert cache.ttl is None
+    assert cache.namespace_ttls == {"standards/": 3600, "models/": 60}
+    monkeypatch.setenv("LOCAL_CACHE_SIZE", "0")
+    assert get_local_cache_service(shared_cache) is shared_cache
+
+
+def test_get_operation_result_store_once_per_process(tmp_path):
+    cache_path = tmp_path / "cache"
+    cache_path.mkdir()
+    (cache_path / "rules.pkl").write_bytes(b"")
+    args = MagicMock(
+        cache=str(cache_path),
+        operation_cache=str(tmp_path / "operations"),
+        operation_cache_max_size=10,
+    )
+    store = get_operation_result_store(args)
+    assert get_operation_result_store(args) is store
+    args.operation_cache = None
+    assert get_operation_result_store(args) is None
+
+
+def get_validation_args(dataset_paths, **kwargs) -> Validation_args:
+    args = Validation_args(
+        cache="",
+        pool_size=1,
+        dataset_paths=dataset_paths,
+        log_level="disabled",
+        report_template="",
+        standard="sdtmig",
+        version="3-4",
+        controlled_terminology_package=[],
+        output="",
+        output_format="JSON",
+        raw_report=False,
+        define_version="",
+        whodrug=None,
+        meddra=None,
+        loinc=None,
+        medrt=None,
+        rules=[],
+        local_rules=None,
+        local_rules_cache=False,
+        local_rules_id=None,
+        progress="disabled",
+        define_xml_path=None,
+    )
+    return args._replace(**kwargs)
+
+
+class DatasetReadCountingCache(InMemoryCacheService):
+    def __init__(self):
+        super().__init__(max_size=10**8)
+        self.dataset_reads = 0
+
+    def get_dataset(self, cache_key):
+        self.dataset_reads += 1
+        return super().get_dataset(cache_key)
+
+
+def test_validate_single_dataset_reads_dataset_once(monkeypatch):
+    monkeypatch.setenv("LOCAL_CACHE_SIZE", "0")
+    monkeypatch.setattr(scripts.run_validation, "_process_cache", None)
+    monkeypatch.setattr(scripts.run_validation, "_task_local_cache", None)
+    monkeypatch.setattr(LocalDataService, "_instance", None)
+    shared_cache = DatasetReadCountingCache()
+    # data service singleton created by the parent process around the shared cache
+    data_service = DataServiceFactory(config, shared_cache).get_data_service()
+
+    def validate_single_rule(engine, rule, dataset_path, datasets, domain):
+        engine.data_service.get_dataset(dataset_name=dataset_path)
+        return []
+
+    monkeypatch.setattr(RulesEngine, "validate_single_rule", validate_single_rule)
+    dataset_path = os.path.join(
+        os.path.dirname(__file__), "..", "resources", "test_dataset.xpt"
+    )
+    dataset = {
+        "domain": "EX",
+        "filename": "test_dataset.xpt",
+        "full_path": dataset_path,
+        "size": os.path.getsize(dataset_path),
+    }
+    args = get_validation_args([dataset_path])
+    rules = [
+        {"core_id": f"CORE-00000{number}", "conditions": {"all": []}}
+        for number in range(3)
+    ]
+    domain, results = validate_single_dataset(
+        shared_cache, [dataset], args, None, rules, [{"EX"}] * 3, dataset
+    )
+    assert domain == "EX" and results == [[], [], []]
+    # the dataset is read from the shared cache once for all rules of the task
+    assert shared_cache.dataset_reads == 1
+    assert data_service.cache_service is shared_cache
+    # rules of the job are not changed, so that other tasks can validate them
+    assert rules[0]["conditions"] == {"all": []}
+
+
+def test_get_rules_engine_applies_categorical_threshold(monkeypatch):
+    monkeypatch.setattr(LocalDataService, "_instance", None)
+    cache = InMemoryCacheService()
+    # data service singleton created by the parent process without the threshold
+    data_service = DataServiceFactory(config, cache).get_data_service()
+    dataset_path = os.path.join(
+        os.path.dirname(__file__), "..", "resources", "test_dataset.xpt"
+    )
+    args = get_validation_args([dataset_path], categorical_threshold=1)
+    engine = get_rules_engine(
+        cache, [{"size": os.path.getsize(dataset_path)}], args, None
+    )
+    assert engine.data_service is data_service
+    dataset = engine.data_service.get_dataset(dataset_name=dataset_path)
+    assert "category" in {str(dtype) for dtype in dataset.data.dtypes}
+
+
+def test_run_validation_releases_shared_memory_on_error(monkeypatch):
+    monkeypatch.setenv("CACHE_TYPE", "shared_memory")
+    monkeypatch.setattr(LocalDataService, "_instance", None)
+    monkeypatch.setattr(scripts.run_validation, "get_rules", lambda args: [])
+    monkeypatch.setattr(
+        scripts.run_validation, "get_library_metadata_from_cache", lambda args: None
+    )
+    dataset_path = os.path.join(
+        os.path.dirname(__file__), "..", "resources", "test_dataset.xpt"
+    )
+    block_names = []
+
+    def get_rule_domains(rule_processor, rules, datasets):
+        # the dataset is stored in a shared memory block before the failure
+        rule_processor.data_service.get_dataset(dataset_name=dataset_path)
+        dataset_index = rule_processor.cache.dataset_index
+        block_names.extend(layout["name"] for layout in dataset_index.values())
+        raise RuntimeError("validation failed")
+
+    monkeypatch.setattr(scripts.run_validation, "get_rule_domains", get_rule_domains)
+    with pytest.raises(RuntimeError, match="validation failed"):
+        run_validation(get_validation_args([dataset_path]))
+    assert block_names
+    for block_name in block_names:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=block_name)
@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 from cdisc_rules_engine.services.cache.in_memory_cache_service import (
     InMemoryCacheService,
 )
@@ -42,3 +44,36 @@ def test_clear_all_with_prefix():
     cache.clear_all("te")
     assert cache.exists("hi")
     assert not cache.exists("test")
+
+
+def test_add_estimates_size_once():
+    size_estimator = MagicMock(return_value=10)
+    cache = InMemoryCacheService(max_size=100, size_estimator=size_estimator)
+    cache.add("test", "this is a test")
+    assert size_estimator.call_count == 1
+    assert cache.cache.currsize == 10
+
+
+def test_add_with_size():
+    size_estimator = MagicMock(return_value=10)
+    cache = InMemoryCacheService(max_size=100, size_estimator=size_estimator)
+    cache.add("test", "this is a test", size=60)
+    cache.add("hi", "bye", size=60)
+    size_estimator.assert_not_called()
+    # the first item is evicted to make room for the second one
+    assert not cache.exists("test")
+    assert cache.get("hi") == "bye"
+    cache.add("large", "value", size=101)
+    assert not cache.exists("large")
+
+
+def test_stats_count_evictions():
+    cache = InMemoryCacheService(max_size=100)
+    cache.add("rules/CORE-000001", 1, size=60)
+    cache.add("rules/CORE-000002", 2, size=60)
+    assert cache.get("rules/CORE-000001") is None
+    assert cache.get("rules/CORE-000002") == 2
+    stats = cache.get_stats()["InMemoryCacheService"]["rules"]
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["evictions"] == 1 and stats["bytes_evicted"] == 60
+    assert stats["bytes_stored"] == 120
@@ -0,0 +1,30 @@
+from cdisc_rules_engine.services.cache.in_memory_cache_service import SizedLRUCache
+from cdisc_rules_engine.services.cache.key_index import KeyIndex
+
+
+def test_keys_with_prefix():
+    index = KeyIndex()
+    for key in ("rules/b", "rules/a", "models/a", "rules", 1):
+        index.add(key)
+    assert index.keys_with_prefix("rules/") == ["rules/a", "rules/b"]
+    index.remove("rules/a")
+    index.add("rules/c")
+    assert index.keys_with_prefix("rules") == ["rules", "rules/b", "rules/c"]
+    # keys removed and added again stay in the index
+    index.remove("rules/b")
+    index.add("rules/b")
+    index.remove("rules/c")
+    assert index.keys_with_prefix("rules/") == ["rules/b"]
+    assert index.keys_with_prefix("") == ["models/a", "rules", "rules/b"]
+    index.clear()
+    assert index.keys_with_prefix("") == []
+
+
+def test_evicted_keys_are_removed_from_index():
+    cache = SizedLRUCache(maxsize=2, getsizeof=lambda value: 1)
+    cache["rules/a"] = 1
+    cache["rules/b"] = 2
+    cache["rules/c"] = 3
+    assert cache.keys_with_prefix("rules/") == ["rules/b", "rules/c"]
+    cache.pop("rules/b")
+    assert cache.keys_with_prefix("rules/") == ["rules/c"]
@@ -0,0 +1,293 @@
+import asyncio
+import fnmatch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cdisc_rules_engine.models.dataset import ArrowDataset, DaskDataset, PandasDataset
+from cdisc_rules_engine.services.cache import RedisCacheService, redis_cache_service
+from cdisc_rules_engine.services.cache.serializers import get_serializer
+
+
+class FakeRedis:
+    """
+    Stand-in for a Redis server, implements the commands used by the cache.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.scanned_keys = 0
+
+    @staticmethod
+    def _key(key) -> bytes:
+        return key if isinstance(key, bytes) else key.encode()
+
+    def set(self, key, value, ex=None, get=False):
+        if isinstance(value, int):
+            value = str(value).encode()
+        previous_value = self.values.get(self._key(key))
+        self.values[self._key(key)] = bytes(value)
+        return previous_value if get else True
+
+    def get(self, key):
+        return self.values.get(self._key(key))
+
+    def mget(self, keys):
+        return [self.get(key) for key in keys]
+
+    def exists(self, key):
+        return int(self._key(key) in self.values)
+
+    def delete(self, *keys):
+        return sum(self.values.pop(self._key(key), None) is not None for key in keys)
+
+    unlink = delete
+
+    def sadd(self, key, *members):
+        self.values.setdefault(self._key(key), set()).update(map(self._key, members))
+
+    def srem(self, key, *members):
+        self.values.get(self._key(key), set()).difference_update(
+            map(self._key, members)
+        )
+
+    def smembers(self, key):
+        return set(self.values.get(self._key(key), set()))
+
+    def scan_iter(self, match="*", count=None):
+        self.scanned_keys += len(self.values)
+        return [key for key in self.values if fnmatch.fnmatch(key.decode(), match)]
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.commands = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    def execute(self):
+        return [
+            getattr(self.client, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+@pytest.fixture
+def dataframe() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "USUBJID": ["1", "2", None] * 100,
+            "AESEQ": pd.Series([1, None, 3] * 100, dtype=object),
+            "AESTDY": [1.5, np.nan, 3.0] * 100,
+        }
+    )
+
+
+def get_cache(**kwargs) -> RedisCacheService:
+    cache = RedisCacheService("localhost", "", 6379, False, **kwargs)
+    cache.client = FakeRedis()
+    return cache
+
+
+@pytest.mark.parametrize(
+    "compression, chunk_size", [("lz4", 100), ("zstd", 10**6), (None, 100)]
+)
+def test_add_and_get_dataset(dataframe, compression, chunk_size):
+    cache = get_cache(dataset_compression=compression, dataset_chunk_size=chunk_size)
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    cache.add_dataset("dm.xpt_contents", ArrowDataset.from_pandas(dataframe))
+    result = cache.get_dataset("ae.xpt_contents")
+    assert type(result) is PandasDataset
+    pd.testing.assert_frame_equal(result.data, dataframe)
+    result = cache.get_dataset("dm.xpt_contents")
+    assert isinstance(result, ArrowDataset) and result.table is not None
+    pd.testing.assert_frame_equal(result.data, dataframe)
+    assert sorted(cache.dataset_keys()) == ["ae.xpt_contents", "dm.xpt_contents"]
+    assert cache.get_dataset("lb.xpt_contents") is None
+
+
+def test_not_convertible_datasets_are_pickled():
+    cache = get_cache(dataset_chunk_size=10)
+    dataframe = pd.DataFrame({"A": [1, "a", None]}, index=[2, 3, 4])
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    pd.testing.assert_frame_equal(cache.get_dataset("ae.xpt_contents").data, dataframe)
+    cache.add_dataset("dm.xpt_contents", DaskDataset.from_dict({"A": [1, 2]}))
+    assert cache.get_dataset("dm.xpt_contents")["A"].tolist() == [1, 2]
+    cache.add_dataset("define.xml_contents", b"<ODM/>")
+    assert cache.get_dataset("define.xml_contents") == b"<ODM/>"
+
+
+def test_replaced_dataset_chunks_are_deleted(dataframe):
+    cache = get_cache(dataset_chunk_size=100)
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    chunk_keys = set(cache.client.values)
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe.head(1)))
+    # only the header key is left
+    assert len(chunk_keys & set(cache.client.values)) == 1
+    pd.testing.assert_frame_equal(
+        cache.get_dataset("ae.xpt_contents").data, dataframe.head(1)
+    )
+    # datasets are not returned with other cache items
+    cache.add("ct-2023-12-15", {"codelists": []})
+    assert list(cache.get_by_regex("*ct-*").values()) == [{"codelists": []}]
+
+
+def test_concurrently_added_dataset_chunks_are_deleted(dataframe, monkeypatch):
+    cache = get_cache(dataset_chunk_size=100)
+    other_host_cache = get_cache(dataset_chunk_size=100)
+    other_host_cache.client = cache.client
+    execute = FakePipeline.execute
+
+    def execute_after_other_host(pipe):
+        # another host adds the dataset while this host writes it
+        monkeypatch.setattr(FakePipeline, "execute", execute)
+        other_host_cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+        return execute(pipe)
+
+    monkeypatch.setattr(FakePipeline, "execute", execute_after_other_host)
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe.head(1)))
+    header = cache._get_dataset_header("ae.xpt_contents")
+    assert {
+        key for key in cache.client.values if key.startswith(b"dataset_chunk:")
+    } == {
+        f"{header['chunk_key']}:{index}".encode() for index in range(header["chunks"])
+    }
+    pd.testing.assert_frame_equal(
+        cache.get_dataset("ae.xpt_contents").data, dataframe.head(1)
+    )
+
+
+def test_unknown_compression():
+    with pytest.raises(ValueError):
+        get_cache(dataset_compression="gzip")
+
+
+def test_lookups_by_prefix_use_key_index():
+    cache = get_cache()
+    cache.add_all(
+        {"rules/sdtmig/3-4/CORE-000001": 1, "rules/sdtmig/3-4/CORE-000002": 2}
+    )
+    cache.add_batch(
+        [{"key": "sdtmig/3-3/CORE-000001", "rule": 3}],
+        "key",
+        pop_cache_key=True,
+        prefix="rules/",
+    )
+    cache.add("sdtmig-3-4-codelists", {})
+    assert cache.get_all_by_prefix("rules/sdtmig/3-4/") == [1, 2]
+    # the key space is scanned once to complete the index of the namespace
+    scanned_keys: int = cache.client.scanned_keys
+    assert cache.filter_cache("rules/sdtmig/3-3") == {
+        "rules/sdtmig/3-3/CORE-000001": {"rule": 3}
+    }
+    assert cache.client.scanned_keys == scanned_keys
+    assert cache.clear_all("rules/sdtmig/3-4/") == 2
+    assert cache.clear("rules/sdtmig/3-3/CORE-000001") == 1
+    assert cache.get_all_by_prefix("rules/") == []
+    # keys without a namespace are scanned
+    assert cache.filter_cache("sdtmig-3-4") == {"sdtmig-3-4-codelists": {}}
+    cache.clear_all()
+    assert cache.client.values == {}
+
+
+def test_key_index_is_completed_and_pruned():
+    cache = get_cache()
+    cache.add("rules/sdtmig/3-4/CORE-000001", 1)
+    # keys written without the index, e.g. by previous versions
+    cache.client.set("rules/sdtmig/3-4/CORE-000002", cache.serializer.dumps(2))
+    assert cache.get_all_by_prefix("rules/sdtmig/3-4/") == [1, 2]
+    # keys evicted by the server are removed from the index
+    cache.client.delete("rules/sdtmig/3-4/CORE-000001")
+    assert cache.get_all_by_prefix("rules/") == [2]
+    assert cache.client.smembers("key_index:rules/") == {
+        b"rules/sdtmig/3-4/CORE-000002"
+    }
+    # the index is completed again once its mark expires
+    cache.client.set("rules/sdtmig/3-4/CORE-000003", cache.serializer.dumps(3))
+    assert cache.get_all_by_prefix("rules/") == [2]
+    cache.client.delete("key_index_complete:rules/")
+    assert cache.get_all_by_prefix("rules/") == [2, 3]
+
+
+@pytest.mark.parametrize("serializer", ["pickle", "pickle_lz4", "pickle_zstd"])
+def test_serializers(serializer):
+    cache = get_cache(serializer=get_serializer(serializer))
+    codelists = {"package": "sdtmct-2023-12-15", "codelists": [{"terms": []}] * 100}
+    cache.add("sdtmct-2023-12-15", codelists)
+    assert cache.get("sdtmct-2023-12-15") == codelists
+    assert cache.client.get("sdtmct-2023-12-15") == get_serializer(serializer).dumps(
+        codelists
+    )
+    with pytest.raises(ValueError):
+        get_serializer("json")
+
+
+def test_serializer_can_be_changed():
+    codelists = {"package": "sdtmct-2023-12-15", "codelists": [{"terms": []}] * 100}
+    cache = get_cache(serializer=get_serializer("pickle"))
+    cache.add("sdtmct-2023-12-15", codelists)
+    for serializer in ("pickle_lz4", "pickle_zstd"):
+        # values written with the previous serializer are still read
+        cache.serializer = get_serializer(serializer)
+        assert cache.get("sdtmct-2023-12-15") == codelists
+        cache.add("sdtmct-2023-12-15", codelists)
+    cache.serializer = get_serializer("pickle")
+    assert cache.get_all(["sdtmct-2023-12-15"]) == [codelists]
+
+
+def test_batches(monkeypatch):
+    monkeypatch.setattr(redis_cache_service, "KEY_BATCH_SIZE", 3)
+    cache = get_cache()
+    cache.add_batch([{"name": f"VAR{i}", "codelists": [i]} for i in range(10)], "name")
+    keys = [f"VAR{i}" for i in range(11)]
+    values = cache.get_all(keys)
+    assert values[:10] == [{"name": f"VAR{i}", "codelists": [i]} for i in range(10)]
+    # missing keys are returned as None in their position
+    assert values[10] is None
+
+
+def test_async_methods():
+    cache = get_cache()
+
+    async def add_and_get():
+        await asyncio.gather(
+            cache.async_add_batch([{"package": "sdtmct-2023-12-15"}], "package"),
+            cache.async_add("published_ct_packages", ["sdtmct-2023-12-15"]),
+        )
+        return await cache.async_get_all(["sdtmct-2023-12-15", "published_ct_packages"])
+
+    assert asyncio.run(add_and_get()) == [
+        {"package": "sdtmct-2023-12-15"},
+        ["sdtmct-2023-12-15"],
+    ]
+
+
+def test_stats(dataframe):
+    cache = get_cache()
+    cache.add("standards/sdtmig/3-4", {"name": "SDTMIG"})
+    cache.get("standards/sdtmig/3-4")
+    cache.get_all(["standards/sdtmig/3-4", "standards/sdtmig/3-3"])
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    cache.get_dataset("ae.xpt_contents")
+    cache.get_dataset("dm.xpt_contents")
+    stats = cache.get_stats()["RedisCacheService"]
+    assert stats["standards"]["hits"] == 2
+    assert stats["standards"]["misses"] == 1
+    assert stats["standards"]["bytes_stored"] == len(
+        cache.client.get("standards/sdtmig/3-4")
+    )
+    assert stats["datasets"]["hits"] == 1
+    assert stats["datasets"]["misses"] == 1
+    assert stats["datasets"]["bytes_stored"] > 0
@@ -0,0 +1,143 @@
+import gc
+import pickle
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cdisc_rules_engine.models.dataset import ArrowDataset, PandasDataset
+from cdisc_rules_engine.services.cache import (
+    InMemoryCacheService,
+    SharedMemoryCacheService,
+)
+from cdisc_rules_engine.services.cache import shared_memory_cache_service
+
+
+@pytest.fixture
+def cache():
+    cache = SharedMemoryCacheService(InMemoryCacheService(), {})
+    yield cache
+    cache.release_shared_memory()
+
+
+def test_add_and_get_dataset(cache):
+    dataframe = pd.DataFrame(
+        {
+            "USUBJID": ["1", "2", None],
+            "AESEQ": [1, 2, 3],
+            "AESTDY": [1.5, np.nan, 3.0],
+            "AESER": [True, False, True],
+            "AESTDTC": pd.to_datetime(["2020-01-01", "2020-01-02", None]),
+        }
+    )
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    result = cache.get_dataset("ae.xpt_contents")
+    assert isinstance(result, PandasDataset)
+    pd.testing.assert_frame_equal(result.data, dataframe)
+
+
+def test_numeric_columns_are_read_only_views(cache):
+    dataframe = pd.DataFrame({"AESEQ": [1, 2, 3], "AESTDY": [1.5, 2.5, 3.5]})
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    result = cache.get_dataset("ae.xpt_contents").data
+    assert not result["AESEQ"].values.flags.writeable
+    assert not result["AESTDY"].values.flags.writeable
+    # operations on the dataframe still produce new writable data
+    assert (result["AESEQ"] + 1).tolist() == [2, 3, 4]
+
+
+def test_object_columns_are_decoded_once(cache):
+    dataframe = pd.DataFrame(
+        {
+            "USUBJID": ["1", "2", None],
+            "AEDECOD": ["HEADACHE", np.nan, "NAUSEA"],
+            "AEOUT": ["RECOVERED", 1, None],
+        }
+    )
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    # strings are stored as Arrow arrays, other objects are pickled
+    layout = cache.dataset_index["ae.xpt_contents"]
+    assert [column[1] for column in layout["columns"]] == ["arrow", "pickle", "pickle"]
+    first_result = cache.get_dataset("ae.xpt_contents").data
+    second_result = cache.get_dataset("ae.xpt_contents").data
+    pd.testing.assert_frame_equal(first_result, dataframe)
+    pd.testing.assert_frame_equal(second_result, dataframe)
+    assert np.shares_memory(
+        first_result["USUBJID"].values, second_result["USUBJID"].values
+    )
+    assert not first_result["USUBJID"].values.flags.writeable
+
+
+def test_evicted_blocks_are_closed(cache):
+    dataframe = pd.DataFrame({"AESEQ": [1, 2, 3]})
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    result = cache.get_dataset("ae.xpt_contents").data
+    # the block is evicted by another process
+    block_name = cache.dataset_index.pop("ae.xpt_contents")["name"]
+    block = shared_memory.SharedMemory(name=block_name)
+    block.unlink()
+    block.close()
+    cache.add_dataset("dm.xpt_contents", PandasDataset(dataframe))
+    cache._detach_evicted_blocks()
+    assert block_name not in shared_memory_cache_service._attached_blocks
+    # the handle is kept open while the dataframe uses the block
+    assert len(shared_memory_cache_service._evicted_blocks) == 1
+    assert result["AESEQ"].tolist() == [1, 2, 3]
+    del result
+    gc.collect()
+    pd.testing.assert_frame_equal(cache.get_dataset("dm.xpt_contents").data, dataframe)
+    cache._detach_evicted_blocks()
+    assert shared_memory_cache_service._evicted_blocks == []
+
+
+def test_dataset_is_shared_with_other_processes(cache):
+    dataframe = pd.DataFrame({"USUBJID": ["1", "2"], "AESEQ": [1, 2]})
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    # worker processes receive a pickled copy of the cache
+    other_process_cache = pickle.loads(pickle.dumps(cache))
+    result = other_process_cache.get_dataset("ae.xpt_contents")
+    pd.testing.assert_frame_equal(result.data, dataframe)
+
+
+def test_non_default_index_is_preserved(cache):
+    dataframe = pd.DataFrame({"AESEQ": [1, 2, 3]}, index=[10, 20, 30])
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    pd.testing.assert_frame_equal(cache.get_dataset("ae.xpt_contents").data, dataframe)
+
+
+def test_add_and_get_arrow_dataset(cache):
+    dataframe = pd.DataFrame({"USUBJID": ["1", "2", None], "AESEQ": [1, 2, 3]})
+    cache.add_dataset("ae.xpt_contents", ArrowDataset.from_pandas(dataframe))
+    result = cache.get_dataset("ae.xpt_contents")
+    assert isinstance(result, ArrowDataset)
+    assert result.table is not None
+    pd.testing.assert_frame_equal(result.data, dataframe)
+
+
+def test_missing_dataset_is_delegated():
+    delegate = InMemoryCacheService()
+    delegate.add_dataset("ae.xpt_contents", "dataset")
+    cache = SharedMemoryCacheService(delegate, {})
+    assert cache.get_dataset("ae.xpt_contents") == "dataset"
+    assert cache.get_dataset("dm.xpt_contents") is None
+
+
+def test_eviction_of_oldest_datasets():
+    dataframe = pd.DataFrame({"AESEQ": np.arange(100, dtype="int64")})
+    cache = SharedMemoryCacheService(InMemoryCacheService(), {}, 1000)
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    cache.add_dataset("dm.xpt_contents", PandasDataset(dataframe))
+    assert cache.dataset_keys() == ["dm.xpt_contents"]
+    assert cache.get_dataset("ae.xpt_contents") is None
+    cache.release_shared_memory()
+
+
+def test_release_shared_memory(cache):
+    dataframe = pd.DataFrame({"AESEQ": [1, 2, 3]})
+    cache.add_dataset("ae.xpt_contents", PandasDataset(dataframe))
+    block_name = cache.dataset_index["ae.xpt_contents"]["name"]
+    cache.release_shared_memory()
+    assert cache.dataset_keys() == []
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=block_name)
@@ -0,0 +1,49 @@
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from pympler import asizeof
+
+from cdisc_rules_engine.models.dataset import PandasDataset
+from cdisc_rules_engine.models.dictionaries.meddra.terms.meddra_term import MedDRATerm
+from cdisc_rules_engine.services.cache.size_estimator import SizeEstimator
+
+
+def test_estimate_dataframe():
+    data = pd.DataFrame({"AESEQ": [1, 2, 3], "AETERM": ["A", "B", "C"]})
+    estimator = SizeEstimator()
+    assert estimator(data) == data.memory_usage(deep=True).sum()
+    assert estimator(data["AETERM"]) == data["AETERM"].memory_usage(deep=True)
+    assert estimator(PandasDataset(data)) == PandasDataset(data).size
+    assert estimator(np.zeros(10)) == 80
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"codelists": [{"conceptId": f"C{i}", "terms": ["A", "B"]} for i in range(5)]},
+        {f"C{i}": {"submissionValue": f"VALUE{i}"} for i in range(1000)},
+        {
+            f"{i}": MedDRATerm({"code": f"{i}", "term": f"TERM {i}", "type": "LLT"})
+            for i in range(1000)
+        },
+        [f"VALUE{i}" for i in range(1000)],
+    ],
+)
+def test_estimate_is_close_to_asizeof(data):
+    assert SizeEstimator()(data) == pytest.approx(asizeof.asizeof(data), rel=0.15)
+
+
+def test_estimate_large_container_from_sample():
+    data = {f"C{i}": f"VALUE{i}" for i in range(1000)}
+    estimator = SizeEstimator(sample_size=10)
+    estimator.register(str, lambda value: 1)
+    assert estimator(data) == sys.getsizeof(data) + 2000
+
+
+def test_shared_objects_are_counted_once():
+    value = "x" * 1000
+    assert SizeEstimator()([value, value]) == sys.getsizeof([value, value]) + (
+        sys.getsizeof(value)
+    )
@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+
+from cdisc_rules_engine.services.cache import (
+    InMemoryCacheService,
+    TaskLocalCacheService,
+)
+
+
+def test_get_dataset_is_served_locally_after_first_read():
+    shared_cache = MagicMock()
+    shared_cache.get_dataset.return_value = "dataset"
+    cache = TaskLocalCacheService(shared_cache)
+    assert cache.get_dataset("ae.xpt_contents") == "dataset"
+    assert cache.get_dataset("ae.xpt_contents") == "dataset"
+    shared_cache.get_dataset.assert_called_once_with("ae.xpt_contents")
+
+
+def test_add_dataset_writes_through_to_shared_cache():
+    shared_cache = InMemoryCacheService()
+    cache = TaskLocalCacheService(shared_cache)
+    cache.add_dataset("ae.xpt_contents", "dataset")
+    assert shared_cache.get_dataset("ae.xpt_contents") == "dataset"
+
+
+def test_release_datasets():
+    shared_cache = MagicMock()
+    shared_cache.get_dataset.return_value = None
+    cache = TaskLocalCacheService(shared_cache)
+    cache.add_dataset("ae.xpt_contents", "dataset")
+    cache.release_datasets()
+    assert cache.get_dataset("ae.xpt_contents") is None
+
+
+def test_non_dataset_items_are_delegated():
+    shared_cache = InMemoryCacheService()
+    cache = TaskLocalCacheService(shared_cache)
+    cache.add("rules/sdtmig/3-4/CORE-000001", {"core_id": "CORE-000001"})
+    assert shared_cache.get("rules/sdtmig/3-4/CORE-000001") == {
+        "core_id": "CORE-000001"
+    }
+    assert cache.filter_cache("rules") == {
+        "rules/sdtmig/3-4/CORE-000001": {"core_id": "CORE-000001"}
+    }
@@ -0,0 +1,116 @@
+from unittest.mock import MagicMock, patch
+
+from cdisc_rules_engine.models.dataset import PandasDataset
+from cdisc_rules_engine.services.cache import (
+    InMemoryCacheService,
+    TieredCacheService,
+)
+
+
+def get_shared_cache() -> MagicMock:
+    return MagicMock(wraps=InMemoryCacheService(max_size=10**6))
+
+
+def test_get_is_served_locally_after_first_read():
+    shared_cache = get_shared_cache()
+    shared_cache.add("standards/sdtmig/3-4", {"name": "SDTMIG"})
+    cache = TieredCacheService(shared_cache)
+    assert cache.get("standards/sdtmig/3-4") == {"name": "SDTMIG"}
+    assert cache.get("standards/sdtmig/3-4") == {"name": "SDTMIG"}
+    assert cache.exists("standards/sdtmig/3-4")
+    shared_cache.get.assert_called_once_with("standards/sdtmig/3-4")
+    shared_cache.exists.assert_not_called()
+
+
+def test_add_writes_through_to_shared_cache():
+    shared_cache = get_shared_cache()
+    cache = TieredCacheService(shared_cache)
+    cache.add("sdtmig-3-4-codelists", {"AESEV": "C66769"})
+    assert shared_cache.get("sdtmig-3-4-codelists") == {"AESEV": "C66769"}
+    assert cache.get("sdtmig-3-4-codelists") == {"AESEV": "C66769"}
+    shared_cache.get.assert_called_once()
+    cache.clear("sdtmig-3-4-codelists")
+    assert cache.get("sdtmig-3-4-codelists") is None
+
+
+def test_get_all_reads_missing_keys_at_once():
+    shared_cache = get_shared_cache()
+    shared_cache.add_all({"a": 1, "b": 2, "c": 3})
+    cache = TieredCacheService(shared_cache)
+    assert cache.get("a") == 1
+    assert cache.get_all(["a", "b", "c", "d"]) == [1, 2, 3, None]
+    shared_cache.get_all.assert_called_once_with(["b", "c", "d"])
+    assert cache.get_all(["a", "b", "c"]) == [1, 2, 3]
+    shared_cache.get_all.assert_called_once()
+
+
+@patch("cdisc_rules_engine.services.cache.tiered_cache_service.time.monotonic")
+def test_entries_expire(mock_monotonic: MagicMock):
+    mock_monotonic.return_value = 0
+    shared_cache = get_shared_cache()
+    shared_cache.add_all({"models/sdtm/2-0": "model", "rules/CORE-000001": "rule"})
+    cache = TieredCacheService(shared_cache, ttl=10, namespace_ttls={"models/": 100})
+    cache.get_all(["models/sdtm/2-0", "rules/CORE-000001"])
+    mock_monotonic.return_value = 50
+    assert cache.get("models/sdtm/2-0") == "model"
+    shared_cache.get.assert_not_called()
+    assert cache.get("rules/CORE-000001") == "rule"
+    shared_cache.get.assert_called_once_with("rules/CORE-000001")
+
+
+@patch("cdisc_rules_engine.services.cache.tiered_cache_service.time.monotonic")
+def test_missing_keys_are_cached(mock_monotonic: MagicMock):
+    mock_monotonic.return_value = 0
+    shared_cache = get_shared_cache()
+    cache = TieredCacheService(shared_cache, negative_ttl=60)
+    assert cache.get("models/sdtm/2-0") is None
+    assert cache.get("models/sdtm/2-0") is None
+    assert not cache.exists("models/sdtm/2-0")
+    shared_cache.get.assert_called_once()
+    mock_monotonic.return_value = 60
+    assert cache.get("models/sdtm/2-0") is None
+    assert shared_cache.get.call_count == 2
+    # keys added to the shared cache by batches are read again
+    cache.add_batch([{"key": "sdtm/2-0", "name": "SDTM"}], "key", prefix="models/")
+    assert cache.get("models/sdtm/2-0") == {"key": "sdtm/2-0", "name": "SDTM"}
+
+
+def test_values_larger_than_local_cache_are_not_kept():
+    shared_cache = get_shared_cache()
+    cache = TieredCacheService(shared_cache, max_size=1000)
+    cache.add("meddra", "0" * 2000)
+    assert cache.get("meddra") == "0" * 2000
+    shared_cache.get.assert_called_once_with("meddra")
+
+
+def test_stats():
+    shared_cache = InMemoryCacheService(max_size=10**6)
+    shared_cache.add("standards/sdtmig/3-4", {"name": "SDTMIG"})
+    cache = TieredCacheService(shared_cache, max_size=1000)
+    cache.get("standards/sdtmig/3-4")
+    cache.get("standards/sdtmig/3-4")
+    cache.get_all(["standards/sdtmig/3-4", "models/sdtm/2-0"])
+    cache.add("rules/CORE-000001", "x" * 600)
+    cache.add("rules/CORE-000002", "x" * 600)
+    stats = cache.get_stats()
+    local_stats = stats["TieredCacheService"]
+    assert local_stats["standards"]["hits"] == 2
+    assert local_stats["standards"]["misses"] == 1
+    assert local_stats["models"]["misses"] == 1
+    assert local_stats["rules"]["evictions"] == 1
+    assert local_stats["rules"]["bytes_evicted"] > 600
+    # lookups that were not served locally reached the shared cache
+    assert stats["InMemoryCacheService"]["standards"]["hits"] == 1
+    assert stats["InMemoryCacheService"]["models"]["misses"] == 1
+
+
+def test_dataframes_are_copied():
+    cache = TieredCacheService(get_shared_cache())
+    dataset = PandasDataset.from_dict({"a": [1, 2]})
+    cache.add("operations/op1", dataset)
+    # operations add columns to the dataset after it is cached
+    dataset["$b"] = [3, 4]
+    result = cache.get("operations/op1")
+    assert list(result.columns) == ["a"]
+    result["$c"] = [5, 6]
+    assert list(cache.get_all(["operations/op1"])[0].columns) == ["a"]
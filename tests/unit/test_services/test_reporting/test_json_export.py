@@ -1,3 +1,5 @@
+import json
+import os
 from unittest.mock import MagicMock
 from version import __version__
 
@@ -274,3 +276,52 @@ def test_get_export():
     assert len(export["Issue_Summary"]) > 0
     assert len(export["Issue_Details"]) > 0
     assert len(export["Rules_Report"]) > 0
+
+
+def _write_report(report: JsonReport) -> dict:
+    report.write_report()
+    with open(report._output_name) as f:
+        export = json.load(f)
+    export["Conformance_Details"].pop("Report_Generation")
+    return export
+
+
+def test_write_report_with_added_results(tmp_path):
+    args = MagicMock(
+        output=os.path.join(tmp_path, "full"),
+        raw_report=False,
+        define_version="2.1",
+        controlled_terminology_package=["sdtmct-03-2021"],
+        standard="sdtmig",
+        version="3-4",
+        meddra=None,
+        whodrug=None,
+    )
+    full_report = JsonReport([], "test", mock_validation_results, 10.1, args)
+    args.output = os.path.join(tmp_path, "streamed")
+    streamed_report = JsonReport([], "test", [], 0, args)
+    for validation_result in reversed(mock_validation_results):
+        streamed_report.add_result(validation_result)
+    streamed_report.set_elapsed_time(10.1)
+    assert _write_report(streamed_report) == _write_report(full_report)
+
+
+def test_write_raw_report_with_added_results(tmp_path):
+    args = MagicMock(
+        output=os.path.join(tmp_path, "streamed"),
+        raw_report=True,
+        define_version="2.1",
+        controlled_terminology_package=["sdtmct-03-2021"],
+        standard="sdtmig",
+        version="3-4",
+        meddra=None,
+        whodrug=None,
+    )
+    report = JsonReport([], "test", [], 0, args)
+    for validation_result in mock_validation_results:
+        report.add_result(validation_result)
+    export = _write_report(report)
+    assert export["results_data"] == [
+        validation_result.to_representation()
+        for validation_result in mock_validation_results
+    ]
@@ -0,0 +1,97 @@
+import os
+
+from cdisc_rules_engine.services.task_queues import (
+    FileSystemTaskQueue,
+    TaskQueueFactory,
+)
+
+
+def test_tasks_are_taken_in_order(tmp_path):
+    task_queue = FileSystemTaskQueue(str(tmp_path), poll_interval=0.01)
+    task_queue.publish_job({"rules": ["CORE-000001"]})
+    task_queue.put_task("00000001", "second")
+    task_queue.put_task("00000000", "first")
+    assert task_queue.get_job() == {"rules": ["CORE-000001"]}
+    assert task_queue.get_task(0) == ("00000000", "first")
+    assert task_queue.get_task(0) == ("00000001", "second")
+    assert task_queue.get_task(0.05) is None
+    # claims are kept until the results are put
+    claimed_path = os.path.join(tmp_path, FileSystemTaskQueue.CLAIMED_DIRECTORY)
+    assert len(os.listdir(claimed_path)) == 2
+    task_queue.put_result("00000000", "first result")
+    task_queue.put_result("00000001", "second result")
+    assert os.listdir(claimed_path) == []
+
+
+def test_task_is_taken_once(tmp_path):
+    first_queue = FileSystemTaskQueue(str(tmp_path), poll_interval=0.01)
+    second_queue = FileSystemTaskQueue(str(tmp_path), poll_interval=0.01)
+    first_queue.put_task("00000000", "task")
+    assert second_queue.get_task(0) == ("00000000", "task")
+    assert first_queue.get_task(0) is None
+
+
+def test_stale_tasks_are_requeued(tmp_path):
+    task_queue = FileSystemTaskQueue(str(tmp_path), poll_interval=0.01)
+    task_queue.put_task("00000000", "first")
+    task_queue.put_task("00000001", "second")
+    assert task_queue.get_task(0) == ("00000000", "first")
+    assert task_queue.get_task(0) == ("00000001", "second")
+    claimed_path = os.path.join(
+        tmp_path, FileSystemTaskQueue.CLAIMED_DIRECTORY, "00000000.pkl"
+    )
+    os.utime(claimed_path, (0, 0))
+    assert task_queue.requeue_stale_tasks(60) == ["00000000"]
+    # renewed claims are not requeued
+    os.utime(claimed_path.replace("00000000", "00000001"), (0, 0))
+    task_queue.touch_task("00000001")
+    assert task_queue.requeue_stale_tasks(60) == []
+    assert task_queue.get_task(0) == ("00000000", "first")
+
+
+def test_results(tmp_path):
+    task_queue = FileSystemTaskQueue(str(tmp_path), poll_interval=0.01)
+    assert task_queue.get_result(0) is None
+    task_queue.put_result("00000000", (True, [1, 2]))
+    assert task_queue.get_result(0) == ("00000000", (True, [1, 2]))
+    assert task_queue.get_result(0) is None
+
+
+def test_close_and_clear(tmp_path):
+    task_queue = FileSystemTaskQueue(str(tmp_path))
+    task_queue.publish_job("job")
+    task_queue.put_task("00000000", "task")
+    task_queue.put_result("00000000", "result")
+    task_queue.close()
+    assert task_queue.is_closed()
+    task_queue.clear()
+    assert not task_queue.is_closed()
+    assert task_queue.get_job() is None
+    assert task_queue.get_task(0) is None
+    assert task_queue.get_result(0) is None
+
+
+def test_lease(tmp_path):
+    first_queue = FileSystemTaskQueue(str(tmp_path))
+    second_queue = FileSystemTaskQueue(str(tmp_path))
+    assert first_queue.acquire_lease("first", 60)
+    assert first_queue.acquire_lease("first", 60)
+    assert not second_queue.acquire_lease("second", 60)
+    # leases that are not renewed can be taken
+    os.utime(os.path.join(tmp_path, FileSystemTaskQueue.LEASE_FILE), (0, 0))
+    assert second_queue.acquire_lease("second", 60)
+    first_queue.release_lease("first")
+    assert not first_queue.acquire_lease("first", 60)
+    second_queue.release_lease("second")
+    assert first_queue.acquire_lease("first", 60)
+    # the lease is kept when the queue is cleared
+    first_queue.clear()
+    assert not second_queue.acquire_lease("second", 60)
+
+
+def test_factory_creates_file_system_queue(tmp_path):
+    path = str(tmp_path)
+    for url in (path, f"file://{path}"):
+        task_queue = TaskQueueFactory(url).get_task_queue()
+        assert isinstance(task_queue, FileSystemTaskQueue)
+        assert task_queue.path == path
@@ -0,0 +1,172 @@
+from unittest.mock import patch
+
+import pytest
+
+from cdisc_rules_engine.services.task_queues import RedisTaskQueue, TaskQueueFactory
+
+
+class FakeRedis:
+    """
+    Stand-in for a Redis server, implements the commands used by the queue.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.expiry_times = {}
+        self.server_time = 1000.0
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and self.get(key) is not None:
+            return None
+        self.values[key] = value.encode() if isinstance(value, str) else value
+        if ex:
+            self.expiry_times[key] = self.server_time + ex
+        return True
+
+    def get(self, key):
+        if self.expiry_times.get(key, self.server_time + 1) <= self.server_time:
+            self.delete(key)
+        return self.values.get(key)
+
+    def expire(self, key, seconds):
+        if self.get(key) is None:
+            return 0
+        self.expiry_times[key] = self.server_time + seconds
+        return 1
+
+    def exists(self, key):
+        return int(key in self.values)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.expiry_times.pop(key, None)
+
+    def rpush(self, key, value):
+        self.values.setdefault(key, []).append(value)
+
+    def lpush(self, key, value):
+        self.values.setdefault(key, []).insert(0, value)
+
+    def blpop(self, keys, timeout):
+        assert timeout > 0
+        for key in keys:
+            if self.values.get(key):
+                return key, self.values[key].pop(0)
+        return None
+
+    def brpoplpush(self, source, destination, timeout):
+        assert timeout > 0
+        if not self.values.get(source):
+            return None
+        value = self.values[source].pop()
+        self.lpush(destination, value)
+        return value
+
+    def lrange(self, key, start, end):
+        assert (start, end) == (0, -1)
+        return list(self.values.get(key, []))
+
+    def llen(self, key):
+        return len(self.values.get(key, []))
+
+    def lrem(self, key, count, value):
+        if value in self.values.get(key, []):
+            self.values[key].remove(value)
+            return 1
+        return 0
+
+    def hset(self, key, field, value):
+        self.values.setdefault(key, {})[field.encode()] = str(value).encode()
+
+    def hsetnx(self, key, field, value):
+        if field.encode() not in self.values.get(key, {}):
+            self.hset(key, field, value)
+
+    def hgetall(self, key):
+        return dict(self.values.get(key, {}))
+
+    def hdel(self, key, field):
+        self.values.get(key, {}).pop(field.encode(), None)
+
+    def time(self):
+        return int(self.server_time), 0
+
+
+@pytest.fixture
+def task_queue() -> RedisTaskQueue:
+    return RedisTaskQueue(FakeRedis(), "test")
+
+
+def test_tasks_and_results(task_queue):
+    task_queue.publish_job({"rules": ["CORE-000001"]})
+    task_queue.put_task("00000000", "first")
+    task_queue.put_task("00000001", "second")
+    assert task_queue.get_job() == {"rules": ["CORE-000001"]}
+    assert task_queue.get_task(0) == ("00000000", "first")
+    assert task_queue.get_task(0) == ("00000001", "second")
+    assert task_queue.get_task(0) is None
+    task_queue.put_result("00000000", (True, "result"))
+    assert task_queue.get_result(0) == ("00000000", (True, "result"))
+    assert task_queue.get_result(0) is None
+
+
+def test_claims(task_queue):
+    task_queue.put_task("00000000", "first")
+    task_queue.put_task("00000001", "second")
+    assert task_queue.get_task(0) == ("00000000", "first")
+    assert task_queue.get_task(0) == ("00000001", "second")
+    task_queue.client.server_time += 30
+    task_queue.touch_task("00000001")
+    task_queue.client.server_time += 40
+    assert task_queue.requeue_stale_tasks(60) == ["00000000"]
+    assert task_queue.has_claimed_tasks()
+    task_queue.put_result("00000001", (True, "result"))
+    assert not task_queue.has_claimed_tasks()
+    assert task_queue.client.values["test:claimed"] == []
+    assert task_queue.client.values["test:claim_times"] == {}
+    assert task_queue.get_task(0) == ("00000000", "first")
+
+
+def test_close_and_clear(task_queue):
+    task_queue.publish_job("job")
+    task_queue.put_task("00000000", "task")
+    task_queue.close()
+    assert task_queue.is_closed()
+    assert set(task_queue.client.values) == {
+        "test:job",
+        "test:tasks",
+        "test:closed",
+    }
+    task_queue.clear()
+    assert not task_queue.is_closed()
+    assert task_queue.get_job() is None
+    assert task_queue.get_task(0) is None
+
+
+def test_lease(task_queue):
+    assert task_queue.acquire_lease("first", 60)
+    assert not task_queue.acquire_lease("second", 60)
+    task_queue.client.server_time += 50
+    assert task_queue.acquire_lease("first", 60)
+    task_queue.client.server_time += 50
+    assert not task_queue.acquire_lease("second", 60)
+    # leases that are not renewed expire
+    task_queue.client.server_time += 60
+    assert task_queue.acquire_lease("second", 60)
+    task_queue.release_lease("first")
+    assert not task_queue.acquire_lease("first", 60)
+    task_queue.release_lease("second")
+    assert task_queue.acquire_lease("first", 60)
+
+
+@patch("cdisc_rules_engine.services.task_queues.redis_task_queue.redis.Redis")
+def test_factory_creates_redis_queue(mock_redis):
+    task_queue = TaskQueueFactory(
+        "redis://localhost:6379/0?queue=validation&socket_timeout=5"
+    ).get_task_queue()
+    assert isinstance(task_queue, RedisTaskQueue)
+    assert task_queue.queue_name == "validation"
+    mock_redis.from_url.assert_called_once_with(
+        "redis://localhost:6379/0?socket_timeout=5"
+    )
@@ -0,0 +1,83 @@
+import json
+from unittest.mock import patch
+
+from cdisc_rules_engine.services.cache import InMemoryCacheService
+from cdisc_rules_engine.utilities.cache_stats import (
+    CacheStats,
+    DEFAULT_NAMESPACE,
+    format_cache_stats,
+    get_cache_namespace,
+    merge_cache_stats,
+    pop_process_cache_stats,
+)
+
+
+def test_get_cache_namespace():
+    assert get_cache_namespace("standards/sdtmig/3-4") == "standards"
+    assert get_cache_namespace(b"models/sdtm/2-0") == "models"
+    assert get_cache_namespace("sdtmig-3-4-codelists") == DEFAULT_NAMESPACE
+    assert get_cache_namespace("/data/study/ae.xpt_contents") == DEFAULT_NAMESPACE
+
+
+def test_record_and_merge():
+    stats = CacheStats()
+    stats.record_get("standards/sdtmig/3-4", True, 0.000005)
+    stats.record_get("standards/sdtmig/3-3", False, 0.5)
+    stats.record_add("standards/sdtmig/3-3", 100, 0.002)
+    stats.record_eviction("standards/sdtmig/3-3", 100)
+    stats.record_get_all(["models/sdtm/2-0", "rules/CORE-000001"], [None, {}], 0.01)
+    result = stats.to_dict()
+    assert list(result) == ["models", "rules", "standards"]
+    assert result["standards"]["hits"] == 1
+    assert result["standards"]["misses"] == 1
+    assert result["standards"]["bytes_stored"] == 100
+    assert result["standards"]["evictions"] == 1
+    assert result["standards"]["get_latency"]["<=0.01ms"] == 1
+    assert result["standards"]["get_latency"]["<=1000ms"] == 1
+    assert result["standards"]["add_latency"]["<=10ms"] == 1
+    assert result["models"]["misses"] == 1 and result["rules"]["hits"] == 1
+    # stats are JSON serializable and can be merged from other processes
+    merged = CacheStats()
+    merged.merge(json.loads(json.dumps(result)))
+    merged.merge(result)
+    assert merged.to_dict()["standards"]["hits"] == 2
+    assert merged.to_dict()["standards"]["get_latency"]["<=1000ms"] == 2
+    stats.reset()
+    assert stats.to_dict() == {}
+
+
+@patch("cdisc_rules_engine.utilities.cache_stats.MAX_NAMESPACES", 2)
+def test_namespaces_above_limit_are_counted_together():
+    stats = CacheStats()
+    for key in ("a/1", "b/1", "c/1", "d/1"):
+        stats.record_get(key, True, 0)
+    result = stats.to_dict()
+    assert result["a"]["hits"] == 1
+    assert result["b"]["hits"] == 1
+    assert result[DEFAULT_NAMESPACE]["hits"] == 2
+
+
+def test_merge_and_format_cache_layers():
+    stats = CacheStats()
+    stats.record_get("standards/sdtmig/3-4", True, 0)
+    stats.record_get("standards/sdtmig/3-4", False, 0)
+    layers = {}
+    merge_cache_stats(layers, {"TieredCacheService": stats.to_dict()})
+    merge_cache_stats(layers, {"TieredCacheService": stats.to_dict()})
+    assert layers["TieredCacheService"]["standards"]["hits"] == 2
+    assert format_cache_stats(layers) == [
+        "TieredCacheService standards: 2 hits, 2 misses (50.0% hit ratio), "
+        "0 evictions, 0.0 MB stored, 0.0 MB evicted"
+    ]
+
+
+def test_pop_process_cache_stats():
+    pop_process_cache_stats()
+    cache = InMemoryCacheService(max_size=10**6)
+    cache.get("standards/sdtmig/3-4")
+    stats = pop_process_cache_stats()
+    assert list(stats) == ["InMemoryCacheService"]
+    assert stats["InMemoryCacheService"]["standards"]["misses"] == 1
+    # stats are reset once they are returned
+    assert pop_process_cache_stats() == {}
+    assert cache.get_stats() == {"InMemoryCacheService": {}}
@@ -0,0 +1,44 @@
+import io
+import json
+
+import pytest
+
+from cdisc_rules_engine.utilities.json_stream_reader import JSONStreamReader
+
+DOCUMENT = {
+    "name": "AE",
+    "records": 2,
+    "items": [{"name": "AESEQ", "label": 'Sequence [1] "number"'}],
+    "itemData": [[1, "a{b"], [2.5e-10, None]],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_read_document(chunk_size: int):
+    reader = JSONStreamReader(io.StringIO(json.dumps(DOCUMENT)), chunk_size)
+    result = {}
+    for key in reader.iter_object():
+        if key == "itemData":
+            result[key] = [reader.read_value() for _ in reader.iter_array()]
+        else:
+            result[key] = reader.read_value()
+    assert result == DOCUMENT
+    assert reader.peek() == ""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_skip_value(chunk_size: int):
+    reader = JSONStreamReader(io.StringIO(json.dumps(DOCUMENT)), chunk_size)
+    keys = []
+    for key in reader.iter_object():
+        keys.append(key)
+        reader.skip_value()
+    assert keys == list(DOCUMENT)
+    assert reader.peek() == ""
+
+
+def test_invalid_document():
+    reader = JSONStreamReader(io.StringIO('{"name": "AE" "records": 1}'), 4)
+    with pytest.raises(json.JSONDecodeError):
+        for _ in reader.iter_object():
+            reader.skip_value()
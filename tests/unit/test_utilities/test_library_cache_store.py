@@ -0,0 +1,127 @@
+import os
+import pickle
+from types import SimpleNamespace
+
+from cdisc_rules_engine.utilities.library_cache_store import (
+    MODELS,
+    RULES,
+    STANDARDS,
+    LibraryCacheStore,
+    StoredLibraryMetadataContainer,
+)
+from scripts.script_utils import (
+    get_library_metadata_from_cache,
+    load_rules_from_cache,
+)
+
+
+def save_pickle(path, data):
+    with open(path, "wb") as f:
+        pickle.dump(data, f)
+
+
+def create_cache(cache_path) -> dict:
+    rules = {
+        "rules/sdtmig/3-4/CORE-000002": {"core_id": "CORE-000002"},
+        "rules/sdtmig/3-4/CORE-000001": {"core_id": "CORE-000001"},
+        "rules/sdtmig/3-3/CORE-000001": {"core_id": "CORE-000001"},
+    }
+    save_pickle(os.path.join(cache_path, "rules.pkl"), rules)
+    save_pickle(
+        os.path.join(cache_path, "standards_details.pkl"),
+        {
+            "standards/sdtmig/3-4": {
+                "name": "SDTMIG v3.4",
+                "_links": {"model": {"href": "/mdr/sdtm/2-0"}},
+            }
+        },
+    )
+    save_pickle(
+        os.path.join(cache_path, "standards_models.pkl"),
+        {"models/sdtm/2-0": {"name": "SDTM v2.0"}},
+    )
+    save_pickle(os.path.join(cache_path, "variable_codelist_maps.pkl"), {})
+    save_pickle(os.path.join(cache_path, "variables_metadata.pkl"), {})
+    save_pickle(
+        os.path.join(cache_path, "sdtmct-2023-12-15.pkl"), {"package": "sdtmct"}
+    )
+    save_pickle(os.path.join(cache_path, "sdtmct-2023-09-29.pkl"), {"package": "old"})
+    return rules
+
+
+def get_args(cache_path, **kwargs) -> SimpleNamespace:
+    args = {
+        "cache": str(cache_path),
+        "standard": "sdtmig",
+        "version": "3.4",
+        "controlled_terminology_package": ["sdtmct-2023-12-15"],
+        "local_rules_cache": False,
+        "local_rules_id": None,
+        "rules": [],
+    }
+    return SimpleNamespace(**{**args, **kwargs})
+
+
+def test_update(tmp_path):
+    rules = create_cache(tmp_path)
+    store = LibraryCacheStore(str(tmp_path))
+    assert RULES in store.update()
+    assert store.update() == []
+    assert store.has_collection(STANDARDS)
+    assert not store.has_collection("local_rules")
+    # items are read by key and prefix in the order of the cache file
+    assert store.get(MODELS, "models/sdtm/2-0") == {"name": "SDTM v2.0"}
+    assert store.get(MODELS, "models/sdtm/1-0") is None
+    assert list(store.get_by_prefix(RULES, "rules/sdtmig/3-4/")) == list(rules)[:2]
+    # changed cache files are copied again
+    rules["rules/sdtmig/3-4/CORE-000003"] = {"core_id": "CORE-000003"}
+    save_pickle(os.path.join(tmp_path, "rules.pkl"), rules)
+    os.utime(os.path.join(tmp_path, "rules.pkl"), ns=(1, 1))
+    assert LibraryCacheStore(str(tmp_path)).update() == [RULES]
+    assert len(LibraryCacheStore(str(tmp_path)).get_by_prefix(RULES, "rules/")) == 4
+    # removed cache files empty their collections
+    os.remove(os.path.join(tmp_path, "rules.pkl"))
+    assert store.update() == [RULES]
+    assert not store.has_collection(RULES)
+    assert store.get_by_prefix(RULES, "rules/") == {}
+
+
+def test_load_rules_from_cache(tmp_path):
+    create_cache(tmp_path)
+    rules = load_rules_from_cache(get_args(tmp_path))
+    assert [rule["core_id"] for rule in rules] == ["CORE-000002", "CORE-000001"]
+    rules = load_rules_from_cache(get_args(tmp_path, rules=["CORE-000001"]))
+    assert rules == [{"core_id": "CORE-000001"}]
+    # rules can be changed by the caller without changing the store
+    rules[0]["core_id"] = "changed"
+    rules = load_rules_from_cache(get_args(tmp_path, rules=["CORE-000001"]))
+    assert rules == [{"core_id": "CORE-000001"}]
+    save_pickle(
+        os.path.join(tmp_path, "local_rules.pkl"),
+        {"local/1/CORE-000003": {"core_id": "CORE-000003"}, "local/2/X": {}},
+    )
+    rules = load_rules_from_cache(
+        get_args(tmp_path, local_rules_cache=True, local_rules_id="1")
+    )
+    assert rules == [{"core_id": "CORE-000003"}]
+
+
+def test_stored_library_metadata(tmp_path):
+    create_cache(tmp_path)
+    library_metadata = get_library_metadata_from_cache(get_args(tmp_path))
+    assert isinstance(library_metadata, StoredLibraryMetadataContainer)
+    assert library_metadata.published_ct_packages == {
+        "sdtmct-2023-12-15",
+        "sdtmct-2023-09-29",
+    }
+    # copies hold keys of the metadata instead of the metadata
+    copy = pickle.loads(pickle.dumps(library_metadata))
+    assert "_standard_metadata" not in copy.__dict__
+    assert copy.standard_metadata["name"] == "SDTMIG v3.4"
+    assert copy.model_metadata == {"name": "SDTM v2.0"}
+    assert copy.variable_codelist_map is None
+    assert copy.get_all_ct_package_metadata() == [{"package": "sdtmct"}]
+    # metadata replaced with the setters is copied
+    library_metadata.variables_metadata = {"AE": {"AETERM": {}}}
+    copy = pickle.loads(pickle.dumps(library_metadata))
+    assert copy.variables_metadata == {"AE": {"AETERM": {}}}
@@ -0,0 +1,108 @@
+import os
+
+import dask.dataframe as dd
+import pandas as pd
+
+from cdisc_rules_engine.models.dataset import PandasDataset
+from cdisc_rules_engine.models.operation_params import OperationParams
+from cdisc_rules_engine.utilities.operation_result_store import OperationResultStore
+
+
+def create_file(path, content: bytes = b"data") -> str:
+    with open(path, "wb") as f:
+        f.write(content)
+    return str(path)
+
+
+def get_operation_params(
+    tmp_path, operation_name: str, target: str = "AESEQ"
+) -> OperationParams:
+    return OperationParams(
+        operation_id="$result",
+        operation_name=operation_name,
+        dataframe=PandasDataset.from_dict({"AESEQ": [1, 2]}),
+        target=target,
+        domain="AE",
+        dataset_path=str(tmp_path / "ae.xpt"),
+        directory_path=str(tmp_path),
+        datasets=[
+            {"domain": "AE", "filename": "ae.xpt"},
+            {"domain": "DM", "filename": "dm.xpt"},
+        ],
+        standard="sdtmig",
+        standard_version="3-4",
+    )
+
+
+def test_add_and_get(tmp_path):
+    ae_path = create_file(tmp_path / "ae.xpt")
+    store = OperationResultStore(str(tmp_path / "store"))
+    key = store.get_key(get_operation_params(tmp_path, "distinct"), [ae_path])
+    assert store.get(key) is None
+    assert store.add(key, {1, 2})
+    assert store.get(key) == {1, 2}
+    assert key != store.get_key(
+        get_operation_params(tmp_path, "distinct", "AETERM"), [ae_path]
+    )
+
+
+def test_key_changes_with_dataset_files(tmp_path):
+    ae_path = create_file(tmp_path / "ae.xpt")
+    create_file(tmp_path / "dm.xpt")
+    store = OperationResultStore(str(tmp_path / "store"))
+    keys = {
+        operation_name: store.get_key(
+            get_operation_params(tmp_path, operation_name), [ae_path]
+        )
+        for operation_name in ("distinct", "variable_value_count", "study_domains")
+    }
+    create_file(tmp_path / "dm.xpt", b"modified data")
+    # results of the evaluated dataset and the list of datasets are reused
+    assert keys["distinct"] == store.get_key(
+        get_operation_params(tmp_path, "distinct"), [ae_path]
+    )
+    assert keys["study_domains"] == store.get_key(
+        get_operation_params(tmp_path, "study_domains")
+    )
+    # results computed from all study datasets are not
+    assert keys["variable_value_count"] != store.get_key(
+        get_operation_params(tmp_path, "variable_value_count")
+    )
+    create_file(ae_path, b"modified data")
+    assert keys["distinct"] != store.get_key(
+        get_operation_params(tmp_path, "distinct"), [ae_path]
+    )
+
+
+def test_key_changes_with_library_files(tmp_path):
+    library_path = create_file(tmp_path / "standards_details.pkl")
+    params = get_operation_params(tmp_path, "expected_variables")
+    key = OperationResultStore(str(tmp_path / "store"), None, [library_path]).get_key(
+        params
+    )
+    create_file(library_path, b"modified data")
+    assert key != OperationResultStore(
+        str(tmp_path / "store"), None, [library_path]
+    ).get_key(params)
+
+
+def test_results_not_stored(tmp_path):
+    store = OperationResultStore(str(tmp_path / "store"))
+    # operation that is not listed in STORED_OPERATIONS
+    assert store.get_key(get_operation_params(tmp_path, "variable_exists")) is None
+    # dataset the operation is applied to is not read from files
+    assert store.get_key(get_operation_params(tmp_path, "distinct")) is None
+    assert not store.add("key", dd.from_pandas(pd.DataFrame({"A": [1]}), 1))
+    assert store.get("key") is None
+
+
+def test_evict_removes_least_recently_used_results(tmp_path):
+    store = OperationResultStore(str(tmp_path / "store"), max_size=2500)
+    for index, key in enumerate(("ae", "dm", "lb")):
+        store.add(key, "0" * 1000)
+        result_path = os.path.join(store.directory, f"{key}.pkl")
+        os.utime(result_path, (index, index))
+    store.get("ae")
+    assert store.evict() == ["dm"]
+    assert store.get("dm") is None
+    assert store.get("lb") == "0" * 1000
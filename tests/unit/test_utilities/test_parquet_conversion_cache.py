@@ -0,0 +1,60 @@
+import os
+
+import pandas as pd
+
+from cdisc_rules_engine.utilities.parquet_conversion_cache import (
+    ParquetConversionCache,
+)
+from cdisc_rules_engine.utilities.utils import get_file_fingerprint
+
+
+def create_file(path, content: bytes = b"data") -> str:
+    with open(path, "wb") as f:
+        f.write(content)
+    return str(path)
+
+
+def test_add_and_get(tmp_path):
+    dataset_path = create_file(tmp_path / "ae.xpt")
+    converted_path = str(tmp_path / "converted.parquet")
+    pd.DataFrame({"AESEQ": [1, 2]}).to_parquet(converted_path)
+    cache = ParquetConversionCache(str(tmp_path / "cache"))
+    assert cache.get(dataset_path) is None
+    cached_path = cache.add(dataset_path, 2, converted_path)
+    assert not os.path.exists(converted_path)
+    assert cache.get(dataset_path) == (2, cached_path)
+    assert pd.read_parquet(cached_path)["AESEQ"].tolist() == [1, 2]
+
+
+def test_modified_dataset_is_converted_again(tmp_path):
+    dataset_path = create_file(tmp_path / "ae.xpt")
+    cache = ParquetConversionCache(str(tmp_path / "cache"))
+    cache.add(dataset_path, 1, create_file(tmp_path / "converted.parquet"))
+    create_file(dataset_path, b"modified data")
+    assert cache.get(dataset_path) is None
+
+
+def test_evict_removes_least_recently_used_files(tmp_path):
+    cache = ParquetConversionCache(str(tmp_path / "cache"), max_size=250)
+    cached_paths = []
+    for index, name in enumerate(("ae", "dm", "lb")):
+        dataset_path = create_file(tmp_path / f"{name}.xpt", name.encode())
+        cached_path = cache.add(
+            dataset_path,
+            1,
+            create_file(tmp_path / f"{name}.parquet", b"0" * 100),
+        )
+        os.utime(cached_path, (index, index))
+        cached_paths.append(cached_path)
+    # the oldest file is used by the current run
+    assert cache.evict([cached_paths[0]]) == [cached_paths[1]]
+    assert cache.get(str(tmp_path / "dm.xpt")) is None
+    assert cache.get(str(tmp_path / "ae.xpt")) == (1, cached_paths[0])
+
+
+def test_file_fingerprint(tmp_path):
+    dataset_path = create_file(tmp_path / "ae.xpt")
+    fingerprint = get_file_fingerprint(dataset_path)
+    assert fingerprint == get_file_fingerprint(dataset_path)
+    create_file(dataset_path, b"modified data")
+    assert fingerprint != get_file_fingerprint(dataset_path)
@@ -13,6 +13,7 @@ from cdisc_rules_engine.models.rule_conditions.single_condition import SingleCon
 from cdisc_rules_engine.services.cache.in_memory_cache_service import (
     InMemoryCacheService,
 )
+from cdisc_rules_engine.utilities.operation_result_store import OperationResultStore
 from cdisc_rules_engine.utilities.rule_processor import RuleProcessor
 from cdisc_rules_engine.constants.rule_constants import ALL_KEYWORD
 from cdisc_rules_engine.constants.classes import (
@@ -22,6 +23,7 @@ from cdisc_rules_engine.constants.classes import (
     INTERVENTIONS,
 )
 from cdisc_rules_engine.models.dataset import PandasDataset, DaskDataset
+from cdisc_rules_engine.enums.rule_types import RuleTypes
 
 
 @pytest.mark.parametrize(
@@ -442,6 +444,47 @@ def test_perform_rule_operation(mock_data_service, dataset_implementation):
         assert result["$unique_aestdy"].equals(pd.Series([{11, 12, 40, 59}] * len(df)))
 
 
+def test_perform_rule_operation_with_result_store(mock_data_service, tmp_path):
+    rule = {
+        "operations": [
+            {"operator": "max", "domain": "AE", "name": "AESTDY", "id": "$max_aestdy"},
+        ],
+    }
+    dataset_path = tmp_path / "ae.xpt"
+    dataset_path.write_bytes(b"data")
+    store = OperationResultStore(str(tmp_path / "store"))
+
+    def perform_rule_operations(df: PandasDataset) -> PandasDataset:
+        processor = RuleProcessor(
+            mock_data_service, InMemoryCacheService(), operation_result_store=store
+        )
+        return processor.perform_rule_operations(
+            rule,
+            df,
+            "AE",
+            [{"domain": "AE", "filename": "ae.xpt"}],
+            str(tmp_path),
+            standard="sdtmig",
+            standard_version="3-1-2",
+            dataset_files=[str(dataset_path)],
+        )
+
+    result = perform_rule_operations(
+        PandasDataset.from_dict({"AESTDY": [11, 59], "DOMAIN": ["AE", "AE"]})
+    )
+    assert result["$max_aestdy"][0] == 59
+    # the dataset file is unchanged, the stored result is reused
+    result = perform_rule_operations(
+        PandasDataset.from_dict({"AESTDY": [11, 60], "DOMAIN": ["AE", "AE"]})
+    )
+    assert result["$max_aestdy"][0] == 59
+    dataset_path.write_bytes(b"modified data")
+    result = perform_rule_operations(
+        PandasDataset.from_dict({"AESTDY": [11, 60], "DOMAIN": ["AE", "AE"]})
+    )
+    assert result["$max_aestdy"][0] == 60
+
+
 @pytest.mark.parametrize("dataset_implementation", [PandasDataset, DaskDataset])
 def test_perform_rule_operation_with_grouping(
     mock_data_service, dataset_implementation
@@ -1187,3 +1230,87 @@ def test_add_conditions_nested_no_duplicates():
     assert len(check[1]) == 2
     assert check[1][0] == single_condition.to_dict()
     assert check[1][1] == nested_composite.to_dict()
+
+
+def test_get_rule_columns(mock_data_service):
+    rule: dict = {
+        "rule_type": "Record Data",
+        "output_variables": ["--TERM"],
+        "operations": [
+            {"id": "$max_date", "operator": "max_date", "name": "--STDTC"},
+        ],
+        "datasets": [
+            {"domain_name": "DM", "match_key": ["USUBJID", "STUDYID"]},
+        ],
+        "conditions": ConditionCompositeFactory.get_condition_composite(
+            {
+                "all": [
+                    {
+                        "name": "get_dataset",
+                        "operator": "greater_than",
+                        "value": {"target": "--ENDTC", "comparator": "DM.RFSTDTC"},
+                    },
+                ]
+            }
+        ),
+    }
+    processor = RuleProcessor(mock_data_service, InMemoryCacheService())
+    assert processor.get_rule_columns(rule, "AE") == [
+        "$max_date",
+        "AEENDTC",
+        "AESEQ",
+        "AESTDTC",
+        "AETERM",
+        "DM",
+        "DM.RFSTDTC",
+        "DOMAIN",
+        "RFSTDTC",
+        "STUDYID",
+        "USUBJID",
+        "max_date",
+    ]
+
+
+@pytest.mark.parametrize(
+    "rule, domain",
+    [
+        ({"rule_type": RuleTypes.VARIABLE_METADATA_CHECK.value}, "AE"),
+        ({"rule_type": "Record Data"}, "SUPPAE"),
+        (
+            {
+                "rule_type": "Record Data",
+                "datasets": [{"domain_name": "SUPPAE", "match_key": ["USUBJID"]}],
+            },
+            "AE",
+        ),
+        ({"rule_type": "Record Data", "conditions": {"all": [{"value": {}}]}}, "AE"),
+        (
+            {
+                "rule_type": "Record Data",
+                "conditions": {
+                    "all": [
+                        {
+                            "operator": "additional_columns_empty",
+                            "value": {"target": "TSVAL"},
+                        }
+                    ]
+                },
+            },
+            "TS",
+        ),
+        (
+            {
+                "rule_type": "Record Data",
+                "operations": [{"id": "$values", "operator": "distinct_values"}],
+            },
+            "AE",
+        ),
+    ],
+)
+def test_get_rule_columns_all_columns(mock_data_service, rule: dict, domain: str):
+    rule.setdefault("conditions", {"all": [{"value": {"target": "--TERM"}}]})
+    rule["conditions"] = ConditionCompositeFactory.get_condition_composite(
+        rule["conditions"]
+    )
+    processor = RuleProcessor(mock_data_service, InMemoryCacheService())
+    assert processor.get_rule_columns(rule, domain) is None
@@ -0,0 +1,67 @@
+import os
+
+from cdisc_rules_engine.enums.rule_types import RuleTypes
+from cdisc_rules_engine.utilities.rule_timing_history import (
+    RuleTimingHistory,
+    estimate_rule_duration,
+)
+
+
+def test_save_and_load(tmp_path):
+    path = os.path.join(tmp_path, "history.json")
+    history = RuleTimingHistory()
+    history.add("CORE-000001", "AE", 2.0)
+    history.save(path)
+    loaded = RuleTimingHistory.load(path)
+    assert loaded.get("CORE-000001", "AE") == 2.0
+    assert loaded.get("CORE-000001", "DM") is None
+
+
+def test_load_invalid_file(tmp_path):
+    path = os.path.join(tmp_path, "history.json")
+    with open(path, "w") as f:
+        f.write("{invalid")
+    assert RuleTimingHistory.load(path).durations == {}
+    assert (
+        RuleTimingHistory.load(os.path.join(tmp_path, "missing.json")).durations == {}
+    )
+
+
+def test_add_keeps_moving_average():
+    history = RuleTimingHistory()
+    history.add("CORE-000001", "AE", 2.0)
+    history.add("CORE-000001", "AE", 4.0)
+    assert history.get("CORE-000001", "AE") == 3.0
+
+
+def test_estimate():
+    history = RuleTimingHistory({"CORE-000001": {"AE": 1.0, "DM": 3.0}})
+    rule = {"core_id": "CORE-000001"}
+    assert history.estimate(rule, {"domain": "AE"}) == 1.0
+    # average of other domains is used for domains without history
+    assert history.estimate(rule, {"domain": "LB"}) == 2.0
+    new_rule = {"core_id": "CORE-000002"}
+    assert history.estimate(new_rule, {"domain": "AE"}) == estimate_rule_duration(
+        new_rule, {"domain": "AE"}
+    )
+
+
+def test_estimate_rule_duration():
+    dataset = {"domain": "AE", "size": 10 * 1024**2}
+    simple_rule = {"rule_type": "Record Data"}
+    join_rule = {"rule_type": "Record Data", "datasets": [{"domain_name": "DM"}]}
+    study_wide_rule = {
+        "rule_type": "Record Data",
+        "operations": [{"operator": "variable_value_count"}],
+    }
+    metadata_rule = {"rule_type": RuleTypes.DATASET_METADATA_CHECK.value}
+    assert estimate_rule_duration(simple_rule, dataset) < estimate_rule_duration(
+        join_rule, dataset
+    )
+    assert estimate_rule_duration(join_rule, dataset) < estimate_rule_duration(
+        study_wide_rule, dataset
+    )
+    # metadata checks do not depend on dataset size
+    assert estimate_rule_duration(metadata_rule, dataset) < estimate_rule_duration(
+        simple_rule, dataset
+    )
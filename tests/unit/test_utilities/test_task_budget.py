@@ -0,0 +1,55 @@
+import signal
+import time
+
+import pytest
+
+from cdisc_rules_engine.exceptions.custom_exceptions import TaskBudgetExceededError
+from cdisc_rules_engine.utilities.task_budget import TaskBudget
+
+
+def busy_wait(seconds: float):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        pass
+
+
+def test_time_limit_exceeded():
+    with pytest.raises(TaskBudgetExceededError) as exc_info:
+        with TaskBudget(max_seconds=0.2, check_interval=0.01):
+            busy_wait(5)
+    assert "time limit" in exc_info.value.message
+
+
+def test_memory_limit_exceeded():
+    with pytest.raises(TaskBudgetExceededError) as exc_info:
+        with TaskBudget(max_memory=1, check_interval=0.01):
+            busy_wait(5)
+    assert "memory limit" in exc_info.value.message
+
+
+def test_caught_interruption_is_repeated():
+    caught_errors = 0
+    with pytest.raises(TaskBudgetExceededError):
+        with TaskBudget(max_seconds=0.1, check_interval=0.01):
+            try:
+                busy_wait(5)
+            except TaskBudgetExceededError:
+                # code that catches all exceptions and carries on
+                caught_errors += 1
+            busy_wait(5)
+    assert caught_errors == 1
+
+
+def test_task_within_budget():
+    handler = signal.getsignal(signal.SIGINT)
+    with TaskBudget(max_seconds=5, max_memory=1024**4, check_interval=0.01):
+        busy_wait(0.05)
+    # previous interrupt handler is restored
+    assert signal.getsignal(signal.SIGINT) is handler
+
+
+def test_no_budget():
+    handler = signal.getsignal(signal.SIGINT)
+    with TaskBudget() as budget:
+        assert budget._watchdog is None
+        assert signal.getsignal(signal.SIGINT) is handler
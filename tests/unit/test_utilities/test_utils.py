@@ -1,9 +1,12 @@
+import os
+
 import pytest
 from unittest.mock import patch
 from cdisc_rules_engine.utilities.utils import (
     is_split_dataset,
     is_supp_dataset,
     get_corresponding_datasets,
+    get_file_fingerprint,
 )
 
 
@@ -100,3 +103,17 @@ def test_get_corresponding_datasets(domain, expected_datasets):
     assert (
         result_datasets == expected_datasets
     ), f"The function should return only datasets matching the '{domain}' domain"
+
+
+def test_file_content_fingerprint(tmp_path):
+    dataset_path = tmp_path / "ae.xpt"
+    dataset_path.write_bytes(b"data")
+    fingerprint = get_file_fingerprint(str(dataset_path), content_hash=True)
+    assert fingerprint != get_file_fingerprint(str(dataset_path))
+    # touching the file keeps the fingerprint
+    os.utime(dataset_path, (1, 1))
+    assert fingerprint == get_file_fingerprint(str(dataset_path), content_hash=True)
+    # the same modification time and size with other contents change it
+    dataset_path.write_bytes(b"date")
+    os.utime(dataset_path, (1, 1))
+    assert fingerprint != get_file_fingerprint(str(dataset_path), content_hash=True)
@@ -0,0 +1,57 @@
+import os
+
+import pandas as pd
+import pyreadstat
+import pytest
+
+from cdisc_rules_engine.services.data_readers.xpt_header_reader import (
+    XPTHeaderReader,
+)
+
+
+@pytest.mark.parametrize("file_name", ["test_dataset.xpt", "test_adam_dataset.xpt"])
+def test_read(file_name: str):
+    test_dataset_path: str = f"{os.path.dirname(__file__)}/../resources/{file_name}"
+    header = XPTHeaderReader(test_dataset_path).read()
+    dataframe, metadata = pyreadstat.read_xport(
+        test_dataset_path, disable_datetime_conversion=True
+    )
+    assert header.dataset_name == metadata.table_name
+    assert header.dataset_label == metadata.file_label
+    assert header.modified == metadata.modification_time
+    assert header.number_of_rows == len(dataframe.index)
+    assert [variable.name for variable in header.variables] == metadata.column_names
+    assert [variable.label for variable in header.variables] == metadata.column_labels
+    assert [variable.length for variable in header.variables] == list(
+        metadata.variable_storage_width.values()
+    )
+    assert [variable.type for variable in header.variables] == list(
+        metadata.readstat_variable_types.values()
+    )
+    assert [variable.format or "NULL" for variable in header.variables] == list(
+        metadata.original_variable_types.values()
+    )
+
+
+@pytest.mark.parametrize("number_of_rows", [0, 1, 3, 30])
+def test_read_short_rows(tmp_path, number_of_rows: int):
+    """
+    Blank padding of the last record is not counted as rows.
+    """
+    file_path = str(tmp_path / "dm.xpt")
+    dataframe = pd.DataFrame(
+        {"DOMAIN": ["DM"] * number_of_rows, "SEX": ["F"] * number_of_rows}
+    )
+    pyreadstat.write_xport(dataframe, file_path, file_format_version=5)
+    header = XPTHeaderReader(file_path).read()
+    assert header.number_of_rows == number_of_rows
+    assert header.get_first_row_value("DOMAIN") == ("DM" if number_of_rows else None)
+
+
+def test_read_version_8(tmp_path):
+    file_path = str(tmp_path / "dm.xpt")
+    pyreadstat.write_xport(
+        pd.DataFrame({"DOMAIN": ["DM"]}), file_path, file_format_version=8
+    )
+    with pytest.raises(ValueError):
+        XPTHeaderReader(file_path).read()
@@ -1,5 +1,7 @@
 import os
 
+import pandas as pd
+
 from cdisc_rules_engine.services.data_readers.xpt_reader import XPTReader
 
 
@@ -17,3 +19,36 @@ def test_read():
         Verify that the rounding of incredibly small values to 0 is applied.
         """
         assert value == 0 or abs(value) > 10**-16
+
+
+def test_to_parquet():
+    test_dataset_path: str = (
+        f"{os.path.dirname(__file__)}/../resources/test_dataset.xpt"
+    )
+    reader = XPTReader()
+    num_rows, parquet_path = reader.to_parquet(test_dataset_path)
+    try:
+        dataframe = pd.read_parquet(parquet_path)
+    finally:
+        os.remove(parquet_path)
+    assert num_rows == len(dataframe.index)
+    for value in dataframe["EXDOSE"]:
+        """
+        Verify that the rounding is applied to the converted chunks.
+        """
+        assert value == 0 or abs(value) > 10**-16
+
+
+def test_from_file_columns():
+    test_dataset_path: str = (
+        f"{os.path.dirname(__file__)}/../resources/test_dataset.xpt"
+    )
+    reader = XPTReader()
+    dataframe = reader.from_file(test_dataset_path)
+    projected_dataframe = reader.from_file(
+        test_dataset_path, ["EXDOSE", "STUDYID", "NOTEXIST"]
+    )
+    assert list(projected_dataframe.columns) == ["STUDYID", "EXDOSE"]
+    pd.testing.assert_frame_equal(
+        projected_dataframe.data, dataframe.data[["STUDYID", "EXDOSE"]]
+    )